@@ -16,7 +16,10 @@ from kiln_ai.adapters.remote_config import (
     refresh_model_list_background,
     should_skip_remote_model_list,
 )
+from kiln_ai.datamodel import Project
+from kiln_ai.tools.mcp_session_manager import MCPSessionManager, is_stateless_server
 from kiln_ai.utils.config import Config
+from kiln_ai.utils.http_client_pool import HttpClientPool
 from kiln_ai.utils.logging import setup_litellm_logging
 
 from app.desktop.git_sync.background_sync import BackgroundSync
@@ -36,6 +39,7 @@ from app.desktop.studio_server.eval_api import connect_evals_api
 from app.desktop.studio_server.finetune_api import connect_fine_tune_api
 from app.desktop.studio_server.import_api import connect_import_api
 from app.desktop.studio_server.jobs.api import connect_jobs_api
+from app.desktop.studio_server.jobs.journal import JobJournal
 from app.desktop.studio_server.jobs.registry import job_registry
 from app.desktop.studio_server.prompt_api import connect_prompt_api
 from app.desktop.studio_server.prompt_optimization_job_api import (
@@ -99,6 +103,25 @@ async def _stop_background_syncs() -> None:
         await manager.close()
 
 
+async def _prewarm_mcp_sessions() -> None:
+    """Open pooled sessions for the stateless MCP servers of every project."""
+    tool_servers = []
+    for project_path in Config.shared().projects or []:
+        try:
+            project = Project.load_from_file(Path(project_path), readonly=True)
+        except Exception:
+            # Missing or unreadable projects are reported when they're opened
+            continue
+        tool_servers.extend(
+            tool_server
+            for tool_server in project.external_tool_servers(readonly=True)
+            if is_stateless_server(tool_server)
+            and not tool_server.properties.get("is_archived", False)
+        )
+    if tool_servers:
+        await MCPSessionManager.shared().prewarm_sessions(tool_servers)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # debug event loop, warning on hangs
@@ -111,10 +134,20 @@ async def lifespan(app: FastAPI):
     original_strict_mode = datamodel_strict_mode.strict_mode()
     datamodel_strict_mode.set_strict_mode(True)
 
+    # Prewarm in the background, slow MCP servers shouldn't delay startup
+    prewarm_task = asyncio.create_task(_prewarm_mcp_sessions())
     try:
+        # Reload jobs from the previous session and resume interrupted ones
+        await job_registry.restore(JobJournal())
         await _start_background_syncs()
         yield
     finally:
+        prewarm_task.cancel()
+        # Detach before the loop cancels supervising tasks, so running jobs
+        # stay journaled as interrupted rather than cancelled.
+        job_registry.close_journal()
+        await MCPSessionManager.shared().close_pools()
+        await HttpClientPool.shared().aclose()
         # End open SSE subscriptions so a UI holding the jobs stream open can't
         # keep the worker alive (e.g. block a dev-server hot reload). Pure
         # observer teardown — jobs keep running. Note uvicorn only reaches
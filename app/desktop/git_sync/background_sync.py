@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import random
 import time
 from contextlib import suppress
 
@@ -12,6 +13,12 @@ class BackgroundSync:
     """Polls remote for changes. Two-phase: fetch without lock,
     fast-forward under lock.
 
+    The poll interval adapts to activity: it drops to active_poll_interval
+    after API requests or when the remote moved, and doubles on each quiet
+    poll up to max_poll_interval. Each poll first checks the remote branch
+    with a cheap ref listing, and only fetches when it moved. Intervals are
+    jittered so several synced repos don't poll in lockstep.
+
     Pauses automatically when idle (no API requests) to avoid
     running indefinitely in the background.
     """
@@ -21,23 +28,52 @@ class BackgroundSync:
         manager: GitSyncManager,
         poll_interval: float = 10.0,
         idle_pause_after: float = 300.0,
+        active_poll_interval: float | None = None,
+        max_poll_interval: float | None = None,
+        jitter: float = 0.1,
     ):
         self._manager = manager
         self._poll_interval = poll_interval
         self._idle_pause_after = idle_pause_after
+        self._active_poll_interval = (
+            active_poll_interval
+            if active_poll_interval is not None
+            else poll_interval / 2
+        )
+        self._max_poll_interval = (
+            max_poll_interval if max_poll_interval is not None else poll_interval * 6
+        )
+        self._jitter = jitter
+        self._current_interval = poll_interval
         self._task: asyncio.Task[None] | None = None
         self._last_request_time: float = 0.0
         self._wake_event: asyncio.Event = asyncio.Event()
+        self.paused = False
+        self.skipped_fetch_count = 0
+
+    @property
+    def current_poll_interval(self) -> float:
+        return self._current_interval
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
 
     def notify_request(self) -> None:
-        """Called by middleware on each request. Resets idle timer, wakes paused loop."""
+        """Called by middleware on each request. Resets idle timer, wakes paused loop.
+
+        Also shortens the poll interval, since others are likely to be active
+        on the same project when this user is.
+        """
         self._last_request_time = time.monotonic()
+        self._current_interval = min(self._current_interval, self._active_poll_interval)
         self._wake_event.set()
 
     async def start(self) -> None:
         if self._task is not None:
             return
         self._last_request_time = time.monotonic()
+        self._current_interval = self._poll_interval
         self._task = asyncio.create_task(self._poll_loop())
 
     async def stop(self) -> None:
@@ -47,9 +83,21 @@ class BackgroundSync:
                 await self._task
             self._task = None
 
+    def _jittered(self, interval: float) -> float:
+        return interval * random.uniform(1 - self._jitter, 1 + self._jitter)
+
+    async def _sleep(self, interval: float) -> None:
+        """Sleep for the interval, cut short to the active interval by a request."""
+        self._wake_event.clear()
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), self._jittered(interval))
+        except asyncio.TimeoutError:
+            return
+        await asyncio.sleep(self._jittered(min(interval, self._active_poll_interval)))
+
     async def _poll_loop(self) -> None:
         while True:
-            await asyncio.sleep(self._poll_interval)
+            await self._sleep(self._current_interval)
 
             idle_time = time.monotonic() - self._last_request_time
             if idle_time > self._idle_pause_after:
@@ -60,18 +108,40 @@ class BackgroundSync:
                 # Re-check after clear: notify_request() sets _last_request_time
                 # before set(), so this catches requests arriving during the race window.
                 if time.monotonic() - self._last_request_time > self._idle_pause_after:
-                    await self._wake_event.wait()
+                    self.paused = True
+                    try:
+                        await self._wake_event.wait()
+                    finally:
+                        self.paused = False
                 continue
 
+            poll_started = time.monotonic()
+            remote_moved = False
             try:
-                await self._manager.fetch()
+                remote_moved = await self._poll_once()
+            except Exception:
+                logger.warning("Background sync failed, will retry", exc_info=True)
 
-                if not await self._manager.has_new_remote_commits():
-                    continue
+            if remote_moved or self._last_request_time >= poll_started:
+                self._current_interval = self._active_poll_interval
+            else:
+                self._current_interval = min(
+                    self._current_interval * 2, self._max_poll_interval
+                )
 
-                async with self._manager.write_lock():
-                    if await self._manager.can_fast_forward():
-                        await self._manager.fast_forward()
+    async def _poll_once(self) -> bool:
+        """Fetch and fast-forward if the remote moved. Returns whether it had."""
+        if not await self._manager.remote_branch_moved():
+            self.skipped_fetch_count += 1
+            return False
 
-            except Exception:
-                logger.warning("Background sync failed, will retry", exc_info=True)
+        await self._manager.fetch()
+        await self._manager.deepen_for_shared_history()
+
+        if not await self._manager.has_new_remote_commits():
+            return False
+
+        async with self._manager.write_lock():
+            if await self._manager.can_fast_forward():
+                await self._manager.fast_forward()
+        return True
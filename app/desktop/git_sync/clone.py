@@ -321,6 +321,7 @@ def clone_repo(
     pat_token: str | None = None,
     auth_mode: AuthMode = "system_keys",
     oauth_token: str | None = None,
+    depth: int | None = None,
 ) -> None:
     """Clone a repository into the given path.
 
@@ -328,6 +329,11 @@ def clone_repo(
     for common OS artifacts. The pygit2 Repository is freed before returning
     to release libgit2 file handles (required on Windows to allow subsequent
     rename/move of the clone directory).
+
+    With a depth, only the latest `depth` commits are fetched (a shallow
+    clone), which makes first-time setup of projects with long histories much
+    faster. GitSyncManager deepens the history if it ever needs more of it.
+    libgit2 doesn't support partial (blob-less) clones or sparse checkouts.
     """
     callbacks = make_credentials(pat_token, auth_mode, oauth_token=oauth_token)
 
@@ -336,6 +342,7 @@ def clone_repo(
         str(clone_path),
         checkout_branch=branch,
         callbacks=callbacks,
+        depth=depth or 0,
     )
 
     try:
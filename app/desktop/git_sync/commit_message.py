@@ -1,3 +1,7 @@
+# Contexts listed in a group commit's message, the rest are only counted
+MAX_GROUP_COMMIT_CONTEXTS = 10
+
+
 def generate_commit_message(file_count: int, context: str) -> str:
     if file_count == 1:
         files_str = "1 file changed"
@@ -5,3 +9,12 @@ def generate_commit_message(file_count: int, context: str) -> str:
         files_str = f"{file_count} files changed"
 
     return f"[Kiln] Auto-sync: {files_str}\n\nContext: {context}"
+
+
+def group_commit_context(contexts: list[str]) -> str:
+    """The context of a group commit: its writes' distinct contexts, capped in number."""
+    unique = list(dict.fromkeys(contexts))
+    context = "; ".join(unique[:MAX_GROUP_COMMIT_CONTEXTS])
+    if len(unique) > MAX_GROUP_COMMIT_CONTEXTS:
+        context += f"; and {len(unique) - MAX_GROUP_COMMIT_CONTEXTS} more"
+    return context
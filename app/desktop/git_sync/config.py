@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Literal, TypedDict
 
 from kiln_ai.utils.config import Config
@@ -60,3 +61,18 @@ def delete_git_sync_config(project_path: str) -> None:
     raw = config.git_sync_projects or {}
     raw.pop(project_path, None)
     config.git_sync_projects = raw
+
+
+@dataclass(frozen=True)
+class GroupCommitSettings:
+    """How writes are coalesced into commits. A window of 0 disables group commit."""
+
+    window_seconds: float = 0.0
+    max_files: int = 1000
+
+    @classmethod
+    def from_config(cls) -> "GroupCommitSettings":
+        config = Config.shared()
+        window_ms = config.git_sync_group_commit_window_ms
+        max_files = config.git_sync_group_commit_max_files
+        return cls(window_seconds=window_ms / 1000, max_files=max_files)
@@ -10,6 +10,12 @@ class SyncConflictError(GitSyncError):
     pass
 
 
+class UnpushedConflictError(SyncConflictError):
+    """Saved changes that conflicted with the remote are waiting to be resolved."""
+
+    pass
+
+
 class RemoteUnreachableError(GitSyncError):
     """Cannot reach git remote."""
 
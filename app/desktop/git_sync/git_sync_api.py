@@ -3,6 +3,7 @@ import html
 import logging
 import os
 import shutil
+import time
 from pathlib import Path
 from typing import Annotated, Literal
 
@@ -217,6 +218,12 @@ class CloneRequest(BaseModel):
         default="system_keys",
         description="Auth mode: 'system_keys', 'pat_token', or 'github_oauth'.",
     )
+    depth: int | None = Field(
+        default=None,
+        ge=1,
+        description="Clone only the latest N commits (a shallow clone), for faster "
+        "setup of projects with long histories. Omit to clone the full history.",
+    )
 
 
 class CloneResponse(BaseModel):
@@ -350,6 +357,49 @@ class GitSyncConfigResponse(BaseModel):
     )
 
 
+class GitSyncStatusResponse(BaseModel):
+    """Live sync activity for a project: polling, traffic with the remote, and freshness."""
+
+    active: bool = Field(
+        description="Whether a sync manager is running for this project's clone."
+    )
+    background_sync_running: bool = Field(
+        default=False, description="Whether the background poller is running."
+    )
+    background_sync_paused: bool = Field(
+        default=False,
+        description="Whether the background poller is paused after inactivity.",
+    )
+    poll_interval_seconds: float | None = Field(
+        default=None,
+        description="Current background poll interval, which adapts to activity.",
+    )
+    fetch_count: int = Field(default=0, description="Fetches from the remote.")
+    fetched_bytes: int = Field(
+        default=0, description="Bytes received from the remote by fetches."
+    )
+    ref_check_count: int = Field(
+        default=0,
+        description="Cheap checks of the remote branch, made before fetching.",
+    )
+    skipped_fetch_count: int = Field(
+        default=0,
+        description="Background polls that skipped the fetch as the remote had not moved.",
+    )
+    seconds_since_remote_check: float | None = Field(
+        default=None,
+        description="Seconds since the remote was last checked, or None if never.",
+    )
+    has_unpushed_writes: bool = Field(
+        default=False,
+        description="Whether saved changes are waiting to be pushed (group commit).",
+    )
+    unpushed_conflicts: list[str] = Field(
+        default_factory=list,
+        description="Refs of saved changes which conflicted with the remote (group commit). Saves are refused until they're resolved.",
+    )
+
+
 class UpdateConfigRequest(BaseModel):
     """Request to partially update a git sync configuration."""
 
@@ -499,6 +549,7 @@ def connect_git_sync_api(app: FastAPI):
                 request.pat_token,
                 request.auth_mode,
                 request.oauth_token,
+                request.depth,
             )
 
             return CloneResponse(
@@ -695,6 +746,53 @@ def connect_git_sync_api(app: FastAPI):
             has_oauth_token=config.get("oauth_token") is not None,
         )
 
+    @app.get(
+        "/api/git_sync/status/{project_id}",
+        summary="Get Git Sync Status",
+        tags=["Git Sync"],
+        openapi_extra=DENY_AGENT,
+    )
+    async def api_get_status(
+        project_id: Annotated[
+            str, FastAPIPath(description="The unique identifier of the project.")
+        ],
+    ) -> GitSyncStatusResponse:
+        project_path = project_path_from_id(project_id)
+        if project_path is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        config = get_git_sync_config(project_path)
+        if config is None:
+            raise HTTPException(
+                status_code=404, detail="Git sync config not found for this project"
+            )
+
+        clone_path = config.get("clone_path")
+        manager = GitSyncRegistry.get_manager(Path(clone_path)) if clone_path else None
+        if manager is None:
+            return GitSyncStatusResponse(active=False)
+
+        stats = manager.stats
+        bg_sync = GitSyncRegistry.get_background_sync(manager.repo_path)
+        return GitSyncStatusResponse(
+            active=True,
+            background_sync_running=bg_sync is not None and bg_sync.running,
+            background_sync_paused=bg_sync is not None and bg_sync.paused,
+            poll_interval_seconds=(
+                bg_sync.current_poll_interval if bg_sync is not None else None
+            ),
+            fetch_count=stats.fetch_count,
+            fetched_bytes=stats.fetched_bytes,
+            ref_check_count=stats.ref_check_count,
+            skipped_fetch_count=bg_sync.skipped_fetch_count if bg_sync else 0,
+            seconds_since_remote_check=(
+                time.time() - stats.last_remote_check
+                if stats.last_remote_check is not None
+                else None
+            ),
+            has_unpushed_writes=manager.has_unpushed_writes,
+            unpushed_conflicts=await manager.unpushed_conflicts(),
+        )
+
     @app.patch(
         "/api/git_sync/config/{project_id}",
         summary="Update Git Sync Config",
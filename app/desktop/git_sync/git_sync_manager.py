@@ -4,21 +4,27 @@ import subprocess
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, TypeVar
 
 import pygit2
 import pygit2.enums
+from kiln_ai.utils.git_sync_protocols import track_written_paths
 
-from app.desktop.git_sync.commit_message import generate_commit_message
-from app.desktop.git_sync.config import AuthMode
+from app.desktop.git_sync.commit_message import (
+    generate_commit_message,
+    group_commit_context,
+)
+from app.desktop.git_sync.config import AuthMode, GroupCommitSettings
 from app.desktop.git_sync.errors import (
     CorruptRepoError,
     GitAuthError,
     GitSyncError,
     RemoteUnreachableError,
     SyncConflictError,
+    UnpushedConflictError,
     WriteLockTimeoutError,
 )
 
@@ -34,6 +40,36 @@ T = TypeVar("T")
 
 FRESHNESS_THRESHOLD = 15.0
 
+# Writes stage only the paths saves recorded. At most this many seconds apart, a
+# write falls back to a full status scan, to pick up files written another way.
+FULL_STATUS_SCAN_INTERVAL = 60.0
+
+# Pathspec characters libgit2 treats as patterns, paths with them are committed with a full scan
+_PATHSPEC_SPECIAL_CHARS = frozenset("[]*?\\")
+
+# Seconds before retrying a group commit push that couldn't reach the remote
+GROUP_PUSH_RETRY_DELAY = 10.0
+
+# A shallow clone is deepened by this many commits at first, doubling on each
+# attempt, when it needs history it doesn't have
+SHALLOW_DEEPEN_STEP = 50
+
+# Deepening attempts before fetching the whole history
+_MAX_DEEPEN_ATTEMPTS = 8
+
+# libgit2's fetch depth for converting a shallow clone into a complete one
+_FETCH_DEPTH_UNSHALLOW = 2147483647
+
+# Group commits that can't be rebased onto the remote are kept under this ref prefix
+UNPUSHED_REF_PREFIX = "refs/kiln/unpushed/"
+
+# The commit group commit writes waiting to be pushed sit on, kept so a restart
+# doesn't lose track of them
+PENDING_BASE_REF = "refs/kiln/pending-base"
+
+# Commit message context for group commit writes left unpushed by an earlier session
+_RESTORED_WRITES_CONTEXT = "changes saved before a restart"
+
 _AUTH_ERROR_MARKERS = (
     "authentication",
     "authoriz",
@@ -102,6 +138,18 @@ def reset_committer_cache() -> None:
     _cached_committer_email = None
 
 
+@dataclass
+class SyncStats:
+    """Counters for the traffic with the remote, reported by the sync status API."""
+
+    fetch_count: int = 0
+    fetched_bytes: int = 0
+    # ls-remote style checks of the remote branch, which skip the fetch when it hasn't moved
+    ref_check_count: int = 0
+    # Wall clock time the remote was last confirmed reachable (by a fetch or ref check)
+    last_remote_check: float | None = None
+
+
 class GitSyncManager:
     _GIT_EXECUTOR_TIMEOUT = 30.0
     _WRITE_LOCK_TIMEOUT = 90.0
@@ -113,6 +161,7 @@ class GitSyncManager:
         remote_name: str = "origin",
         pat_token: str | None = None,
         oauth_token: str | None = None,
+        group_commit: GroupCommitSettings | None = None,
     ):
         self._repo_path = repo_path
         self._remote_name = remote_name
@@ -125,6 +174,26 @@ class GitSyncManager:
         self._write_lock = threading.Lock()
         self._repo: pygit2.Repository | None = None
         self._last_sync: float = 0.0
+        # Time of the last full status scan, and whether the tree is known to be
+        # clean since then (only our own commits and resets have touched it)
+        self._last_full_scan: float = 0.0
+        self._known_clean = False
+        # A scoped commit may have left behind files written without being recorded
+        self._unrecorded_writes_possible = False
+        self._group_commit = group_commit or GroupCommitSettings()
+        # Writes committed locally but not pushed yet (group commit only). They sit on
+        # top of _unpushed_base, the HEAD before the first of them.
+        self._unpushed_base: str | None = None
+        self._unpushed_contexts: list[str] = []
+        self._unpushed_file_count = 0
+        self._push_task: asyncio.Task[None] | None = None
+        self._push_now = asyncio.Event()
+        # Whether PENDING_BASE_REF has been read, to pick up an earlier session's writes
+        self._pending_base_checked = False
+        # Refs of group commits kept after a conflict, None until read from the repo
+        self._conflict_refs: list[str] | None = None
+        self.last_push_error: Exception | None = None
+        self.stats = SyncStats()
 
     @property
     def repo_path(self) -> Path:
@@ -176,27 +245,85 @@ class GitSyncManager:
         @no_write_lock endpoints -- never from inside an outer atomic_write
         -- so nesting should not occur in practice.
 
+        With group commit enabled (a non-zero window), the commit is local and
+        the block returns without pushing. Writes within the window (or until
+        max_files have changed) are squashed into one commit and pushed in the
+        background, see push_pending(). Rollback is unchanged: a failed block
+        resets to its own pre-yield HEAD, keeping earlier unpushed writes. The
+        base of the unpushed writes is kept in PENDING_BASE_REF, and the first
+        write after a restart pushes any an earlier session left behind.
+
+        Saves record the paths they write (see track_written_paths), and only
+        those are staged, rather than every file a status scan of the whole repo
+        finds. The full scan still runs when nothing was recorded, after a
+        failure, and at least every FULL_STATUS_SCAN_INTERVAL seconds. A scoped
+        commit doesn't vouch for files written some other way, so the next write
+        checks the whole tree first, and commits any it finds with its own.
+
+        While a group commit that conflicted with the remote is waiting to be
+        resolved (see unpushed_conflicts()), writes raise UnpushedConflictError.
+
         Args:
             context: Descriptive string used in the commit message. Examples:
                 "POST /api/projects/123/tasks", "extraction job for doc 456".
         """
         async with self.write_lock():
+            await self._ensure_no_unpushed_conflicts()
             await self.ensure_clean()
+            if self.has_unpushed_writes and not self.group_commit_enabled:
+                # Group commit writes from an earlier session go out before this one
+                await self._push_pending_locked()
             await self.ensure_fresh()
             pre_head = await self.get_head()
             try:
-                yield
-                if await self.has_dirty_files():
-                    await self.commit_and_push(
-                        context=context,
-                        pre_request_head=pre_head,
-                    )
+                with track_written_paths() as written:
+                    yield
+                # Unless ensure_clean() found files an earlier write didn't record
+                staged_paths = (
+                    self._scoped_pathspecs(written) if self._known_clean else None
+                )
+                if staged_paths is None:
+                    dirty = await self.has_dirty_files()
+                    self._last_full_scan = time.monotonic()
+                else:
+                    dirty = await self._run_git(self._stage_paths, staged_paths) > 0
+                if dirty:
+                    if self.group_commit_enabled:
+                        await self._commit_to_group(
+                            context,
+                            pre_request_head=pre_head,
+                            staged=staged_paths is not None,
+                        )
+                    else:
+                        await self.commit_and_push(
+                            context=context,
+                            pre_request_head=pre_head,
+                            staged=staged_paths is not None,
+                        )
             except Exception:
+                self._known_clean = False
                 await self.rollback(pre_head)
                 raise
+            self._known_clean = staged_paths is None
+            self._unrecorded_writes_possible = staged_paths is not None
 
     async def ensure_clean(self) -> None:
-        if await self._is_clean():
+        # Before crash recovery, so an earlier session's unpushed writes aren't reset
+        await self._restore_pending_writes()
+
+        # After our own full commits the tree is clean, only the repo state needs checking
+        if await self._is_clean(full_scan=not self._known_clean):
+            return
+        self._known_clean = False
+
+        state = await self._run_git(self._get_repo_state)
+        if (
+            self._unrecorded_writes_possible
+            and state == pygit2.enums.RepositoryState.NONE
+        ):
+            # Written by our own earlier saves without being recorded, not crash
+            # debris. The write commits them with a full scan.
+            logger.info("Committing files an earlier save didn't record")
             return
 
         logger.warning("Repo dirty on write request -- running crash recovery")
@@ -205,7 +332,6 @@ class GitSyncManager:
         # has unresolved conflict entries from a mid-rebase crash.
         # _state_cleanup() clears state and hard-resets to HEAD to resolve
         # any conflict entries in the index before stashing.
-        state = await self._run_git(self._get_repo_state)
         if state != pygit2.enums.RepositoryState.NONE:
             logger.warning("Aborting in-progress rebase/merge")
             await self._run_git(self._state_cleanup)
@@ -216,7 +342,10 @@ class GitSyncManager:
                 "[Kiln] Auto-recovery stash -- dirty state from prior session",
             )
 
-        unpushed = await self._count_unpushed_commits()
+        # Our own group commits are waiting to be pushed, they aren't crash debris
+        unpushed = (
+            0 if self.has_unpushed_writes else await self._count_unpushed_commits()
+        )
         if unpushed > 0:
             logger.warning("Resetting %d unpushed commits to match remote", unpushed)
             remote_head = await self._get_remote_head_oid()
@@ -249,7 +378,7 @@ class GitSyncManager:
 
         Unlike ensure_fresh(), this acquires the write lock only for the
         fast-forward step (not the fetch), since reads don't already hold
-        the lock.
+        the lock. A shallow clone is deepened here too, if it needs to be.
         """
         now = time.monotonic()
         if now - self._last_sync < FRESHNESS_THRESHOLD:
@@ -262,6 +391,8 @@ class GitSyncManager:
         except Exception as e:
             raise RemoteUnreachableError(f"Cannot sync with remote: {e}") from e
 
+        await self.deepen_for_shared_history()
+
         if await self.can_fast_forward():
             async with self.write_lock():
                 if await self.can_fast_forward():
@@ -278,8 +409,11 @@ class GitSyncManager:
     async def get_dirty_file_paths(self) -> list[str]:
         return await self._run_git(self._get_dirty_file_paths_sync)
 
-    async def commit_and_push(self, context: str, pre_request_head: str) -> None:
-        commit_oid = await self._run_git(self._create_commit, context)
+    async def commit_and_push(
+        self, context: str, pre_request_head: str, staged: bool = False
+    ) -> None:
+        """Commit and push the dirty files, or with staged=True just the staged ones."""
+        commit_oid = await self._run_git(self._create_commit, context, staged)
         try:
             await self._run_git(self._push_sync)
         except Exception as first_push_error:
@@ -308,6 +442,161 @@ class GitSyncManager:
 
         self._last_sync = time.monotonic()
 
+    @property
+    def group_commit_enabled(self) -> bool:
+        return self._group_commit.window_seconds > 0
+
+    @property
+    def has_unpushed_writes(self) -> bool:
+        return self._unpushed_base is not None
+
+    async def push_pending(self) -> None:
+        """Squash the writes waiting for a group commit into one commit and push it.
+
+        If the remote moved on, the commit is rebased onto it and pushed again. A
+        commit that conflicts is kept under refs/kiln/unpushed/ and the branch is
+        reset to the remote, so no write is lost. Further writes are refused until
+        it's resolved, see unpushed_conflicts(). If the remote can't be reached,
+        the writes stay pending for the next attempt.
+        """
+        async with self.write_lock():
+            await self._push_pending_locked()
+
+    async def _push_pending_locked(self) -> None:
+        if self._unpushed_base is None:
+            return
+        commit_oid = await self._run_git(
+            self._squash_onto,
+            self._unpushed_base,
+            group_commit_context(self._unpushed_contexts),
+        )
+
+        try:
+            await self._run_git(self._push_sync)
+        except Exception as first_push_error:
+            logger.warning(
+                "Group commit push failed, attempting fetch+rebase+retry: %s",
+                first_push_error,
+            )
+            await self.fetch()
+            if not await self._run_git(self._rebase_onto_remote, commit_oid):
+                ref_name = await self._run_git(self._keep_unpushed, commit_oid)
+                await self._clear_unpushed()
+                await self.unpushed_conflicts()
+                raise SyncConflictError(
+                    f"Saved changes conflict with the remote, kept them in {ref_name}"
+                )
+            self._unpushed_base = await self._run_git(self._head_parent_hex)
+            await self._run_git(self._write_pending_base, self._unpushed_base)
+            await self._run_git(self._push_sync)
+
+        await self._clear_unpushed()
+        self.last_push_error = None
+        self._last_sync = time.monotonic()
+
+    async def unpushed_conflicts(self) -> list[str]:
+        """Refs of group commits kept after they conflicted with the remote.
+
+        Writes are refused while any exist. To recover, apply the kept commit to
+        the branch by hand and push it, then delete its ref (see the README).
+        Read from the repo, so refs deleted by hand are noticed.
+        """
+        self._conflict_refs = await self._run_git(self._list_unpushed_refs)
+        return self._conflict_refs
+
+    async def _ensure_no_unpushed_conflicts(self) -> None:
+        # Read once, then again only while there are conflicts, to see them resolved
+        if self._conflict_refs is None or self._conflict_refs:
+            await self.unpushed_conflicts()
+        if self._conflict_refs:
+            raise UnpushedConflictError(
+                "Saved changes conflict with the remote and must be resolved "
+                f"before saving again: {', '.join(self._conflict_refs)}"
+            )
+
+    async def _commit_to_group(
+        self, context: str, pre_request_head: str, staged: bool = False
+    ) -> None:
+        """Commit the block's writes locally, and schedule the push of the group."""
+        if self._unpushed_base is None:
+            # Recorded before the commit, so a crash right after it can't orphan it
+            await self._run_git(self._write_pending_base, pre_request_head)
+        _, file_count = await self._run_git(self._commit_all, context, staged)
+        if self._unpushed_base is None:
+            self._unpushed_base = pre_request_head
+        self._unpushed_contexts.append(context)
+        self._unpushed_file_count += file_count
+
+        if self._unpushed_file_count >= self._group_commit.max_files:
+            self._push_now.set()
+        self._schedule_group_push()
+
+    def _schedule_group_push(self) -> None:
+        if self._push_task is None or self._push_task.done():
+            self._push_task = asyncio.create_task(self._push_group_loop())
+
+    async def _restore_pending_writes(self) -> None:
+        """Pick up group commit writes an earlier session committed but didn't push.
+
+        Their base is kept in PENDING_BASE_REF, so they're squashed from the right
+        commit, and crash recovery doesn't reset them to match the remote.
+        """
+        if self._pending_base_checked:
+            return
+        base = await self._run_git(self._read_pending_base)
+        self._pending_base_checked = True
+        if base is None or self._unpushed_base is not None:
+            return
+        logger.info("Pushing changes saved but not pushed before a restart")
+        self._unpushed_base = base
+        self._unpushed_contexts = [_RESTORED_WRITES_CONTEXT]
+        if self.group_commit_enabled:
+            self._schedule_group_push()
+
+    async def _push_group_loop(self) -> None:
+        delay = self._group_commit.window_seconds
+        while self._unpushed_base is not None:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._push_now.wait(), timeout=delay)
+            self._push_now.clear()
+            try:
+                await self.push_pending()
+                delay = self._group_commit.window_seconds
+            except Exception as e:
+                self.last_push_error = e
+                logger.warning("Group commit push failed, will retry", exc_info=True)
+                delay = max(self._group_commit.window_seconds, GROUP_PUSH_RETRY_DELAY)
+
+    def _scoped_pathspecs(self, written: set[Path]) -> list[str] | None:
+        """Repo relative pathspecs for the recorded writes, or None for a full scan."""
+        if not written:
+            return None
+        if time.monotonic() - self._last_full_scan >= FULL_STATUS_SCAN_INTERVAL:
+            return None
+        root = self._repo_path.resolve()
+        pathspecs: list[str] = []
+        for path in written:
+            try:
+                relative = path.resolve().relative_to(root)
+            except ValueError:
+                # Written outside this repo (e.g. a settings file)
+                continue
+            pathspec = relative.as_posix()
+            if (
+                pathspec == "."
+                or pathspec.startswith("!")
+                or not _PATHSPEC_SPECIAL_CHARS.isdisjoint(pathspec)
+            ):
+                return None
+            pathspecs.append(pathspec)
+        return pathspecs
+
+    async def _clear_unpushed(self) -> None:
+        await self._run_git(self._delete_pending_base)
+        self._unpushed_base = None
+        self._unpushed_contexts = []
+        self._unpushed_file_count = 0
+
     async def rollback(self, pre_request_head: str) -> None:
         state = await self._run_git(self._get_repo_state)
         if state != pygit2.enums.RepositoryState.NONE:
@@ -336,6 +625,56 @@ class GitSyncManager:
                 raise GitAuthError(f"Git authentication failed: {e}") from e
             raise RemoteUnreachableError(f"Cannot sync with remote: {e}") from e
 
+    async def deepen_for_shared_history(self) -> None:
+        """Deepen a shallow clone until HEAD and the remote head share history.
+
+        Shallow clones stop at a cut-off commit. Usually the remote head builds on
+        the local one, but after a force push (or a long time offline) their
+        merge base can be older than the cut-off. Without it, ahead/behind counts
+        are wrong, so fetch more history until it's found, doubling the depth
+        each time and falling back to the full history.
+
+        Call after fetch(), outside the write lock. On a long history these
+        fetches can take a while, so they aren't held to the git operation
+        timeout. Until they're done, the sync checks see diverged history and
+        don't fast-forward.
+        """
+        if not await self._run_git(self._needs_deeper_history_sync):
+            return
+
+        depth = SHALLOW_DEEPEN_STEP
+        for _ in range(_MAX_DEEPEN_ATTEMPTS):
+            logger.info("Deepening shallow clone to %d commits", depth)
+            await self._deepen(depth)
+            if not await self._run_git(self._needs_deeper_history_sync):
+                return
+            depth *= 2
+
+        logger.info("Fetching the full history of shallow clone")
+        await self._deepen(_FETCH_DEPTH_UNSHALLOW)
+
+    async def _deepen(self, depth: int) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._git_executor, self._deepen_sync, depth)
+        except pygit2.GitError as e:
+            if _is_auth_error(e):
+                raise GitAuthError(f"Git authentication failed: {e}") from e
+            raise RemoteUnreachableError(f"Cannot sync with remote: {e}") from e
+
+    async def remote_branch_moved(self) -> bool:
+        """Check if the remote branch differs from our tracking ref, without fetching.
+
+        Lists the remote refs (like git ls-remote), which is much cheaper than a
+        fetch. True when the branch moved, or can't be compared.
+        """
+        try:
+            return await self._run_git(self._remote_branch_moved_sync)
+        except pygit2.GitError as e:
+            if _is_auth_error(e):
+                raise GitAuthError(f"Git authentication failed: {e}") from e
+            raise RemoteUnreachableError(f"Cannot sync with remote: {e}") from e
+
     async def has_new_remote_commits(self) -> bool:
         return await self._run_git(self._has_new_remote_commits_sync)
 
@@ -346,7 +685,23 @@ class GitSyncManager:
         await self._run_git(self._fast_forward_sync)
         self._last_sync = time.monotonic()
 
+    async def flush(self) -> None:
+        """Push pending group commit writes now instead of after the window."""
+        if self._push_task is not None:
+            self._push_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._push_task
+            self._push_task = None
+        if self._unpushed_base is not None:
+            try:
+                await self.push_pending()
+            except Exception as e:
+                # The commits stay local, and are pushed after the next save
+                self.last_push_error = e
+                logger.warning("Failed to push pending writes", exc_info=True)
+
     async def close(self) -> None:
+        await self.flush()
         self._git_executor.shutdown(wait=True)
         if self._repo is not None:
             self._repo.free()
@@ -421,31 +776,135 @@ class GitSyncManager:
         oid = pygit2.Oid(hex=hex_str)
         self._hard_reset(oid)
 
-    def _create_commit(self, context: str) -> pygit2.Oid:
+    def _create_commit(self, context: str, staged: bool = False) -> pygit2.Oid:
+        commit_oid, _ = self._commit_all(context, staged)
+        return commit_oid
+
+    def _stage_paths(self, pathspecs: list[str]) -> int:
+        """Stage the files under each pathspec, returning the number of staged changes.
+
+        One add_all per pathspec, so libgit2 only walks that part of the working
+        tree. Deleted files under a pathspec are removed from the index.
+        """
         repo = self._get_repo()
+        index = repo.index
+        for pathspec in pathspecs:
+            index.add_all([pathspec])
+        index.write()
+        return self._count_staged()
 
-        status = repo.status()
-        file_count = sum(
-            1
-            for flags in status.values()
-            if flags != pygit2.enums.FileStatus.IGNORED
-            and flags != pygit2.enums.FileStatus.CURRENT
-        )
+    def _count_staged(self) -> int:
+        repo = self._get_repo()
+        head_tree = repo.head.peel(pygit2.Commit).tree
+        return len(repo.index.diff_to_tree(head_tree))
+
+    def _commit_all(self, context: str, staged: bool = False) -> tuple[pygit2.Oid, int]:
+        """Commit every dirty file, returning the commit and the number of files.
+
+        With staged=True, commits what _stage_paths staged and skips the status scan.
+        """
+        repo = self._get_repo()
+        index = repo.index
+
+        if staged:
+            file_count = self._count_staged()
+        else:
+            status = repo.status()
+            file_count = sum(
+                1
+                for flags in status.values()
+                if flags != pygit2.enums.FileStatus.IGNORED
+                and flags != pygit2.enums.FileStatus.CURRENT
+            )
         if file_count == 0:
             raise CorruptRepoError(
                 "_create_commit called with no dirty files -- this is a bug"
             )
 
-        index = repo.index
-        index.add_all()
-        index.write()
+        if not staged:
+            index.add_all()
+            index.write()
         tree = index.write_tree()
 
         message = generate_commit_message(file_count, context)
         sig = pygit2.Signature(get_committer_name(), get_committer_email())
 
         parents = [repo.head.target]
-        return repo.create_commit(repo.head.name, sig, sig, message, tree, parents)
+        commit_oid = repo.create_commit(
+            repo.head.name, sig, sig, message, tree, parents
+        )
+        return commit_oid, file_count
+
+    def _squash_onto(self, base_hex: str, context: str) -> pygit2.Oid:
+        """Replace the commits since base with one commit of HEAD's tree."""
+        repo = self._get_repo()
+        head = repo.head.peel(pygit2.Commit)
+        base_oid = pygit2.Oid(hex=base_hex)
+        if head.parent_ids == [base_oid]:
+            return head.id
+        base = repo[base_oid].peel(pygit2.Commit)
+        file_count = len(repo.diff(base.tree, head.tree))
+        message = generate_commit_message(file_count, context)
+        sig = pygit2.Signature(get_committer_name(), get_committer_email())
+        commit_oid = repo.create_commit(
+            None, sig, sig, message, head.tree_id, [base_oid]
+        )
+        # Same tree, so the working directory and index are already up to date
+        repo.head.set_target(commit_oid)
+        return commit_oid
+
+    def _head_parent_hex(self) -> str:
+        repo = self._get_repo()
+        return str(repo.head.peel(pygit2.Commit).parent_ids[0])
+
+    def _keep_unpushed(self, commit_oid: pygit2.Oid) -> str:
+        repo = self._get_repo()
+        ref_name = f"{UNPUSHED_REF_PREFIX}{commit_oid}"
+        repo.references.create(ref_name, commit_oid, force=True)
+        return ref_name
+
+    def _write_pending_base(self, base_hex: str) -> None:
+        repo = self._get_repo()
+        repo.references.create(PENDING_BASE_REF, pygit2.Oid(hex=base_hex), force=True)
+
+    def _delete_pending_base(self) -> None:
+        repo = self._get_repo()
+        ref = repo.references.get(PENDING_BASE_REF)
+        if ref is not None:
+            ref.delete()
+
+    def _read_pending_base(self) -> str | None:
+        """The base of group commit writes left unpushed, if they're still on the branch."""
+        repo = self._get_repo()
+        ref = repo.references.get(PENDING_BASE_REF)
+        if ref is None:
+            return None
+        base = ref.target
+        head = repo.head.target
+        remote_ref = repo.references.get(
+            f"refs/remotes/{self._remote_name}/{repo.head.shorthand}"
+        )
+        if (
+            head == base
+            or not repo.descendant_of(head, base)
+            or (
+                remote_ref is not None
+                and (
+                    remote_ref.target == head
+                    or repo.descendant_of(remote_ref.target, head)
+                )
+            )
+        ):
+            # Pushed (or reset) before the ref could be deleted
+            ref.delete()
+            return None
+        return str(base)
+
+    def _list_unpushed_refs(self) -> list[str]:
+        repo = self._get_repo()
+        return sorted(
+            name for name in repo.references if name.startswith(UNPUSHED_REF_PREFIX)
+        )
 
     def _push_sync(self) -> None:
         from app.desktop.git_sync.clone import make_push_callbacks
@@ -466,7 +925,50 @@ class GitSyncManager:
         repo = self._get_repo()
         remote = repo.remotes[self._remote_name]
         callbacks = self._make_remote_callbacks()
-        remote.fetch(callbacks=callbacks)
+        progress = remote.fetch(callbacks=callbacks)
+        self.stats.fetch_count += 1
+        self.stats.fetched_bytes += progress.received_bytes
+        self.stats.last_remote_check = time.time()
+
+    def _deepen_sync(self, depth: int) -> None:
+        repo = self._get_repo()
+        remote = repo.remotes[self._remote_name]
+        callbacks = self._make_remote_callbacks()
+        progress = remote.fetch(callbacks=callbacks, depth=depth)
+        self.stats.fetch_count += 1
+        self.stats.fetched_bytes += progress.received_bytes
+
+    def _needs_deeper_history_sync(self) -> bool:
+        """Whether a shallow clone is missing the merge base of HEAD and the remote."""
+        repo = self._get_repo()
+        if not repo.is_shallow:
+            return False
+        branch_name = repo.head.shorthand
+        ref = repo.references.get(f"refs/remotes/{self._remote_name}/{branch_name}")
+        if ref is None or ref.target == repo.head.target:
+            return False
+        return repo.merge_base(repo.head.target, ref.target) is None
+
+    def _remote_branch_moved_sync(self) -> bool:
+        repo = self._get_repo()
+        branch_name = repo.head.shorthand
+        remote = repo.remotes[self._remote_name]
+        heads = remote.ls_remotes(callbacks=self._make_remote_callbacks())
+        self.stats.ref_check_count += 1
+        self.stats.last_remote_check = time.time()
+
+        remote_oid = next(
+            (
+                head["oid"]
+                for head in heads
+                if head.get("name") == f"refs/heads/{branch_name}"
+            ),
+            None,
+        )
+        ref = repo.references.get(f"refs/remotes/{self._remote_name}/{branch_name}")
+        if remote_oid is None or ref is None:
+            return True
+        return ref.target != remote_oid
 
     async def _get_remote_head_oid(self) -> pygit2.Oid:
         return await self._run_git(self._get_remote_head_oid_sync)
@@ -508,11 +1010,18 @@ class GitSyncManager:
         ahead, _ = repo.ahead_behind(local_oid, remote_oid)
         return ahead
 
-    async def _is_clean(self) -> bool:
+    async def _is_clean(self, full_scan: bool = True) -> bool:
         state = await self._run_git(self._get_repo_state)
         if state != pygit2.enums.RepositoryState.NONE:
             return False
-        return not await self.has_dirty_files()
+        if not full_scan:
+            return True
+        clean = not await self.has_dirty_files()
+        if clean:
+            self._last_full_scan = time.monotonic()
+            self._known_clean = True
+            self._unrecorded_writes_possible = False
+        return clean
 
     def _has_new_remote_commits_sync(self) -> bool:
         repo = self._get_repo()
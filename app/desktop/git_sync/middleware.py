@@ -19,6 +19,7 @@ from app.desktop.git_sync.errors import (
     GitSyncError,
     RemoteUnreachableError,
     SyncConflictError,
+    UnpushedConflictError,
     WriteLockTimeoutError,
 )
 from app.desktop.git_sync.git_sync_manager import GitSyncManager
@@ -56,6 +57,11 @@ ERROR_MAP: dict[type[GitSyncError], tuple[int, str]] = {
         503,
         "Cannot sync with remote. Check your connection.",
     ),
+    UnpushedConflictError: (
+        409,
+        "Saved changes conflict with the remote and must be resolved before "
+        "saving again. See the git sync status for details.",
+    ),
     SyncConflictError: (
         409,
         "There was a problem saving. Please try again.",
@@ -5,7 +5,7 @@ import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
-from app.desktop.git_sync.config import AuthMode
+from app.desktop.git_sync.config import AuthMode, GroupCommitSettings
 from app.desktop.git_sync.git_sync_manager import GitSyncManager
 
 if TYPE_CHECKING:
@@ -53,6 +53,7 @@ class GitSyncRegistry:
                     pat_token=pat_token,
                     oauth_token=oauth_token,
                     auth_mode=auth_mode,
+                    group_commit=GroupCommitSettings.from_config(),
                 )
                 cls._managers[resolved] = manager
             else:
@@ -105,6 +106,7 @@ class GitSyncRegistry:
         if bg_sync is not None:
             await bg_sync.stop()
         if manager is not None:
+            await manager.flush()
             manager._git_executor.shutdown(wait=False)
 
     @classmethod
@@ -183,3 +183,103 @@ async def test_fetch_failure_logs_and_retries(manager, git_repos, second_clone,
 
     assert call_count >= 2
     assert (local_path / "retry_file.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_poll_skips_fetch_when_remote_unchanged(manager):
+    bg = BackgroundSync(manager, poll_interval=0.05, idle_pause_after=60.0)
+
+    assert await bg._poll_once() is False
+    assert bg.skipped_fetch_count == 1
+    assert manager.stats.ref_check_count == 1
+    assert manager.stats.fetch_count == 0
+    assert manager.stats.last_remote_check is not None
+
+
+@pytest.mark.asyncio
+async def test_poll_fetches_when_remote_moved(manager, git_repos, second_clone):
+    local_path, _ = git_repos
+    commit_in_repo(second_clone, "moved.txt", "data", "remote commit")
+    push_from(second_clone)
+    bg = BackgroundSync(manager, poll_interval=0.05, idle_pause_after=60.0)
+
+    assert await bg._poll_once() is True
+    assert bg.skipped_fetch_count == 0
+    assert manager.stats.fetch_count == 1
+    assert manager.stats.fetched_bytes > 0
+    assert (local_path / "moved.txt").exists()
+
+    # caught up, so the next poll only checks the ref
+    assert await bg._poll_once() is False
+    assert manager.stats.fetch_count == 1
+    assert bg.skipped_fetch_count == 1
+
+
+@pytest.mark.asyncio
+async def test_poll_deepens_shallow_clone_outside_write_lock(manager, second_clone):
+    commit_in_repo(second_clone, "moved.txt", "data", "remote commit")
+    push_from(second_clone)
+    bg = BackgroundSync(manager, poll_interval=0.05, idle_pause_after=60.0)
+    lock_held_while_deepening: list[bool] = []
+
+    async def deepen():
+        lock_held_while_deepening.append(manager._write_lock.locked())
+
+    manager.deepen_for_shared_history = deepen  # type: ignore[assignment]
+
+    assert await bg._poll_once() is True
+    assert lock_held_while_deepening == [False]
+
+
+@pytest.mark.asyncio
+async def test_poll_interval_backs_off_when_quiet(manager):
+    bg = BackgroundSync(
+        manager,
+        poll_interval=0.02,
+        idle_pause_after=60.0,
+        max_poll_interval=0.08,
+        jitter=0.0,
+    )
+    await bg.start()
+    try:
+        await asyncio.sleep(0.3)
+        assert bg.current_poll_interval == 0.08
+        assert bg.running
+    finally:
+        await bg.stop()
+    assert not bg.running
+    assert bg.skipped_fetch_count >= 2
+
+
+@pytest.mark.asyncio
+async def test_notify_request_shortens_poll_interval(manager):
+    bg = BackgroundSync(
+        manager, poll_interval=10.0, idle_pause_after=60.0, active_poll_interval=0.05
+    )
+    await bg.start()
+    try:
+        await asyncio.sleep(0.05)
+        assert manager.stats.ref_check_count == 0
+
+        # a request cuts the 10s sleep short
+        bg.notify_request()
+        assert bg.current_poll_interval == 0.05
+        await asyncio.sleep(0.3)
+        assert manager.stats.ref_check_count >= 1
+    finally:
+        await bg.stop()
+
+
+@pytest.mark.asyncio
+async def test_paused_while_idle(manager):
+    bg = BackgroundSync(manager, poll_interval=0.02, idle_pause_after=0.05)
+    await bg.start()
+    try:
+        await asyncio.sleep(0.3)
+        assert bg.paused
+
+        bg.notify_request()
+        await asyncio.sleep(0.01)
+        assert not bg.paused
+    finally:
+        await bg.stop()
@@ -463,6 +463,33 @@ class TestCloneRepoFreesRepository:
         mock_repo.free.assert_called_once()
 
 
+class TestCloneRepoDepth:
+    def _clone(self, **kwargs) -> MagicMock:
+        with (
+            patch("app.desktop.git_sync.clone.make_credentials"),
+            patch(
+                "app.desktop.git_sync.clone.pygit2.clone_repository",
+                return_value=MagicMock(),
+            ) as mock_clone,
+            patch("app.desktop.git_sync.clone._ensure_gitignore"),
+        ):
+            clone_repo(
+                "https://github.com/org/repo.git",
+                Path("/tmp/clone"),
+                "main",
+                **kwargs,
+            )
+        return mock_clone
+
+    def test_full_clone_by_default(self):
+        mock_clone = self._clone()
+        assert mock_clone.call_args.kwargs["depth"] == 0
+
+    def test_shallow_clone_with_depth(self):
+        mock_clone = self._clone(depth=5)
+        assert mock_clone.call_args.kwargs["depth"] == 5
+
+
 class TestTestWriteAccessFreesRepository:
     def _make_mock_repo(self) -> MagicMock:
         mock_repo = MagicMock()
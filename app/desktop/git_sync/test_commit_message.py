@@ -1,4 +1,8 @@
-from app.desktop.git_sync.commit_message import generate_commit_message
+from app.desktop.git_sync.commit_message import (
+    MAX_GROUP_COMMIT_CONTEXTS,
+    generate_commit_message,
+    group_commit_context,
+)
 
 
 def test_generate_commit_message_single_file():
@@ -20,3 +24,17 @@ def test_generate_commit_message_includes_context():
     msg = generate_commit_message(2, "DELETE /api/projects/xyz/tasks/789")
     assert "Context: DELETE /api/projects/xyz/tasks/789" in msg
     assert msg.startswith("[Kiln] Auto-sync:")
+
+
+def test_group_commit_context_dedupes_contexts():
+    assert group_commit_context(["POST /a", "PATCH /b", "POST /a"]) == (
+        "POST /a; PATCH /b"
+    )
+
+
+def test_group_commit_context_is_capped():
+    contexts = [f"POST /api/runs/{i}" for i in range(MAX_GROUP_COMMIT_CONTEXTS + 5)]
+    context = group_commit_context(contexts)
+    assert context.startswith("POST /api/runs/0; POST /api/runs/1;")
+    assert f"POST /api/runs/{MAX_GROUP_COMMIT_CONTEXTS - 1}; and 5 more" in context
+    assert f"POST /api/runs/{MAX_GROUP_COMMIT_CONTEXTS}" not in context
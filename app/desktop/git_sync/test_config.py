@@ -1,7 +1,11 @@
+import os
 from unittest.mock import patch
 
+from kiln_ai.utils.config import Config
+
 from app.desktop.git_sync.config import (
     GitSyncProjectConfig,
+    GroupCommitSettings,
     delete_git_sync_config,
     get_git_sync_config,
     save_git_sync_config,
@@ -191,3 +195,33 @@ def test_get_git_sync_config_defaults_oauth_token():
 
     assert result is not None
     assert result["oauth_token"] is None
+
+
+def test_group_commit_settings_from_config(caplog):
+    with patch.object(Config, "_shared_instance", Config()):
+        assert GroupCommitSettings.from_config() == GroupCommitSettings()
+        assert GroupCommitSettings.from_config().window_seconds == 0
+
+    with patch.dict(
+        os.environ,
+        {
+            "KILN_GIT_SYNC_GROUP_COMMIT_WINDOW_MS": "250",
+            "KILN_GIT_SYNC_GROUP_COMMIT_MAX_FILES": "50",
+        },
+    ):
+        with patch.object(Config, "_shared_instance", Config()):
+            assert GroupCommitSettings.from_config() == GroupCommitSettings(
+                window_seconds=0.25, max_files=50
+            )
+
+    with patch.dict(
+        os.environ,
+        {
+            "KILN_GIT_SYNC_GROUP_COMMIT_WINDOW_MS": "-1",
+            "KILN_GIT_SYNC_GROUP_COMMIT_MAX_FILES": "0",
+        },
+    ):
+        with patch.object(Config, "_shared_instance", Config()):
+            assert GroupCommitSettings.from_config() == GroupCommitSettings()
+    assert "Invalid git_sync_group_commit_window_ms" in caplog.text
+    assert "Invalid git_sync_group_commit_max_files" in caplog.text
@@ -1,4 +1,5 @@
 import json
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,6 +10,7 @@ from kiln_ai.utils.config import Config
 from kiln_ai.utils.project_utils import DuplicateProjectError
 
 from app.desktop.git_sync.git_sync_api import connect_git_sync_api
+from app.desktop.git_sync.git_sync_manager import SyncStats
 
 
 @pytest.fixture
@@ -141,6 +143,41 @@ class TestClone:
         assert data["success"] is True
         assert data["clone_path"] == str(expected_clone)
 
+    def test_passes_depth(self, api_client, tmp_path):
+        with (
+            patch(
+                "app.desktop.git_sync.git_sync_api.default_project_path"
+            ) as mock_path,
+            patch("app.desktop.git_sync.git_sync_api.clone_repo") as mock_clone,
+            patch(
+                "app.desktop.git_sync.git_sync_api.compute_temp_clone_path"
+            ) as mock_compute,
+        ):
+            mock_path.return_value = str(tmp_path)
+            mock_compute.return_value = tmp_path / "kiln_clone_abc123"
+
+            resp = api_client.post(
+                "/api/git_sync/clone",
+                json={
+                    "git_url": "https://github.com/test/repo.git",
+                    "branch": "main",
+                    "depth": 10,
+                },
+            )
+        assert resp.json()["success"] is True
+        assert mock_clone.call_args.args[-1] == 10
+
+    def test_rejects_invalid_depth(self, api_client):
+        resp = api_client.post(
+            "/api/git_sync/clone",
+            json={
+                "git_url": "https://github.com/test/repo.git",
+                "branch": "main",
+                "depth": 0,
+            },
+        )
+        assert resp.status_code == 422
+
     def test_auth_error_returns_401(self, api_client, tmp_path):
         with (
             patch(
@@ -571,6 +608,105 @@ class TestSaveAndGetConfig:
         assert resp.status_code == 404
 
 
+_STATUS_CONFIG = {
+    "sync_mode": "auto",
+    "auth_mode": "system_keys",
+    "remote_name": "origin",
+    "branch": "main",
+    "clone_path": "/tmp/clone",
+    "git_url": "https://github.com/test/repo.git",
+    "pat_token": None,
+}
+
+
+class TestGetStatus:
+    def test_status_with_background_sync(self, api_client):
+        manager = MagicMock()
+        manager.repo_path = Path("/tmp/clone")
+        manager.stats = SyncStats(
+            fetch_count=3,
+            fetched_bytes=2048,
+            ref_check_count=10,
+            last_remote_check=time.time() - 5,
+        )
+        manager.has_unpushed_writes = False
+        manager.unpushed_conflicts = AsyncMock(
+            return_value=["refs/kiln/unpushed/abc123"]
+        )
+        bg_sync = MagicMock()
+        bg_sync.running = True
+        bg_sync.paused = False
+        bg_sync.current_poll_interval = 20.0
+        bg_sync.skipped_fetch_count = 7
+        with (
+            patch(
+                "app.desktop.git_sync.git_sync_api.project_path_from_id",
+                return_value="/tmp/clone/project.kiln",
+            ),
+            patch(
+                "app.desktop.git_sync.git_sync_api.get_git_sync_config",
+                return_value=_STATUS_CONFIG,
+            ),
+            patch(
+                "app.desktop.git_sync.git_sync_api.GitSyncRegistry.get_manager",
+                return_value=manager,
+            ),
+            patch(
+                "app.desktop.git_sync.git_sync_api.GitSyncRegistry.get_background_sync",
+                return_value=bg_sync,
+            ),
+        ):
+            resp = api_client.get("/api/git_sync/status/proj1")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["active"] is True
+        assert data["background_sync_running"] is True
+        assert data["poll_interval_seconds"] == 20.0
+        assert data["fetch_count"] == 3
+        assert data["fetched_bytes"] == 2048
+        assert data["ref_check_count"] == 10
+        assert data["skipped_fetch_count"] == 7
+        assert 5 <= data["seconds_since_remote_check"] < 60
+        assert data["has_unpushed_writes"] is False
+        assert data["unpushed_conflicts"] == ["refs/kiln/unpushed/abc123"]
+
+    def test_status_without_manager(self, api_client):
+        with (
+            patch(
+                "app.desktop.git_sync.git_sync_api.project_path_from_id",
+                return_value="/tmp/clone/project.kiln",
+            ),
+            patch(
+                "app.desktop.git_sync.git_sync_api.get_git_sync_config",
+                return_value=_STATUS_CONFIG,
+            ),
+            patch(
+                "app.desktop.git_sync.git_sync_api.GitSyncRegistry.get_manager",
+                return_value=None,
+            ),
+        ):
+            resp = api_client.get("/api/git_sync/status/proj1")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["active"] is False
+        assert data["fetch_count"] == 0
+        assert data["seconds_since_remote_check"] is None
+
+    def test_status_no_sync_config(self, api_client):
+        with (
+            patch(
+                "app.desktop.git_sync.git_sync_api.project_path_from_id",
+                return_value="/tmp/clone/project.kiln",
+            ),
+            patch(
+                "app.desktop.git_sync.git_sync_api.get_git_sync_config",
+                return_value=None,
+            ),
+        ):
+            resp = api_client.get("/api/git_sync/status/proj1")
+        assert resp.status_code == 404
+
+
 class TestUpdateConfig:
     def test_toggle_mode(self, api_client):
         existing = {
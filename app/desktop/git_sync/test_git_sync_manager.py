@@ -1,19 +1,27 @@
 import asyncio
 import time
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pygit2
 import pygit2.enums
 import pytest
+from kiln_ai.utils.git_sync_protocols import record_written_path
 
+from app.desktop.git_sync.config import GroupCommitSettings
 from app.desktop.git_sync.conftest import _test_sig, commit_in_repo, push_from
 from app.desktop.git_sync.errors import (
     GitAuthError,
     RemoteUnreachableError,
     SyncConflictError,
+    UnpushedConflictError,
     WriteLockTimeoutError,
 )
 from app.desktop.git_sync.git_sync_manager import (
+    FULL_STATUS_SCAN_INTERVAL,
+    PENDING_BASE_REF,
+    SHALLOW_DEEPEN_STEP,
+    UNPUSHED_REF_PREFIX,
     GitSyncManager,
     _is_auth_error,
     get_committer_email,
@@ -436,6 +444,132 @@ async def test_write_lock_serialization(manager):
     assert order[3] == "b_end"
 
 
+# --- remote_branch_moved ---
+
+
+@pytest.mark.asyncio
+async def test_remote_branch_moved_false_when_up_to_date(manager):
+    assert await manager.remote_branch_moved() is False
+    assert manager.stats.ref_check_count == 1
+    assert manager.stats.fetch_count == 0
+
+
+@pytest.mark.asyncio
+async def test_remote_branch_moved_until_fetched(manager, second_clone):
+    commit_in_repo(second_clone, "new.txt", "data", "new commit")
+    push_from(second_clone)
+
+    assert await manager.remote_branch_moved() is True
+    await manager.fetch()
+    assert await manager.remote_branch_moved() is False
+    assert manager.stats.fetch_count == 1
+    assert manager.stats.fetched_bytes > 0
+
+
+@pytest.mark.asyncio
+async def test_remote_branch_moved_unreachable(manager, git_repos):
+    local_path, remote_path = git_repos
+    repo = pygit2.Repository(str(local_path))
+    repo.remotes.set_url("origin", str(remote_path.parent / "missing.git"))
+
+    with pytest.raises(RemoteUnreachableError):
+        await manager.remote_branch_moved()
+
+
+# --- shallow clones ---
+
+
+def test_needs_deeper_history_skips_complete_clones(manager):
+    repo = MagicMock()
+    repo.is_shallow = False
+    with patch.object(manager, "_get_repo", return_value=repo):
+        assert manager._needs_deeper_history_sync() is False
+    repo.merge_base.assert_not_called()
+
+
+def test_needs_deeper_history_without_merge_base(manager):
+    repo = MagicMock()
+    repo.is_shallow = True
+    repo.merge_base.return_value = None
+    with patch.object(manager, "_get_repo", return_value=repo):
+        assert manager._needs_deeper_history_sync() is True
+    repo.merge_base.return_value = "base"
+    with patch.object(manager, "_get_repo", return_value=repo):
+        assert manager._needs_deeper_history_sync() is False
+
+
+@pytest.mark.asyncio
+async def test_deepen_until_merge_base(manager):
+    with (
+        patch.object(
+            manager, "_needs_deeper_history_sync", side_effect=[True, True, False]
+        ),
+        patch.object(manager, "_deepen_sync") as deepen,
+    ):
+        await manager.deepen_for_shared_history()
+    assert [c.args[0] for c in deepen.call_args_list] == [
+        SHALLOW_DEEPEN_STEP,
+        SHALLOW_DEEPEN_STEP * 2,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_deepen_falls_back_to_full_history(manager):
+    with (
+        patch.object(manager, "_needs_deeper_history_sync", return_value=True),
+        patch.object(manager, "_deepen_sync") as deepen,
+    ):
+        await manager.deepen_for_shared_history()
+    depths = [c.args[0] for c in deepen.call_args_list]
+    assert depths[0] == SHALLOW_DEEPEN_STEP
+    assert depths[-1] == 2147483647
+
+
+@pytest.mark.asyncio
+async def test_deepen_is_not_held_to_the_git_timeout(manager):
+    manager._GIT_EXECUTOR_TIMEOUT = 0.05
+
+    def slow_deepen(depth):
+        time.sleep(0.2)
+
+    with (
+        patch.object(manager, "_needs_deeper_history_sync", side_effect=[True, False]),
+        patch.object(manager, "_deepen_sync", side_effect=slow_deepen) as deepen,
+    ):
+        await manager.deepen_for_shared_history()
+    deepen.assert_called_once_with(SHALLOW_DEEPEN_STEP)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "message,error",
+    [
+        ("HTTP 401 Unauthorized", GitAuthError),
+        ("could not resolve host", RemoteUnreachableError),
+    ],
+)
+async def test_deepen_maps_fetch_errors(manager, message, error):
+    with (
+        patch.object(manager, "_needs_deeper_history_sync", return_value=True),
+        patch.object(manager, "_deepen_sync", side_effect=pygit2.GitError(message)),
+        pytest.raises(error),
+    ):
+        await manager.deepen_for_shared_history()
+
+
+@pytest.mark.asyncio
+async def test_sync_checks_work_on_unshallow_repo(manager, second_clone):
+    # a full clone never deepens, even when the remote moved
+    commit_in_repo(second_clone, "new.txt", "data", "new commit")
+    push_from(second_clone)
+    await manager.fetch()
+    with patch.object(manager, "_deepen_sync") as deepen:
+        await manager.deepen_for_shared_history()
+        assert await manager.can_fast_forward() is True
+        assert await manager.has_new_remote_commits() is True
+    deepen.assert_not_called()
+
+
 # --- has_new_remote_commits ---
 
 
@@ -513,6 +647,455 @@ async def test_atomic_write_context_in_commit_message(manager, git_repos):
     assert "Context: unique-ctx-string-123" in head_commit.message
 
 
+# --- group commit ---
+
+
+@pytest.fixture
+def group_manager(git_repos):
+    local_path, _ = git_repos
+    mgr = GitSyncManager(
+        repo_path=local_path,
+        auth_mode="system_keys",
+        group_commit=GroupCommitSettings(window_seconds=60.0, max_files=100),
+    )
+    yield mgr
+    if mgr._push_task is not None:
+        mgr._push_task.cancel()
+    mgr._git_executor.shutdown(wait=True)
+    if mgr._repo is not None:
+        mgr._repo.free()
+        mgr._repo = None
+
+
+def _remote_head(remote_path: Path) -> pygit2.Commit:
+    commit = pygit2.Repository(str(remote_path)).revparse_single("refs/heads/main")
+    assert isinstance(commit, pygit2.Commit)
+    return commit
+
+
+@pytest.mark.asyncio
+async def test_group_commit_coalesces_writes_into_one_push(group_manager, git_repos):
+    local_path, remote_path = git_repos
+    initial = _remote_head(remote_path)
+
+    for i in range(3):
+        async with group_manager.atomic_write(f"POST /api/runs/{i}"):
+            _write_file(local_path, f"run_{i}.kiln", f"run {i}")
+
+    # committed locally, not pushed yet
+    assert await group_manager.has_dirty_files() is False
+    assert group_manager.has_unpushed_writes
+    assert _remote_head(remote_path).id == initial.id
+
+    await group_manager.flush()
+    assert not group_manager.has_unpushed_writes
+    pushed = _remote_head(remote_path)
+    assert str(pushed.id) == await group_manager.get_head()
+    assert pushed.parent_ids == [initial.id]
+    assert {entry.name for entry in pushed.tree} >= {
+        "run_0.kiln",
+        "run_1.kiln",
+        "run_2.kiln",
+    }
+    assert "3 files changed" in pushed.message
+    assert "POST /api/runs/0; POST /api/runs/1; POST /api/runs/2" in pushed.message
+
+
+@pytest.mark.asyncio
+async def test_group_commit_rolls_back_only_the_failed_write(group_manager, git_repos):
+    local_path, remote_path = git_repos
+
+    async with group_manager.atomic_write("kept"):
+        _write_file(local_path, "kept.kiln", "kept")
+    kept_head = await group_manager.get_head()
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async with group_manager.atomic_write("failed"):
+            _write_file(local_path, "failed.kiln", "nope")
+            raise RuntimeError("boom")
+
+    assert await group_manager.get_head() == kept_head
+    assert (local_path / "kept.kiln").exists()
+    assert not (local_path / "failed.kiln").exists()
+
+    await group_manager.flush()
+    assert str(_remote_head(remote_path).id) == kept_head
+
+
+@pytest.mark.asyncio
+async def test_group_commit_pushes_when_max_files_reached(git_repos):
+    local_path, remote_path = git_repos
+    mgr = GitSyncManager(
+        repo_path=local_path,
+        auth_mode="system_keys",
+        group_commit=GroupCommitSettings(window_seconds=60.0, max_files=2),
+    )
+    async with mgr.atomic_write("first"):
+        _write_file(local_path, "a.kiln")
+    assert mgr._push_task is not None
+    await asyncio.sleep(0.05)
+    assert mgr.has_unpushed_writes
+
+    async with mgr.atomic_write("second"):
+        _write_file(local_path, "b.kiln")
+    await asyncio.wait_for(mgr._push_task, 5)
+    assert not mgr.has_unpushed_writes
+    assert str(_remote_head(remote_path).id) == await mgr.get_head()
+    await mgr.close()
+
+
+@pytest.mark.asyncio
+async def test_group_commit_pushes_after_the_window(git_repos):
+    local_path, remote_path = git_repos
+    mgr = GitSyncManager(
+        repo_path=local_path,
+        auth_mode="system_keys",
+        group_commit=GroupCommitSettings(window_seconds=0.05),
+    )
+    async with mgr.atomic_write("windowed"):
+        _write_file(local_path, "a.kiln")
+    assert mgr._push_task is not None
+    await asyncio.wait_for(mgr._push_task, 5)
+    assert str(_remote_head(remote_path).id) == await mgr.get_head()
+    await mgr.close()
+
+
+@pytest.mark.asyncio
+async def test_group_commit_rebases_onto_new_remote_commits(
+    group_manager, git_repos, second_clone
+):
+    local_path, remote_path = git_repos
+    async with group_manager.atomic_write("local"):
+        _write_file(local_path, "local.kiln", "local")
+
+    commit_in_repo(second_clone, "remote.kiln", "remote", "Remote change")
+    push_from(second_clone)
+    remote_before = _remote_head(remote_path)
+
+    await group_manager.flush()
+    pushed = _remote_head(remote_path)
+    assert pushed.parent_ids == [remote_before.id]
+    assert {"local.kiln", "remote.kiln"} <= {entry.name for entry in pushed.tree}
+    assert not group_manager.has_unpushed_writes
+
+
+@pytest.mark.asyncio
+async def test_group_commit_conflict_keeps_writes_in_a_ref(
+    group_manager, git_repos, second_clone
+):
+    local_path, remote_path = git_repos
+    async with group_manager.atomic_write("local"):
+        _write_file(local_path, "README.md", "local edit")
+    local_commit = await group_manager.get_head()
+
+    commit_in_repo(second_clone, "README.md", "remote edit", "Remote edit")
+    push_from(second_clone)
+
+    with pytest.raises(SyncConflictError, match="refs/kiln/unpushed/"):
+        await group_manager.push_pending()
+
+    # the branch matches the remote again, and the write is kept in a ref
+    assert await group_manager.get_head() == str(_remote_head(remote_path).id)
+    assert not group_manager.has_unpushed_writes
+    repo = pygit2.Repository(str(local_path))
+    kept = [r for r in repo.references if r.startswith(UNPUSHED_REF_PREFIX)]
+    assert kept == [f"{UNPUSHED_REF_PREFIX}{local_commit}"]
+    assert await group_manager.unpushed_conflicts() == kept
+
+    # saves are refused until the conflict is resolved
+    with pytest.raises(UnpushedConflictError, match=kept[0]):
+        async with group_manager.atomic_write("blocked"):
+            _write_file(local_path, "blocked.kiln")
+    assert not (local_path / "blocked.kiln").exists()
+
+    repo.references.delete(kept[0])
+    async with group_manager.atomic_write("resolved"):
+        _write_file(local_path, "resolved.kiln")
+    assert await group_manager.unpushed_conflicts() == []
+
+
+@pytest.mark.asyncio
+async def test_group_commit_keeps_writes_when_remote_unreachable(
+    group_manager, git_repos
+):
+    local_path, remote_path = git_repos
+    initial = _remote_head(remote_path)
+    async with group_manager.atomic_write("offline"):
+        _write_file(local_path, "offline.kiln")
+
+    repo = pygit2.Repository(str(local_path))
+    repo.remotes.set_url("origin", str(remote_path.parent / "missing.git"))
+    await group_manager.flush()
+    assert group_manager.has_unpushed_writes
+    assert isinstance(group_manager.last_push_error, RemoteUnreachableError)
+
+    # the next save doesn't treat the unpushed commit as crash debris
+    group_manager._last_sync = 0.0
+    repo.remotes.set_url("origin", str(remote_path))
+    async with group_manager.atomic_write("online"):
+        _write_file(local_path, "online.kiln")
+    await group_manager.flush()
+    assert not group_manager.has_unpushed_writes
+    assert group_manager.last_push_error is None
+    pushed = _remote_head(remote_path)
+    assert pushed.parent_ids == [initial.id]
+    assert {"offline.kiln", "online.kiln"} <= {entry.name for entry in pushed.tree}
+
+
+@pytest.mark.asyncio
+async def test_group_commit_tracks_its_base_in_a_ref(group_manager, git_repos):
+    local_path, remote_path = git_repos
+    initial = _remote_head(remote_path)
+    async with group_manager.atomic_write("first"):
+        _write_file(local_path, "first.kiln")
+    async with group_manager.atomic_write("second"):
+        _write_file(local_path, "second.kiln")
+
+    repo = pygit2.Repository(str(local_path))
+    assert repo.references[PENDING_BASE_REF].target == initial.id
+
+    await group_manager.flush()
+    assert repo.references.get(PENDING_BASE_REF) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("window_seconds", [60.0, 0.0])
+async def test_restart_keeps_unpushed_group_commit_writes(
+    group_manager, git_repos, second_clone, window_seconds
+):
+    local_path, remote_path = git_repos
+    initial = _remote_head(remote_path)
+    for name in ("first", "second"):
+        async with group_manager.atomic_write(name):
+            _write_file(local_path, f"{name}.kiln")
+
+    # the app is killed inside the window, leaving a half written file behind
+    _write_file(local_path, "debris.kiln")
+    commit_in_repo(second_clone, "remote.kiln", "remote", "Remote change")
+    push_from(second_clone)
+    restarted = GitSyncManager(
+        repo_path=local_path,
+        auth_mode="system_keys",
+        group_commit=GroupCommitSettings(window_seconds=window_seconds),
+    )
+    try:
+        async with restarted.atomic_write("after restart"):
+            _write_file(local_path, "third.kiln")
+        await restarted.flush()
+    finally:
+        await restarted.close()
+
+    # crash recovery didn't reset the earlier writes, and the rebase kept all of them
+    pushed = _remote_head(remote_path)
+    names = {entry.name for entry in pushed.tree}
+    assert {"first.kiln", "second.kiln", "third.kiln", "remote.kiln"} <= names
+    assert "debris.kiln" not in names
+    assert initial.id not in pushed.parent_ids
+    repo = pygit2.Repository(str(local_path))
+    assert repo.references.get(PENDING_BASE_REF) is None
+
+
+def test_stale_pending_base_is_dropped(manager, git_repos):
+    local_path, _ = git_repos
+    repo = pygit2.Repository(str(local_path))
+    repo.references.create(PENDING_BASE_REF, repo.head.target)
+    assert manager._read_pending_base() is None
+    assert repo.references.get(PENDING_BASE_REF) is None
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_benchmark_group_commit_throughput(benchmark, git_repos):
+    # The remote is a local bare repo, add a hosted remote's round trip to each push
+    local_path, _ = git_repos
+    writes = 50
+    push_latency = 0.2
+    push_sync = GitSyncManager._push_sync
+
+    def slow_push_sync(self):
+        time.sleep(push_latency)
+        push_sync(self)
+
+    async def saves_per_second(manager: GitSyncManager) -> float:
+        start = benchmark._timer()
+        for i in range(writes):
+            async with manager.atomic_write(f"POST /api/eval_runs/{i}"):
+                name = f"eval_run_{manager.group_commit_enabled}_{i}.kiln"
+                _write_file(local_path, name)
+        await manager.flush()
+        elapsed = benchmark._timer() - start
+        await manager.close()
+        return writes / elapsed
+
+    with patch.object(GitSyncManager, "_push_sync", slow_push_sync):
+        immediate = await saves_per_second(
+            GitSyncManager(repo_path=local_path, auth_mode="system_keys")
+        )
+        grouped = await saves_per_second(
+            GitSyncManager(
+                repo_path=local_path,
+                auth_mode="system_keys",
+                group_commit=GroupCommitSettings(window_seconds=0.5),
+            )
+        )
+    # Pushing every save pays the push latency each time. Loose bound for CI.
+    if grouped < immediate * 5:
+        pytest.fail(
+            f"{writes} saves with {push_latency * 1000:.0f}ms pushes: "
+            f"{immediate:.1f}/s pushing each, {grouped:.1f}/s with group commit, "
+            "expected at least 5x more"
+        )
+
+
+# --- path scoped commits ---
+
+
+def _head_commit(repo_path: Path) -> pygit2.Commit:
+    commit = pygit2.Repository(str(repo_path)).revparse_single("HEAD")
+    assert isinstance(commit, pygit2.Commit)
+    return commit
+
+
+@pytest.mark.asyncio
+async def test_atomic_write_stages_only_recorded_paths(manager, git_repos):
+    local_path, remote_path = git_repos
+    # a write that records nothing is committed with a full scan, the tree is known clean
+    async with manager.atomic_write("first"):
+        _write_file(local_path, "first.kiln")
+
+    with patch.object(
+        GitSyncManager,
+        "_has_dirty_files_sync",
+        side_effect=AssertionError("unexpected full status scan"),
+    ):
+        async with manager.atomic_write("scoped"):
+            task_dir = local_path / "tasks" / "123 - Task"
+            task_dir.mkdir(parents=True)
+            record_written_path(_write_file(task_dir, "task.kiln"))
+            _write_file(local_path, "not_recorded.kiln")
+
+    head = _head_commit(local_path)
+    assert str(_remote_head(remote_path).id) == str(head.id)
+    assert "Context: scoped" in head.message
+    assert head.tree["tasks/123 - Task/task.kiln"].name == "task.kiln"
+    assert "not_recorded.kiln" not in [entry.name for entry in head.tree]
+    assert (local_path / "not_recorded.kiln").exists()
+    # the scoped commit doesn't vouch for the rest of the tree
+    assert manager._known_clean is False
+
+
+@pytest.mark.asyncio
+async def test_atomic_write_stages_recorded_deletes(manager, git_repos):
+    local_path, _ = git_repos
+    run_dir = local_path / "runs" / "456"
+    async with manager.atomic_write("create"):
+        run_dir.mkdir(parents=True)
+        record_written_path(_write_file(run_dir, "task_run.kiln"))
+        record_written_path(_write_file(run_dir, "attachment.png"))
+
+    async with manager.atomic_write("delete"):
+        for f in run_dir.iterdir():
+            f.unlink()
+        run_dir.rmdir()
+        record_written_path(run_dir)
+
+    head = _head_commit(local_path)
+    assert "runs" not in [entry.name for entry in head.tree]
+    assert "2 files changed" in head.message
+    assert await manager.has_dirty_files() is False
+
+
+@pytest.mark.asyncio
+async def test_atomic_write_ignores_recorded_paths_outside_repo(
+    manager, git_repos, tmp_path
+):
+    local_path, _ = git_repos
+    async with manager.atomic_write("first"):
+        record_written_path(_write_file(local_path, "first.kiln"))
+    pre_head = await manager.get_head()
+
+    async with manager.atomic_write("outside"):
+        record_written_path(_write_file(tmp_path, "settings.yaml"))
+
+    assert await manager.get_head() == pre_head
+
+
+@pytest.mark.asyncio
+async def test_atomic_write_full_scan_picks_up_unrecorded_files(manager, git_repos):
+    local_path, _ = git_repos
+    async with manager.atomic_write("first"):
+        record_written_path(_write_file(local_path, "first.kiln"))
+    async with manager.atomic_write("scoped"):
+        record_written_path(_write_file(local_path, "recorded.kiln"))
+        _write_file(local_path, "missed.kiln")
+    assert await manager.has_dirty_files() is True
+
+    # the next write checks the whole tree, and commits the missed file rather
+    # than stashing it as crash debris
+    async with manager.atomic_write("safety net"):
+        record_written_path(_write_file(local_path, "later.kiln"))
+
+    names = [entry.name for entry in _head_commit(local_path).tree]
+    assert {"missed.kiln", "later.kiln"} <= set(names)
+    assert await manager.has_dirty_files() is False
+    assert manager._known_clean is True
+
+
+@pytest.mark.asyncio
+async def test_atomic_write_full_scan_after_interval(manager, git_repos):
+    local_path, _ = git_repos
+    async with manager.atomic_write("first"):
+        _write_file(local_path, "first.kiln")
+    assert manager._known_clean is True
+
+    manager._last_full_scan = time.monotonic() - FULL_STATUS_SCAN_INTERVAL
+    async with manager.atomic_write("interval"):
+        record_written_path(_write_file(local_path, "recorded.kiln"))
+        _write_file(local_path, "missed.kiln")
+
+    names = [entry.name for entry in _head_commit(local_path).tree]
+    assert {"recorded.kiln", "missed.kiln"} <= set(names)
+
+
+@pytest.mark.asyncio
+async def test_atomic_write_full_scan_after_rollback(manager, git_repos):
+    local_path, _ = git_repos
+    async with manager.atomic_write("first"):
+        record_written_path(_write_file(local_path, "first.kiln"))
+
+    with pytest.raises(RuntimeError):
+        async with manager.atomic_write("failed"):
+            record_written_path(_write_file(local_path, "failed.kiln"))
+            raise RuntimeError("boom")
+
+    assert manager._known_clean is False
+    with patch.object(
+        GitSyncManager,
+        "_has_dirty_files_sync",
+        autospec=True,
+        side_effect=GitSyncManager._has_dirty_files_sync,
+    ) as full_scan:
+        async with manager.atomic_write("after"):
+            record_written_path(_write_file(local_path, "after.kiln"))
+    assert full_scan.called
+    assert not (local_path / "failed.kiln").exists()
+
+
+@pytest.mark.asyncio
+async def test_atomic_write_pattern_characters_use_full_scan(manager, git_repos):
+    local_path, _ = git_repos
+    async with manager.atomic_write("first"):
+        record_written_path(_write_file(local_path, "first.kiln"))
+
+    async with manager.atomic_write("brackets"):
+        record_written_path(_write_file(local_path, "name [draft].kiln"))
+        _write_file(local_path, "other.kiln")
+
+    names = [entry.name for entry in _head_commit(local_path).tree]
+    assert {"name [draft].kiln", "other.kiln"} <= set(names)
+
+
 # --- close ---
 
 
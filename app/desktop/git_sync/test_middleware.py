@@ -20,6 +20,7 @@ from app.desktop.git_sync.errors import (
     GitAuthError,
     RemoteUnreachableError,
     SyncConflictError,
+    UnpushedConflictError,
     WriteLockTimeoutError,
 )
 from app.desktop.git_sync.middleware import GitSyncMiddleware
@@ -357,6 +358,12 @@ def test_no_write_lock_decorator_on_post(git_repos):
             "Cannot sync with remote. Check your connection.",
         ),
         (SyncConflictError, 409, "There was a problem saving. Please try again."),
+        (
+            UnpushedConflictError,
+            409,
+            "Saved changes conflict with the remote and must be resolved before "
+            "saving again. See the git sync status for details.",
+        ),
         (
             WriteLockTimeoutError,
             503,
@@ -55,18 +55,39 @@ def make_stream_mock(chunks: list[bytes]):
     return mock_upstream
 
 
+async def read_request_content(content) -> bytes:
+    """The body a request was sent with, reading it like httpx if it's streamed."""
+    if content is None or isinstance(content, bytes):
+        return content or b""
+    return b"".join([chunk async for chunk in content])
+
+
 def make_n_round_mock_client(*chunk_rounds: list[bytes]):
-    """Create a mock httpx client that serves multiple streaming rounds in sequence."""
+    """
+    Create a mock httpx client that serves multiple streaming rounds in sequence.
+
+    Request bodies are recorded in mock_client.sent_bodies, in order. Streamed bodies
+    are read when the request is sent, as httpx does.
+    """
     mocks = [make_stream_mock(chunks) for chunks in chunk_rounds]
     call_count = 0
+    sent_bodies: list[bytes] = []
 
     def side_effect(*args, **kwargs):
         nonlocal call_count
         idx = min(call_count, len(mocks) - 1)
         call_count += 1
-        return mocks[idx]
+        mock_upstream = mocks[idx]
+
+        async def send():
+            sent_bodies.append(await read_request_content(kwargs.get("content")))
+            return mock_upstream
+
+        mock_upstream.__aenter__ = AsyncMock(side_effect=send)
+        return mock_upstream
 
     mock_client = MagicMock()
+    mock_client.sent_bodies = sent_bodies
     mock_client.stream.side_effect = side_effect
     mock_client.__aenter__ = AsyncMock(return_value=mock_client)
     mock_client.__aexit__ = AsyncMock(return_value=None)
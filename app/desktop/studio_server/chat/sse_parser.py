@@ -1,12 +1,12 @@
 import json
 import logging
+import re
 from dataclasses import dataclass, field
 from typing import Any
 
 from kiln_ai.adapters.model_adapters.stream_events import (
     AiSdkStreamEvent,
     FinishEvent,
-    TextDeltaEvent,
     ToolInputAvailableEvent,
 )
 from pydantic import ValidationError
@@ -26,47 +26,118 @@ def _try_parse_ai_sdk_event(data: dict[str, Any]) -> AiSdkStreamEvent | None:
         return None
 
 
+# The events ChatStreamSession acts on, every other event is forwarded without decoding
+_HANDLED_EVENT_TYPES = [
+    "error",
+    KILN_SSE_CHAT_TRACE,
+    "finish",
+    "text-delta",
+    "tool-input-available",
+]
+
+# The SSE data lines the session acts on, found by one scan of the chunk. Text deltas
+# in the AI SDK's usual form capture their delta, which is read without decoding the
+# line. Other lines capture their payload to be decoded, unless it starts with the
+# "type" key of an event which isn't handled (as the AI SDK and Kiln's servers write
+# them), those lines are skipped inside the regex engine. It starts with the literal
+# "data: " then checks it began a line, so the engine can search for it quickly.
+_EVENT_LINE = re.compile(
+    rb"data: (?<![^\n]data: )[ \t]*(?:"
+    rb'\{[ \t]*"type"[ \t]*:[ \t]*"text-delta"[ \t]*,'
+    rb'[ \t]*"id"[ \t]*:[ \t]*"[^"\\\n]*"[ \t]*,'
+    rb'[ \t]*"delta"[ \t]*:[ \t]*(?P<delta>"(?:[^"\\\n]|\\.)*")[ \t]*\}[ \t\r]*$'
+    rb'|(?!\{[ \t]*"type"[ \t]*:[ \t]*"(?!(?:'
+    + b"|".join(re.escape(event_type.encode()) for event_type in _HANDLED_EVENT_TYPES)
+    + rb')")[^"\\\n]*")(?P<payload>.*)$'
+    rb")",
+    re.MULTILINE,
+)
+
+_DATA_PREFIX = b"data: "
+
+
+def _decode_delta(quoted: bytes) -> str | None:
+    """The text of a captured delta JSON string, None if it isn't valid."""
+    try:
+        if b"\\" not in quoted:
+            return quoted[1:-1].decode()
+        return json.loads(quoted)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
 @dataclass
 class ParseResult:
-    lines_to_forward: list[bytes] = field(default_factory=list)
+    # The complete lines parsed, each followed by its newline, ready to forward
+    forward: bytes = b""
     finish_tool_calls: bool = False
     tool_input_events: list[ToolInputAvailableEvent] = field(default_factory=list)
     text_delta: str = ""
     chat_trace_id: str | None = None
     has_error_event: bool = False
 
+    @property
+    def lines_to_forward(self) -> list[bytes]:
+        if not self.forward:
+            return []
+        return self.forward[:-1].split(b"\n")
+
 
 class EventParser:
-    """Stateful SSE parser that accumulates a line buffer across chunks."""
+    """
+    Stateful, incremental SSE parser.
+
+    Only the bytes of each new chunk are scanned for line boundaries, and the complete
+    lines are forwarded as one slice of the chunk (the chunk itself when it ends on a
+    line boundary) rather than split and joined again. Payloads are prefiltered by
+    their type in the same scan, so only the few events the session acts on are
+    decoded as JSON, and text deltas are read straight from the line.
+    """
 
     def __init__(self) -> None:
-        self._line_buffer = bytearray()
+        # The start of a line split across chunks, joined once its end arrives
+        self._partial_line: list[bytes] = []
 
     def parse(self, raw: bytes) -> ParseResult:
-        self._line_buffer.extend(raw)
-
-        parts = bytes(self._line_buffer).split(b"\n")
-        self._line_buffer.clear()
-        self._line_buffer.extend(parts[-1])
-        complete_lines = parts[:-1]
-
-        result = ParseResult(lines_to_forward=list(complete_lines))
-
-        i = 0
-        while i < len(result.lines_to_forward):
-            line = result.lines_to_forward[i]
-            if line.startswith(b"data: "):
-                payload = line[6:].strip()
-                if payload and payload != b"[DONE]":
-                    self._process_payload(payload, result)
-            i += 1
-
+        last_newline = raw.rfind(b"\n")
+        if last_newline == -1:
+            if raw:
+                self._partial_line.append(raw)
+            return ParseResult()
+
+        if self._partial_line:
+            self._partial_line.append(raw[: last_newline + 1])
+            forward = b"".join(self._partial_line)
+            self._partial_line.clear()
+        elif last_newline == len(raw) - 1:
+            forward = raw
+        else:
+            forward = raw[: last_newline + 1]
+        if last_newline < len(raw) - 1:
+            self._partial_line.append(raw[last_newline + 1 :])
+
+        result = ParseResult(forward=forward)
+        text_deltas: list[str] = []
+        for match in _EVENT_LINE.finditer(forward):
+            quoted = match.group("delta")
+            if quoted is not None:
+                delta = _decode_delta(quoted)
+                if delta is not None:
+                    text_deltas.append(delta)
+                    continue
+            payload = forward[match.start() + len(_DATA_PREFIX) : match.end()].strip()
+            if payload and payload != b"[DONE]":
+                self._process_payload(payload, result, text_deltas)
+
+        result.text_delta = "".join(text_deltas)
         return result
 
-    def _process_payload(self, payload: bytes, result: ParseResult) -> None:
+    def _process_payload(
+        self, payload: bytes, result: ParseResult, text_deltas: list[str]
+    ) -> None:
         try:
             event = json.loads(payload)
-        except (json.JSONDecodeError, TypeError):
+        except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
             logger.debug("Failed to parse SSE payload as JSON: %s", payload[:120])
             return
 
@@ -85,12 +156,17 @@ class EventParser:
                 result.chat_trace_id = tid
             return
 
+        if event_type == "text-delta":
+            # Written in an unusual form, checked by hand rather than validated
+            delta = event.get("delta")
+            if isinstance(event.get("id"), str) and isinstance(delta, str):
+                text_deltas.append(delta)
+            return
+
         parsed = _try_parse_ai_sdk_event(event)
         if isinstance(parsed, FinishEvent):
             meta = parsed.messageMetadata
             if meta is not None and meta.finishReason == "tool-calls":
                 result.finish_tool_calls = True
-        elif isinstance(parsed, TextDeltaEvent):
-            result.text_delta += parsed.delta
         elif isinstance(parsed, ToolInputAvailableEvent):
             result.tool_input_events.append(parsed)
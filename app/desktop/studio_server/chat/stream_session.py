@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 from kiln_ai.adapters.model_adapters.stream_events import ToolInputAvailableEvent
 from kiln_ai.tools.tool_registry import tool_from_id
+from kiln_ai.utils.http_client_pool import HttpClientPool
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.desktop.studio_server.chat.constants import (
@@ -96,130 +97,129 @@ class ChatStreamSession:
         self._upstream_url = upstream_url
         self._headers = headers
         self._body = initial_body
+        self._encoded_messages: list[tuple[Any, bytes]] = []
         self._initial_trace_id: str | None = initial_body.get("trace_id")
 
     async def stream(self):
         """AsyncGenerator yielding SSE bytes to the client."""
         trace_id_for_error: str | None = self._initial_trace_id
         seen_upstream_error = False
-        async with httpx.AsyncClient(timeout=CHAT_TIMEOUT) as client:
-            for _ in range(MAX_TOOL_ROUNDS):
-                round_state = RoundState()
-                parser = EventParser()
-
-                async with client.stream(
-                    "POST",
-                    self._upstream_url,
-                    content=json.dumps(self._body, ensure_ascii=False).encode(),
-                    headers=self._headers,
-                ) as upstream:
-                    if upstream.status_code != 200:
-                        error_body = await upstream.aread()
-                        detail = "Chat request failed."
-                        code: str | None = None
-                        if error_body.startswith(b"{"):
-                            try:
-                                parsed = json.loads(error_body)
-                                detail = parsed.get("message", detail) or detail
-                                code = parsed.get("code")
-                            except json.JSONDecodeError:
-                                pass
-                        error_payload: dict[str, Any] = {
+        # Shared and kept alive between requests, so rounds reuse warm connections
+        client = HttpClientPool.shared().client(self._upstream_url)
+        for _ in range(MAX_TOOL_ROUNDS):
+            round_state = RoundState()
+            parser = EventParser()
+
+            async with client.stream(
+                "POST",
+                self._upstream_url,
+                content=self._encode_body(),
+                headers=self._headers,
+                timeout=CHAT_TIMEOUT,
+            ) as upstream:
+                if upstream.status_code != 200:
+                    error_body = await upstream.aread()
+                    detail = "Chat request failed."
+                    code: str | None = None
+                    if error_body.startswith(b"{"):
+                        try:
+                            parsed = json.loads(error_body)
+                            detail = parsed.get("message", detail) or detail
+                            code = parsed.get("code")
+                        except json.JSONDecodeError:
+                            pass
+                    error_payload: dict[str, Any] = {
+                        "type": "error",
+                        "message": detail,
+                    }
+                    if code:
+                        error_payload["code"] = code
+                    if trace_id_for_error:
+                        error_payload["trace_id"] = trace_id_for_error
+                    yield f"data: {json.dumps(error_payload, ensure_ascii=False)}\n\n".encode()
+                    return
+
+                try:
+                    async for chunk in upstream.aiter_bytes():
+                        result = parser.parse(chunk)
+                        if result.has_error_event:
+                            seen_upstream_error = True
+                        if result.finish_tool_calls:
+                            round_state.finish_tool_calls = True
+                        round_state.tool_input_events.extend(result.tool_input_events)
+                        round_state.assistant_text += result.text_delta
+                        if result.chat_trace_id is not None:
+                            round_state.trace_id = result.chat_trace_id
+                            trace_id_for_error = result.chat_trace_id
+                        if result.forward:
+                            yield result.forward
+                except httpx.RemoteProtocolError:
+                    if round_state.finish_tool_calls:
+                        logger.debug(
+                            "Connection closed after streamed tool boundary "
+                            "(AI SDK tool-calls finish; expected)"
+                        )
+                    elif seen_upstream_error:
+                        # we already passed on an error coming out of upstream server, the UI should be rendering it
+                        # we don't need to also tell it the stream was closed by the upstream server
+                        logger.debug(
+                            "Connection closed after upstream error event; "
+                            "suppressing duplicate error"
+                        )
+                        return
+                    else:
+                        trace_id = trace_id_for_error or str(uuid.uuid4())
+                        error_payload = {
                             "type": "error",
-                            "message": detail,
+                            "message": "Something went wrong.",
+                            "trace_id": trace_id,
                         }
-                        if code:
-                            error_payload["code"] = code
-                        if trace_id_for_error:
-                            error_payload["trace_id"] = trace_id_for_error
                         yield f"data: {json.dumps(error_payload, ensure_ascii=False)}\n\n".encode()
+                        logger.exception(
+                            "RemoteProtocolError during streaming (trace_id=%s)",
+                            trace_id,
+                        )
                         return
 
-                    try:
-                        async for chunk in upstream.aiter_bytes():
-                            result = parser.parse(chunk)
-                            if result.has_error_event:
-                                seen_upstream_error = True
-                            if result.finish_tool_calls:
-                                round_state.finish_tool_calls = True
-                            round_state.tool_input_events.extend(
-                                result.tool_input_events
-                            )
-                            round_state.assistant_text += result.text_delta
-                            if result.chat_trace_id is not None:
-                                round_state.trace_id = result.chat_trace_id
-                                trace_id_for_error = result.chat_trace_id
-                            forward_bytes = b"\n".join(result.lines_to_forward)
-                            if result.lines_to_forward:
-                                yield forward_bytes + b"\n"
-                    except httpx.RemoteProtocolError:
-                        if round_state.finish_tool_calls:
-                            logger.debug(
-                                "Connection closed after streamed tool boundary "
-                                "(AI SDK tool-calls finish; expected)"
-                            )
-                        elif seen_upstream_error:
-                            # we already passed on an error coming out of upstream server, the UI should be rendering it
-                            # we don't need to also tell it the stream was closed by the upstream server
-                            logger.debug(
-                                "Connection closed after upstream error event; "
-                                "suppressing duplicate error"
-                            )
-                            return
-                        else:
-                            trace_id = trace_id_for_error or str(uuid.uuid4())
-                            error_payload = {
-                                "type": "error",
-                                "message": "Something went wrong.",
-                                "trace_id": trace_id,
-                            }
-                            yield f"data: {json.dumps(error_payload, ensure_ascii=False)}\n\n".encode()
-                            logger.exception(
-                                "RemoteProtocolError during streaming (trace_id=%s)",
-                                trace_id,
-                            )
-                            return
-
-                if round_state.trace_id:
-                    self._body = {
-                        **self._body,
-                        "trace_id": round_state.trace_id,
-                        "messages": [],
-                    }
-
-                if round_state.finish_tool_calls:
-                    client_events = [
-                        e
-                        for e in round_state.tool_input_events
-                        if not tool_input_executor_is_server(e)
-                    ]
-                    needs_approval = [
-                        e for e in client_events if tool_requires_user_approval(e)
-                    ]
-                    if needs_approval:
-                        yield _format_tool_calls_pending_sse(client_events)
-                        return
-
-                    expected_tool_count = len(client_events)
-                    yield self._format_tool_exec_start(expected_tool_count)
-                    tool_results = await self._execute_client_tools(round_state, None)
-                    for tc_id, output in tool_results.items():
-                        yield self._format_tool_output(tc_id, output)
-                    yield self._format_tool_exec_end(len(tool_results))
-
-                    if not tool_results:
-                        return
-
-                    self._body = _build_openai_tool_continuation(
-                        self._body,
-                        round_state.assistant_text,
-                        round_state.tool_input_events,
-                        tool_results,
-                    )
-                    continue
+            if round_state.trace_id:
+                self._body = {
+                    **self._body,
+                    "trace_id": round_state.trace_id,
+                    "messages": [],
+                }
 
-                return
+            if round_state.finish_tool_calls:
+                client_events = [
+                    e
+                    for e in round_state.tool_input_events
+                    if not tool_input_executor_is_server(e)
+                ]
+                needs_approval = [
+                    e for e in client_events if tool_requires_user_approval(e)
+                ]
+                if needs_approval:
+                    yield _format_tool_calls_pending_sse(client_events)
+                    return
+
+                expected_tool_count = len(client_events)
+                yield self._format_tool_exec_start(expected_tool_count)
+                tool_results = await self._execute_client_tools(round_state, None)
+                for tc_id, output in tool_results.items():
+                    yield self._format_tool_output(tc_id, output)
+                yield self._format_tool_exec_end(len(tool_results))
+
+                if not tool_results:
+                    return
+
+                self._body = _build_openai_tool_continuation(
+                    self._body,
+                    round_state.assistant_text,
+                    round_state.tool_input_events,
+                    tool_results,
+                )
+                continue
 
+            return
         # Loop exhausted all MAX_TOOL_ROUNDS without a natural exit
         error_payload = {
             "type": "error",
@@ -229,6 +229,38 @@ class ChatStreamSession:
             error_payload["trace_id"] = trace_id_for_error
         yield f"data: {json.dumps(error_payload, ensure_ascii=False)}\n\n".encode()
 
+    def _encode_body(self) -> bytes:
+        """
+        The request body as JSON. Messages are encoded once and reused by the
+        following rounds, so a growing conversation isn't re-serialized each round.
+        """
+        messages = self._body.get("messages")
+        if not isinstance(messages, list):
+            return json.dumps(self._body, ensure_ascii=False).encode()
+
+        # Continuations keep the earlier message dicts, so they're matched by identity
+        reused = 0
+        for (message, _), current in zip(self._encoded_messages, messages):
+            if message is not current:
+                break
+            reused += 1
+        self._encoded_messages = [
+            *self._encoded_messages[:reused],
+            *(
+                (message, json.dumps(message, ensure_ascii=False).encode())
+                for message in messages[reused:]
+            ),
+        ]
+
+        encoded_messages = (
+            b"[" + b", ".join(e for _, e in self._encoded_messages) + b"]"
+        )
+        rest = {key: value for key, value in self._body.items() if key != "messages"}
+        if not rest:
+            return b'{"messages": ' + encoded_messages + b"}"
+        encoded_rest = json.dumps(rest, ensure_ascii=False).encode()
+        return encoded_rest[:-1] + b', "messages": ' + encoded_messages + b"}"
+
     async def _execute_client_tools(
         self,
         round_state: RoundState,
@@ -307,8 +307,7 @@ class TestRemoteToolRoundTrip:
         assert b"The answer is 16" in content
         assert get_call_count() == 2
 
-        continuation_call = mock_client.stream.call_args_list[1]
-        continuation_body = json.loads(continuation_call.kwargs["content"])
+        continuation_body = json.loads(mock_client.sent_bodies[1])
         messages = continuation_body["messages"]
 
         # original user + assistant(tool_calls) + tool result
@@ -360,9 +359,7 @@ class TestRemoteToolRoundTrip:
         assert response.status_code == 200
         assert get_call_count() == 2
 
-        continuation_body = json.loads(
-            mock_client.stream.call_args_list[1].kwargs["content"]
-        )
+        continuation_body = json.loads(mock_client.sent_bodies[1])
         messages = continuation_body["messages"]
         roles = [m["role"] for m in messages]
         assert roles == ["tool"]
@@ -447,9 +444,7 @@ class TestRemoteToolRoundTrip:
                 _ = response.content
 
         assert get_call_count() == 2
-        continuation_body = json.loads(
-            mock_client.stream.call_args_list[1].kwargs["content"]
-        )
+        continuation_body = json.loads(mock_client.sent_bodies[1])
         messages = continuation_body["messages"]
         # user + assistant(2 tool_calls) + 2 tool messages
         assert len(messages) == 4
@@ -752,9 +747,7 @@ class TestMockedFlows:
         assert "16" in joined_text
 
         assert get_call_count() == 2
-        continuation_body = json.loads(
-            mock_client.stream.call_args_list[1].kwargs["content"]
-        )
+        continuation_body = json.loads(mock_client.sent_bodies[1])
         assert continuation_body["trace_id"] == trace_id
         messages = continuation_body["messages"]
         roles = [m["role"] for m in messages]
@@ -797,7 +790,7 @@ class TestMockedFlows:
         assert r2.status_code == 200
         assert get_call_count() == 2
 
-        second_body = json.loads(mock_client.stream.call_args_list[1].kwargs["content"])
+        second_body = json.loads(mock_client.sent_bodies[1])
         assert second_body["trace_id"] == trace_id
         assert len(second_body["messages"]) == 1
         assert second_body["messages"][0]["role"] == "user"
@@ -968,9 +961,7 @@ class TestMockedFlows:
         assert tool_output_ids == {"tc_cli1", "tc_cli2"}
         assert "tc_srv" not in tool_output_ids
 
-        continuation_body = json.loads(
-            mock_client.stream.call_args_list[1].kwargs["content"]
-        )
+        continuation_body = json.loads(mock_client.sent_bodies[1])
         tool_call_ids_in_continuation = {
             m["tool_call_id"]
             for m in continuation_body["messages"]
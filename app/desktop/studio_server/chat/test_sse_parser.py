@@ -1,3 +1,9 @@
+import json
+import random
+from unittest.mock import patch
+
+import pytest
+
 from app.desktop.studio_server.chat import EventParser, tool_input_executor_is_server
 from app.desktop.studio_server.chat.helpers import sse_text_delta
 
@@ -109,3 +115,140 @@ class TestEventParser:
         )
         assert result.finish_tool_calls is False
         assert result.tool_input_events == []
+
+    def test_forwards_aligned_chunks_without_copying(self):
+        raw = sse_text_delta("hi")
+        result = EventParser().parse(raw)
+        assert result.forward is raw
+        assert result.lines_to_forward == raw[:-1].split(b"\n")
+
+    def test_any_chunking_gives_the_same_result(self):
+        stream = (
+            b'data: {"type":"kiln_chat_trace","trace_id":"tid"}\r\n'
+            + sse_text_delta("h\u00e9llo ")
+            + b'data: {"type":"reasoning-delta","id":"r1","delta":"hmm"}\n\n'
+            + b": keep-alive comment\n\n"
+            + sse_text_delta("world")
+            + b'data: {"type":"tool-input-available","toolCallId":"tc1","toolName":"t","input":{}}\n\n'
+            + b'data: {"type":"finish","messageMetadata":{"finishReason":"tool-calls"}}\n\n'
+            + b"data: [DONE]\n\n"
+        )
+        rng = random.Random(0)
+        for _ in range(50):
+            cuts = sorted(rng.sample(range(1, len(stream)), 8))
+            chunks = [stream[a:b] for a, b in zip([0, *cuts], [*cuts, len(stream)])]
+            parser = EventParser()
+            results = [parser.parse(chunk) for chunk in chunks]
+
+            assert b"".join(r.forward for r in results) == stream
+            assert "".join(r.text_delta for r in results) == "h\u00e9llo world"
+            assert [r.chat_trace_id for r in results if r.chat_trace_id] == ["tid"]
+            assert any(r.finish_tool_calls for r in results)
+            assert [e.toolCallId for r in results for e in r.tool_input_events] == [
+                "tc1"
+            ]
+
+    def test_only_handled_event_types_are_decoded(self):
+        raw = (
+            b'data: {"type":"reasoning-delta","id":"r1","delta":"hmm"}\n\n'
+            + b'data: {"type":"start-step"}\n\n'
+            + sse_text_delta("hi")
+        )
+        with patch(
+            "app.desktop.studio_server.chat.sse_parser.json.loads", wraps=json.loads
+        ) as loads:
+            result = EventParser().parse(raw)
+        # text deltas are read from the line without decoding it
+        assert loads.call_count == 0
+        assert result.text_delta == "hi"
+        assert len(result.lines_to_forward) == 6
+
+    @pytest.mark.parametrize(
+        "delta", ["plain", 'a "quote", a \\ and a\nnewline', "héllo ☃", "😀"]
+    )
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    @pytest.mark.parametrize("separators", [(", ", ": "), (",", ":")])
+    def test_text_deltas_read_from_the_line(self, delta, ensure_ascii, separators):
+        payload = {"type": "text-delta", "id": "t1", "delta": delta}
+        line = json.dumps(payload, ensure_ascii=ensure_ascii, separators=separators)
+        result = EventParser().parse(f"data: {line}\r\n\n".encode())
+        assert result.text_delta == delta
+
+    def test_data_prefix_inside_a_line_is_not_an_event(self):
+        raw = sse_text_delta('data: {"type":"error"}\n')
+        result = EventParser().parse(raw)
+        assert result.text_delta == 'data: {"type":"error"}\n'
+        assert result.has_error_event is False
+
+    def test_text_deltas_with_other_fields_are_decoded(self):
+        raw = b'data: {"type":"text-delta","id":"t1","delta":"hi","providerMetadata":{}}\n\n'
+        with patch(
+            "app.desktop.studio_server.chat.sse_parser.json.loads", wraps=json.loads
+        ) as loads:
+            result = EventParser().parse(raw)
+        assert loads.call_count == 1
+        assert result.text_delta == "hi"
+
+    def test_payloads_not_starting_with_their_type_are_decoded(self):
+        raw = b'data: {"id":"t1","type":"text-delta","delta":"hi"}\n\n'
+        raw += b'data: {"input":{"type":"text-delta"},"type":"error"}\n\n'
+        result = EventParser().parse(raw)
+        assert result.text_delta == "hi"
+        assert result.has_error_event is True
+
+
+def _baseline_parse(buffer: bytearray, raw: bytes) -> str:
+    """The parser before incremental scanning: copy and split the whole buffer, decode every payload."""
+    buffer.extend(raw)
+    parts = bytes(buffer).split(b"\n")
+    buffer.clear()
+    buffer.extend(parts[-1])
+    deltas = []
+    for line in parts[:-1]:
+        if line.startswith(b"data: "):
+            payload = line[6:].strip()
+            if payload and payload != b"[DONE]":
+                event = json.loads(payload)
+                if event.get("type") == "text-delta":
+                    deltas.append(event["delta"])
+    return "".join(deltas)
+
+
+@pytest.mark.benchmark
+def test_benchmark_event_parser(benchmark):
+    # A long agent response: mostly reasoning and text deltas, some tool calls
+    events: list[bytes] = []
+    for i in range(40_000):
+        if i % 1000 == 0:
+            events.append(
+                b'data: {"type":"tool-input-available","toolCallId":"tc%d","toolName":"search","input":{"query":"q"}}\n\n'
+                % i
+            )
+        elif i % 3 == 0:
+            events.append(sse_text_delta(f"word{i} "))
+        else:
+            events.append(
+                b'data: {"type":"reasoning-delta","id":"r1","delta":"thinking about step %d "}\n\n'
+                % i
+            )
+    stream = b"".join(events)
+    # Network reads don't line up with events
+    chunks = [stream[i : i + 1500] for i in range(0, len(stream), 1500)]
+
+    start = benchmark._timer()
+    parser = EventParser()
+    text = "".join(parser.parse(chunk).text_delta for chunk in chunks)
+    parse_time = benchmark._timer() - start
+
+    start = benchmark._timer()
+    buffer = bytearray()
+    baseline_text = "".join(_baseline_parse(buffer, chunk) for chunk in chunks)
+    baseline_time = benchmark._timer() - start
+
+    assert text == baseline_text
+    # Copying the buffer and decoding every event should be far slower. Loose bound for CI.
+    if parse_time * 2 > baseline_time:
+        pytest.fail(
+            f"Parsed a {len(stream) / 1e6:.1f}MB stream in {len(chunks)} chunks in {parse_time:.3f}s, "
+            f"copying and decoding every event took {baseline_time:.3f}s, expected at least 2x faster"
+        )
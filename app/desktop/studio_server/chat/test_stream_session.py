@@ -5,10 +5,12 @@ from unittest.mock import AsyncMock, patch
 import httpx
 import pytest
 from kiln_ai.adapters.model_adapters.stream_events import ToolInputAvailableEvent
+from kiln_ai.utils.http_client_pool import HttpClientPool
 from kiln_server.error_codes import CHAT_CLIENT_VERSION_TOO_OLD
 
-from app.desktop.studio_server.chat import execute_tool
+from app.desktop.studio_server.chat import execute_tool, stream_session
 from app.desktop.studio_server.chat.constants import SSE_TYPE_TOOL_CALLS_PENDING
+from app.desktop.studio_server.chat.helpers import PATCH_EXECUTE_TOOL, sse_text_delta
 from app.desktop.studio_server.chat.stream_session import (
     ChatStreamSession,
     ToolCallInfo,
@@ -382,3 +384,136 @@ class TestExecuteToolBatch:
             out = await execute_tool_batch(calls, {})
         assert "error" in json.loads(out["b"])
         m.assert_not_called()
+
+
+_TOOL_ROUND = [
+    sse_text_delta("Let me compute that"),
+    b'data: {"type":"tool-input-available","toolCallId":"tc1","toolName":"multiply","input":{"a":2,"b":8}}\n\n',
+    b'data: {"type":"finish","messageMetadata":{"finishReason":"tool-calls"}}\n\n',
+]
+_ANSWER_ROUND = [sse_text_delta("The answer is 16"), b'data: {"type":"finish"}\n\n']
+
+
+class _UpstreamTransport(httpx.AsyncBaseTransport):
+    """Serves rounds of SSE chunks, recording the requests it was sent."""
+
+    def __init__(self, *rounds: list[bytes]):
+        self.rounds = list(rounds)
+        self.requests: list[httpx.Request] = []
+        self.bodies: list[bytes] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.bodies.append(await request.aread())
+        return httpx.Response(200, content=b"".join(self.rounds.pop(0)))
+
+
+@pytest.fixture
+def upstream():
+    """Patches the pooled client to one using an _UpstreamTransport, set with upstream(transport)."""
+    transports: list[_UpstreamTransport] = []
+
+    def client(self, url):
+        return httpx.AsyncClient(transport=transports[-1])
+
+    with patch.object(HttpClientPool, "client", client):
+        yield transports.append
+
+
+async def test_continuation_is_sent_with_the_tool_results(upstream):
+    transport = _UpstreamTransport(_TOOL_ROUND, _ANSWER_ROUND)
+    upstream(transport)
+    session = ChatStreamSession(
+        upstream_url="https://example.test/v1/chat",
+        headers={},
+        initial_body={"messages": [{"role": "user", "content": "compute 2*8"}]},
+    )
+
+    with patch(PATCH_EXECUTE_TOOL, AsyncMock(return_value="16")):
+        content = b"".join([chunk async for chunk in session.stream()])
+
+    assert b"The answer is 16" in content
+    assert len(transport.requests) == 2
+    # a plain body with its length, not a chunked stream
+    for request, body in zip(transport.requests, transport.bodies):
+        assert request.headers["content-length"] == str(len(body))
+        assert "transfer-encoding" not in request.headers
+    continuation = json.loads(transport.bodies[1])
+    assert [m["role"] for m in continuation["messages"]] == [
+        "user",
+        "assistant",
+        "tool",
+    ]
+    assert continuation["messages"][2]["content"] == "16"
+
+
+def test_encode_body_reuses_encoded_messages():
+    user = {"role": "user", "content": "héllo"}
+    session = ChatStreamSession(
+        upstream_url="https://example.test/v1/chat",
+        headers={},
+        initial_body={"model": "m", "messages": [user]},
+    )
+    first = session._encode_body()
+    assert json.loads(first) == {"model": "m", "messages": [user]}
+    encoded_user = session._encoded_messages[0][1]
+
+    tool = {"role": "tool", "tool_call_id": "tc1", "content": "16"}
+    session._body = {**session._body, "messages": [user, tool]}
+    with patch.object(
+        stream_session.json, "dumps", wraps=stream_session.json.dumps
+    ) as dumps:
+        second = session._encode_body()
+    assert json.loads(second) == {"model": "m", "messages": [user, tool]}
+    assert session._encoded_messages[0][1] is encoded_user
+    # only the new message and the other fields were encoded
+    assert [call.args[0] for call in dumps.call_args_list] == [tool, {"model": "m"}]
+
+    # a new message list (e.g. a trace continuation) is encoded from scratch
+    session._body = {"trace_id": "t", "messages": [dict(tool)]}
+    assert json.loads(session._encode_body()) == session._body
+    session._body = {"trace_id": "t"}
+    assert json.loads(session._encode_body()) == {"trace_id": "t"}
+
+
+@pytest.mark.benchmark
+def test_benchmark_encode_body(benchmark):
+    # A long agent conversation, one tool result appended per round
+    messages: list[dict[str, Any]] = [
+        {"role": "user", "content": "Summarize the design doc. " * 200}
+    ]
+    rounds = 50
+    for i in range(rounds):
+        messages.append(
+            {
+                "role": "assistant",
+                "content": f"Looking up section {i}",
+                "tool_calls": [{"id": f"tc{i}", "function": {"name": "search"}}],
+            }
+        )
+        messages.append(
+            {"role": "tool", "tool_call_id": f"tc{i}", "content": "result " * 300}
+        )
+    bodies = [
+        {"model": "m", "messages": messages[: 1 + 2 * i]} for i in range(1, rounds + 1)
+    ]
+
+    session = _make_session()
+    start = benchmark._timer()
+    for body in bodies:
+        session._body = body
+        session._encode_body()
+    incremental_time = benchmark._timer() - start
+
+    start = benchmark._timer()
+    for body in bodies:
+        json.dumps(body, ensure_ascii=False).encode()
+    full_time = benchmark._timer() - start
+
+    assert json.loads(session._encode_body()) == bodies[-1]
+    # Re-encoding the whole growing body every round should be far slower. Loose bound for CI.
+    if incremental_time * 2 > full_time:
+        pytest.fail(
+            f"Encoded {rounds} rounds incrementally in {incremental_time:.3f}s, "
+            f"re-encoding every body took {full_time:.3f}s, expected at least 2x faster"
+        )
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterable
+
+from kiln_ai.utils.config import Config
+from pydantic import ValidationError
+
+from .models import JobRecord, _utc_now
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR_NAME = "jobs"
+JOURNAL_FILE_NAME = "journal.jsonl"
+
+# Progress-only updates for a job are journaled at most this often. Status
+# transitions are always written straight away.
+DEFAULT_CHECKPOINT_INTERVAL = 5.0
+# Rewrite the journal down to one line per job once it has this many lines.
+DEFAULT_COMPACT_AFTER = 5000
+# Finished jobs older than this are dropped when the journal is loaded.
+DEFAULT_RETENTION = timedelta(days=7)
+
+
+def journal_dir() -> Path:
+    return Path(Config.settings_dir()) / JOURNAL_DIR_NAME
+
+
+def journal_path() -> Path:
+    return journal_dir() / JOURNAL_FILE_NAME
+
+
+class JobJournal:
+    """Append-only JSON Lines journal of job records, replayed on startup.
+
+    Each line is either a full job snapshot ({"job": {...}}) or a deletion
+    ({"deleted": "<job id>"}); the last line for a job id wins. Writes are
+    best-effort like the error log: an IO failure is logged and swallowed, since
+    losing a checkpoint only costs a little rework — workers re-derive their
+    progress from on-disk state via compute_state when resumed.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+        compact_after: int = DEFAULT_COMPACT_AFTER,
+        retention: timedelta = DEFAULT_RETENTION,
+    ) -> None:
+        self.path = path if path is not None else journal_path()
+        self.checkpoint_interval = checkpoint_interval
+        self.compact_after = compact_after
+        self.retention = retention
+        self._line_count = 0
+        # Job id -> (status value, monotonic time) of its last journaled snapshot.
+        self._last_written: dict[str, tuple[str, float]] = {}
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._line_count >= self.compact_after
+
+    def record(self, job: JobRecord, force: bool = False) -> None:
+        """Journal a snapshot of the job. Progress-only changes are throttled to
+        one write per checkpoint_interval; status changes always go through."""
+        now = time.monotonic()
+        last = self._last_written.get(job.id)
+        if (
+            not force
+            and last is not None
+            and last[0] == job.status.value
+            and now - last[1] < self.checkpoint_interval
+        ):
+            return
+        if self._append({"job": job.model_dump(mode="json")}):
+            self._last_written[job.id] = (job.status.value, now)
+
+    def record_deleted(self, job_id: str) -> None:
+        self._last_written.pop(job_id, None)
+        self._append({"deleted": job_id})
+
+    def load(self) -> list[JobRecord]:
+        """Replay the journal into the latest record per job. Best-effort.
+
+        A missing file returns []. Unparsable lines and records that no longer
+        validate are skipped. Finished jobs past the retention window are
+        dropped. Never raises.
+        """
+        records: dict[str, JobRecord] = {}
+        self._line_count = 0
+        try:
+            if not self.path.exists():
+                return []
+            with self.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    self._line_count += 1
+                    try:
+                        entry = json.loads(line)
+                    except (ValueError, TypeError):
+                        continue
+                    if not isinstance(entry, dict):
+                        continue
+                    if isinstance(entry.get("deleted"), str):
+                        records.pop(entry["deleted"], None)
+                        continue
+                    try:
+                        job = JobRecord.model_validate(entry.get("job"))
+                    except ValidationError:
+                        continue
+                    records[job.id] = job
+        except Exception:
+            logger.warning("Failed to read job journal %s", self.path, exc_info=True)
+
+        cutoff = _utc_now() - self.retention
+        return [
+            job
+            for job in records.values()
+            if not (
+                job.status.is_terminal
+                and job.ended_at is not None
+                and job.ended_at < cutoff
+            )
+        ]
+
+    def compact(self, jobs: Iterable[JobRecord]) -> None:
+        """Atomically rewrite the journal as one snapshot line per job."""
+        jobs = list(jobs)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", encoding="utf-8") as f:
+                for job in jobs:
+                    line = json.dumps(
+                        {"job": job.model_dump(mode="json")}, ensure_ascii=False
+                    )
+                    f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._line_count = len(jobs)
+        except Exception:
+            logger.warning("Failed to compact job journal %s", self.path, exc_info=True)
+
+    def _append(self, entry: dict) -> bool:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            line = json.dumps(entry, ensure_ascii=False)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except Exception:
+            logger.warning("Failed to write job journal %s", self.path, exc_info=True)
+            return False
+        self._line_count += 1
+        return True
@@ -108,7 +108,7 @@ class JobError(BaseModel):
 
 
 class JobRecord(BaseModel):
-    """Ephemeral, in-memory bookkeeping for a single job. Never persisted to disk."""
+    """Bookkeeping for a single job, held in memory and snapshotted to the job journal."""
 
     id: str = Field(description="Unique identifier for this job.")
     type: str = Field(
@@ -9,10 +9,11 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from . import error_log
 from .events import JobEventBus
+from .journal import JobJournal
 from .models import (
     BackgroundJobStatus,
     JobContext,
@@ -29,6 +30,7 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_CONCURRENT = 10
 MAX_CONCURRENT_ENV_VAR = "KILN_JOBS_MAX_CONCURRENT"
+RESUME_ON_STARTUP_ENV_VAR = "KILN_JOBS_RESUME_ON_STARTUP"
 
 _JOB_ID_ALPHABET = "abcdefghijklmnopqrstuvwxyz234567"
 _JOB_ID_LENGTH = 12
@@ -64,12 +66,22 @@ def _resolve_max_concurrent(explicit: int | None) -> int:
     return DEFAULT_MAX_CONCURRENT
 
 
+def _resolve_resume_on_startup(explicit: bool | None) -> bool:
+    if explicit is not None:
+        return explicit
+    raw = os.environ.get(RESUME_ON_STARTUP_ENV_VAR)
+    if raw:
+        return raw.strip().lower() not in ("0", "false", "no", "off")
+    return True
+
+
 class JobRegistry:
     """In-memory registry owning job lifecycle, concurrency, and reconciliation.
 
-    Singleton per process. The in-memory index is the only store — no disk
-    persistence of state. Supervising tasks are owned here and decoupled from any
-    HTTP connection.
+    Singleton per process. The in-memory index is authoritative; once a journal
+    is attached via restore(), every transition and a throttled stream of
+    progress checkpoints is also appended to it so jobs survive a restart.
+    Supervising tasks are owned here and decoupled from any HTTP connection.
     """
 
     def __init__(self, max_concurrent: int | None = None) -> None:
@@ -93,6 +105,7 @@ class JobRegistry:
         # awaiter cancelling its wait() leaves the event (and the task) untouched.
         self._completion_events: dict[str, asyncio.Event] = {}
         self._running_count = 0
+        self._journal: JobJournal | None = None
         self.events = JobEventBus(snapshot_provider=self._snapshot)
 
     # -- registration --------------------------------------------------------
@@ -411,6 +424,8 @@ class JobRegistry:
         self._completion_events.pop(job_id, None)
         if job.run_id is not None:
             error_log.delete_errors(job.run_id)
+        if self._journal is not None:
+            self._journal.record_deleted(job_id)
         self.events.publish_deleted(job_id, job.type, job.project_id)
 
     async def _cancel_task(self, job_id: str) -> None:
@@ -507,12 +522,109 @@ class JobRegistry:
         job.updated_at = _utc_now()
 
     def _emit(self, job: JobRecord) -> None:
+        if self._journal is not None:
+            self._journal.record(job)
+            if self._journal.needs_compaction:
+                self._journal.compact(self._jobs.values())
         self.events.publish_job(job)
         if job.status.is_terminal:
             ev = self._completion_events.get(job.id)
             if ev is not None:
                 ev.set()
 
+    # -- persistence ---------------------------------------------------------
+
+    async def restore(
+        self, journal: JobJournal, resume_interrupted: bool | None = None
+    ) -> None:
+        """Load the jobs a journal recorded and attach it for future writes.
+
+        Call once on startup, after worker types are registered. Jobs a restart
+        left running or pending are reconciled against on-disk state first;
+        ones still incomplete are re-queued — run() is idempotent, so workers
+        skip the items already done. With resuming disabled (argument or
+        KILN_JOBS_RESUME_ON_STARTUP=false) they are paused instead, or failed
+        when the worker can't pause. Jobs of a type no longer registered are
+        failed since nothing can run them.
+        """
+        resume = _resolve_resume_on_startup(resume_interrupted)
+        recovered: list[JobRecord] = []
+        for job in journal.load():
+            if job.id in self._jobs:
+                continue
+            self._jobs[job.id] = job
+            if job.status not in (
+                BackgroundJobStatus.RUNNING,
+                BackgroundJobStatus.PENDING,
+            ):
+                continue
+            recovered.append(job)
+            try:
+                await self._recover_interrupted(job, resume)
+            except Exception:
+                # One bad record must not stop the server from starting
+                logger.exception("Failed to recover job %s", job.id)
+                self._remove_pending(job.id)
+                self._fail_interrupted(
+                    job, "Couldn't be recovered after a server restart"
+                )
+
+        for job in recovered:
+            self._emit(job)
+        # Start the journal over from what was recovered, dropping superseded
+        # checkpoints and expired jobs.
+        journal.compact(self._jobs.values())
+        self._journal = journal
+        if recovered:
+            logger.info("Recovered %d interrupted job(s)", len(recovered))
+        self._dispatch_pending()
+
+    async def _recover_interrupted(self, job: JobRecord, resume: bool) -> None:
+        worker = self._workers.get(job.type)
+        if worker is None:
+            self._fail_interrupted(job, f"Job type '{job.type}' is no longer available")
+            return
+        try:
+            worker.params_model.model_validate(job.params)
+        except ValidationError:
+            # e.g. the worker's params model changed in an upgrade
+            logger.warning("Journaled params of job %s no longer validate", job.id)
+            self._fail_interrupted(job, "Job parameters are no longer valid")
+            return
+        await self._reconcile(job, emit_on_change=False)
+        if job.status.is_terminal:
+            return
+        if resume:
+            job.status = BackgroundJobStatus.PENDING
+            self._pending_ids.append(job.id)
+        elif job.supports_pause:
+            job.status = BackgroundJobStatus.PAUSED
+        else:
+            self._fail_interrupted(job, "Interrupted by a server restart")
+            return
+        self._touch(job)
+
+    def close_journal(self) -> None:
+        """Checkpoint unfinished jobs and detach the journal.
+
+        Call on shutdown before the event loop tears down supervising tasks, so
+        the cancellations that follow aren't journaled as user cancels and the
+        jobs are recovered on the next start.
+        """
+        journal = self._journal
+        if journal is None:
+            return
+        for job in self._jobs.values():
+            if not job.status.is_terminal:
+                journal.record(job, force=True)
+        self._journal = None
+
+    def _fail_interrupted(self, job: JobRecord, message: str) -> None:
+        job.status = BackgroundJobStatus.FAILED
+        job.error = JobError(error=message)
+        job.ended_at = _utc_now()
+        self._touch(job)
+
     # -- await completion ----------------------------------------------------
 
     async def wait(self, job_id: str, timeout: float | None = None) -> JobRecord:
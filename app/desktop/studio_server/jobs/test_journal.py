@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from app.desktop.studio_server.jobs import journal as journal_module
+from app.desktop.studio_server.jobs.journal import JobJournal
+from app.desktop.studio_server.jobs.models import (
+    BackgroundJobStatus,
+    JobProgress,
+    JobRecord,
+    _utc_now,
+)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return JobJournal(tmp_path / "journal.jsonl", checkpoint_interval=60.0)
+
+
+def _job(job_id: str = "j_a", **kwargs) -> JobRecord:
+    fields = {"type": "noop", "status": BackgroundJobStatus.RUNNING, **kwargs}
+    return JobRecord(id=job_id, **fields)
+
+
+def test_default_path_is_under_settings_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        journal_module.Config, "settings_dir", classmethod(lambda cls: str(tmp_path))
+    )
+    assert JobJournal().path == tmp_path / "jobs" / "journal.jsonl"
+
+
+def test_load_missing_file_returns_empty(journal):
+    assert journal.load() == []
+
+
+def test_last_snapshot_wins(journal):
+    job = _job()
+    journal.record(job)
+    job.status = BackgroundJobStatus.SUCCEEDED
+    job.ended_at = _utc_now()
+    journal.record(job)
+
+    loaded = journal.load()
+    assert [j.id for j in loaded] == ["j_a"]
+    assert loaded[0].status == BackgroundJobStatus.SUCCEEDED
+
+
+def test_progress_checkpoints_are_throttled(journal):
+    job = _job()
+    journal.record(job)
+    job.progress = JobProgress(total=10, success=3)
+    journal.record(job)
+
+    # Same status within the checkpoint interval: the second write is skipped.
+    assert journal.load()[0].progress.success == 0
+
+    journal.record(job, force=True)
+    assert journal.load()[0].progress.success == 3
+
+
+def test_status_change_bypasses_throttle(journal):
+    job = _job()
+    journal.record(job)
+    job.status = BackgroundJobStatus.PAUSED
+    journal.record(job)
+    assert journal.load()[0].status == BackgroundJobStatus.PAUSED
+
+
+def test_deleted_jobs_are_dropped(journal):
+    journal.record(_job("j_a"))
+    journal.record(_job("j_b"))
+    journal.record_deleted("j_a")
+    assert [j.id for j in journal.load()] == ["j_b"]
+
+
+def test_load_skips_unparsable_lines(journal):
+    journal.record(_job("j_a"))
+    with journal.path.open("a", encoding="utf-8") as f:
+        f.write("not json at all\n")
+        f.write('{"job": {"id": "missing fields"}}\n')
+        f.write("\n")
+    journal.record(_job("j_b"))
+    assert {j.id for j in journal.load()} == {"j_a", "j_b"}
+
+
+def test_load_drops_expired_terminal_jobs(tmp_path):
+    journal = JobJournal(tmp_path / "journal.jsonl", retention=timedelta(days=1))
+    old_end = _utc_now() - timedelta(days=2)
+    journal.record(
+        _job("j_old", status=BackgroundJobStatus.SUCCEEDED, ended_at=old_end)
+    )
+    journal.record(_job("j_paused", status=BackgroundJobStatus.PAUSED))
+    journal.record(
+        _job("j_new", status=BackgroundJobStatus.FAILED, ended_at=_utc_now())
+    )
+    assert {j.id for j in journal.load()} == {"j_paused", "j_new"}
+
+
+def test_compact_rewrites_one_line_per_job(tmp_path):
+    journal = JobJournal(tmp_path / "journal.jsonl", compact_after=3)
+    job = _job()
+    for status in (
+        BackgroundJobStatus.PENDING,
+        BackgroundJobStatus.RUNNING,
+        BackgroundJobStatus.PAUSED,
+    ):
+        job.status = status
+        journal.record(job)
+    assert journal.needs_compaction
+
+    journal.compact([job])
+    assert not journal.needs_compaction
+    assert len(journal.path.read_text(encoding="utf-8").splitlines()) == 1
+    assert journal.load()[0].status == BackgroundJobStatus.PAUSED
+
+
+def test_write_failure_is_swallowed(tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("a file, not a directory")
+    journal = JobJournal(blocker / "journal.jsonl")
+    journal.record(_job())
+    journal.record_deleted("j_a")
+    journal.compact([_job()])
+    assert journal.load() == []
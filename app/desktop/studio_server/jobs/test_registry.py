@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import uuid
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel
 
 from app.desktop.studio_server.jobs import error_log
+from app.desktop.studio_server.jobs.journal import JobJournal
 from app.desktop.studio_server.jobs.models import (
     BackgroundJobStatus,
     JobDerivedState,
+    JobRecord,
     JobWorker,
+    _utc_now,
 )
 from app.desktop.studio_server.jobs.registry import (
     JobNotFoundError,
@@ -872,3 +876,157 @@ async def test_report_progress_detail_rejects_wrong_model():
     # The type guard raises inside run(), routing the job to FAILED.
     await wait_for_status(reg, job.id, BackgroundJobStatus.FAILED)
     assert reg._jobs[job.id].error is not None
+
+
+# -- journal / restart recovery ---------------------------------------------
+
+
+def _interrupted(journal: JobJournal, type_name: str, params=None) -> str:
+    """Journal a job as a crashed process would have left it: still running."""
+    job = JobRecord(
+        id=_new_job_id(),
+        type=type_name,
+        status=BackgroundJobStatus.RUNNING,
+        params=params or {},
+        supports_pause=type_name != "nonpausable",
+        run_id=str(uuid.uuid4()),
+    )
+    journal.record(job)
+    return job.id
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return JobJournal(tmp_path / "jobs" / "journal.jsonl")
+
+
+async def test_restore_resumes_interrupted_job(registry, journal):
+    job_id = _interrupted(journal, "noop", {"steps": 2, "sleep_per_step_seconds": 0.01})
+
+    await registry.restore(journal, resume_interrupted=True)
+    await wait_for_status(registry, job_id, BackgroundJobStatus.SUCCEEDED)
+
+    journaled = {j.id: j for j in journal.load()}
+    assert journaled[job_id].status == BackgroundJobStatus.SUCCEEDED
+    assert journaled[job_id].result == {"completed_steps": 2}
+
+
+async def test_restore_keeps_finished_and_paused_jobs(registry, journal):
+    finished = JobRecord(
+        id=_new_job_id(),
+        type="noop",
+        status=BackgroundJobStatus.SUCCEEDED,
+        ended_at=_utc_now(),
+    )
+    paused = JobRecord(id=_new_job_id(), type="noop", status=BackgroundJobStatus.PAUSED)
+    journal.record(finished)
+    journal.record(paused)
+
+    await registry.restore(journal, resume_interrupted=True)
+
+    assert registry._jobs[finished.id].status == BackgroundJobStatus.SUCCEEDED
+    assert registry._jobs[paused.id].status == BackgroundJobStatus.PAUSED
+    assert registry._pending_ids == []
+
+
+async def test_restore_without_resume_pauses_or_fails(journal):
+    reg = JobRegistry(max_concurrent=10)
+    reg.register_type(NoopJobWorker)
+    reg.register_type(NonPausableWorker)
+    pausable_id = _interrupted(journal, "noop")
+    nonpausable_id = _interrupted(journal, "nonpausable")
+
+    await reg.restore(journal, resume_interrupted=False)
+
+    assert reg._jobs[pausable_id].status == BackgroundJobStatus.PAUSED
+    failed = reg._jobs[nonpausable_id]
+    assert failed.status == BackgroundJobStatus.FAILED
+    assert failed.error is not None
+    assert "restart" in failed.error.error
+
+
+async def test_restore_resume_env_var(registry, journal, monkeypatch):
+    monkeypatch.setenv("KILN_JOBS_RESUME_ON_STARTUP", "false")
+    job_id = _interrupted(journal, "noop")
+
+    await registry.restore(journal)
+
+    assert registry._jobs[job_id].status == BackgroundJobStatus.PAUSED
+
+
+async def test_restore_fails_unknown_job_type(registry, journal):
+    job_id = _interrupted(journal, "no_longer_registered")
+
+    await registry.restore(journal, resume_interrupted=True)
+
+    job = registry._jobs[job_id]
+    assert job.status == BackgroundJobStatus.FAILED
+    assert job.error is not None
+    assert "no_longer_registered" in job.error.error
+
+
+async def test_restore_fails_job_with_invalid_params(registry, journal):
+    bad_id = _interrupted(journal, "noop", {"steps": "not-an-int"})
+    good_id = _interrupted(
+        journal, "noop", {"steps": 1, "sleep_per_step_seconds": 0.01}
+    )
+
+    await registry.restore(journal, resume_interrupted=True)
+
+    bad = registry._jobs[bad_id]
+    assert bad.status == BackgroundJobStatus.FAILED
+    assert bad.error is not None
+    assert "no longer valid" in bad.error.error
+    # the other jobs are still recovered
+    await wait_for_status(registry, good_id, BackgroundJobStatus.SUCCEEDED)
+
+
+async def test_restore_fails_job_whose_recovery_raises(registry, journal):
+    job_id = _interrupted(journal, "noop")
+
+    with patch.object(
+        JobRegistry, "_reconcile", side_effect=RuntimeError("corrupt record")
+    ):
+        await registry.restore(journal, resume_interrupted=True)
+
+    job = registry._jobs[job_id]
+    assert job.status == BackgroundJobStatus.FAILED
+    assert registry._pending_ids == []
+    assert registry._journal is journal
+
+
+async def test_restore_completes_job_already_done_on_disk(journal):
+    reg = JobRegistry(max_concurrent=10)
+    reg.register_type(AlreadyCompleteWorker)
+    AlreadyCompleteWorker.run_called = False
+    job_id = _interrupted(journal, "already_complete")
+
+    await reg.restore(journal, resume_interrupted=True)
+
+    assert reg._jobs[job_id].status == BackgroundJobStatus.SUCCEEDED
+    assert reg._jobs[job_id].progress.success == 5
+    assert AlreadyCompleteWorker.run_called is False
+
+
+async def test_close_journal_leaves_running_jobs_recoverable(registry, journal):
+    await registry.restore(journal)
+    job = await registry.create("noop", {"steps": 100, "sleep_per_step_seconds": 0.05})
+    await wait_for_status(registry, job.id, BackgroundJobStatus.RUNNING)
+
+    registry.close_journal()
+    # Shutdown cancels the supervising task; that must not reach the journal.
+    await registry.cancel(job.id)
+
+    journaled = {j.id: j for j in journal.load()}
+    assert journaled[job.id].status == BackgroundJobStatus.RUNNING
+
+
+async def test_delete_is_journaled(registry, journal):
+    await registry.restore(journal)
+    job = await registry.create("noop", {"steps": 1, "sleep_per_step_seconds": 0.01})
+    await wait_for_status(registry, job.id, BackgroundJobStatus.SUCCEEDED)
+    assert [j.id for j in journal.load()] == [job.id]
+
+    await registry.delete(job.id)
+
+    assert journal.load() == []
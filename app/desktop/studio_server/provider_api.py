@@ -46,6 +46,7 @@ from kiln_ai.datamodel.finetune import Finetune
 from kiln_ai.datamodel.registry import all_projects
 from kiln_ai.utils.config import Config
 from kiln_ai.utils.exhaustive_error import raise_exhaustive_enum_error
+from kiln_ai.utils.http_client_pool import HttpClientPool
 from kiln_ai.utils.wandb_utils import AuthenticationError, get_wandb_default_entity
 from kiln_server.utils.agent_checks.policy import ALLOW_AGENT, DENY_AGENT
 from pydantic import BaseModel, Field
@@ -1036,13 +1037,17 @@ def connect_provider_api(app: FastAPI):
             return JSONResponse(status_code=200, content={"is_valid": False})
 
         base_url = os.environ.get("KILN_SERVER_BASE_URL", "https://api.kiln.tech")
+        url = f"{base_url}/v1/verify_api_key"
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{base_url}/v1/verify_api_key",
+            response = (
+                await HttpClientPool.shared()
+                .client(url)
+                .get(
+                    url,
                     headers={"Authorization": f"Bearer {key}"},
                     timeout=10,
                 )
+            )
         except httpx.RequestError:
             return JSONResponse(status_code=200, content={"is_valid": False})
 
@@ -3,11 +3,13 @@ from typing import Annotated, Any
 from fastapi import FastAPI, HTTPException, Path, Query
 from kiln_ai.utils.config import Config
 from kiln_ai.utils.filesystem import open_folder
+from kiln_ai.utils.http_client_pool import HttpClientPool
 from kiln_server.project_api import project_from_id
 from kiln_server.utils.agent_checks.policy import (
     DENY_AGENT,
     agent_policy_require_approval,
 )
+from pydantic import BaseModel, Field
 
 from app.desktop.log_config import get_log_file_path
 from app.desktop.studio_server.api_client.kiln_ai_server_client.api.auth import (
@@ -20,6 +22,17 @@ from app.desktop.studio_server.utils.copilot_utils import get_copilot_api_key
 from app.desktop.studio_server.utils.response_utils import unwrap_response
 
 
+class HttpPoolMetricsResponse(BaseModel):
+    requests: int = Field(description="Requests sent through the pooled client.")
+    connections_opened: int = Field(description="New connections opened.")
+    connections_reused: int = Field(
+        description="Requests which went out on an already open connection."
+    )
+    reuse_ratio: float = Field(
+        description="Fraction of requests which reused a connection, 0 to 1."
+    )
+
+
 def open_logs_folder() -> None:
     open_folder(get_log_file_path("dummy.log"))
 
@@ -59,6 +72,24 @@ def connect_settings(app: FastAPI):
         settings = Config.shared().settings(hide_sensitive=True)
         return {item_id: settings.get(item_id, None)}
 
+    @app.get(
+        "/api/http_pool_metrics",
+        summary="Get HTTP Pool Metrics",
+        tags=["Settings & Utilities"],
+        openapi_extra=DENY_AGENT,
+    )
+    def read_http_pool_metrics() -> dict[str, HttpPoolMetricsResponse]:
+        """Request and connection counts of the pooled HTTP clients since startup, by base URL (or provider)."""
+        return {
+            key: HttpPoolMetricsResponse(
+                requests=metrics.requests,
+                connections_opened=metrics.connections_opened,
+                connections_reused=metrics.connections_reused,
+                reuse_ratio=metrics.reuse_ratio,
+            )
+            for key, metrics in HttpClientPool.shared().metrics().items()
+        }
+
     @app.post(
         "/api/open_logs",
         summary="Open Logs Folder",
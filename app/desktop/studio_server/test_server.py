@@ -1,5 +1,6 @@
 import os
 import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -23,6 +24,10 @@ def client(monkeypatch):
         patch(
             "app.desktop.desktop_server.refresh_model_list_background"
         ) as mock_refresh_model_list_background,
+        patch(
+            "app.desktop.studio_server.jobs.journal.journal_dir",
+            new=lambda: Path(temp_dir) / "jobs",
+        ),
     ):
         mock_refresh_model_list_background.return_value = None
         os.makedirs(temp_dir, exist_ok=True)
@@ -6,6 +6,7 @@ import yaml
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from kiln_ai.utils.config import Config
+from kiln_ai.utils.http_client_pool import HttpClientPool, HttpPoolMetrics
 from kiln_server.custom_errors import connect_custom_errors
 
 from app.desktop.studio_server.api_client.kiln_ai_server_client.models.check_entitlements_v1_check_entitlements_get_response_check_entitlements_v1_check_entitlements_get import (
@@ -68,6 +69,24 @@ def test_read_settings(client, temp_home):
     assert response.json() == test_settings
 
 
+def test_read_http_pool_metrics(client):
+    pool = HttpClientPool()
+    pool._metrics["https://api.openai.com"] = HttpPoolMetrics(
+        requests=4, connections_opened=1
+    )
+    with patch.object(HttpClientPool, "shared", return_value=pool):
+        response = client.get("/api/http_pool_metrics")
+    assert response.status_code == 200
+    assert response.json() == {
+        "https://api.openai.com": {
+            "requests": 4,
+            "connections_opened": 1,
+            "connections_reused": 3,
+            "reuse_ratio": 0.75,
+        }
+    }
+
+
 def test_read_item(client, temp_home):
     response = client.get("/api/settings/setting1")
     assert response.status_code == 200
@@ -176,6 +176,31 @@ async def test_create_tool_server_success(client, test_project):
             )
             assert "id" in result
             assert "created_at" in result
+            assert "stateless" not in result["properties"]
+
+
+async def test_create_tool_server_stateless(client, test_project):
+    tool_data = {
+        "name": "test_mcp_tool",
+        "server_url": "https://example.com/mcp",
+        "stateless": True,
+        "is_archived": False,
+    }
+
+    with patch(
+        "app.desktop.studio_server.tool_api.project_from_id"
+    ) as mock_project_from_id:
+        mock_project_from_id.return_value = test_project
+
+        async with mock_mcp_success():
+            response = client.post(
+                f"/api/projects/{test_project.id}/connect_remote_mcp",
+                json=tool_data,
+            )
+
+    assert response.status_code == 200
+    assert response.json()["properties"]["stateless"] is True
+    assert test_project.external_tool_servers()[0].properties["stateless"] is True
 
 
 async def test_create_tool_server_validation_connection_failed(client, test_project):
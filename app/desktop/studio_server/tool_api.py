@@ -87,6 +87,10 @@ class ExternalToolServerCreationRequest(BaseModel):
         default_factory=list,
         description="Header keys whose values are stored as secrets.",
     )
+    stateless: bool = Field(
+        default=False,
+        description="Whether the server keeps no state between calls, so its sessions can be pooled and shared by runs.",
+    )
     is_archived: bool = Field(description="Whether the tool server is archived.")
 
 
@@ -108,6 +112,10 @@ class LocalToolServerCreationRequest(BaseModel):
         default_factory=list,
         description="Environment variable keys whose values are stored as secrets.",
     )
+    stateless: bool = Field(
+        default=False,
+        description="Whether the server keeps no state between calls, so its sessions can be pooled and shared by runs.",
+    )
     is_archived: bool = Field(description="Whether the tool server is archived.")
 
 
@@ -753,12 +761,15 @@ def connect_tool_servers_api(app: FastAPI):
         tool_data: ExternalToolServerCreationRequest,
     ) -> RemoteServerProperties:
         # Create the ExternalToolServer with all data for validation
-        return {
+        properties: RemoteServerProperties = {
             "server_url": tool_data.server_url,
             "headers": tool_data.headers,
             "secret_header_keys": tool_data.secret_header_keys,
             "is_archived": tool_data.is_archived,
         }
+        if tool_data.stateless:
+            properties["stateless"] = True
+        return properties
 
     @app.post(
         "/api/projects/{project_id}/connect_local_mcp",
@@ -850,13 +861,16 @@ def connect_tool_servers_api(app: FastAPI):
     def _local_tool_server_properties(
         tool_data: LocalToolServerCreationRequest,
     ) -> LocalServerProperties:
-        return {
+        properties: LocalServerProperties = {
             "command": tool_data.command,
             "args": tool_data.args,
             "env_vars": tool_data.env_vars,
             "secret_env_var_keys": tool_data.secret_env_var_keys,
             "is_archived": tool_data.is_archived,
         }
+        if tool_data.stateless:
+            properties["stateless"] = True
+        return properties
 
     def _validate_kiln_task_tool_task_and_run_config(
         project_id: str, tool_data: KilnTaskToolServerCreationRequest
@@ -1481,6 +1481,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/http_pool_metrics": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get HTTP Pool Metrics
+         * @description Request and connection counts of the pooled HTTP clients since startup, by base URL (or provider).
+         */
+        get: operations["read_http_pool_metrics_api_http_pool_metrics_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/open_logs": {
         parameters: {
             query?: never;
@@ -3341,6 +3361,23 @@ export interface paths {
         patch: operations["api_update_config_api_git_sync_config__project_id__patch"];
         trace?: never;
     };
+    "/api/git_sync/status/{project_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** Get Git Sync Status */
+        get: operations["api_get_status_api_git_sync_status__project_id__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/git_sync/oauth/start": {
         parameters: {
             query?: never;
@@ -4593,6 +4630,8 @@ export interface components {
             is_error?: boolean | null;
             /** Error Message */
             error_message?: string | null;
+            /** Cache Hit */
+            cache_hit?: boolean | null;
         };
         /**
          * ChatCompletionUserMessageParam
@@ -4803,6 +4842,11 @@ export interface components {
              * @enum {string}
              */
             auth_mode: "system_keys" | "pat_token" | "github_oauth";
+            /**
+             * Depth
+             * @description Clone only the latest N commits (a shallow clone), for faster setup of projects with long histories. Omit to clone the full history.
+             */
+            depth?: number | null;
         };
         /**
          * CloneResponse
@@ -7133,6 +7177,12 @@ export interface components {
              * @description Header keys whose values are stored as secrets.
              */
             secret_header_keys?: string[];
+            /**
+             * Stateless
+             * @description Whether the server keeps no state between calls, so its sessions can be pooled and shared by runs.
+             * @default false
+             */
+            stateless?: boolean;
             /**
              * Is Archived
              * @description Whether the tool server is archived.
@@ -7944,6 +7994,74 @@ export interface components {
              */
             has_oauth_token: boolean;
         };
+        /**
+         * GitSyncStatusResponse
+         * @description Live sync activity for a project: polling, traffic with the remote, and freshness.
+         */
+        GitSyncStatusResponse: {
+            /**
+             * Active
+             * @description Whether a sync manager is running for this project's clone.
+             */
+            active: boolean;
+            /**
+             * Background Sync Running
+             * @description Whether the background poller is running.
+             * @default false
+             */
+            background_sync_running: boolean;
+            /**
+             * Background Sync Paused
+             * @description Whether the background poller is paused after inactivity.
+             * @default false
+             */
+            background_sync_paused: boolean;
+            /**
+             * Poll Interval Seconds
+             * @description Current background poll interval, which adapts to activity.
+             */
+            poll_interval_seconds?: number | null;
+            /**
+             * Fetch Count
+             * @description Fetches from the remote.
+             * @default 0
+             */
+            fetch_count: number;
+            /**
+             * Fetched Bytes
+             * @description Bytes received from the remote by fetches.
+             * @default 0
+             */
+            fetched_bytes: number;
+            /**
+             * Ref Check Count
+             * @description Cheap checks of the remote branch, made before fetching.
+             * @default 0
+             */
+            ref_check_count: number;
+            /**
+             * Skipped Fetch Count
+             * @description Background polls that skipped the fetch as the remote had not moved.
+             * @default 0
+             */
+            skipped_fetch_count: number;
+            /**
+             * Seconds Since Remote Check
+             * @description Seconds since the remote was last checked, or None if never.
+             */
+            seconds_since_remote_check?: number | null;
+            /**
+             * Has Unpushed Writes
+             * @description Whether saved changes are waiting to be pushed (group commit).
+             * @default false
+             */
+            has_unpushed_writes: boolean;
+            /**
+             * Unpushed Conflicts
+             * @description Refs of saved changes which conflicted with the remote (group commit). Saves are refused until they're resolved.
+             */
+            unpushed_conflicts: string[];
+        };
         /** GuidePreviewInput */
         GuidePreviewInput: {
             /**
@@ -8020,6 +8138,29 @@ export interface components {
             /** Hallucinations Examples */
             hallucinations_examples: string;
         };
+        /** HttpPoolMetricsResponse */
+        HttpPoolMetricsResponse: {
+            /**
+             * Requests
+             * @description Requests sent through the pooled client.
+             */
+            requests: number;
+            /**
+             * Connections Opened
+             * @description New connections opened.
+             */
+            connections_opened: number;
+            /**
+             * Connections Reused
+             * @description Requests which went out on an already open connection.
+             */
+            connections_reused: number;
+            /**
+             * Reuse Ratio
+             * @description Fraction of requests which reused a connection, 0 to 1.
+             */
+            reuse_ratio: number;
+        };
         /** ImageURL */
         ImageURL: {
             /** Url */
@@ -8175,7 +8316,7 @@ export interface components {
         };
         /**
          * JobRecord
-         * @description Ephemeral, in-memory bookkeeping for a single job. Never persisted to disk.
+         * @description Bookkeeping for a single job, held in memory and snapshotted to the job journal.
          */
         JobRecord: {
             /**
@@ -8504,6 +8645,9 @@ export interface components {
             doc_id_key: string;
             /** Nprobes */
             nprobes: number;
+            /** Refine Factor */
+            refine_factor?: number;
+            vector_index?: components["schemas"]["LanceDBVectorIndexProperties"];
         };
         /** LanceDBConfigHybridPropertiesPublic */
         LanceDBConfigHybridPropertiesPublic: {
@@ -8532,6 +8676,9 @@ export interface components {
             doc_id_key: string;
             /** Nprobes */
             nprobes: number;
+            /** Refine Factor */
+            refine_factor?: number;
+            vector_index?: components["schemas"]["LanceDBVectorIndexProperties"];
         };
         /** LanceDBConfigVectorPropertiesPublic */
         LanceDBConfigVectorPropertiesPublic: {
@@ -8541,6 +8688,29 @@ export interface components {
              */
             similarity_top_k: number;
         };
+        /**
+         * LanceDBVectorIndexMetric
+         * @description The distance metric the ANN index is built for.
+         * @enum {string}
+         */
+        LanceDBVectorIndexMetric: "l2" | "cosine" | "dot";
+        /** LanceDBVectorIndexProperties */
+        LanceDBVectorIndexProperties: {
+            index_type: components["schemas"]["LanceDBVectorIndexType"];
+            metric: components["schemas"]["LanceDBVectorIndexMetric"];
+            /** Min Rows */
+            min_rows: number;
+            /** Num Partitions */
+            num_partitions?: number;
+            /** Num Sub Vectors */
+            num_sub_vectors?: number;
+        };
+        /**
+         * LanceDBVectorIndexType
+         * @description The type of approximate nearest neighbor (ANN) index built over the vectors.
+         * @enum {string}
+         */
+        LanceDBVectorIndexType: "ivf_pq" | "ivf_hnsw_sq" | "ivf_hnsw_pq";
         /**
          * ListBranchesRequest
          * @description Request to list branches on a git remote.
@@ -8716,6 +8886,12 @@ export interface components {
              * @description Environment variable keys whose values are stored as secrets.
              */
             secret_env_var_keys?: string[];
+            /**
+             * Stateless
+             * @description Whether the server keeps no state between calls, so its sessions can be pooled and shared by runs.
+             * @default false
+             */
+            stateless?: boolean;
             /**
              * Is Archived
              * @description Whether the tool server is archived.
@@ -8879,6 +9055,11 @@ export interface components {
              * @description Number of tokens served from prompt cache. None if not reported.
              */
             cached_tokens?: number | null;
+            /**
+             * Response Cache Hits
+             * @description Number of LLM calls replayed from Kiln's local response cache instead of calling the provider. Their token counts are from the original call, and their cost is zero.
+             */
+            response_cache_hits?: number | null;
         };
         /** ModelDetails */
         ModelDetails: {
@@ -12295,6 +12476,11 @@ export interface components {
              * @description Number of tokens served from prompt cache. None if not reported.
              */
             cached_tokens?: number | null;
+            /**
+             * Response Cache Hits
+             * @description Number of LLM calls replayed from Kiln's local response cache instead of calling the provider. Their token counts are from the original call, and their cost is zero.
+             */
+            response_cache_hits?: number | null;
             /**
              * Total Llm Latency Ms
              * @description Total time spent waiting on LLM API calls in milliseconds. Sum of per-call latencies, excludes tool execution time.
@@ -15921,6 +16107,28 @@ export interface operations {
             };
         };
     };
+    read_http_pool_metrics_api_http_pool_metrics_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": {
+                        [key: string]: components["schemas"]["HttpPoolMetricsResponse"];
+                    };
+                };
+            };
+        };
+    };
     open_logs_api_open_logs_post: {
         parameters: {
             query?: never;
@@ -20119,6 +20327,38 @@ export interface operations {
             };
         };
     };
+    api_get_status_api_git_sync_status__project_id__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                /** @description The unique identifier of the project. */
+                project_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["GitSyncStatusResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     api_oauth_start_api_git_sync_oauth_start_post: {
         parameters: {
             query?: never;
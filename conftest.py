@@ -72,6 +72,42 @@ def reset_config():
     Config._shared_instance = None
 
 
+# Pooled HTTP clients are bound to the test's event loop, so don't share them between tests
+@pytest.fixture(autouse=True)
+def reset_http_client_pool():
+    yield
+    # Only loaded once something has used the pool, no need to import it otherwise
+    http_client_pool = sys.modules.get("kiln_ai.utils.http_client_pool")
+    if http_client_pool is not None:
+        http_client_pool.HttpClientPool.reset_shared()
+
+
+# Cached tool results would otherwise carry over between tests which reuse a run ID
+@pytest.fixture(autouse=True)
+def reset_tool_result_cache():
+    yield
+    tool_result_cache = sys.modules.get("kiln_ai.tools.tool_result_cache")
+    if tool_result_cache is not None:
+        tool_result_cache.ToolResultCache.reset_shared()
+
+
+# Tests reuse tool server IDs with different mocked tool lists
+@pytest.fixture(autouse=True)
+def reset_mcp_tool_catalog():
+    yield
+    mcp_tool_catalog = sys.modules.get("kiln_ai.tools.mcp_tool_catalog")
+    if mcp_tool_catalog is not None:
+        mcp_tool_catalog.MCPToolCatalog.reset_shared()
+
+
+@pytest.fixture(autouse=True)
+def reset_kiln_task_adapter_cache():
+    yield
+    kiln_task_adapter_cache = sys.modules.get("kiln_ai.tools.kiln_task_adapter_cache")
+    if kiln_task_adapter_cache is not None:
+        kiln_task_adapter_cache.KilnTaskAdapterCache.reset_shared()
+
+
 # mock out the settings path so we don't clobber the user's actual settings during tests
 @pytest.fixture(autouse=True)
 def use_temp_settings_dir(tmp_path):
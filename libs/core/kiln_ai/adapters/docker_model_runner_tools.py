@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 
 from kiln_ai.adapters.ml_model_list import ModelProviderName, built_in_models
 from kiln_ai.utils.config import Config
+from kiln_ai.utils.http_client_pool import HttpClientPool
 
 
 def docker_model_runner_base_url() -> str:
@@ -32,9 +33,9 @@ async def docker_model_runner_online() -> bool:
     try:
         base_url = docker_model_runner_base_url()
         # Docker Model Runner uses OpenAI-compatible endpoints
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{base_url}/v1/models", timeout=5.0)
-            response.raise_for_status()
+        url = f"{base_url}/v1/models"
+        response = await HttpClientPool.shared().client(url).get(url, timeout=5.0)
+        response.raise_for_status()
     except httpx.RequestError:
         return False
     return True
@@ -10,6 +10,7 @@ from kiln_ai.adapters.embedding.base_embedding_adapter import (
     Embedding,
     EmbeddingResult,
 )
+from kiln_ai.adapters.litellm_utils.response_cache import LlmResponseCache
 from kiln_ai.adapters.ml_embedding_model_list import (
     KilnEmbeddingModelProvider,
     built_in_embedding_models_from_provider,
@@ -18,6 +19,7 @@ from kiln_ai.adapters.ml_embedding_model_list import (
 from kiln_ai.adapters.provider_tools import LiteLlmCoreConfig
 from kiln_ai.datamodel.datamodel_enums import ModelProviderName
 from kiln_ai.datamodel.embedding import EmbeddingConfig
+from kiln_ai.utils.http_client_pool import HttpClientPool
 from kiln_ai.utils.litellm import get_litellm_provider_info
 
 # litellm enforces a limit, documented here:
@@ -158,6 +160,10 @@ class LitellmEmbeddingAdapter(BaseEmbeddingAdapter):
             "input": input_texts,
             **self.build_options().model_dump(exclude_none=True),
             **completion_kwargs,
+            "shared_session": HttpClientPool.shared().litellm_session(
+                self.litellm_core_config.base_url,
+                self.embedding_config.model_provider_name,
+            ),
         }
 
         # OpenRouter rejects encoding_format=None; we must send encoding_format='float'
@@ -165,7 +171,7 @@ class LitellmEmbeddingAdapter(BaseEmbeddingAdapter):
         if self.embedding_config.model_provider_name == ModelProviderName.openrouter:
             aembedding_kwargs["encoding_format"] = "float"
 
-        response = await litellm.aembedding(**aembedding_kwargs)
+        response = await LlmResponseCache.shared().aembedding(**aembedding_kwargs)
 
         validated_embeddings = validate_map_to_embeddings(
             response, expected_embedding_count=len(input_texts)
@@ -1,5 +1,5 @@
 from typing import List, Tuple
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 from litellm import Usage
@@ -307,6 +307,7 @@ class TestLitellmEmbeddingAdapter:
             model="openai/text-embedding-3-small",
             input=["test text"],
             dimensions=1536,
+            shared_session=ANY,
         )
 
         assert len(result.embeddings) == 1
@@ -393,6 +394,7 @@ class TestLitellmEmbeddingAdapter:
         mock_aembedding.assert_called_once_with(
             model="openai/text-embedding-3-small",
             input=["single text"],
+            shared_session=ANY,
         )
 
         assert len(result.embeddings) == 1
@@ -36,6 +36,7 @@ from kiln_ai.datamodel.eval_splits import (
 )
 from kiln_ai.datamodel.task import TaskRunConfig
 from kiln_ai.datamodel.task_run import EvalItemSource, TaskRun, Usage
+from kiln_ai.run_context import clear_eval_id, get_eval_id, set_eval_id
 from kiln_ai.utils.async_job_runner import AsyncJobRunner, Progress, RetryableError
 from kiln_ai.utils.git_sync_protocols import SaveContext, default_save_context
 from kiln_ai.utils.open_ai_types import serialize_trace
@@ -289,6 +290,17 @@ class EvalRunner:
             yield progress
 
     async def run_job(self, job: EvalJob) -> bool:
+        # Scopes eval scoped caches (like tool results) to this eval's items
+        is_root_eval = get_eval_id() is None
+        if is_root_eval and self.eval.id is not None:
+            set_eval_id(self.eval.id)
+        try:
+            return await self._run_job(job)
+        finally:
+            if is_root_eval:
+                clear_eval_id()
+
+    async def _run_job(self, job: EvalJob) -> bool:
         try:
             if job.eval_config.config_type == EvalConfigType.v2:
                 return await self._run_v2_job(job)
@@ -50,6 +50,7 @@ from kiln_ai.datamodel.eval_splits import resolve_split
 from kiln_ai.datamodel.run_config import KilnAgentRunConfigProperties
 from kiln_ai.datamodel.task import StructuredOutputMode, TaskRunConfig
 from kiln_ai.datamodel.usage import MessageUsage, Usage
+from kiln_ai.run_context import get_eval_id
 from kiln_ai.utils.async_job_runner import RetryableError
 from kiln_ai.utils.git_sync_protocols import default_save_context
 from kiln_ai.utils.open_ai_types import ChatCompletionMessageParam
@@ -846,6 +847,38 @@ async def test_run_job_success_eval_config_eval(
     assert saved_run.eval_config_eval is True
 
 
+@pytest.mark.asyncio
+async def test_run_job_sets_eval_id(
+    mock_eval_runner, mock_task, data_source, mock_eval_config
+):
+    task_run = TaskRun(
+        parent=mock_task,
+        input="test input",
+        input_source=data_source,
+        output=TaskOutput(output="test output"),
+    )
+    task_run.save_to_file()
+    job = EvalJob(item=task_run, type="eval_config_eval", eval_config=mock_eval_config)
+    seen_eval_ids = []
+
+    class RecordingEvaluator(BaseEval):
+        async def run_eval(
+            self, task_run: TaskRun, eval_job_item: TaskRun | None = None
+        ) -> tuple[EvalScores, Dict[str, str] | None]:
+            seen_eval_ids.append(get_eval_id())
+            return {"accuracy": 0.95}, None
+
+    with patch(
+        "kiln_ai.adapters.eval.eval_runner.legacy_eval_adapter_from_type",
+        return_value=lambda *args, **kwargs: RecordingEvaluator(*args, **kwargs),
+    ):
+        assert await mock_eval_runner.run_job(job) is True
+
+    # eval scoped caches are shared by the eval's items, and cleared after each job
+    assert seen_eval_ids == [mock_eval_runner.eval.id]
+    assert get_eval_id() is None
+
+
 @pytest.mark.asyncio
 async def test_run_job_invalid_evaluator(
     mock_eval_runner, mock_task, data_source, mock_run_config, mock_eval_config
@@ -1035,6 +1068,7 @@ async def test_run_job_full_trace_serializes_per_message_usage(
         "total_tokens": None,
         "cost": 0.001,
         "cached_tokens": None,
+        "response_cache_hits": None,
     }
 
 
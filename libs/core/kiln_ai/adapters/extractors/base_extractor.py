@@ -1,6 +1,8 @@
 import logging
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
 
 from pydantic import BaseModel, Field
 
@@ -28,6 +30,20 @@ class ExtractionOutput(BaseModel):
     content: str = Field(description="The extracted data.")
 
 
+@dataclass
+class ExtractionPageProgress:
+    """
+    Progress of a multi-page extraction, reported each time a page finishes.
+    """
+
+    complete: int
+    total: int
+    errors: int
+
+
+ExtractionPageProgressCallback = Callable[[ExtractionPageProgress], None]
+
+
 class BaseExtractor(ABC):
     """
     Base class for all extractors.
@@ -39,15 +55,22 @@ class BaseExtractor(ABC):
         self.extractor_config = extractor_config
 
     @abstractmethod
-    async def _extract(self, extraction_input: ExtractionInput) -> ExtractionOutput:
+    async def _extract(
+        self,
+        extraction_input: ExtractionInput,
+        on_page_progress: ExtractionPageProgressCallback | None = None,
+    ) -> ExtractionOutput:
         pass
 
     async def extract(
         self,
         extraction_input: ExtractionInput,
+        on_page_progress: ExtractionPageProgressCallback | None = None,
     ) -> ExtractionOutput:
         """
         Extracts content from a file by delegating to the concrete extractor implementation.
+
+        Extractors that process a file page by page call on_page_progress as pages finish.
         """
         try:
             if self._should_passthrough(extraction_input.mime_type):
@@ -59,6 +82,7 @@ class BaseExtractor(ABC):
 
             return await self._extract(
                 extraction_input,
+                on_page_progress,
             )
         except Exception as e:
             raise ValueError(f"Error extracting {extraction_input.path}: {e}") from e
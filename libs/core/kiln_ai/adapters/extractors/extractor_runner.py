@@ -1,10 +1,15 @@
+import asyncio
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import AsyncGenerator, Dict, List, Set
 
-from kiln_ai.adapters.extractors.base_extractor import BaseExtractor, ExtractionInput
+from kiln_ai.adapters.extractors.base_extractor import (
+    BaseExtractor,
+    ExtractionInput,
+    ExtractionPageProgress,
+)
 from kiln_ai.adapters.extractors.extractor_registry import extractor_adapter_from_type
 from kiln_ai.datamodel.basemodel import ID_TYPE, KilnAttachmentModel
 from kiln_ai.datamodel.extraction import (
@@ -14,6 +19,7 @@ from kiln_ai.datamodel.extraction import (
     ExtractorConfig,
 )
 from kiln_ai.utils.async_job_runner import AsyncJobRunner, Progress
+from kiln_ai.utils.filesystem_cache import FilesystemCache
 from kiln_ai.utils.git_sync_protocols import SaveContext, default_save_context
 
 logger = logging.getLogger(__name__)
@@ -25,12 +31,25 @@ class ExtractorJob:
     extractor_config: ExtractorConfig
 
 
+@dataclass
+class ExtractorProgress(Progress):
+    """
+    Document level progress, plus page level progress summed over the documents that
+    have reported pages so far (only page-by-page extractors report pages).
+    """
+
+    pages_complete: int = 0
+    pages_total: int = 0
+    pages_errors: int = 0
+
+
 class ExtractorRunner:
     def __init__(
         self,
         documents: List[Document],
         extractor_configs: List[ExtractorConfig],
         save_context: SaveContext | None = None,
+        filesystem_cache: FilesystemCache | None = None,
     ):
         if len(extractor_configs) == 0:
             raise ValueError("Extractor runner requires at least one extractor config")
@@ -38,6 +57,11 @@ class ExtractorRunner:
         self.documents = documents
         self.extractor_configs = extractor_configs
         self._save_context: SaveContext = save_context or default_save_context
+        self.filesystem_cache = filesystem_cache
+        # latest page progress per job, keyed by id(job) since jobs are not hashable
+        self._page_progress: Dict[int, ExtractionPageProgress] = {}
+        self._document_progress = Progress(complete=0, total=0, errors=0)
+        self._progress_updates: asyncio.Queue[ExtractorProgress | None] | None = None
 
     def collect_jobs(self) -> List[ExtractorJob]:
         jobs = []
@@ -68,14 +92,56 @@ class ExtractorRunner:
             jobs=jobs,
             run_job_fn=self.run_job,
         )
-        async for progress in runner.run():
-            yield progress
+
+        # Document progress comes from the job runner, page progress from the extractors
+        # while a document is still running. Both feed one queue so either can yield.
+        # None marks the end of the run.
+        progress_updates: asyncio.Queue[ExtractorProgress | None] = asyncio.Queue()
+        self._progress_updates = progress_updates
+        self._document_progress = Progress(complete=0, total=len(jobs), errors=0)
+        self._page_progress.clear()
+
+        async def run_jobs():
+            try:
+                async for progress in runner.run():
+                    self._document_progress = progress
+                    progress_updates.put_nowait(self._combined_progress())
+            finally:
+                progress_updates.put_nowait(None)
+
+        jobs_task = asyncio.create_task(run_jobs())
+        try:
+            while (progress := await progress_updates.get()) is not None:
+                yield progress
+            # surface any error from the job runner
+            await jobs_task
+        finally:
+            jobs_task.cancel()
+            await asyncio.gather(jobs_task, return_exceptions=True)
+            self._progress_updates = None
+
+    def _combined_progress(self) -> ExtractorProgress:
+        page_progress = self._page_progress.values()
+        return ExtractorProgress(
+            complete=self._document_progress.complete,
+            total=self._document_progress.total,
+            errors=self._document_progress.errors,
+            pages_complete=sum(progress.complete for progress in page_progress),
+            pages_total=sum(progress.total for progress in page_progress),
+            pages_errors=sum(progress.errors for progress in page_progress),
+        )
+
+    def _on_page_progress(self, job: ExtractorJob, progress: ExtractionPageProgress):
+        self._page_progress[id(job)] = progress
+        if self._progress_updates is not None:
+            self._progress_updates.put_nowait(self._combined_progress())
 
     async def run_job(self, job: ExtractorJob) -> bool:
         try:
             extractor = extractor_adapter_from_type(
                 job.extractor_config.extractor_type,
                 job.extractor_config,
+                self.filesystem_cache,
             )
             if not isinstance(extractor, BaseExtractor):
                 raise ValueError("Not able to create extractor from extractor config")
@@ -91,7 +157,8 @@ class ExtractorRunner:
                         )
                     ),
                     mime_type=job.doc.original_file.mime_type,
-                )
+                ),
+                on_page_progress=lambda progress: self._on_page_progress(job, progress),
             )
 
             async with self._save_context():
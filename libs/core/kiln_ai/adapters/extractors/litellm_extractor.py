@@ -1,10 +1,12 @@
 import asyncio
 import hashlib
 import logging
+from dataclasses import replace
 from functools import cached_property
 from pathlib import Path
 from typing import Any, List
 
+import aiohttp
 import litellm
 from litellm.types.utils import Choices, ModelResponse
 
@@ -12,6 +14,8 @@ from kiln_ai.adapters.extractors.base_extractor import (
     BaseExtractor,
     ExtractionInput,
     ExtractionOutput,
+    ExtractionPageProgress,
+    ExtractionPageProgressCallback,
 )
 from kiln_ai.adapters.extractors.encoding import to_base64, to_base64_url
 from kiln_ai.adapters.ml_model_list import (
@@ -19,12 +23,13 @@ from kiln_ai.adapters.ml_model_list import (
     built_in_models_from_provider,
 )
 from kiln_ai.adapters.provider_tools import LiteLlmCoreConfig
-from kiln_ai.datamodel.basemodel import string_to_valid_name
 from kiln_ai.datamodel.datamodel_enums import ModelProviderName
 from kiln_ai.datamodel.extraction import ExtractorConfig, ExtractorType, Kind
+from kiln_ai.utils.filesystem import file_sha256
 from kiln_ai.utils.filesystem_cache import FilesystemCache
+from kiln_ai.utils.http_client_pool import HttpClientPool
 from kiln_ai.utils.litellm import get_litellm_provider_info
-from kiln_ai.utils.pdf_utils import convert_pdf_to_images, split_pdf_into_pages
+from kiln_ai.utils.pdf_utils import convert_pdf_to_images, stream_pdf_pages
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +60,28 @@ MIME_TYPES_SUPPORTED = {
 }
 
 
+# Transient provider errors worth retrying a single page for. Anything else (bad request,
+# malformed response, ...) would fail the same way again.
+RETRYABLE_PAGE_ERRORS = (
+    litellm.RateLimitError,
+    litellm.APIConnectionError,
+    litellm.Timeout,
+    litellm.InternalServerError,
+    litellm.ServiceUnavailableError,
+    litellm.BadGatewayError,
+)
+
+
+def is_retryable_page_error(e: BaseException) -> bool:
+    # _extract_single_pdf_page wraps provider errors, so check the cause chain too
+    error: BaseException | None = e
+    while error is not None:
+        if isinstance(error, RETRYABLE_PAGE_ERRORS):
+            return True
+        error = error.__cause__
+    return False
+
+
 # OpenAI-style `input_audio` blocks take a bare format string, not a MIME type.
 AUDIO_MIME_TO_INPUT_AUDIO_FORMAT = {
     "audio/wav": "wav",
@@ -132,12 +159,19 @@ class LitellmExtractor(BaseExtractor):
         litellm_core_config: LiteLlmCoreConfig,
         filesystem_cache: FilesystemCache | None = None,
         default_max_parallel_requests: int = 5,
+        max_page_retries: int = 2,
+        page_retry_delay: float = 1.0,  # in seconds, doubled on each retry
     ):
         if extractor_config.extractor_type != ExtractorType.LITELLM:
             raise ValueError(
                 f"LitellmExtractor must be initialized with a litellm extractor_type config. Got {extractor_config.extractor_type}"
             )
 
+        if max_page_retries < 0:
+            raise ValueError("max_page_retries must be >= 0")
+        if page_retry_delay < 0:
+            raise ValueError("page_retry_delay must be >= 0")
+
         self.filesystem_cache = filesystem_cache
 
         super().__init__(extractor_config)
@@ -151,31 +185,45 @@ class LitellmExtractor(BaseExtractor):
 
         self.litellm_core_config = litellm_core_config
         self.default_max_parallel_requests = default_max_parallel_requests
+        self.max_page_retries = max_page_retries
+        self.page_retry_delay = page_retry_delay
+
+    @cached_property
+    def _cache_extractor_hash(self) -> str:
+        """
+        Hash of everything besides the file that determines a page's extracted content: the
+        model and the prompt. Extractor configs that share these share cached pages.
+        """
+        extractor_identity = "\n".join(
+            [
+                self.extractor_config.model_provider_name,
+                self.extractor_config.model_name,
+                self.prompt_for_kind[Kind.DOCUMENT],
+            ]
+        )
+        return hashlib.sha256(extractor_identity.encode("utf-8")).hexdigest()[:16]
 
     def _cache_prefix_for_file_path(self, file_path: Path) -> str:
-        if self.extractor_config.id is None:
-            raise ValueError("Extractor config ID is required for cache prefix")
-        file_path_hash = hashlib.md5(
-            str(file_path.resolve()).encode("utf-8")
-        ).hexdigest()
-        # sanitize the extractor ID to make sure we don't have special cases
-        # a known pattern in the codebase is to make custom IDs like theid::something
-        safe_extractor_id = string_to_valid_name(self.extractor_config.id)
-        return f"{safe_extractor_id}_{file_path_hash}_"
+        """
+        Cache keys are based on the file content, not its path, so the same file uploaded
+        twice or moved is only extracted once.
+        """
+        return f"{file_sha256(file_path)}_{self._cache_extractor_hash}_"
 
     def _cache_key_for_page(self, file_path: Path, page_number: int) -> str:
         """
-        Generate a cache key for a page of a file. The file path must be the full path to the file
-        and stable across runs.
+        Generate a cache key for a page of a file.
         """
-        if self.extractor_config.id is None:
-            raise ValueError("Extractor config ID is required for page cache key")
         return f"{self._cache_prefix_for_file_path(file_path)}{page_number}"
 
+    async def _cache_key_for_page_async(self, file_path: Path, page_number: int) -> str:
+        # hashing the file (or checking the memoized hash is current) hits the disk
+        return await asyncio.to_thread(self._cache_key_for_page, file_path, page_number)
+
     async def clear_cache_for_file_path(self, file_path: Path) -> None:
-        prefix = self._cache_prefix_for_file_path(file_path)
         if self.filesystem_cache is None:
             return
+        prefix = await asyncio.to_thread(self._cache_prefix_for_file_path, file_path)
         await self.filesystem_cache.delete_by_prefix(prefix)
 
     async def get_page_content_from_cache(
@@ -185,7 +233,7 @@ class LitellmExtractor(BaseExtractor):
             return None
 
         page_bytes = await self.filesystem_cache.get(
-            self._cache_key_for_page(file_path, page_number)
+            await self._cache_key_for_page_async(file_path, page_number)
         )
 
         if page_bytes is not None:
@@ -233,7 +281,9 @@ class LitellmExtractor(BaseExtractor):
                 )
 
             completion_kwargs = self._build_completion_kwargs(prompt, page_input)
-            response = await litellm.acompletion(**completion_kwargs)
+            response = await litellm.acompletion(
+                **completion_kwargs, shared_session=self._shared_session()
+            )
         except Exception as e:
             raise RuntimeError(
                 f"Error extracting page {page_number} in file {page_path}: {e}"
@@ -261,7 +311,7 @@ class LitellmExtractor(BaseExtractor):
             try:
                 logger.debug(f"Caching page {page_number} of {page_path} in cache")
                 await self.filesystem_cache.set(
-                    self._cache_key_for_page(pdf_path, page_number),
+                    await self._cache_key_for_page_async(pdf_path, page_number),
                     content.encode("utf-8"),
                 )
             except Exception:
@@ -274,51 +324,103 @@ class LitellmExtractor(BaseExtractor):
 
         return content
 
-    async def _extract_pdf_page_by_page(self, pdf_path: Path, prompt: str) -> str:
-        async with split_pdf_into_pages(pdf_path) as page_paths:
-            page_outcomes: List[str | Exception | None] = [None] * len(page_paths)
-
-            extract_page_jobs: list = []
-            page_indices_for_jobs: list = []  # Track which page index each job corresponds to
-
-            # we extract from each page individually and then combine the results
-            # this ensures the model stays focused on the current page and does not
-            # start summarizing the later pages
-            for i, page_path in enumerate(page_paths):
-                page_content = await self.get_page_content_from_cache(pdf_path, i)
-                if page_content is not None:
-                    page_outcomes[i] = page_content
-                    continue
-
-                extract_page_jobs.append(
-                    self._extract_single_pdf_page(
-                        pdf_path, page_path, prompt, page_number=i
+    async def _extract_pdf_page_with_retries(
+        self,
+        pdf_path: Path,
+        page_path: Path,
+        prompt: str,
+        page_number: int,
+        request_slots: asyncio.Semaphore,
+    ) -> str:
+        attempt = 0
+        while True:
+            try:
+                # only hold a request slot while the request is in flight, not while backing off
+                async with request_slots:
+                    return await self._extract_single_pdf_page(
+                        pdf_path, page_path, prompt, page_number=page_number
                     )
+            except Exception as e:
+                if attempt >= self.max_page_retries or not is_retryable_page_error(e):
+                    raise
+                delay = self.page_retry_delay * (2**attempt)
+                logger.warning(
+                    "Transient error extracting page %s of %s, retrying in %ss: %s",
+                    page_number,
+                    pdf_path,
+                    delay,
+                    e,
                 )
-                page_indices_for_jobs.append(i)
-
-                if (
-                    len(extract_page_jobs) >= self.max_parallel_requests_for_model
-                    or i == len(page_paths) - 1
-                ):
-                    extraction_results = await asyncio.gather(
-                        *extract_page_jobs, return_exceptions=True
-                    )
+                await asyncio.sleep(delay)
+                attempt += 1
 
-                    for batch_i, extraction_result in enumerate(extraction_results):
-                        page_index = page_indices_for_jobs[batch_i]
-                        # we let it continue even if there is an error - the success results will be cached
-                        # and can be reused on the next run
-                        if isinstance(extraction_result, Exception):
-                            page_outcomes[page_index] = extraction_result
-                        elif isinstance(extraction_result, str):
-                            page_outcomes[page_index] = extraction_result
-                        else:
-                            raise ValueError(
-                                f"Unexpected type {type(extraction_result)} for page {page_index}"
-                            )
-                    extract_page_jobs.clear()
-                    page_indices_for_jobs.clear()
+    async def _extract_pdf_page_by_page(
+        self,
+        pdf_path: Path,
+        prompt: str,
+        on_page_progress: ExtractionPageProgressCallback | None = None,
+    ) -> str:
+        # a sliding window: a new page request starts as soon as any in-flight one finishes,
+        # so a single slow page doesn't hold back the pages behind it
+        request_slots = asyncio.Semaphore(self.max_parallel_requests_for_model)
+        page_tasks: dict[asyncio.Task[str], int] = {}
+
+        async with stream_pdf_pages(pdf_path) as page_stream:
+            page_outcomes: List[str | Exception | None] = [
+                None
+            ] * page_stream.page_count
+            progress = ExtractionPageProgress(
+                complete=0, total=page_stream.page_count, errors=0
+            )
+
+            def record_page_outcome(page_index: int, outcome: str | Exception):
+                # we let it continue even if there is an error - the success results will be cached
+                # and can be reused on the next run
+                page_outcomes[page_index] = outcome
+                if isinstance(outcome, Exception):
+                    progress.errors += 1
+                else:
+                    progress.complete += 1
+                if on_page_progress is not None:
+                    on_page_progress(replace(progress))
+
+            def on_page_task_done(task: asyncio.Task[str]):
+                page_index = page_tasks[task]
+                if task.cancelled():
+                    return
+                exception = task.exception()
+                if isinstance(exception, Exception):
+                    record_page_outcome(page_index, exception)
+                elif exception is None:
+                    record_page_outcome(page_index, task.result())
+
+            try:
+                # we extract from each page individually and then combine the results
+                # this ensures the model stays focused on the current page and does not
+                # start summarizing the later pages. Pages arrive as soon as they are split,
+                # so extraction of early pages overlaps with splitting the rest of the file.
+                async for i, page_path in page_stream:
+                    page_content = await self.get_page_content_from_cache(pdf_path, i)
+                    if page_content is not None:
+                        record_page_outcome(i, page_content)
+                        continue
+
+                    task = asyncio.create_task(
+                        self._extract_pdf_page_with_retries(
+                            pdf_path, page_path, prompt, i, request_slots
+                        )
+                    )
+                    page_tasks[task] = i
+                    task.add_done_callback(on_page_task_done)
+
+                if len(page_tasks) > 0:
+                    await asyncio.wait(page_tasks)
+            finally:
+                # page files are removed when the stream closes, so nothing may outlive it
+                for task in page_tasks:
+                    task.cancel()
+                if len(page_tasks) > 0:
+                    await asyncio.wait(page_tasks)
 
         exceptions: list[tuple[int, Exception]] = [
             (page_index, result)
@@ -341,6 +443,12 @@ class LitellmExtractor(BaseExtractor):
                 return kind
         return None
 
+    def _shared_session(self) -> aiohttp.ClientSession:
+        return HttpClientPool.shared().litellm_session(
+            self.litellm_core_config.base_url,
+            self.extractor_config.model_provider_name,
+        )
+
     def _build_completion_kwargs(
         self, prompt: str, extraction_input: ExtractionInput
     ) -> dict[str, Any]:
@@ -374,7 +482,11 @@ class LitellmExtractor(BaseExtractor):
 
         return completion_kwargs
 
-    async def _extract(self, extraction_input: ExtractionInput) -> ExtractionOutput:
+    async def _extract(
+        self,
+        extraction_input: ExtractionInput,
+        on_page_progress: ExtractionPageProgressCallback | None = None,
+    ) -> ExtractionOutput:
         kind = self._get_kind_from_mime_type(extraction_input.mime_type)
         if kind is None:
             raise ValueError(
@@ -388,7 +500,7 @@ class LitellmExtractor(BaseExtractor):
         # special handling for PDFs - process each page individually
         if extraction_input.mime_type == "application/pdf":
             content = await self._extract_pdf_page_by_page(
-                Path(extraction_input.path), prompt
+                Path(extraction_input.path), prompt, on_page_progress
             )
             return ExtractionOutput(
                 is_passthrough=False,
@@ -398,7 +510,9 @@ class LitellmExtractor(BaseExtractor):
 
         completion_kwargs = self._build_completion_kwargs(prompt, extraction_input)
 
-        response = await litellm.acompletion(**completion_kwargs)
+        response = await litellm.acompletion(
+            **completion_kwargs, shared_session=self._shared_session()
+        )
 
         if (
             not isinstance(response, ModelResponse)
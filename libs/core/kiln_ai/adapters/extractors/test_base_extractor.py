@@ -7,6 +7,7 @@ from kiln_ai.adapters.extractors.base_extractor import (
     BaseExtractor,
     ExtractionInput,
     ExtractionOutput,
+    ExtractionPageProgressCallback,
 )
 from kiln_ai.datamodel.extraction import (
     ExtractorConfig,
@@ -17,7 +18,11 @@ from kiln_ai.datamodel.extraction import (
 
 
 class MockBaseExtractor(BaseExtractor):
-    async def _extract(self, input: ExtractionInput) -> ExtractionOutput:
+    async def _extract(
+        self,
+        input: ExtractionInput,
+        on_page_progress: ExtractionPageProgressCallback | None = None,
+    ) -> ExtractionOutput:
         return ExtractionOutput(
             is_passthrough=False,
             content="mock concrete extractor output",
@@ -215,7 +220,8 @@ async def test_extract_non_passthrough(
             ExtractionInput(
                 path=path,
                 mime_type=mime_type,
-            )
+            ),
+            None,
         )
 
         assert not result.is_passthrough
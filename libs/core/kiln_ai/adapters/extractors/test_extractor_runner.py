@@ -4,8 +4,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from kiln_ai.adapters.extractors.base_extractor import BaseExtractor, ExtractionOutput
-from kiln_ai.adapters.extractors.extractor_runner import ExtractorJob, ExtractorRunner
+from kiln_ai.adapters.extractors.base_extractor import (
+    BaseExtractor,
+    ExtractionOutput,
+    ExtractionPageProgress,
+)
+from kiln_ai.adapters.extractors.extractor_runner import (
+    ExtractorJob,
+    ExtractorProgress,
+    ExtractorRunner,
+)
 from kiln_ai.datamodel.basemodel import KilnAttachmentModel
 from kiln_ai.datamodel.extraction import (
     Document,
@@ -19,6 +27,7 @@ from kiln_ai.datamodel.extraction import (
 )
 from kiln_ai.datamodel.project import Project
 from kiln_ai.pytest_mock_files import MockFileFactoryMimeType
+from kiln_ai.utils.filesystem_cache import FilesystemCache
 from kiln_ai.utils.git_sync_protocols import default_save_context
 
 
@@ -116,6 +125,79 @@ async def test_async_extractor_runner_status_updates(
     assert mock_extractor_runner.run_job.call_count == job_count
 
 
+@pytest.mark.asyncio
+async def test_extractor_runner_yields_page_progress(
+    mock_extractor_runner, mock_document, mock_extractor_config
+):
+    async def extract(extraction_input, on_page_progress=None):
+        for complete in range(1, 4):
+            on_page_progress(
+                ExtractionPageProgress(complete=complete, total=3, errors=0)
+            )
+        return ExtractionOutput(
+            content="hello world",
+            content_format=OutputFormat.TEXT,
+            is_passthrough=False,
+        )
+
+    fake_extractor = MagicMock(spec=BaseExtractor)
+    fake_extractor.extract = AsyncMock(side_effect=extract)
+
+    with (
+        patch(
+            "kiln_ai.adapters.extractors.extractor_runner.extractor_adapter_from_type",
+            return_value=fake_extractor,
+        ),
+        patch("kiln_ai.adapters.extractors.extractor_runner.Extraction"),
+    ):
+        updates = [progress async for progress in mock_extractor_runner.run()]
+
+    assert all(isinstance(progress, ExtractorProgress) for progress in updates)
+    assert [(p.complete, p.pages_complete, p.pages_total) for p in updates] == [
+        (0, 0, 0),
+        (0, 1, 3),
+        (0, 2, 3),
+        (0, 3, 3),
+        (1, 3, 3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_job_uses_filesystem_cache(
+    mock_extractor_config, mock_document, tmp_path
+):
+    cache = FilesystemCache(tmp_path)
+    runner = ExtractorRunner(
+        documents=[mock_document],
+        extractor_configs=[mock_extractor_config],
+        filesystem_cache=cache,
+    )
+
+    fake_extractor = MagicMock(spec=BaseExtractor)
+    fake_extractor.extract = AsyncMock(
+        return_value=ExtractionOutput(
+            content="hello world",
+            content_format=OutputFormat.TEXT,
+            is_passthrough=False,
+        )
+    )
+
+    with (
+        patch(
+            "kiln_ai.adapters.extractors.extractor_runner.extractor_adapter_from_type",
+            return_value=fake_extractor,
+        ) as mock_adapter_from_type,
+        patch("kiln_ai.adapters.extractors.extractor_runner.Extraction"),
+    ):
+        assert await runner.run_job(
+            ExtractorJob(doc=mock_document, extractor_config=mock_extractor_config)
+        )
+
+    mock_adapter_from_type.assert_called_once_with(
+        mock_extractor_config.extractor_type, mock_extractor_config, cache
+    )
+
+
 def test_collect_jobs_excludes_already_run_extraction(
     mock_extractor_runner, mock_document, mock_extractor_config
 ):
@@ -1,11 +1,19 @@
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import List, Tuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import litellm
 import pytest
 from litellm.types.utils import Choices, ModelResponse
+from pypdf import PdfWriter
 
-from kiln_ai.adapters.extractors.base_extractor import ExtractionInput, OutputFormat
+from kiln_ai.adapters.extractors.base_extractor import (
+    ExtractionInput,
+    ExtractionPageProgress,
+    OutputFormat,
+)
 from kiln_ai.adapters.extractors.encoding import to_base64, to_base64_url
 from kiln_ai.adapters.extractors.extractor_registry import extractor_adapter_from_type
 from kiln_ai.adapters.extractors.litellm_extractor import (
@@ -13,6 +21,7 @@ from kiln_ai.adapters.extractors.litellm_extractor import (
     Kind,
     LitellmExtractor,
     encode_file_litellm_format,
+    is_retryable_page_error,
 )
 from kiln_ai.adapters.ml_model_list import (
     ModelName,
@@ -27,7 +36,9 @@ from kiln_ai.adapters.pytest_prerelease_whitelist import (
 from kiln_ai.datamodel.datamodel_enums import ModelProviderName
 from kiln_ai.datamodel.extraction import ExtractorType
 from kiln_ai.pytest_mock_files import MockFileFactoryMimeType
+from kiln_ai.utils.filesystem import file_sha256
 from kiln_ai.utils.filesystem_cache import FilesystemCache
+from kiln_ai.utils.pdf_utils import stream_pdf_pages
 
 PROMPTS_FOR_KIND: dict[str, str] = {
     "document": "prompt for documents",
@@ -369,14 +380,14 @@ async def test_extract_failure_from_bytes_read(mock_litellm_extractor):
             return_value="provider-name/model-name",
         ),
         patch(
-            "kiln_ai.adapters.extractors.litellm_extractor.split_pdf_into_pages",
-            side_effect=Exception("error from split_pdf_into_pages"),
+            "kiln_ai.adapters.extractors.litellm_extractor.stream_pdf_pages",
+            side_effect=Exception("error from stream_pdf_pages"),
         ),
     ):
         # test the extract method
         with pytest.raises(
             ValueError,
-            match=r"Error extracting test.pdf: error from split_pdf_into_pages",
+            match=r"Error extracting test.pdf: error from stream_pdf_pages",
         ):
             await mock_litellm_extractor.extract(
                 extraction_input=ExtractionInput(
@@ -847,6 +858,47 @@ async def test_extract_pdf_page_by_page(mock_file_factory, mock_litellm_extracto
     assert result.content_format == OutputFormat.MARKDOWN
 
 
+async def test_extract_pdf_page_by_page_preserves_page_order(
+    mock_file_factory, mock_litellm_extractor
+):
+    """Test that pages streamed out of order are still joined in page order."""
+    test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
+
+    @asynccontextmanager
+    async def reversed_page_stream(pdf_path):
+        async with stream_pdf_pages(pdf_path) as page_stream:
+            pages = [page async for page in page_stream]
+
+            class ReversedPageStream:
+                page_count = page_stream.page_count
+
+                async def __aiter__(self):
+                    for page in sorted(pages, reverse=True):
+                        yield page
+
+            yield ReversedPageStream()
+
+    async def extract_single_page(pdf_path, page_path, prompt, page_number):
+        return f"Content from page {page_number + 1}"
+
+    with (
+        patch(
+            "kiln_ai.adapters.extractors.litellm_extractor.stream_pdf_pages",
+            reversed_page_stream,
+        ),
+        patch.object(
+            mock_litellm_extractor,
+            "_extract_single_pdf_page",
+            side_effect=extract_single_page,
+        ),
+    ):
+        content = await mock_litellm_extractor._extract_pdf_page_by_page(
+            test_file, "prompt"
+        )
+
+    assert content == "Content from page 1\n\nContent from page 2"
+
+
 async def test_extract_pdf_page_by_page_pdf_as_image(
     mock_file_factory, mock_litellm_extractor, tmp_path
 ):
@@ -1060,18 +1112,20 @@ def mock_litellm_extractor_without_cache():
     )
 
 
-def test_cache_key_for_page_generation(mock_litellm_extractor_with_cache):
+def test_cache_key_for_page_generation(
+    mock_litellm_extractor_with_cache, mock_file_factory
+):
     """Test that PDF page cache keys are generated correctly."""
-    pdf_path = Path("test_document.pdf")
+    pdf_path = mock_file_factory(MockFileFactoryMimeType.PDF)
     page_number = 0
 
     cache_key = mock_litellm_extractor_with_cache._cache_key_for_page(
         pdf_path, page_number
     )
 
-    # Should include extractor ID and a hash of the PDF name and page number
-    assert cache_key.startswith("test_extractor_123_")
-    assert len(cache_key) > len("test_extractor_123_")  # Should have hash suffix
+    # Should start with the hash of the file content
+    assert cache_key.startswith(f"{file_sha256(pdf_path)}_")
+    assert cache_key.endswith("_0")
 
     # Same PDF and page should generate same key
     cache_key2 = mock_litellm_extractor_with_cache._cache_key_for_page(
@@ -1084,25 +1138,45 @@ def test_cache_key_for_page_generation(mock_litellm_extractor_with_cache):
     assert cache_key != cache_key3
 
 
-def test_cache_key_for_page_requires_extractor_id():
-    """Test that PDF page cache key generation requires extractor ID."""
-    extractor_config = ExtractorConfig(
-        id=None,  # No ID
-        name="mock",
-        extractor_type=ExtractorType.LITELLM,
-        model_name="gpt_4o",
-        model_provider_name="openai",
-        properties={
-            "extractor_type": ExtractorType.LITELLM,
-            "prompt_document": PROMPTS_FOR_KIND["document"],
-            "prompt_image": PROMPTS_FOR_KIND["image"],
-            "prompt_video": PROMPTS_FOR_KIND["video"],
-            "prompt_audio": PROMPTS_FOR_KIND["audio"],
-        },
-    )
-
-    extractor = LitellmExtractor(
-        extractor_config,
+def test_cache_key_for_page_is_based_on_content_not_path(
+    mock_litellm_extractor_with_cache, mock_file_factory, tmp_path
+):
+    pdf_path = mock_file_factory(MockFileFactoryMimeType.PDF)
+    copied_pdf_path = tmp_path / "moved" / "copy.pdf"
+    copied_pdf_path.parent.mkdir()
+    copied_pdf_path.write_bytes(pdf_path.read_bytes())
+
+    assert mock_litellm_extractor_with_cache._cache_key_for_page(
+        pdf_path, 0
+    ) == mock_litellm_extractor_with_cache._cache_key_for_page(copied_pdf_path, 0)
+
+    other_pdf_path = tmp_path / "other.pdf"
+    other_pdf_path.write_bytes(pdf_path.read_bytes() + b"\n%% changed")
+    assert mock_litellm_extractor_with_cache._cache_key_for_page(
+        pdf_path, 0
+    ) != mock_litellm_extractor_with_cache._cache_key_for_page(other_pdf_path, 0)
+
+
+def make_extractor_for_cache_key(
+    extractor_id: str | None,
+    model_name: str = "gpt_4o",
+    prompt_document: str = PROMPTS_FOR_KIND["document"],
+) -> LitellmExtractor:
+    return LitellmExtractor(
+        ExtractorConfig(
+            id=extractor_id,
+            name="mock",
+            extractor_type=ExtractorType.LITELLM,
+            model_name=model_name,
+            model_provider_name="openai",
+            properties={
+                "extractor_type": ExtractorType.LITELLM,
+                "prompt_document": prompt_document,
+                "prompt_image": PROMPTS_FOR_KIND["image"],
+                "prompt_video": PROMPTS_FOR_KIND["video"],
+                "prompt_audio": PROMPTS_FOR_KIND["audio"],
+            },
+        ),
         LiteLlmCoreConfig(
             base_url="https://test.com",
             additional_body_options={"api_key": "test-key"},
@@ -1110,10 +1184,40 @@ def test_cache_key_for_page_requires_extractor_id():
         ),
     )
 
-    with pytest.raises(
-        ValueError, match="Extractor config ID is required for page cache key"
-    ):
-        extractor._cache_key_for_page(Path("test.pdf"), 0)
+
+def test_cache_key_for_page_shared_across_extractor_configs(mock_file_factory):
+    """Extractor configs with the same model and prompt reuse each other's pages."""
+    pdf_path = mock_file_factory(MockFileFactoryMimeType.PDF)
+
+    cache_key = make_extractor_for_cache_key("extractor_1")._cache_key_for_page(
+        pdf_path, 0
+    )
+
+    # the extractor ID is not part of the key, and not required
+    assert (
+        make_extractor_for_cache_key("extractor_2")._cache_key_for_page(pdf_path, 0)
+        == cache_key
+    )
+    assert (
+        make_extractor_for_cache_key(None)._cache_key_for_page(pdf_path, 0) == cache_key
+    )
+
+    # a different model or prompt gets its own cache entries
+    assert (
+        make_extractor_for_cache_key(
+            "extractor_1", model_name="gpt_4_1"
+        )._cache_key_for_page(pdf_path, 0)
+        != cache_key
+    )
+    assert (
+        make_extractor_for_cache_key(
+            "extractor_1", prompt_document="another prompt"
+        )._cache_key_for_page(pdf_path, 0)
+        != cache_key
+    )
+
+    # keys must be valid cache file names
+    FilesystemCache(Path("unused")).validate_key(cache_key)
 
 
 async def test_extract_pdf_with_cache_storage(
@@ -1403,6 +1507,230 @@ async def test_extract_pdf_parallel_processing_error_handling(
     assert mock_acompletion.call_count == 2
 
 
+def write_blank_pdf(path: Path, page_count: int) -> Path:
+    pdf_writer = PdfWriter()
+    for _ in range(page_count):
+        pdf_writer.add_blank_page(width=72, height=72)
+    with open(path, "wb") as file:
+        pdf_writer.write(file)
+    return path
+
+
+def mock_page_response(content: str) -> ModelResponse:
+    mock_response = AsyncMock(spec=ModelResponse)
+    mock_choice = AsyncMock(spec=Choices)
+    mock_message = AsyncMock()
+    mock_message.content = content
+    mock_choice.message = mock_message
+    mock_response.choices = [mock_choice]
+    return mock_response
+
+
+async def test_extract_pdf_sliding_window_slow_page_does_not_block(
+    tmp_path, mock_litellm_extractor
+):
+    """A slow page holds one request slot, the other pages keep flowing through the rest."""
+    pdf_path = write_blank_pdf(tmp_path / "blank.pdf", page_count=5)
+    mock_litellm_extractor.max_parallel_requests_for_model = 2
+
+    release_first_page = asyncio.Event()
+    in_flight = 0
+    max_in_flight = 0
+    finished_pages: list[int] = []
+
+    async def extract_single_page(pdf_path, page_path, prompt, page_number):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            if page_number == 0:
+                await release_first_page.wait()
+            else:
+                await asyncio.sleep(0)
+            finished_pages.append(page_number)
+            return f"Content from page {page_number + 1}"
+        finally:
+            in_flight -= 1
+
+    async def release_when_others_done():
+        while len(finished_pages) < 4:
+            await asyncio.sleep(0.01)
+        release_first_page.set()
+
+    with patch.object(
+        mock_litellm_extractor,
+        "_extract_single_pdf_page",
+        side_effect=extract_single_page,
+    ):
+        content, _ = await asyncio.gather(
+            mock_litellm_extractor._extract_pdf_page_by_page(pdf_path, "prompt"),
+            asyncio.wait_for(release_when_others_done(), timeout=10),
+        )
+
+    # every other page finished while page 1 was still in flight
+    assert finished_pages[-1] == 0
+    assert max_in_flight == 2
+    assert content == "\n\n".join(f"Content from page {i + 1}" for i in range(5))
+
+
+async def test_extract_pdf_retries_transient_page_errors(
+    mock_file_factory, mock_litellm_extractor
+):
+    test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
+    mock_litellm_extractor.page_retry_delay = 0
+
+    # keyed by a substring of the page (or page image) path sent to the model
+    responses = {
+        "page_1.pdf": [mock_page_response("Content from page 1")],
+        "page_2.pdf": [
+            litellm.RateLimitError("slow down", "openai", "gpt-4o"),
+            litellm.InternalServerError("oops", "openai", "gpt-4o"),
+            mock_page_response("Content from page 2"),
+        ],
+    }
+
+    async def acompletion(page_path: str, **_):
+        page_key = next(key for key in responses if key in str(page_path))
+        response = responses[page_key].pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    with (
+        patch("litellm.acompletion", side_effect=acompletion) as mock_acompletion,
+        patch.object(
+            mock_litellm_extractor,
+            "_build_completion_kwargs",
+            side_effect=lambda prompt, page_input: {"page_path": page_input.path},
+        ),
+    ):
+        content = await mock_litellm_extractor._extract_pdf_page_by_page(
+            test_file, "prompt"
+        )
+
+    assert content == "Content from page 1\n\nContent from page 2"
+    assert mock_acompletion.call_count == 4
+
+
+async def test_extract_pdf_gives_up_after_max_page_retries(
+    mock_file_factory, mock_litellm_extractor
+):
+    test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
+    mock_litellm_extractor.page_retry_delay = 0
+    mock_litellm_extractor.max_page_retries = 1
+
+    with patch(
+        "litellm.acompletion",
+        side_effect=litellm.RateLimitError("slow down", "openai", "gpt-4o"),
+    ) as mock_acompletion:
+        with pytest.raises(RuntimeError, match="slow down"):
+            await mock_litellm_extractor._extract_pdf_page_by_page(test_file, "prompt")
+
+    # 2 pages, each tried once and retried once
+    assert mock_acompletion.call_count == 4
+
+
+async def test_extract_pdf_does_not_retry_permanent_page_errors(
+    mock_file_factory, mock_litellm_extractor
+):
+    test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
+    mock_litellm_extractor.page_retry_delay = 0
+
+    with patch(
+        "litellm.acompletion",
+        side_effect=Exception("bad request"),
+    ) as mock_acompletion:
+        with pytest.raises(RuntimeError, match="bad request"):
+            await mock_litellm_extractor._extract_pdf_page_by_page(test_file, "prompt")
+
+    assert mock_acompletion.call_count == 2
+
+
+async def test_extract_pdf_reports_page_progress(
+    mock_file_factory, mock_litellm_extractor_with_cache
+):
+    test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
+
+    # page 1 is cached, page 2 is extracted
+    await mock_litellm_extractor_with_cache.filesystem_cache.set(
+        mock_litellm_extractor_with_cache._cache_key_for_page(test_file, 0),
+        b"Cached content from page 1",
+    )
+
+    progress_updates: list[ExtractionPageProgress] = []
+    with patch(
+        "litellm.acompletion",
+        return_value=mock_page_response("Content from page 2"),
+    ):
+        result = await mock_litellm_extractor_with_cache.extract(
+            ExtractionInput(path=str(test_file), mime_type="application/pdf"),
+            on_page_progress=progress_updates.append,
+        )
+
+    assert result.content == "Cached content from page 1\n\nContent from page 2"
+    assert progress_updates == [
+        ExtractionPageProgress(complete=1, total=2, errors=0),
+        ExtractionPageProgress(complete=2, total=2, errors=0),
+    ]
+
+
+async def test_extract_pdf_reports_page_errors_in_progress(
+    mock_file_factory, mock_litellm_extractor
+):
+    test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
+
+    progress_updates: list[ExtractionPageProgress] = []
+    with patch("litellm.acompletion", side_effect=Exception("bad request")):
+        with pytest.raises(RuntimeError):
+            await mock_litellm_extractor._extract_pdf_page_by_page(
+                test_file, "prompt", progress_updates.append
+            )
+
+    assert progress_updates[-1] == ExtractionPageProgress(complete=0, total=2, errors=2)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (litellm.RateLimitError("slow down", "openai", "gpt-4o"), True),
+        (litellm.InternalServerError("oops", "openai", "gpt-4o"), True),
+        (litellm.BadRequestError("bad", "gpt-4o", "openai"), False),
+        (ValueError("no text"), False),
+    ],
+)
+def test_is_retryable_page_error(error, expected):
+    assert is_retryable_page_error(error) is expected
+    # errors from a page are wrapped, the cause is what decides
+    try:
+        raise RuntimeError("Error extracting page 1") from error
+    except RuntimeError as wrapped:
+        assert is_retryable_page_error(wrapped) is expected
+
+
+def test_litellm_extractor_rejects_negative_retry_settings(mock_litellm_core_config):
+    extractor_config = ExtractorConfig(
+        name="mock",
+        extractor_type=ExtractorType.LITELLM,
+        model_name="gpt_4o",
+        model_provider_name="openai",
+        properties={
+            "extractor_type": ExtractorType.LITELLM,
+            "prompt_document": PROMPTS_FOR_KIND["document"],
+            "prompt_image": PROMPTS_FOR_KIND["image"],
+            "prompt_video": PROMPTS_FOR_KIND["video"],
+            "prompt_audio": PROMPTS_FOR_KIND["audio"],
+        },
+    )
+    with pytest.raises(ValueError, match="max_page_retries"):
+        LitellmExtractor(
+            extractor_config, mock_litellm_core_config, max_page_retries=-1
+        )
+    with pytest.raises(ValueError, match="page_retry_delay"):
+        LitellmExtractor(
+            extractor_config, mock_litellm_core_config, page_retry_delay=-1
+        )
+
+
 async def test_extract_pdf_parallel_processing_all_cached(
     mock_file_factory, mock_litellm_extractor_with_cache
 ):
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar, Hashable
+
+from kiln_ai.datamodel import Task, TaskRun
+from kiln_ai.datamodel.model_cache import ModelCache
+
+# Without a save in this process or a run added or removed, a refresh this soon
+# after the last one skips the scan. Edits made outside the process (a git pull,
+# another app) to existing runs are picked up after at most this long.
+DEFAULT_REFRESH_INTERVAL_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class _RunSummary:
+    """The fields of a run that few-shot example selection depends on."""
+
+    id: str | None
+    parent_task_run_id: str | None
+    eval_generated: bool
+    repaired: bool
+    # Rating of an unrepaired, high quality run. None if it's not a rated candidate.
+    rating: float | None
+    input_hash: str
+    # Hash of the text an example shows besides the input: the output, its repair
+    # and the repair instructions. Edits to it change the prompt's example section.
+    example_hash: str
+
+    @classmethod
+    def from_run(cls, run: TaskRun) -> _RunSummary:
+        rating = run.output.rating
+        repaired = run.repaired_output is not None
+        high_quality = (
+            rating is not None and rating.value is not None and rating.is_high_quality()
+        )
+        return cls(
+            id=run.id,
+            parent_task_run_id=run.parent_task_run_id,
+            eval_generated=run.eval_source is not None,
+            repaired=repaired,
+            rating=rating.value if rating and high_quality and not repaired else None,
+            input_hash=hashlib.sha256(run.input.encode("utf-8")).hexdigest(),
+            example_hash=_example_hash(run),
+        )
+
+
+def _example_hash(run: TaskRun) -> str:
+    example = [
+        run.output.output,
+        run.repaired_output.output if run.repaired_output else None,
+        run.repair_instructions,
+    ]
+    return hashlib.sha256(json.dumps(example).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _IndexEntry:
+    # (mtime_ns, size) of the run file when it was summarized
+    signature: tuple[int, int]
+    # Position in the order the runs were first seen, used to break ties
+    seq: int
+    summary: _RunSummary
+
+
+class FewShotExampleIndex:
+    """
+    An incrementally maintained index of a task's runs, for picking few-shot examples.
+
+    Building a few-shot prompt used to load and scan every run of the task, then sort
+    the rated ones, on every prompt build. This index keeps a small summary per run
+    file and the candidate examples in order: repaired runs first, then high quality
+    runs by rating. A refresh only stats the run files, and only reloads those which
+    were added or changed since the last refresh. Refreshes are throttled: the run
+    files aren't stat'd again until refresh_interval has passed, a model was saved or
+    deleted in this process, or the runs folder changed.
+
+    version increments whenever the set of runs (or a run's rating, repair or
+    example text) changes, so anything derived from the selected examples, like a prompt's
+    example section, can be memoized against it with memoized_section.
+
+    Selection matches Task.runs(): eval generated runs and intermediate runs of a
+    multiturn chain are never used as examples.
+    """
+
+    _indexes: ClassVar[dict[Path, FewShotExampleIndex]] = {}
+    _indexes_lock = threading.Lock()
+
+    def __init__(
+        self,
+        task_path: Path,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+    ):
+        self.task_path = task_path
+        self.refresh_interval = refresh_interval
+        self.version = 0
+        # (monotonic time, runs folder mtime, ModelCache generation) of the last scan
+        self._last_scan: tuple[float, int | None, int] | None = None
+        self._lock = threading.RLock()
+        self._entries: dict[Path, _IndexEntry] = {}
+        self._next_seq = 0
+        # Candidates in selection order, kept sorted as runs change
+        self._repaired: list[tuple[int, Path]] = []
+        self._rated: list[tuple[float, int, Path]] = []
+        # Runs which are a parent of another run in a multiturn chain
+        self._parent_ids: Counter[str] = Counter()
+        self._sections: dict[Hashable, tuple[int, str]] = {}
+
+    @classmethod
+    def for_task(cls, task: Task) -> FewShotExampleIndex | None:
+        """The shared index for a task, or None if the task isn't saved (so has no runs)."""
+        if task.path is None:
+            return None
+        with cls._indexes_lock:
+            index = cls._indexes.get(task.path)
+            if index is None:
+                index = cls(task.path)
+                cls._indexes[task.path] = index
+            return index
+
+    @classmethod
+    def clear_all(cls) -> None:
+        with cls._indexes_lock:
+            cls._indexes.clear()
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the run files on disk, returning the version."""
+        with self._lock:
+            # Taken before the scan, so a change made during it is caught next time
+            scan_state = (
+                time.monotonic(),
+                self._runs_folder_mtime(),
+                ModelCache.shared().generation,
+            )
+            if self._last_scan is not None and (
+                scan_state[1:] == self._last_scan[1:]
+                and scan_state[0] - self._last_scan[0] < self.refresh_interval
+            ):
+                return self.version
+            self._last_scan = scan_state
+
+            # Without fine grained mtimes a change can't be detected from the file
+            # stats, so every run is re-summarized (but only a real change bumps the version)
+            trust_signatures = ModelCache.shared().enabled
+            changed = False
+            seen: set[Path] = set()
+            for path in TaskRun.iterate_children_paths_of_parent_path(self.task_path):
+                seen.add(path)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    # deleted since it was listed
+                    seen.discard(path)
+                    continue
+                signature = (stat.st_mtime_ns, stat.st_size)
+                entry = self._entries.get(path)
+                if (
+                    entry is not None
+                    and trust_signatures
+                    and entry.signature == signature
+                ):
+                    continue
+                summary = _RunSummary.from_run(
+                    TaskRun.load_from_file(path, readonly=True)
+                )
+                if entry is not None and entry.summary == summary:
+                    entry.signature = signature
+                    continue
+                self._update(path, signature, summary)
+                changed = True
+
+            for path in [path for path in self._entries if path not in seen]:
+                self._remove(path)
+                changed = True
+
+            if changed:
+                self.version += 1
+                self._sections.clear()
+            return self.version
+
+    def _runs_folder_mtime(self) -> int | None:
+        runs_folder = self.task_path.parent / TaskRun.relationship_name()
+        try:
+            return os.stat(runs_folder).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def top_examples(self, count: int) -> list[TaskRun]:
+        """
+        The best count examples as of the last refresh: repaired runs first, in the
+        order they were first seen, then high quality runs by rating, highest first.
+        """
+        with self._lock:
+            paths: list[Path] = []
+            for _, path in self._repaired:
+                if len(paths) >= count:
+                    break
+                if self._is_example(path):
+                    paths.append(path)
+            for _, _, path in self._rated:
+                if len(paths) >= count:
+                    break
+                if self._is_example(path):
+                    paths.append(path)
+        examples: list[TaskRun] = []
+        for path in paths:
+            try:
+                examples.append(TaskRun.load_from_file(path, readonly=True))
+            except FileNotFoundError:
+                # deleted since the last refresh
+                continue
+        return examples
+
+    def candidates(self) -> dict[str, tuple[Path, str]]:
+        """
+        Every run which could be picked as an example as of the last refresh, ignoring
+        the count: run ID to the run's path and a hash of its input.
+        """
+        with self._lock:
+            candidates: dict[str, tuple[Path, str]] = {}
+            paths = [path for _, path in self._repaired]
+            paths += [path for _, _, path in self._rated]
+            for path in paths:
+                summary = self._entries[path].summary
+                if summary.id is not None and self._is_example(path):
+                    candidates[summary.id] = (path, summary.input_hash)
+            return candidates
+
+    def memoized_section(self, key: Hashable, version: int) -> str | None:
+        """A section stored with store_section, if it was built from this version of the runs."""
+        with self._lock:
+            cached = self._sections.get(key)
+            if cached is None or cached[0] != version:
+                return None
+            return cached[1]
+
+    def store_section(self, key: Hashable, version: int, section: str) -> None:
+        with self._lock:
+            if version == self.version:
+                self._sections[key] = (version, section)
+
+    def _is_example(self, path: Path) -> bool:
+        run_id = self._entries[path].summary.id
+        return run_id is None or self._parent_ids[run_id] == 0
+
+    def _update(self, path: Path, signature: tuple[int, int], summary: _RunSummary):
+        entry = self._entries.get(path)
+        if entry is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        else:
+            seq = entry.seq
+            self._remove(path)
+        self._entries[path] = _IndexEntry(signature=signature, seq=seq, summary=summary)
+
+        if summary.parent_task_run_id:
+            self._parent_ids[summary.parent_task_run_id] += 1
+        if summary.eval_generated:
+            return
+        if summary.repaired:
+            bisect.insort(self._repaired, (seq, path))
+        elif summary.rating is not None:
+            bisect.insort(self._rated, (-summary.rating, seq, path))
+
+    def _remove(self, path: Path):
+        entry = self._entries.pop(path)
+        summary = entry.summary
+        if summary.parent_task_run_id:
+            self._parent_ids[summary.parent_task_run_id] -= 1
+            if self._parent_ids[summary.parent_task_run_id] <= 0:
+                del self._parent_ids[summary.parent_task_run_id]
+        if summary.eval_generated:
+            return
+        if summary.repaired:
+            _remove_sorted(self._repaired, (entry.seq, path))
+        elif summary.rating is not None:
+            _remove_sorted(self._rated, (-summary.rating, entry.seq, path))
+
+
+def _remove_sorted(items: list, item: tuple) -> None:
+    position = bisect.bisect_left(items, item)
+    if position < len(items) and items[position] == item:
+        del items[position]
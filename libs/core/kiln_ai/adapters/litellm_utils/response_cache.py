@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import litellm
+from litellm.types.utils import EmbeddingResponse, ModelResponse
+from pydantic import BaseModel
+
+from kiln_ai.utils.config import Config
+from kiln_ai.utils.filesystem_cache import FilesystemCache
+
+logger = logging.getLogger(__name__)
+
+# Set in a replayed response's _hidden_params, so usage can be marked as cached
+RESPONSE_CACHE_HIT_KEY = "kiln_response_cache_hit"
+
+# Credentials and transport details don't change what a model returns, and keeping
+# them out of the key means rotating an API key doesn't invalidate the cache
+_EXCLUDED_KEY_FIELDS = frozenset(
+    {
+        "api_key",
+        "headers",
+        "default_headers",
+        "extra_headers",
+        "timeout",
+        "shared_session",
+        "client",
+    }
+)
+
+CacheableResponse = ModelResponse | EmbeddingResponse | litellm.RerankResponse
+
+
+class LlmResponseCacheMode(str, Enum):
+    """
+    off: every call goes to the provider.
+    record: replay cached responses, and call the provider and cache the response on a miss.
+    replay_only: replay cached responses, and raise on a miss rather than calling the provider. For offline CI.
+    """
+
+    off = "off"
+    record = "record"
+    replay_only = "replay_only"
+
+
+class LlmResponseCacheMissError(RuntimeError):
+    """Raised in replay_only mode when a call has no cached response."""
+
+
+class LlmResponseCache:
+    """
+    An opt-in, on-disk cache of LiteLLM completion, embedding and rerank responses,
+    keyed by a canonical hash of the call's kwargs.
+
+    Re-running an eval or a prompt iteration with the same inputs replays the recorded
+    responses instead of calling the provider again. Entries expire after the TTL and
+    the store is size-bounded with LRU eviction. replay_only mode ignores the TTL, as
+    recordings checked in for CI shouldn't go stale.
+
+    Configured with the llm_response_cache_* settings, off by default. Streaming calls
+    are not cached, and neither are sampled completions (see is_deterministic_completion):
+    replaying one would return the first sample for every later request.
+    """
+
+    _shared_instance: LlmResponseCache | None = None
+    _shared_settings: tuple[Any, ...] | None = None
+
+    def __init__(
+        self,
+        mode: LlmResponseCacheMode,
+        filesystem_cache: FilesystemCache | None = None,
+        ttl_seconds: int | None = None,
+    ):
+        if mode != LlmResponseCacheMode.off and filesystem_cache is None:
+            raise ValueError("A filesystem cache is required unless the mode is off")
+        if ttl_seconds is not None and ttl_seconds < 1:
+            raise ValueError("ttl_seconds must be >= 1")
+        self.mode = mode
+        self.filesystem_cache = filesystem_cache
+        self.ttl_seconds = ttl_seconds
+
+    @classmethod
+    def shared(cls) -> LlmResponseCache:
+        # Rebuilt when the settings change, so the cache can be toggled without a restart
+        settings = _settings_from_config()
+        if cls._shared_instance is None or cls._shared_settings != settings:
+            cls._shared_instance = cls.from_config()
+            cls._shared_settings = settings
+        return cls._shared_instance
+
+    @classmethod
+    def from_config(cls) -> LlmResponseCache:
+        mode_setting, cache_dir_setting, ttl_hours, max_size_mb = (
+            _settings_from_config()
+        )
+        try:
+            mode = LlmResponseCacheMode(mode_setting or LlmResponseCacheMode.off)
+        except ValueError:
+            logger.warning(
+                f"Invalid llm_response_cache_mode {mode_setting!r}, the LLM response cache is off. Expected one of: {', '.join(m.value for m in LlmResponseCacheMode)}"
+            )
+            mode = LlmResponseCacheMode.off
+        if mode == LlmResponseCacheMode.off:
+            return cls(mode=mode)
+
+        cache_dir = (
+            Path(cache_dir_setting)
+            if cache_dir_setting
+            else Path(Config.settings_dir()) / "cache" / "llm_responses"
+        )
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cls(
+            mode=mode,
+            filesystem_cache=FilesystemCache(
+                path=cache_dir,
+                max_size_bytes=max_size_mb * 1024 * 1024,
+            ),
+            # 0 means entries never expire
+            ttl_seconds=ttl_hours * 60 * 60 if ttl_hours else None,
+        )
+
+    async def acompletion(self, **kwargs: Any) -> Any:
+        """A drop in for litellm.acompletion, for non-streaming calls."""
+        if self.mode == LlmResponseCacheMode.off or kwargs.get("stream"):
+            return await litellm.acompletion(**kwargs)
+        if not is_deterministic_completion(kwargs):
+            if self.mode == LlmResponseCacheMode.replay_only:
+                raise LlmResponseCacheMissError(
+                    f"Completion for model {kwargs.get('model')!r} is sampled (no seed, temperature above 0, or n above 1), so it can't be replayed and the LLM response cache is in replay only mode. Set temperature to 0 or a seed to record and replay it."
+                )
+            return await litellm.acompletion(**kwargs)
+        return await self._cached_call(
+            "completion", litellm.acompletion, ModelResponse, kwargs
+        )
+
+    async def aembedding(self, **kwargs: Any) -> Any:
+        """A drop in for litellm.aembedding."""
+        if self.mode == LlmResponseCacheMode.off:
+            return await litellm.aembedding(**kwargs)
+        return await self._cached_call(
+            "embedding", litellm.aembedding, EmbeddingResponse, kwargs
+        )
+
+    async def arerank(self, **kwargs: Any) -> Any:
+        """A drop in for litellm.arerank."""
+        if self.mode == LlmResponseCacheMode.off:
+            return await litellm.arerank(**kwargs)
+        return await self._cached_call(
+            "rerank", litellm.arerank, litellm.RerankResponse, kwargs
+        )
+
+    async def _cached_call(
+        self,
+        kind: str,
+        call: Callable[..., Awaitable[Any]],
+        response_type: type[CacheableResponse],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        key = cache_key(kind, kwargs)
+        cached = await self._get(key, response_type)
+        if cached is not None:
+            return cached
+
+        if self.mode == LlmResponseCacheMode.replay_only:
+            raise LlmResponseCacheMissError(
+                f"No cached {kind} response for model {kwargs.get('model')!r} (cache key {key}), and the LLM response cache is in replay only mode."
+            )
+
+        response = await call(**kwargs)
+        # Only cache well formed responses, errors and unexpected types pass through
+        if isinstance(response, response_type):
+            await self._set(key, response)
+        return response
+
+    async def _get(
+        self, key: str, response_type: type[CacheableResponse]
+    ) -> CacheableResponse | None:
+        if self.filesystem_cache is None:
+            return None
+        raw = await self.filesystem_cache.get(key)
+        if raw is None:
+            return None
+
+        # we don't want to raise because of cache corruption, just call the provider
+        try:
+            entry = json.loads(raw)
+            if self.mode != LlmResponseCacheMode.replay_only and self._expired(
+                entry["created_at"]
+            ):
+                return None
+            response = response_type(**entry["response"])
+        except Exception:
+            logger.warning(f"Ignoring unreadable LLM response cache entry {key}")
+            return None
+
+        # Nothing was spent on this call, so report zero cost (the token counts are those of the original call)
+        response._hidden_params = {
+            **(response._hidden_params or {}),
+            "response_cost": 0.0,
+            RESPONSE_CACHE_HIT_KEY: True,
+        }
+        return response
+
+    async def _set(self, key: str, response: BaseModel) -> None:
+        if self.filesystem_cache is None:
+            return
+        entry = {"created_at": time.time(), "response": response.model_dump()}
+        try:
+            await self.filesystem_cache.set(key, json.dumps(entry).encode("utf-8"))
+        except Exception:
+            # failing to cache shouldn't fail the call
+            logger.error(f"Error writing LLM response cache entry {key}", exc_info=True)
+
+    def _expired(self, created_at: float) -> bool:
+        if self.ttl_seconds is None:
+            return False
+        return time.time() - created_at > self.ttl_seconds
+
+
+def _settings_from_config() -> tuple[Any, ...]:
+    config = Config.shared()
+    return (
+        config.llm_response_cache_mode,
+        config.llm_response_cache_dir,
+        config.llm_response_cache_ttl_hours,
+        config.llm_response_cache_max_size_mb,
+    )
+
+
+def is_cached_response(response: Any) -> bool:
+    hidden_params = getattr(response, "_hidden_params", None) or {}
+    return bool(hidden_params.get(RESPONSE_CACHE_HIT_KEY))
+
+
+def is_deterministic_completion(kwargs: dict[str, Any]) -> bool:
+    """Whether a completion request asks for a single, repeatable response.
+
+    That's one choice (n unset or 1), with a seed or a temperature of 0. Other requests
+    sample, and each call should get a fresh response rather than a replay.
+    """
+    n = kwargs.get("n")
+    if n is not None and n != 1:
+        return False
+    return kwargs.get("seed") is not None or kwargs.get("temperature") == 0
+
+
+def cache_key(kind: str, kwargs: dict[str, Any]) -> str:
+    """A canonical hash of the call kwargs, independent of their order."""
+    keyed = {k: v for k, v in kwargs.items() if k not in _EXCLUDED_KEY_FIELDS}
+    canonical = json.dumps(
+        keyed, sort_keys=True, separators=(",", ":"), default=_canonical_json
+    )
+    return f"{kind}_{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+
+def _canonical_json(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", exclude_none=True)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
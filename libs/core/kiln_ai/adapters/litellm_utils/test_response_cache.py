@@ -0,0 +1,350 @@
+import json
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import litellm
+import pytest
+from litellm.types.utils import EmbeddingResponse, ModelResponse
+from litellm.types.utils import Usage as LiteLlmUsage
+
+from kiln_ai.adapters.litellm_utils.response_cache import (
+    LlmResponseCache,
+    LlmResponseCacheMissError,
+    LlmResponseCacheMode,
+    cache_key,
+    is_cached_response,
+    is_deterministic_completion,
+)
+from kiln_ai.utils.config import Config
+from kiln_ai.utils.filesystem_cache import FilesystemCache
+
+
+def model_response(content: str = "hello") -> ModelResponse:
+    return ModelResponse(
+        model="gpt-4o",
+        choices=[{"message": {"content": content}, "finish_reason": "stop"}],
+        usage=LiteLlmUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+    )
+
+
+def completion_kwargs(content: str = "hi") -> dict:
+    return {
+        "model": "openai/gpt-4o",
+        "messages": [{"role": "user", "content": content}],
+        "temperature": 0,
+    }
+
+
+@pytest.fixture
+def filesystem_cache(tmp_path):
+    return FilesystemCache(path=tmp_path, max_size_bytes=1024 * 1024)
+
+
+@pytest.fixture
+def record_cache(filesystem_cache):
+    return LlmResponseCache(
+        mode=LlmResponseCacheMode.record, filesystem_cache=filesystem_cache
+    )
+
+
+def test_cache_key_is_canonical():
+    kwargs = completion_kwargs()
+    reordered = dict(reversed(list(kwargs.items())))
+    assert cache_key("completion", kwargs) == cache_key("completion", reordered)
+
+    # credentials and headers aren't part of the key
+    assert cache_key("completion", kwargs) == cache_key(
+        "completion", {**kwargs, "api_key": "sk-1", "headers": {"X-Test": "1"}}
+    )
+
+    assert cache_key("completion", kwargs) != cache_key(
+        "completion", completion_kwargs("different")
+    )
+    assert cache_key("completion", kwargs) != cache_key(
+        "completion", {**kwargs, "temperature": 1}
+    )
+    assert cache_key("completion", kwargs) != cache_key("embedding", kwargs)
+
+
+def test_cache_key_handles_pydantic_values():
+    message = litellm.Message(role="assistant", content="hello")
+    kwargs = {"model": "openai/gpt-4o", "messages": [message]}
+    assert cache_key("completion", kwargs) == cache_key(
+        "completion",
+        {
+            "model": "openai/gpt-4o",
+            "messages": [litellm.Message(role="assistant", content="hello")],
+        },
+    )
+    assert cache_key("completion", kwargs).startswith("completion_")
+
+
+def test_init_validation(filesystem_cache):
+    with pytest.raises(ValueError, match="filesystem cache is required"):
+        LlmResponseCache(mode=LlmResponseCacheMode.record)
+    with pytest.raises(ValueError, match="ttl_seconds"):
+        LlmResponseCache(
+            mode=LlmResponseCacheMode.record,
+            filesystem_cache=filesystem_cache,
+            ttl_seconds=0,
+        )
+
+
+async def test_off_mode_passes_through():
+    cache = LlmResponseCache(mode=LlmResponseCacheMode.off)
+    response = model_response()
+    with patch("litellm.acompletion", AsyncMock(return_value=response)) as mock:
+        assert await cache.acompletion(**completion_kwargs()) is response
+        assert await cache.acompletion(**completion_kwargs()) is response
+    assert mock.await_count == 2
+
+
+async def test_record_mode_replays_responses(record_cache):
+    with patch("litellm.acompletion", AsyncMock(return_value=model_response())) as mock:
+        first = await record_cache.acompletion(**completion_kwargs())
+        second = await record_cache.acompletion(**completion_kwargs())
+        await record_cache.acompletion(**completion_kwargs("different"))
+
+    assert mock.await_count == 2
+    assert not is_cached_response(first)
+    assert is_cached_response(second)
+    assert isinstance(second, ModelResponse)
+    assert second.choices[0].message.content == "hello"
+    # tokens are those of the original call, but the replay cost nothing
+    assert second.usage.prompt_tokens == 10
+    assert second._hidden_params["response_cost"] == 0.0
+
+
+async def test_record_mode_does_not_cache_errors(record_cache):
+    with patch(
+        "litellm.acompletion",
+        AsyncMock(side_effect=[RuntimeError("boom"), model_response()]),
+    ) as mock:
+        with pytest.raises(RuntimeError, match="boom"):
+            await record_cache.acompletion(**completion_kwargs())
+        response = await record_cache.acompletion(**completion_kwargs())
+
+    assert mock.await_count == 2
+    assert not is_cached_response(response)
+
+
+async def test_streaming_calls_are_not_cached(record_cache):
+    with patch("litellm.acompletion", AsyncMock(return_value="stream")) as mock:
+        await record_cache.acompletion(**completion_kwargs(), stream=True)
+        await record_cache.acompletion(**completion_kwargs(), stream=True)
+    assert mock.await_count == 2
+
+
+@pytest.mark.parametrize(
+    "overrides,expected",
+    [
+        ({}, True),
+        ({"n": 1}, True),
+        ({"temperature": 0.7, "seed": 42}, True),
+        ({"temperature": 0.7}, False),
+        ({"temperature": None}, False),
+        ({"n": 3}, False),
+        ({"n": 3, "seed": 42}, False),
+    ],
+)
+def test_is_deterministic_completion(overrides, expected):
+    assert is_deterministic_completion({**completion_kwargs(), **overrides}) is expected
+
+
+async def test_sampled_completions_are_not_replayed(record_cache, filesystem_cache):
+    kwargs = {**completion_kwargs(), "temperature": 0.7}
+    with patch(
+        "litellm.acompletion",
+        AsyncMock(side_effect=[model_response("one"), model_response("two")]),
+    ) as mock:
+        first = await record_cache.acompletion(**kwargs)
+        second = await record_cache.acompletion(**kwargs)
+
+    assert mock.await_count == 2
+    assert first.choices[0].message.content == "one"
+    assert second.choices[0].message.content == "two"
+    assert not is_cached_response(second)
+    assert await filesystem_cache.get(cache_key("completion", kwargs)) is None
+
+    replayer = LlmResponseCache(
+        mode=LlmResponseCacheMode.replay_only, filesystem_cache=filesystem_cache
+    )
+    with patch("litellm.acompletion", AsyncMock()) as mock:
+        with pytest.raises(LlmResponseCacheMissError, match="sampled"):
+            await replayer.acompletion(**kwargs)
+    mock.assert_not_awaited()
+
+
+async def test_record_mode_expires_entries(filesystem_cache):
+    cache = LlmResponseCache(
+        mode=LlmResponseCacheMode.record,
+        filesystem_cache=filesystem_cache,
+        ttl_seconds=60,
+    )
+    with patch("litellm.acompletion", AsyncMock(return_value=model_response())) as mock:
+        await cache.acompletion(**completion_kwargs())
+        with patch(
+            "kiln_ai.adapters.litellm_utils.response_cache.time.time",
+            return_value=time.time() + 120,
+        ):
+            response = await cache.acompletion(**completion_kwargs())
+
+    assert mock.await_count == 2
+    assert not is_cached_response(response)
+
+
+async def test_replay_only_mode(filesystem_cache):
+    recorder = LlmResponseCache(
+        mode=LlmResponseCacheMode.record, filesystem_cache=filesystem_cache
+    )
+    with patch("litellm.acompletion", AsyncMock(return_value=model_response())):
+        await recorder.acompletion(**completion_kwargs())
+
+    replayer = LlmResponseCache(
+        mode=LlmResponseCacheMode.replay_only,
+        filesystem_cache=filesystem_cache,
+        ttl_seconds=60,
+    )
+    with patch("litellm.acompletion", AsyncMock()) as mock:
+        # replay only ignores the TTL, recordings don't go stale
+        with patch(
+            "kiln_ai.adapters.litellm_utils.response_cache.time.time",
+            return_value=time.time() + 120,
+        ):
+            response = await replayer.acompletion(**completion_kwargs())
+        assert is_cached_response(response)
+
+        with pytest.raises(LlmResponseCacheMissError, match="replay only"):
+            await replayer.acompletion(**completion_kwargs("not recorded"))
+    mock.assert_not_awaited()
+
+
+async def test_unreadable_entry_is_a_miss(record_cache, filesystem_cache):
+    kwargs = completion_kwargs()
+    await filesystem_cache.set(cache_key("completion", kwargs), b"not json")
+
+    with patch("litellm.acompletion", AsyncMock(return_value=model_response())) as mock:
+        response = await record_cache.acompletion(**kwargs)
+        assert not is_cached_response(response)
+        # and the good response replaces it
+        assert is_cached_response(await record_cache.acompletion(**kwargs))
+    assert mock.await_count == 1
+
+
+async def test_embedding_and_rerank_are_cached(record_cache):
+    embedding_response = EmbeddingResponse(
+        model="text-embedding-3-small",
+        data=[{"object": "embedding", "index": 0, "embedding": [0.1, 0.2]}],
+        usage=LiteLlmUsage(prompt_tokens=3, total_tokens=3),
+    )
+    rerank_response = litellm.RerankResponse(
+        id="rerank", results=[{"index": 0, "relevance_score": 0.9}]
+    )
+
+    with (
+        patch(
+            "litellm.aembedding", AsyncMock(return_value=embedding_response)
+        ) as mock_embedding,
+        patch(
+            "litellm.arerank", AsyncMock(return_value=rerank_response)
+        ) as mock_rerank,
+    ):
+        for _ in range(2):
+            embedding = await record_cache.aembedding(
+                model="openai/text-embedding-3-small", input=["hello"]
+            )
+            rerank = await record_cache.arerank(
+                model="cohere/rerank-v3.5", query="q", documents=["a"]
+            )
+
+    mock_embedding.assert_awaited_once()
+    mock_rerank.assert_awaited_once()
+    assert is_cached_response(embedding)
+    assert embedding.data[0]["embedding"] == [0.1, 0.2]
+    assert embedding.usage.prompt_tokens == 3
+    assert is_cached_response(rerank)
+    assert rerank.results[0]["relevance_score"] == 0.9
+
+
+async def test_cached_entries_are_json(record_cache, filesystem_cache):
+    kwargs = completion_kwargs()
+    with patch("litellm.acompletion", AsyncMock(return_value=model_response())):
+        await record_cache.acompletion(**kwargs)
+
+    raw = await filesystem_cache.get(cache_key("completion", kwargs))
+    assert raw is not None
+    entry = json.loads(raw)
+    assert entry["created_at"] <= time.time()
+    assert entry["response"]["choices"][0]["message"]["content"] == "hello"
+
+
+def test_from_config_defaults_to_off():
+    cache = LlmResponseCache.from_config()
+    assert cache.mode == LlmResponseCacheMode.off
+    assert cache.filesystem_cache is None
+
+
+def test_from_config(tmp_path):
+    cache_dir = tmp_path / "llm_cache"
+    with patch.dict(
+        os.environ,
+        {
+            "KILN_LLM_RESPONSE_CACHE_MODE": "replay_only",
+            "KILN_LLM_RESPONSE_CACHE_DIR": str(cache_dir),
+            "KILN_LLM_RESPONSE_CACHE_TTL_HOURS": "2",
+            "KILN_LLM_RESPONSE_CACHE_MAX_SIZE_MB": "3",
+        },
+    ):
+        with patch.object(Config, "_shared_instance", Config()):
+            cache = LlmResponseCache.from_config()
+
+    assert cache.mode == LlmResponseCacheMode.replay_only
+    assert cache.ttl_seconds == 2 * 60 * 60
+    assert cache.filesystem_cache is not None
+    assert cache.filesystem_cache.cache_dir_path == cache_dir
+    assert cache.filesystem_cache.max_size_bytes == 3 * 1024 * 1024
+    assert cache_dir.is_dir()
+
+
+def test_from_config_zero_ttl_never_expires(tmp_path):
+    with patch.dict(
+        os.environ,
+        {
+            "KILN_LLM_RESPONSE_CACHE_MODE": "record",
+            "KILN_LLM_RESPONSE_CACHE_DIR": str(tmp_path),
+            "KILN_LLM_RESPONSE_CACHE_TTL_HOURS": "0",
+        },
+    ):
+        with patch.object(Config, "_shared_instance", Config()):
+            cache = LlmResponseCache.from_config()
+
+    assert cache.mode == LlmResponseCacheMode.record
+    assert cache.ttl_seconds is None
+
+
+def test_from_config_invalid_mode_is_off():
+    with patch.dict(os.environ, {"KILN_LLM_RESPONSE_CACHE_MODE": "sometimes"}):
+        with patch.object(Config, "_shared_instance", Config()):
+            cache = LlmResponseCache.from_config()
+    assert cache.mode == LlmResponseCacheMode.off
+
+
+def test_shared_follows_config_changes(tmp_path):
+    with patch.object(Config, "_shared_instance", Config()):
+        off = LlmResponseCache.shared()
+        assert off.mode == LlmResponseCacheMode.off
+        assert LlmResponseCache.shared() is off
+
+        with patch.dict(
+            os.environ,
+            {
+                "KILN_LLM_RESPONSE_CACHE_MODE": "record",
+                "KILN_LLM_RESPONSE_CACHE_DIR": str(tmp_path),
+            },
+        ):
+            record = LlmResponseCache.shared()
+            assert record.mode == LlmResponseCacheMode.record
+            assert LlmResponseCache.shared() is record
+
+        assert LlmResponseCache.shared().mode == LlmResponseCacheMode.off
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-import copy
+import asyncio
 import json
 import logging
 import time
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, AsyncIterator, NoReturn
-
-from litellm.types.utils import ChatCompletionMessageToolCall, Choices, ModelResponse
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator, NoReturn
+
+from litellm.types.utils import (
+    ChatCompletionMessageToolCall,
+    Choices,
+    Function,
+    ModelResponse,
+    ModelResponseStream,
+)
 
 from kiln_ai.adapters.chat import ChatCompletionMessageIncludingLiteLLM
 from kiln_ai.adapters.chat.chat_formatter import ChatFormatter, chat_message_to_dict
 from kiln_ai.adapters.litellm_utils.litellm_streaming import StreamingCompletion
 from kiln_ai.adapters.ml_model_list import KilnModelProvider
+from kiln_ai.adapters.model_adapters.provider_message_log import ProviderMessageLog
 from kiln_ai.adapters.model_adapters.stream_events import (
     AdapterStreamEvent,
     ToolCallEvent,
@@ -20,6 +28,7 @@ from kiln_ai.adapters.model_adapters.stream_events import (
 )
 from kiln_ai.adapters.run_output import RunOutput
 from kiln_ai.datamodel import MessageUsage, Usage
+from kiln_ai.utils.open_ai_types import ChatCompletionToolMessageParamWrapper
 
 if TYPE_CHECKING:
     from kiln_ai.adapters.model_adapters.litellm_adapter import LiteLlmAdapter
@@ -86,6 +95,24 @@ def raise_for_empty_model_response(response_choice: Any) -> NoReturn:
     raise ValueError(EMPTY_RESPONSE_ERROR_MESSAGE)
 
 
+@dataclass
+class StartedToolCall:
+    """A tool call started while the model's response was still streaming in."""
+
+    name: str
+    arguments: str
+    task: asyncio.Task[ChatCompletionToolMessageParamWrapper]
+
+    def matches(self, tool_call: ChatCompletionMessageToolCall) -> bool:
+        return (
+            tool_call.function.name == self.name
+            and tool_call.function.arguments == self.arguments
+        )
+
+    async def result(self) -> ChatCompletionToolMessageParamWrapper:
+        return await self.task
+
+
 @dataclass
 class AdapterStreamResult:
     run_output: RunOutput
@@ -116,6 +143,8 @@ class AdapterStream:
         self._provider = provider
         self._chat_formatter = chat_formatter
         self._messages = initial_messages
+        # Provider-ready snapshots of _messages, extended as the stream appends to it
+        self._message_log = ProviderMessageLog(initial_messages)
         self._top_logprobs = top_logprobs
         self._result: AdapterStreamResult | None = None
         self._iterated = False
@@ -166,17 +195,19 @@ class AdapterStream:
             turn_top_logprobs = self._top_logprobs if turn.final_call else None
 
             interrupted = False
-            async for event in self._stream_model_turn(
-                skip_response_format, turn_top_logprobs
-            ):
-                if isinstance(event, _ModelTurnComplete):
-                    usage += event.usage
-                    prior_output = event.assistant_message
-                    final_choice = event.model_choice
-                    if event.interrupted_by_tool_calls:
-                        interrupted = True
-                else:
-                    yield event
+            # Closed explicitly so an aborted stream cancels the turn's tool calls right away
+            async with aclosing(
+                self._stream_model_turn(skip_response_format, turn_top_logprobs)
+            ) as turn_events:
+                async for event in turn_events:
+                    if isinstance(event, _ModelTurnComplete):
+                        usage += event.usage
+                        prior_output = event.assistant_message
+                        final_choice = event.model_choice
+                        if event.interrupted_by_tool_calls:
+                            interrupted = True
+                    else:
+                        yield event
 
             if interrupted:
                 break
@@ -212,100 +243,119 @@ class AdapterStream:
         self,
         skip_response_format: bool,
         top_logprobs: int | None,
-    ) -> AsyncIterator[AdapterStreamEvent | _ModelTurnComplete]:
+    ) -> AsyncGenerator[AdapterStreamEvent | _ModelTurnComplete, None]:
         usage = Usage()
         tool_calls_count = 0
 
         while tool_calls_count < MAX_TOOL_CALLS_PER_TURN:
             completion_kwargs = await self._adapter.build_completion_kwargs(
                 self._provider,
-                copy.deepcopy(self._messages),
+                self._message_log,
                 top_logprobs,
                 skip_response_format,
             )
 
-            stream = StreamingCompletion(**completion_kwargs)
-            start = time.monotonic()
-            async for chunk in stream:
-                yield chunk
-            call_latency_ms = int((time.monotonic() - start) * 1000)
-
-            response, response_choice = _validate_response(stream.response)
-            call_usage = self._adapter.usage_from_response(response)
-            usage += call_usage
-            usage.total_llm_latency_ms = (
-                usage.total_llm_latency_ms or 0
-            ) + call_latency_ms
-
-            content = response_choice.message.content
-            tool_calls = response_choice.message.tool_calls
-            if not content and not tool_calls:
-                raise_for_empty_model_response(response_choice)
-
-            self._messages.append(response_choice.message)
-            self._message_latency[len(self._messages) - 1] = call_latency_ms
-            self._message_usage[len(self._messages) - 1] = call_usage
-
-            if tool_calls and len(tool_calls) > 0:
-                # Check for return_on_tool_call BEFORE processing
-                if self._adapter.base_adapter_config.return_on_tool_call:
-                    real_tool_calls = [
-                        tc for tc in tool_calls if tc.function.name != "task_response"
-                    ]
-                    if real_tool_calls:
-                        # Yield INPUT_AVAILABLE events for each tool call
-                        for tc in real_tool_calls:
-                            try:
-                                parsed_args = json.loads(tc.function.arguments)
-                            except (json.JSONDecodeError, TypeError):
-                                parsed_args = None
-                            yield ToolCallEvent(
-                                event_type=ToolCallEventType.INPUT_AVAILABLE,
-                                tool_call_id=tc.id,
-                                tool_name=tc.function.name or "unknown",
-                                arguments=parsed_args,
-                                error=(
-                                    f"Failed to parse arguments: {tc.function.arguments}"
-                                    if parsed_args is None
-                                    else None
-                                ),
+            # Tools aren't run here when the caller handles the tool calls
+            speculator = (
+                None
+                if self._adapter.base_adapter_config.return_on_tool_call
+                else _ToolCallSpeculator(self._adapter)
+            )
+            try:
+                stream = StreamingCompletion(**completion_kwargs)
+                start = time.monotonic()
+                async for chunk in stream:
+                    if speculator is not None:
+                        await speculator.add_chunk(chunk)
+                    yield chunk
+                call_latency_ms = int((time.monotonic() - start) * 1000)
+
+                response, response_choice = _validate_response(stream.response)
+                call_usage = self._adapter.usage_from_response(response)
+                usage += call_usage
+                usage.total_llm_latency_ms = (
+                    usage.total_llm_latency_ms or 0
+                ) + call_latency_ms
+
+                content = response_choice.message.content
+                tool_calls = response_choice.message.tool_calls
+                if not content and not tool_calls:
+                    raise_for_empty_model_response(response_choice)
+
+                self._messages.append(response_choice.message)
+                self._message_latency[len(self._messages) - 1] = call_latency_ms
+                self._message_usage[len(self._messages) - 1] = call_usage
+
+                if tool_calls and len(tool_calls) > 0:
+                    # Check for return_on_tool_call BEFORE processing
+                    if self._adapter.base_adapter_config.return_on_tool_call:
+                        real_tool_calls = [
+                            tc
+                            for tc in tool_calls
+                            if tc.function.name != "task_response"
+                        ]
+                        if real_tool_calls:
+                            # Yield INPUT_AVAILABLE events for each tool call
+                            for tc in real_tool_calls:
+                                try:
+                                    parsed_args = json.loads(tc.function.arguments)
+                                except (json.JSONDecodeError, TypeError):
+                                    parsed_args = None
+                                yield ToolCallEvent(
+                                    event_type=ToolCallEventType.INPUT_AVAILABLE,
+                                    tool_call_id=tc.id,
+                                    tool_name=tc.function.name or "unknown",
+                                    arguments=parsed_args,
+                                    error=(
+                                        f"Failed to parse arguments: {tc.function.arguments}"
+                                        if parsed_args is None
+                                        else None
+                                    ),
+                                )
+
+                            yield _ModelTurnComplete(
+                                assistant_message="",
+                                model_choice=response_choice,
+                                usage=usage,
+                                interrupted_by_tool_calls=True,
                             )
+                            return
 
+                    # Existing flow: handle tool calls internally
+                    async with aclosing(
+                        self._handle_tool_calls(tool_calls, speculator)
+                    ) as tool_events:
+                        async for event in tool_events:
+                            yield event
+
+                    assistant_msg = self._extract_task_response(tool_calls)
+                    if assistant_msg is not None:
                         yield _ModelTurnComplete(
-                            assistant_message="",
+                            assistant_message=assistant_msg,
                             model_choice=response_choice,
                             usage=usage,
-                            interrupted_by_tool_calls=True,
                         )
                         return
 
-                # Existing flow: handle tool calls internally
-                async for event in self._handle_tool_calls(tool_calls):
-                    yield event
+                    tool_calls_count += 1
+                    continue
 
-                assistant_msg = self._extract_task_response(tool_calls)
-                if assistant_msg is not None:
+                if content:
                     yield _ModelTurnComplete(
-                        assistant_message=assistant_msg,
+                        assistant_message=content,
                         model_choice=response_choice,
                         usage=usage,
                     )
                     return
 
-                tool_calls_count += 1
-                continue
-
-            if content:
-                yield _ModelTurnComplete(
-                    assistant_message=content,
-                    model_choice=response_choice,
-                    usage=usage,
+                raise RuntimeError(
+                    "Model returned neither content nor tool calls. It must return at least one of these."
                 )
-                return
-
-            raise RuntimeError(
-                "Model returned neither content nor tool calls. It must return at least one of these."
-            )
+            finally:
+                # Cancels tools started for a turn that was aborted, or for a tool call
+                # the final response didn't include
+                if speculator is not None:
+                    speculator.cancel()
 
         raise RuntimeError(
             f"Too many tool calls ({tool_calls_count}). Stopping iteration to avoid using too many tokens."
@@ -314,7 +364,8 @@ class AdapterStream:
     async def _handle_tool_calls(
         self,
         tool_calls: list[ChatCompletionMessageToolCall],
-    ) -> AsyncIterator[AdapterStreamEvent]:
+        speculator: _ToolCallSpeculator | None = None,
+    ) -> AsyncGenerator[AdapterStreamEvent, None]:
         real_tool_calls = [
             tc for tc in tool_calls if tc.function.name != "task_response"
         ]
@@ -337,18 +388,37 @@ class AdapterStream:
                 ),
             )
 
-        _, tool_msgs = await self._adapter.process_tool_calls(tool_calls)
+        # Run the tools in the background, reporting each result as soon as its tool
+        # finishes rather than after all of them
+        results: asyncio.Queue[ChatCompletionToolMessageParamWrapper] = asyncio.Queue()
+        processing = asyncio.create_task(
+            self._adapter.process_tool_calls(
+                tool_calls,
+                started_tool_calls=speculator.started if speculator else None,
+                on_tool_result=results.put_nowait,
+            )
+        )
+        reported: set[str] = set()
+        try:
+            while True:
+                next_result = asyncio.ensure_future(results.get())
+                await asyncio.wait(
+                    {processing, next_result}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not next_result.done():
+                    next_result.cancel()
+                    break
+                tool_msg = next_result.result()
+                reported.add(tool_msg["tool_call_id"])
+                yield _tool_output_event(tool_calls, tool_msg)
+            _, tool_msgs = processing.result()
+        finally:
+            # The consumer stopped iterating or a tool failed, don't leave tools running
+            processing.cancel()
 
         for tool_msg in tool_msgs:
-            tc_id = tool_msg["tool_call_id"]
-            tc_name = _find_tool_name(tool_calls, tc_id)
-            content = tool_msg["content"]
-            yield ToolCallEvent(
-                event_type=ToolCallEventType.OUTPUT_AVAILABLE,
-                tool_call_id=tc_id,
-                tool_name=tc_name,
-                result=str(content) if content is not None else None,
-            )
+            if tool_msg["tool_call_id"] not in reported:
+                yield _tool_output_event(tool_calls, tool_msg)
 
         self._messages.extend(tool_msgs)
 
@@ -362,6 +432,97 @@ class AdapterStream:
         return None
 
 
+@dataclass
+class _PartialToolCall:
+    """A tool call being assembled from streamed deltas."""
+
+    id: str | None = None
+    name: str | None = None
+    arguments: str = ""
+    # Whether starting it was attempted, so it's only started (or rejected) once
+    attempted: bool = False
+
+
+@dataclass
+class _ToolCallSpeculator:
+    """
+    Starts each tool call as soon as its arguments have streamed in, rather than once
+    the model's whole response has, so slow tools (searches, sub-tasks, MCP calls)
+    overlap with the rest of the response.
+
+    A tool call's arguments are complete once they parse as a JSON object: no valid
+    object is a prefix of a longer one. Calls which would fail validation aren't
+    started, process_tool_calls reports the error for the final response.
+    """
+
+    adapter: LiteLlmAdapter
+    # Started tool calls by tool call ID, handed to process_tool_calls
+    started: dict[str, StartedToolCall] = field(default_factory=dict)
+    _partial: dict[int, _PartialToolCall] = field(default_factory=dict)
+
+    async def add_chunk(self, chunk: ModelResponseStream) -> None:
+        for choice in chunk.choices:
+            delta = choice.delta
+            if delta is None or not delta.tool_calls:
+                continue
+            for tc_delta in delta.tool_calls:
+                partial = self._partial.setdefault(tc_delta.index, _PartialToolCall())
+                if tc_delta.id is not None:
+                    partial.id = tc_delta.id
+                func = getattr(tc_delta, "function", None)
+                if func is not None:
+                    if func.name is not None:
+                        partial.name = func.name
+                    if func.arguments:
+                        partial.arguments += func.arguments
+                # Cheap check before trying to parse the arguments
+                if partial.arguments.rstrip().endswith("}"):
+                    await self._maybe_start(partial)
+
+    async def _maybe_start(self, partial: _PartialToolCall) -> None:
+        if (
+            partial.attempted
+            or partial.id is None
+            or partial.name is None
+            or partial.name == "task_response"
+        ):
+            return
+        try:
+            arguments = json.loads(partial.arguments)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(arguments, dict):
+            return
+
+        partial.attempted = True
+        tool_call = ChatCompletionMessageToolCall(
+            id=partial.id,
+            type="function",
+            function=Function(name=partial.name, arguments=partial.arguments),
+        )
+        try:
+            dispatch = await self.adapter._tool_dispatch_table()
+            run_tool = await self.adapter.prepare_tool_call(tool_call, dispatch)
+        except Exception:
+            return
+        self.started[partial.id] = StartedToolCall(
+            name=partial.name,
+            arguments=partial.arguments,
+            task=asyncio.create_task(run_tool()),
+        )
+
+    def cancel(self) -> None:
+        """Cancel started tool calls which are still running."""
+        for started in self.started.values():
+            if not started.task.done():
+                started.task.cancel()
+            elif not started.task.cancelled():
+                # An unused failure would otherwise be logged as never retrieved
+                started.task.exception()
+        self.started.clear()
+        self._partial.clear()
+
+
 @dataclass
 class _ModelTurnComplete:
     """Internal sentinel yielded when a model turn finishes."""
@@ -387,6 +548,20 @@ def _validate_response(
     return response, response.choices[0]
 
 
+def _tool_output_event(
+    tool_calls: list[ChatCompletionMessageToolCall],
+    tool_msg: ChatCompletionToolMessageParamWrapper,
+) -> ToolCallEvent:
+    tc_id = tool_msg["tool_call_id"]
+    content = tool_msg["content"]
+    return ToolCallEvent(
+        event_type=ToolCallEventType.OUTPUT_AVAILABLE,
+        tool_call_id=tc_id,
+        tool_name=_find_tool_name(tool_calls, tc_id),
+        result=str(content) if content is not None else None,
+    )
+
+
 def _find_tool_name(
     tool_calls: list[ChatCompletionMessageToolCall], tool_call_id: str
 ) -> str:
@@ -267,6 +267,8 @@ class BaseAdapter(metaclass=ABCMeta):
         # exception thrown from inside `_run` (or the post-processing that
         # follows). `_run` must mutate this list in place (extend/append,
         # or `list[:] = ...`) and never rebind the local name.
+        await self._prepare_prompt_for_input(input, prior_trace)
+
         trace_ref: list[ChatCompletionMessageParam] = []
         try:
             run_output, usage = await self._run(
@@ -432,6 +434,16 @@ class BaseAdapter(metaclass=ABCMeta):
             self, input, input_source, prior_trace, parent_task_run
         )
 
+    async def _prepare_prompt_for_input(
+        self,
+        input: InputType,
+        prior_trace: list[ChatCompletionMessageParam] | None,
+    ) -> None:
+        # Continuations reuse the system prompt in the prior trace, so only new runs
+        # build a prompt, which may depend on the input (like retrieved examples)
+        if self.prompt_builder is not None and not prior_trace:
+            await self.prompt_builder.prepare_for_input(input)
+
     def _prepare_stream(
         self,
         input: InputType,
@@ -901,6 +913,9 @@ class OpenAIStreamResult:
             set_agent_run_id(generate_agent_run_id())
 
         try:
+            await self._adapter._prepare_prompt_for_input(
+                self._input, self._prior_trace
+            )
             adapter_stream = self._adapter._prepare_stream(
                 self._input, self._prior_trace
             )
@@ -964,6 +979,9 @@ class AiSdkStreamResult:
             set_agent_run_id(generate_agent_run_id())
 
         try:
+            await self._adapter._prepare_prompt_for_input(
+                self._input, self._prior_trace
+            )
             adapter_stream = self._adapter._prepare_stream(
                 self._input, self._prior_trace
             )
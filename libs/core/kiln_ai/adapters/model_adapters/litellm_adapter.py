@@ -4,9 +4,9 @@ import json
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Coroutine, Dict, List, Tuple
 
-import litellm
+import jsonschema
 from litellm.types.utils import (
     ChatCompletionMessageToolCall,
     ChoiceLogprobs,
@@ -22,6 +22,10 @@ from openai.types.chat.chat_completion_message_tool_call_param import (
 import kiln_ai.datamodel as datamodel
 from kiln_ai.adapters.chat import ChatCompletionMessageIncludingLiteLLM
 from kiln_ai.adapters.chat.chat_formatter import chat_message_to_dict
+from kiln_ai.adapters.litellm_utils.response_cache import (
+    LlmResponseCache,
+    is_cached_response,
+)
 from kiln_ai.adapters.ml_model_list import (
     KilnModelProvider,
     ModelProviderName,
@@ -30,6 +34,7 @@ from kiln_ai.adapters.ml_model_list import (
 from kiln_ai.adapters.model_adapters.adapter_stream import (
     EMPTY_RESPONSE_ERROR_MESSAGE,
     AdapterStream,
+    StartedToolCall,
     raise_for_empty_model_response,
 )
 from kiln_ai.adapters.model_adapters.base_adapter import (
@@ -40,11 +45,13 @@ from kiln_ai.adapters.model_adapters.base_adapter import (
     Usage,
 )
 from kiln_ai.adapters.model_adapters.litellm_config import LiteLlmConfig
+from kiln_ai.adapters.model_adapters.provider_message_log import ProviderMessageLog
 from kiln_ai.datamodel.datamodel_enums import InputType
 from kiln_ai.datamodel.json_schema import (
     close_object_schemas,
     strip_numeric_bounds,
-    validate_schema_with_value_error,
+    validate_with_value_error,
+    validator_for_schema,
 )
 from kiln_ai.datamodel.run_config import (
     KilnAgentRunConfigProperties,
@@ -56,7 +63,9 @@ from kiln_ai.tools.base_tool import (
     ToolCallDefinition,
 )
 from kiln_ai.tools.kiln_task_tool import KilnTaskToolResult
+from kiln_ai.tools.tool_result_cache import ToolResultCache
 from kiln_ai.utils.exhaustive_error import raise_exhaustive_enum_error
+from kiln_ai.utils.http_client_pool import HttpClientPool
 from kiln_ai.utils.litellm import get_litellm_provider_info
 from kiln_ai.utils.open_ai_types import (
     ChatCompletionAssistantMessageParamWrapper,
@@ -91,6 +100,25 @@ class ModelTurnResult:
     message_usage: dict[int, MessageUsage] | None = None
 
 
+@dataclass
+class ToolDispatchEntry:
+    tool: KilnToolInterface
+    # Resolved and compiled on the tool's first call, so a broken definition or
+    # schema only fails calls to its own tool
+    parameters_schema: str | None = None
+    validator: jsonschema.Draft202012Validator | None = None
+
+    async def get_validator(self) -> jsonschema.Draft202012Validator:
+        if self.validator is None:
+            if self.parameters_schema is None:
+                tool_call_definition = await self.tool.toolcall_definition()
+                self.parameters_schema = json.dumps(
+                    tool_call_definition["function"]["parameters"]
+                )
+            self.validator = validator_for_schema(self.parameters_schema)
+        return self.validator
+
+
 class LiteLlmAdapter(BaseAdapter):
     def __init__(
         self,
@@ -106,6 +134,7 @@ class LiteLlmAdapter(BaseAdapter):
         self._headers = config.default_headers
         self._litellm_model_id: str | None = None
         self._cached_available_tools: list[KilnToolInterface] | None = None
+        self._cached_tool_dispatch: dict[str, ToolDispatchEntry] | None = None
 
         super().__init__(
             task=kiln_task,
@@ -140,13 +169,15 @@ class LiteLlmAdapter(BaseAdapter):
         # Kept separate because we don't own the LiteLLM message objects.
         message_latency: dict[int, int] = {}
         message_usage: dict[int, MessageUsage] = {}
+        # Snapshots each message once as it's appended, rather than copying the whole
+        # conversation on every iteration of the tool loop.
+        message_log = ProviderMessageLog(messages)
 
         while tool_calls_count < MAX_TOOL_CALLS_PER_TURN:
             # Build completion kwargs for tool calls
             completion_kwargs = await self.build_completion_kwargs(
                 provider,
-                # Pass a copy, as acompletion mutates objects and breaks types.
-                copy.deepcopy(messages),
+                message_log,
                 top_logprobs,
                 skip_response_format,
             )
@@ -417,7 +448,7 @@ class LiteLlmAdapter(BaseAdapter):
     async def acompletion_checking_response(
         self, **kwargs: Any
     ) -> Tuple[ModelResponse, Choices]:
-        response = await litellm.acompletion(**kwargs)
+        response = await LlmResponseCache.shared().acompletion(**kwargs)
 
         if (
             not isinstance(response, ModelResponse)
@@ -699,19 +730,29 @@ class LiteLlmAdapter(BaseAdapter):
     async def build_completion_kwargs(
         self,
         provider: KilnModelProvider,
-        messages: list[ChatCompletionMessageIncludingLiteLLM],
+        messages: list[ChatCompletionMessageIncludingLiteLLM] | ProviderMessageLog,
         top_logprobs: int | None,
         skip_response_format: bool = False,
     ) -> dict[str, Any]:
         run_config = as_kiln_agent_run_config(self.run_config)
         extra_body = self.build_extra_body(provider)
 
+        # A message log already holds sanitized copies, only a plain list needs stripping
+        if isinstance(messages, ProviderMessageLog):
+            provider_messages = messages.provider_messages()
+        else:
+            provider_messages = sanitize_messages_for_provider(messages)
+
         # Merge all parameters into a single kwargs dict for litellm
         completion_kwargs = {
             "model": self.litellm_model_id(),
-            "messages": messages,
+            "messages": provider_messages,
             "api_base": self._api_base,
             "headers": self._headers,
+            # Reuse pooled connections rather than paying for a handshake per call
+            "shared_session": HttpClientPool.shared().litellm_session(
+                self._api_base, provider.name
+            ),
             "temperature": run_config.temperature,
             "top_p": run_config.top_p,
             # This drops params that are not supported by the model. Only openai params like top_p, temperature -- not litellm params like model, etc.
@@ -776,7 +817,7 @@ class LiteLlmAdapter(BaseAdapter):
         if len(allowed_openai_params) > 0:
             completion_kwargs["allowed_openai_params"] = allowed_openai_params
 
-        completion_kwargs["messages"] = sanitize_messages_for_provider(messages)
+        completion_kwargs["messages"] = provider_messages
 
         return completion_kwargs
 
@@ -789,6 +830,8 @@ class LiteLlmAdapter(BaseAdapter):
             cost = litellm_usage.get("cost", None)
 
         usage = MessageUsage()
+        if is_cached_response(response):
+            usage.response_cache_hits = 1
 
         if not litellm_usage and not cost:
             return usage
@@ -830,6 +873,19 @@ class LiteLlmAdapter(BaseAdapter):
         unmanaged = self.base_adapter_config.unmanaged_tools or []
         return registry + unmanaged
 
+    async def _tool_dispatch_table(self) -> dict[str, ToolDispatchEntry]:
+        """Tool name to tool and argument validator, built once and reused for every tool call."""
+        if self._cached_tool_dispatch is None:
+            dispatch: dict[str, ToolDispatchEntry] = {}
+            for tool in await self._tools_for_execution():
+                name = await tool.name()
+                # first tool wins on a name clash, matching litellm_tools order
+                if name in dispatch:
+                    continue
+                dispatch[name] = ToolDispatchEntry(tool=tool)
+            self._cached_tool_dispatch = dispatch
+        return self._cached_tool_dispatch
+
     async def litellm_tools(self) -> list[ToolCallDefinition]:
         available_tools = await self.cached_available_tools()
 
@@ -851,15 +907,83 @@ class LiteLlmAdapter(BaseAdapter):
 
         return merged
 
+    async def prepare_tool_call(
+        self,
+        tool_call: ChatCompletionMessageToolCall,
+        dispatch: dict[str, ToolDispatchEntry],
+    ) -> Callable[[], Coroutine[Any, Any, ChatCompletionToolMessageParamWrapper]]:
+        """Validate a tool call against the available tools, returning a function which runs it.
+
+        Raises:
+            RuntimeError: If the tool isn't available, or the arguments aren't valid for it.
+        """
+        tool_name = tool_call.function.name
+        dispatch_entry = dispatch.get(tool_name) if tool_name else None
+        if not dispatch_entry:
+            raise RuntimeError(
+                f"A tool named '{tool_name}' was invoked by a model, but was not available."
+            )
+
+        # Parse the arguments and validate them against the tool's schema
+        try:
+            parsed_args = json.loads(tool_call.function.arguments)
+        except json.JSONDecodeError:
+            raise RuntimeError(
+                f"Failed to parse arguments for tool '{tool_name}' (should be JSON): {tool_call.function.arguments}"
+            )
+        tool = dispatch_entry.tool
+        try:
+            validator = await dispatch_entry.get_validator()
+            validate_with_value_error(parsed_args, validator)
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to validate arguments for tool '{tool_name}'. The arguments didn't match the tool's schema. The arguments were: {parsed_args}\n The error was: {e}"
+            ) from e
+
+        # Create context with the calling task's allow_saving setting
+        context = ToolCallContext(allow_saving=self.base_adapter_config.allow_saving)
+
+        async def run_tool_and_format():
+            result, cache_hit = await ToolResultCache.shared().call(
+                tool, parsed_args, lambda: tool.run(context, **parsed_args)
+            )
+            return ChatCompletionToolMessageParamWrapper(
+                role="tool",
+                tool_call_id=tool_call.id,
+                content=result.output,
+                kiln_task_tool_data=result.kiln_task_tool_data
+                if isinstance(result, KilnTaskToolResult)
+                else None,
+                is_error=result.is_error if result.is_error else None,
+                error_message=result.error_message if result.error_message else None,
+                cache_hit=True if cache_hit else None,
+            )
+
+        return run_tool_and_format
+
     async def process_tool_calls(
-        self, tool_calls: list[ChatCompletionMessageToolCall] | None
+        self,
+        tool_calls: list[ChatCompletionMessageToolCall] | None,
+        started_tool_calls: dict[str, StartedToolCall] | None = None,
+        on_tool_result: Callable[[ChatCompletionToolMessageParamWrapper], None]
+        | None = None,
     ) -> tuple[str | None, list[ChatCompletionToolMessageParamWrapper]]:
+        """Run the tool calls concurrently, returning the task_response output (if any) and the tool messages in call order.
+
+        Args:
+            tool_calls: The tool calls from the model's response.
+            started_tool_calls: Tool calls already started while the response streamed in, by
+                tool call ID. One is used in place of running the call again if its name and
+                arguments match the final tool call.
+            on_tool_result: Called with each tool message as soon as its tool finishes.
+        """
         if tool_calls is None:
             return None, []
 
         assistant_output_from_toolcall: str | None = None
         tool_call_response_messages: list[ChatCompletionToolMessageParamWrapper] = []
         tool_run_coroutines = []
+        dispatch = await self._tool_dispatch_table()
 
         for tool_call in tool_calls:
             # Kiln "task_response" tool is used for returning structured output via tool calls.
@@ -869,56 +993,18 @@ class LiteLlmAdapter(BaseAdapter):
                 continue
 
             # Process normal tool calls (not the "task_response" tool)
-            tool_name = tool_call.function.name
-            tool = None
-            for tool_option in await self._tools_for_execution():
-                if await tool_option.name() == tool_name:
-                    tool = tool_option
-                    break
-            if not tool:
-                raise RuntimeError(
-                    f"A tool named '{tool_name}' was invoked by a model, but was not available."
-                )
-
-            # Parse the arguments and validate them against the tool's schema
-            try:
-                parsed_args = json.loads(tool_call.function.arguments)
-            except json.JSONDecodeError:
-                raise RuntimeError(
-                    f"Failed to parse arguments for tool '{tool_name}' (should be JSON): {tool_call.function.arguments}"
-                )
-            try:
-                tool_call_definition = await tool.toolcall_definition()
-                json_schema = json.dumps(tool_call_definition["function"]["parameters"])
-                validate_schema_with_value_error(parsed_args, json_schema)
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed to validate arguments for tool '{tool_name}'. The arguments didn't match the tool's schema. The arguments were: {parsed_args}\n The error was: {e}"
-                ) from e
-
-            # Create context with the calling task's allow_saving setting
-            context = ToolCallContext(
-                allow_saving=self.base_adapter_config.allow_saving
-            )
-
-            async def run_tool_and_format(
-                t=tool, c=context, args=parsed_args, tc_id=tool_call.id
-            ):
-                result = await t.run(c, **args)
-                return ChatCompletionToolMessageParamWrapper(
-                    role="tool",
-                    tool_call_id=tc_id,
-                    content=result.output,
-                    kiln_task_tool_data=result.kiln_task_tool_data
-                    if isinstance(result, KilnTaskToolResult)
-                    else None,
-                    is_error=result.is_error if result.is_error else None,
-                    error_message=result.error_message
-                    if result.error_message
-                    else None,
-                )
-
-            tool_run_coroutines.append(run_tool_and_format())
+            run_tool = await self.prepare_tool_call(tool_call, dispatch)
+            started = (started_tool_calls or {}).get(tool_call.id)
+            if started is not None and started.matches(tool_call):
+                run_tool = started.result
+
+            async def run_and_report(run=run_tool):
+                message = await run()
+                if on_tool_result is not None:
+                    on_tool_result(message)
+                return message
+
+            tool_run_coroutines.append(run_and_report())
 
         if tool_run_coroutines:
             tool_call_response_messages = await asyncio.gather(*tool_run_coroutines)
@@ -0,0 +1,87 @@
+import copy
+from typing import Any
+
+from pydantic import BaseModel
+
+from kiln_ai.adapters.chat import ChatCompletionMessageIncludingLiteLLM
+from kiln_ai.utils.open_ai_types import sanitize_message_for_provider
+
+
+class ProviderMessageLog:
+    """
+    Provider-ready view of an append-only conversation.
+
+    Wraps the caller-owned messages list (the trace, which the adapters append to in
+    place) and keeps a parallel list of sanitized, deep-copied snapshots of each
+    message. Snapshots are taken once, when a message is first seen, so a tool loop
+    only converts the messages appended since the previous model call rather than
+    copying the whole conversation every iteration.
+
+    The snapshots are never handed to the provider directly: each call gets fresh
+    copies of every dict, list and model a snapshot is built from, as acompletion and
+    provider transforms mutate the messages they're given (including nested tool_calls,
+    content parts and function dicts). The strings those hold are shared, which is where
+    the weight of a long conversation is. The original messages are never passed to the
+    provider, so their types are safe.
+    """
+
+    def __init__(self, messages: list[ChatCompletionMessageIncludingLiteLLM]):
+        self._messages = messages
+        # Source message for each snapshot, used to detect a rewritten history
+        self._sources: list[ChatCompletionMessageIncludingLiteLLM] = []
+        self._snapshots: list[Any] = []
+
+    @property
+    def messages(self) -> list[ChatCompletionMessageIncludingLiteLLM]:
+        return self._messages
+
+    def provider_messages(self) -> list[Any]:
+        """
+        The conversation to send to the provider, without kiln-only fields. Returns a
+        new list with fresh copies of each message's containers on every call.
+        """
+        self._sync()
+        return [_copy_containers(snapshot) for snapshot in self._snapshots]
+
+    def _sync(self) -> None:
+        known = len(self._snapshots)
+        # An identity check per message is far cheaper than the copies it saves
+        if known > len(self._messages) or any(
+            message is not source
+            for message, source in zip(self._messages, self._sources)
+        ):
+            # The list was edited rather than appended to, start over
+            self._sources.clear()
+            self._snapshots.clear()
+            known = 0
+
+        for message in self._messages[known:]:
+            self._sources.append(message)
+            self._snapshots.append(
+                copy.deepcopy(sanitize_message_for_provider(message))
+            )
+
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def _copy_containers(value: Any) -> Any:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]
+    if isinstance(value, BaseModel):
+        # Copy field values without going through model_copy(update=...), which would
+        # mark every field as explicitly set and change what exclude_unset dumps
+        copied = value.model_copy()
+        for key, item in value.__dict__.items():
+            copied.__dict__[key] = _copy_containers(item)
+        # model_copy gives the copy its own extra dict, but shares the values in it
+        extra = copied.__pydantic_extra__
+        if extra:
+            for key, item in extra.items():
+                extra[key] = _copy_containers(item)
+        return copied
+    return copy.deepcopy(value)
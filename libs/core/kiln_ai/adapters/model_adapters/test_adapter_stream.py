@@ -1,9 +1,12 @@
+import asyncio
 import json
+from functools import partial
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from litellm.types.utils import (
+    ChatCompletionDeltaToolCall,
     ChatCompletionMessageToolCall,
     Choices,
     Delta,
@@ -19,11 +22,16 @@ from kiln_ai.adapters.model_adapters.adapter_stream import (
     AdapterStream,
     raise_for_empty_model_response,
 )
+from kiln_ai.adapters.model_adapters.litellm_adapter import (
+    LiteLlmAdapter,
+    ToolDispatchEntry,
+)
 from kiln_ai.adapters.model_adapters.stream_events import (
     ToolCallEvent,
     ToolCallEventType,
 )
 from kiln_ai.datamodel import MessageUsage, Usage
+from kiln_ai.tools.base_tool import ToolCallResult
 
 
 def _make_streaming_chunk(
@@ -498,6 +506,335 @@ class TestAdapterStreamReturnOnToolCall:
         assert result.run_output.output == "Hello world"
 
 
+def _make_tool_call_chunks(
+    index: int, call_id: str, name: str, arguments: str
+) -> list[ModelResponseStream]:
+    """Stream a tool call the way providers do: ID and name first, then the arguments in pieces."""
+    pieces = [arguments[i : i + 5] for i in range(0, len(arguments), 5)]
+    deltas = [
+        ChatCompletionDeltaToolCall(
+            index=index, id=call_id, function=Function(name=name, arguments="")
+        )
+    ] + [
+        ChatCompletionDeltaToolCall(index=index, function=Function(arguments=piece))
+        for piece in pieces
+    ]
+    return [
+        ModelResponseStream(
+            id="test-stream",
+            choices=[StreamingChoices(index=0, delta=Delta(tool_calls=[delta]))],
+        )
+        for delta in deltas
+    ]
+
+
+class RecordingTool:
+    """A tool which records its runs, and can wait before it finishes."""
+
+    def __init__(self, output: str, wait_for: asyncio.Event | None = None):
+        self.output = output
+        self.wait_for = wait_for
+        self.started = asyncio.Event()
+        self.finished = asyncio.Event()
+        self.cancelled = False
+        self.runs = 0
+
+    async def run(self, context, **kwargs) -> ToolCallResult:
+        self.runs += 1
+        self.started.set()
+        try:
+            if self.wait_for is not None:
+                await self.wait_for.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        self.finished.set()
+        return ToolCallResult(output=self.output)
+
+
+class ToolCallStream(FakeStreamingCompletion):
+    """Streams tool calls, recording which tools had started before the stream ended."""
+
+    def __init__(
+        self,
+        tool_calls: list[ChatCompletionMessageToolCall],
+        tools: dict[str, RecordingTool],
+    ):
+        chunks = []
+        for index, tool_call in enumerate(tool_calls):
+            chunks += _make_tool_call_chunks(
+                index,
+                tool_call.id,
+                tool_call.function.name or "",
+                tool_call.function.arguments,
+            )
+        super().__init__(
+            _make_model_response(content=None, tool_calls=tool_calls), chunks
+        )
+        self.tools = tools
+        self.started_before_end: set[str] = set()
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+            # give started tools a chance to run, as slow network reads would
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.started_before_end = {
+            name for name, tool in self.tools.items() if tool.started.is_set()
+        }
+        yield _make_streaming_chunk(finish_reason="tool_calls")
+
+
+@pytest.fixture
+def tool_adapter(mock_adapter):
+    """A mock adapter which runs tool calls with the real LiteLlmAdapter logic."""
+    mock_adapter.base_adapter_config.allow_saving = False
+    mock_adapter.prepare_tool_call = partial(
+        LiteLlmAdapter.prepare_tool_call, mock_adapter
+    )
+    mock_adapter.process_tool_calls = partial(
+        LiteLlmAdapter.process_tool_calls, mock_adapter
+    )
+    return mock_adapter
+
+
+OBJECT_SCHEMA = json.dumps({"type": "object", "properties": {}})
+
+
+def _set_tools(adapter, tools: dict[str, RecordingTool]) -> None:
+    adapter._tool_dispatch_table = AsyncMock(
+        return_value={
+            name: ToolDispatchEntry(tool=tool, parameters_schema=OBJECT_SCHEMA)  # type: ignore[arg-type]
+            for name, tool in tools.items()
+        }
+    )
+
+
+class TestAdapterStreamSpeculativeToolCalls:
+    async def _run(self, adapter, provider, first_stream, final_text="done"):
+        final_stream = FakeStreamingCompletion(
+            _make_model_response(content=final_text),
+            [_make_streaming_chunk(content=final_text)],
+        )
+        streams_iter = iter([first_stream, final_stream])
+        with patch(
+            "kiln_ai.adapters.model_adapters.adapter_stream.StreamingCompletion",
+            side_effect=lambda **kw: next(streams_iter),
+        ):
+            stream = AdapterStream(
+                adapter=adapter,
+                provider=provider,
+                chat_formatter=FakeChatFormatter(),
+                initial_messages=[],
+                top_logprobs=None,
+            )
+            events = [event async for event in stream]
+        return stream, events
+
+    @pytest.mark.asyncio
+    async def test_tools_start_before_the_response_ends(
+        self, tool_adapter, mock_provider
+    ):
+        tools = {"search": RecordingTool("found"), "lookup": RecordingTool("value")}
+        _set_tools(tool_adapter, tools)
+        tool_calls = [
+            _make_tool_call("call_1", "search", {"query": "kiln"}),
+            _make_tool_call("call_2", "lookup", {"key": "a"}),
+        ]
+        first_stream = ToolCallStream(tool_calls, tools)
+
+        stream, events = await self._run(tool_adapter, mock_provider, first_stream)
+
+        assert first_stream.started_before_end == {"search", "lookup"}
+        # the started runs are used, not run again
+        assert tools["search"].runs == 1
+        assert tools["lookup"].runs == 1
+        outputs = {
+            e.tool_call_id: e.result
+            for e in events
+            if isinstance(e, ToolCallEvent)
+            and e.event_type == ToolCallEventType.OUTPUT_AVAILABLE
+        }
+        assert outputs == {"call_1": "found", "call_2": "value"}
+        assert stream.result.run_output.output == "done"
+
+    @pytest.mark.asyncio
+    async def test_outputs_are_reported_as_tools_finish(
+        self, tool_adapter, mock_provider
+    ):
+        # the first tool can't finish until the second one's output has been reported
+        release = asyncio.Event()
+        slow = RecordingTool("slow", wait_for=release)
+        fast = RecordingTool("fast")
+        tools = {"slow": slow, "fast": fast}
+        _set_tools(tool_adapter, tools)
+        tool_calls = [
+            _make_tool_call("call_slow", "slow", {"x": 1}),
+            _make_tool_call("call_fast", "fast", {"x": 2}),
+        ]
+        final_stream = FakeStreamingCompletion(
+            _make_model_response(content="done"),
+            [_make_streaming_chunk(content="done")],
+        )
+        streams_iter = iter([ToolCallStream(tool_calls, tools), final_stream])
+
+        output_ids = []
+        with patch(
+            "kiln_ai.adapters.model_adapters.adapter_stream.StreamingCompletion",
+            side_effect=lambda **kw: next(streams_iter),
+        ):
+            stream = AdapterStream(
+                adapter=tool_adapter,
+                provider=mock_provider,
+                chat_formatter=FakeChatFormatter(),
+                initial_messages=[],
+                top_logprobs=None,
+            )
+            async for event in stream:
+                if (
+                    isinstance(event, ToolCallEvent)
+                    and event.event_type == ToolCallEventType.OUTPUT_AVAILABLE
+                ):
+                    output_ids.append(event.tool_call_id)
+                    release.set()
+
+        assert output_ids == ["call_fast", "call_slow"]
+
+    @pytest.mark.asyncio
+    async def test_tool_messages_keep_call_order(self, tool_adapter, mock_provider):
+        fast = RecordingTool("fast")
+        slow = RecordingTool("slow", wait_for=fast.finished)
+        tools = {"slow": slow, "fast": fast}
+        _set_tools(tool_adapter, tools)
+        tool_calls = [
+            _make_tool_call("call_slow", "slow", {"x": 1}),
+            _make_tool_call("call_fast", "fast", {"x": 2}),
+        ]
+        messages: list = []
+        final_stream = FakeStreamingCompletion(
+            _make_model_response(content="done"),
+            [_make_streaming_chunk(content="done")],
+        )
+        streams_iter = iter([ToolCallStream(tool_calls, tools), final_stream])
+        with patch(
+            "kiln_ai.adapters.model_adapters.adapter_stream.StreamingCompletion",
+            side_effect=lambda **kw: next(streams_iter),
+        ):
+            stream = AdapterStream(
+                adapter=tool_adapter,
+                provider=mock_provider,
+                chat_formatter=FakeChatFormatter(),
+                initial_messages=messages,
+                top_logprobs=None,
+            )
+            [event async for event in stream]
+
+        tool_messages = [
+            m for m in messages if isinstance(m, dict) and m["role"] == "tool"
+        ]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_slow", "call_fast"]
+
+    @pytest.mark.asyncio
+    async def test_aborted_stream_cancels_started_tools(
+        self, tool_adapter, mock_provider
+    ):
+        never = asyncio.Event()
+        tool = RecordingTool("never", wait_for=never)
+        _set_tools(tool_adapter, {"wait": tool})
+        first_stream = ToolCallStream(
+            [_make_tool_call("call_1", "wait", {"x": 1})], {"wait": tool}
+        )
+
+        with patch(
+            "kiln_ai.adapters.model_adapters.adapter_stream.StreamingCompletion",
+            return_value=first_stream,
+        ):
+            stream = AdapterStream(
+                adapter=tool_adapter,
+                provider=mock_provider,
+                chat_formatter=FakeChatFormatter(),
+                initial_messages=[],
+                top_logprobs=None,
+            )
+            iterator = stream.__aiter__()
+            async for _ in iterator:
+                if tool.started.is_set():
+                    break
+            await iterator.aclose()
+
+        await asyncio.sleep(0)
+        assert tool.cancelled
+
+    @pytest.mark.asyncio
+    async def test_aborted_tool_round_cancels_running_tools(
+        self, tool_adapter, mock_provider
+    ):
+        never = asyncio.Event()
+        waiting = RecordingTool("never", wait_for=never)
+        quick = RecordingTool("quick")
+        tools = {"wait": waiting, "quick": quick}
+        _set_tools(tool_adapter, tools)
+        first_stream = ToolCallStream(
+            [
+                _make_tool_call("call_1", "wait", {"x": 1}),
+                _make_tool_call("call_2", "quick", {"x": 2}),
+            ],
+            tools,
+        )
+
+        with patch(
+            "kiln_ai.adapters.model_adapters.adapter_stream.StreamingCompletion",
+            return_value=first_stream,
+        ):
+            stream = AdapterStream(
+                adapter=tool_adapter,
+                provider=mock_provider,
+                chat_formatter=FakeChatFormatter(),
+                initial_messages=[],
+                top_logprobs=None,
+            )
+            iterator = stream.__aiter__()
+            async for event in iterator:
+                # the quick tool's output arrives while the other is still running
+                if (
+                    isinstance(event, ToolCallEvent)
+                    and event.event_type == ToolCallEventType.OUTPUT_AVAILABLE
+                ):
+                    assert event.tool_call_id == "call_2"
+                    break
+            await iterator.aclose()
+
+        await asyncio.sleep(0)
+        assert waiting.cancelled
+
+    @pytest.mark.asyncio
+    async def test_invalid_tool_call_is_not_started(self, tool_adapter, mock_provider):
+        tool = RecordingTool("ok")
+        _set_tools(tool_adapter, {"known": tool})
+        first_stream = ToolCallStream(
+            [_make_tool_call("call_1", "unknown", {"x": 1})], {"known": tool}
+        )
+
+        with pytest.raises(RuntimeError, match="was not available"):
+            await self._run(tool_adapter, mock_provider, first_stream)
+        assert tool.runs == 0
+
+    @pytest.mark.asyncio
+    async def test_no_speculation_when_returning_tool_calls(
+        self, tool_adapter, mock_provider
+    ):
+        tool_adapter.base_adapter_config.return_on_tool_call = True
+        tool = RecordingTool("ok")
+        _set_tools(tool_adapter, {"tool": tool})
+        first_stream = ToolCallStream(
+            [_make_tool_call("call_1", "tool", {"x": 1})], {"tool": tool}
+        )
+
+        await self._run(tool_adapter, mock_provider, first_stream)
+        assert tool.runs == 0
+
+
 class TestAdapterStreamEdgeCases:
     @pytest.mark.asyncio
     async def test_too_many_turns_raises(self, mock_adapter, mock_provider):
@@ -2032,3 +2032,17 @@ def test_build_chat_formatter_forward_thinking_instructions(
         assert formatter.forward_thinking_instructions is True
     else:
         assert formatter.__class__.__name__ == "TwoMessageCotFormatter"
+
+
+async def test_prepare_prompt_for_input_only_for_new_runs(adapter):
+    prompt_builder = MagicMock()
+    prompt_builder.prepare_for_input = AsyncMock()
+    adapter.prompt_builder = prompt_builder
+
+    await adapter._prepare_prompt_for_input({"a": 1}, None)
+    prompt_builder.prepare_for_input.assert_awaited_once_with({"a": 1})
+
+    # continuations reuse the prior trace's system prompt
+    prompt_builder.prepare_for_input.reset_mock()
+    await adapter._prepare_prompt_for_input("next", [{"role": "user", "content": "hi"}])
+    prompt_builder.prepare_for_input.assert_not_awaited()
@@ -11,6 +11,7 @@ from litellm.types.utils import (
     ModelResponse,
 )
 
+from kiln_ai.adapters.litellm_utils.response_cache import RESPONSE_CACHE_HIT_KEY
 from kiln_ai.adapters.ml_model_list import (
     KilnModelProvider,
     ModelName,
@@ -40,6 +41,7 @@ from kiln_ai.tools.built_in_tools.math_tools import (
     MultiplyTool,
     SubtractTool,
 )
+from kiln_ai.utils.http_client_pool import HttpClientPool
 
 
 @pytest.fixture
@@ -804,6 +806,26 @@ async def test_build_completion_kwargs_custom_temperature_top_p(config, mock_tas
     assert kwargs["drop_params"] is True
 
 
+async def test_build_completion_kwargs_uses_pooled_session(config, mock_task):
+    adapter = LiteLlmAdapter(config=config, kiln_task=mock_task)
+    provider = KilnModelProvider(name=ModelProviderName.openai, model_id="gpt-4o")
+    messages = [{"role": "user", "content": "Hello"}]
+
+    with (
+        patch.object(adapter, "litellm_model_id", return_value="openai/gpt-4o"),
+        patch.object(adapter, "build_extra_body", return_value={}),
+        patch.object(adapter, "response_format_options", return_value={}),
+    ):
+        first = await adapter.build_completion_kwargs(provider, messages, None)
+        second = await adapter.build_completion_kwargs(provider, messages, None)
+
+    # every call to the provider shares one pooled session
+    assert first["shared_session"] is second["shared_session"]
+    assert first["shared_session"] is HttpClientPool.shared().litellm_session(
+        config.base_url, ModelProviderName.openai
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "top_logprobs,response_format,extra_body",
@@ -1017,6 +1039,31 @@ def test_usage_from_response(config, mock_task, litellm_usage, cost, expected_us
     response.get.assert_called_once_with("usage", None)
 
 
+def test_usage_from_response_marks_response_cache_hits(config, mock_task):
+    adapter = LiteLlmAdapter(config=config, kiln_task=mock_task)
+    response = ModelResponse(
+        model="gpt-4o",
+        choices=[{"message": {"content": "hi"}}],
+        usage=litellm.types.utils.Usage(
+            prompt_tokens=10, completion_tokens=5, total_tokens=15
+        ),
+    )
+
+    response._hidden_params = {"response_cost": 0.01}
+    result = adapter.usage_from_response(response)
+    assert result.response_cache_hits is None
+    assert result.cost == 0.01
+
+    response._hidden_params = {
+        "response_cost": 0.0,
+        RESPONSE_CACHE_HIT_KEY: True,
+    }
+    result = adapter.usage_from_response(response)
+    assert result.response_cache_hits == 1
+    assert result.input_tokens == 10
+    assert result.cost == 0.0
+
+
 def test_usage_from_response_prompt_details_without_cached_tokens(config, mock_task):
     """Test that a warning is logged when prompt_tokens_details lacks cached_tokens attribute"""
     adapter = LiteLlmAdapter(config=config, kiln_task=mock_task)
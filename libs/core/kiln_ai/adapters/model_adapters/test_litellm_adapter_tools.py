@@ -20,6 +20,7 @@ from kiln_ai.datamodel import PromptId
 from kiln_ai.datamodel.datamodel_enums import ModelProviderName, StructuredOutputMode
 from kiln_ai.datamodel.run_config import KilnAgentRunConfigProperties
 from kiln_ai.datamodel.tool_id import ToolId
+from kiln_ai.run_context import clear_agent_run_id, set_agent_run_id
 from kiln_ai.tools.base_tool import ToolCallContext, ToolCallResult, UnmanagedKilnTool
 from kiln_ai.tools.built_in_tools.math_tools import (
     AddTool,
@@ -972,9 +973,112 @@ async def test_process_tool_calls_normal_tool_success(tmp_path):
         "kiln_task_tool_data": None,
         "is_error": None,
         "error_message": None,
+        "cache_hit": None,
     }
 
 
+async def test_process_tool_calls_builds_dispatch_table_once(tmp_path):
+    """Tool lookup and argument schemas are resolved once, not on every tool call"""
+    task = build_test_task(tmp_path)
+    config = LiteLlmConfig(
+        run_config_properties=KilnAgentRunConfigProperties(
+            structured_output_mode=StructuredOutputMode.json_schema,
+            model_name="gpt_4_1_mini",
+            model_provider_name=ModelProviderName.openai,
+            prompt_id="simple_prompt_builder",
+        )
+    )
+    litellm_adapter = LiteLlmAdapter(config=config, kiln_task=task)
+
+    add_tool = MockTool("add", return_value="5")
+    multiply_tool = MockTool("multiply", return_value="6")
+    add_spy = Mock(wraps=add_tool)
+    multiply_spy = Mock(wraps=multiply_tool)
+    add_spy.name = AsyncMock(side_effect=add_tool.name)
+    multiply_spy.name = AsyncMock(side_effect=multiply_tool.name)
+    add_spy.toolcall_definition = AsyncMock(side_effect=add_tool.toolcall_definition)
+    multiply_spy.toolcall_definition = AsyncMock(
+        side_effect=multiply_tool.toolcall_definition
+    )
+
+    with patch.object(
+        litellm_adapter, "cached_available_tools", return_value=[add_spy, multiply_spy]
+    ):
+        for i in range(3):
+            _, tool_messages = await litellm_adapter.process_tool_calls(
+                [
+                    MockToolCall(f"call_add_{i}", "multiply", '{"a": 2, "b": 3}'),
+                    MockToolCall(f"call_mul_{i}", "add", '{"a": 2, "b": 3}'),
+                ]  # type: ignore
+            )
+            assert [m["content"] for m in tool_messages] == ["6", "5"]
+
+    add_spy.name.assert_awaited_once()
+    multiply_spy.name.assert_awaited_once()
+    add_spy.toolcall_definition.assert_awaited_once()
+    multiply_spy.toolcall_definition.assert_awaited_once()
+
+
+async def test_process_tool_calls_broken_definition_only_fails_its_own_tool(tmp_path):
+    """A tool whose definition can't be loaded doesn't break calls to other tools"""
+    task = build_test_task(tmp_path)
+    config = LiteLlmConfig(
+        run_config_properties=KilnAgentRunConfigProperties(
+            structured_output_mode=StructuredOutputMode.json_schema,
+            model_name="gpt_4_1_mini",
+            model_provider_name=ModelProviderName.openai,
+            prompt_id="simple_prompt_builder",
+        )
+    )
+    litellm_adapter = LiteLlmAdapter(config=config, kiln_task=task)
+
+    add_tool = MockTool("add", return_value="5")
+    broken_tool = MockTool("broken")
+    broken_tool.toolcall_definition = AsyncMock(  # type: ignore[method-assign]
+        side_effect=RuntimeError("MCP server unavailable")
+    )
+
+    with patch.object(
+        litellm_adapter, "cached_available_tools", return_value=[add_tool, broken_tool]
+    ):
+        _, tool_messages = await litellm_adapter.process_tool_calls(
+            [MockToolCall("call_1", "add", '{"a": 2, "b": 3}')]  # type: ignore
+        )
+        assert tool_messages[0]["content"] == "5"
+        broken_tool.toolcall_definition.assert_not_awaited()
+
+        with pytest.raises(RuntimeError, match="MCP server unavailable"):
+            await litellm_adapter.process_tool_calls(
+                [MockToolCall("call_2", "broken", '{"a": 2, "b": 3}')]  # type: ignore
+            )
+
+
+async def test_process_tool_calls_duplicate_names_uses_first_tool(tmp_path):
+    """With two tools sharing a name, the first one listed is dispatched"""
+    task = build_test_task(tmp_path)
+    config = LiteLlmConfig(
+        run_config_properties=KilnAgentRunConfigProperties(
+            structured_output_mode=StructuredOutputMode.json_schema,
+            model_name="gpt_4_1_mini",
+            model_provider_name=ModelProviderName.openai,
+            prompt_id="simple_prompt_builder",
+        )
+    )
+    litellm_adapter = LiteLlmAdapter(config=config, kiln_task=task)
+
+    first = MockTool("add", return_value="first")
+    second = MockTool("add", return_value="second")
+
+    with patch.object(
+        litellm_adapter, "cached_available_tools", return_value=[first, second]
+    ):
+        _, tool_messages = await litellm_adapter.process_tool_calls(
+            [MockToolCall("call_1", "add", '{"a": 2, "b": 3}')]  # type: ignore
+        )
+
+    assert tool_messages[0]["content"] == "first"
+
+
 class _RunnableUnmanagedKilnToolForTest(UnmanagedKilnTool):
     async def run(
         self, context: ToolCallContext | None = None, **kwargs
@@ -1352,3 +1456,46 @@ async def test_process_tool_calls_kiln_task_tool_result(tmp_path):
         tool_messages[0].get("kiln_task_tool_data")
         == "proj123:::tool456:::task789:::run101"
     )
+
+
+async def test_process_tool_calls_reuses_cacheable_tool_results(tmp_path):
+    """Repeated calls of a cacheable tool in a run are served from the tool result cache"""
+    task = build_test_task(tmp_path)
+    config = LiteLlmConfig(
+        run_config_properties=KilnAgentRunConfigProperties(
+            structured_output_mode=StructuredOutputMode.json_schema,
+            model_name="gpt_4_1_mini",
+            model_provider_name=ModelProviderName.openai,
+            prompt_id="simple_prompt_builder",
+        )
+    )
+    litellm_adapter = LiteLlmAdapter(config=config, kiln_task=task)
+    add_tool = AddTool()
+
+    set_agent_run_id("run_cache_test")
+    try:
+        with (
+            patch.object(
+                litellm_adapter, "cached_available_tools", return_value=[add_tool]
+            ),
+            patch.object(AddTool, "run", autospec=True, side_effect=AddTool.run) as run,
+        ):
+            _, first = await litellm_adapter.process_tool_calls(
+                [MockToolCall("call_1", "add", '{"a": 2, "b": 3}')]  # type: ignore
+            )
+            _, second = await litellm_adapter.process_tool_calls(
+                [
+                    MockToolCall("call_2", "add", '{"b": 3, "a": 2}'),
+                    MockToolCall("call_3", "add", '{"a": 1, "b": 1}'),
+                ]  # type: ignore
+            )
+    finally:
+        clear_agent_run_id()
+
+    assert run.call_count == 2
+    assert first[0]["content"] == "5"
+    assert first[0].get("cache_hit") is None
+    assert second[0]["content"] == "5"
+    assert second[0].get("cache_hit") is True
+    assert second[1]["content"] == "2"
+    assert second[1].get("cache_hit") is None
@@ -0,0 +1,276 @@
+import asyncio
+import copy
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from litellm.types.utils import Message as LiteLLMMessage
+from litellm.types.utils import ModelResponse
+
+from kiln_ai import datamodel
+from kiln_ai.adapters.ml_model_list import KilnModelProvider
+from kiln_ai.adapters.model_adapters.litellm_adapter import LiteLlmAdapter
+from kiln_ai.adapters.model_adapters.litellm_config import LiteLlmConfig
+from kiln_ai.adapters.model_adapters.provider_message_log import ProviderMessageLog
+from kiln_ai.datamodel.datamodel_enums import ModelProviderName, StructuredOutputMode
+from kiln_ai.datamodel.run_config import KilnAgentRunConfigProperties
+from kiln_ai.tools.built_in_tools.math_tools import AddTool
+
+
+def test_provider_messages_strips_kiln_only_fields():
+    messages = [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello", "latency_ms": 12},
+        {
+            "role": "tool",
+            "content": "{}",
+            "tool_call_id": "c1",
+            "is_error": True,
+            "error_message": "boom",
+        },
+    ]
+    original = copy.deepcopy(messages)
+
+    log = ProviderMessageLog(messages)
+
+    assert log.provider_messages() == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+        {"role": "tool", "content": "{}", "tool_call_id": "c1"},
+    ]
+    assert messages == original
+    assert log.messages is messages
+
+
+def test_provider_messages_only_snapshots_new_messages():
+    messages = [{"role": "user", "content": "hi"}]
+    log = ProviderMessageLog(messages)
+    log.provider_messages()
+
+    messages.append({"role": "assistant", "content": "hello"})
+    with patch(
+        "kiln_ai.adapters.model_adapters.provider_message_log.copy.deepcopy",
+        side_effect=copy.deepcopy,
+    ) as mock_deepcopy:
+        provider_messages = log.provider_messages()
+
+    mock_deepcopy.assert_called_once_with({"role": "assistant", "content": "hello"})
+    assert provider_messages == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+    ]
+
+
+def test_provider_messages_are_isolated_from_source_and_each_call():
+    messages = [{"role": "user", "content": [{"type": "text", "text": "hi"}]}]
+    log = ProviderMessageLog(messages)
+
+    first = log.provider_messages()
+    # a provider transform rewriting a message must not leak into the next call
+    first[0]["content"] = "rewritten"
+    first.append({"role": "user", "content": "extra"})
+    second = log.provider_messages()
+    assert second == [{"role": "user", "content": [{"type": "text", "text": "hi"}]}]
+    assert second is not first
+
+    # nor should later edits to the snapshots reach the trace
+    second[0]["content"][0]["text"] = "changed"
+    assert messages[0]["content"][0]["text"] == "hi"
+
+
+def test_provider_messages_isolates_nested_fields_between_calls():
+    messages = [
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": "c1",
+                    "type": "function",
+                    "function": {"name": "add", "arguments": '{"a": 1}'},
+                }
+            ],
+        },
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "hi", "cache_control": {"x": 1}}],
+        },
+    ]
+    original = copy.deepcopy(messages)
+    log = ProviderMessageLog(messages)
+
+    # litellm's provider transforms rewrite nested parts of the messages in place
+    first = log.provider_messages()
+    first[0]["tool_calls"][0]["function"]["arguments"] = "{}"
+    first[0]["tool_calls"].append({"id": "c2"})
+    first[1]["content"][0].pop("cache_control")
+
+    assert log.provider_messages() == original
+    assert messages == original
+
+
+def test_provider_messages_isolates_nested_litellm_fields_between_calls():
+    message = LiteLLMMessage(
+        role="assistant",
+        content=None,
+        tool_calls=[
+            {
+                "id": "c1",
+                "type": "function",
+                "function": {"name": "add", "arguments": '{"a": 1}'},
+            }
+        ],
+    )
+    log = ProviderMessageLog([message])
+
+    first = log.provider_messages()[0]
+    first.tool_calls[0].function.arguments = "{}"
+
+    assert log.provider_messages()[0].tool_calls[0].function.arguments == '{"a": 1}'
+    assert message.tool_calls[0].function.arguments == '{"a": 1}'
+    # the copy serializes like the original
+    assert (
+        first.model_dump(exclude_unset=True).keys()
+        == message.model_dump(exclude_unset=True).keys()
+    )
+
+
+def test_provider_messages_copies_litellm_messages():
+    message = LiteLLMMessage(role="assistant", content="hello")
+    log = ProviderMessageLog([message])
+
+    provider_messages = log.provider_messages()
+
+    assert isinstance(provider_messages[0], LiteLLMMessage)
+    assert provider_messages[0] is not message
+    assert provider_messages[0].content == "hello"
+    provider_messages[0].content = "changed"
+    assert message.content == "hello"
+    assert log.provider_messages()[0].content == "hello"
+
+
+def test_provider_messages_rebuilds_after_history_is_rewritten():
+    messages = [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+    ]
+    log = ProviderMessageLog(messages)
+    log.provider_messages()
+
+    messages[-1] = {"role": "assistant", "content": "replaced"}
+    assert log.provider_messages()[-1] == {"role": "assistant", "content": "replaced"}
+
+    del messages[1:]
+    assert log.provider_messages() == [{"role": "user", "content": "hi"}]
+
+    # an edit anywhere in the history is picked up, not just at the end
+    messages.append({"role": "assistant", "content": "hello"})
+    log.provider_messages()
+    messages[0] = {"role": "user", "content": "edited"}
+    assert log.provider_messages()[0] == {"role": "user", "content": "edited"}
+
+
+def tool_loop_adapter(tmp_path: Path) -> LiteLlmAdapter:
+    project = datamodel.Project(name="test", path=tmp_path / "test.kiln")
+    project.save_to_file()
+    task = datamodel.Task(
+        parent=project,
+        name="test task",
+        instruction="Add numbers with the add tool.",
+    )
+    task.save_to_file()
+    config = LiteLlmConfig(
+        run_config_properties=KilnAgentRunConfigProperties(
+            structured_output_mode=StructuredOutputMode.json_schema,
+            model_name="gpt_4_1_mini",
+            model_provider_name=ModelProviderName.openai,
+            prompt_id="simple_prompt_builder",
+        )
+    )
+    return LiteLlmAdapter(config=config, kiln_task=task)
+
+
+def add_tool_call_response(index: int) -> ModelResponse:
+    return ModelResponse(
+        model="gpt-4o-mini",
+        choices=[
+            {
+                "message": {
+                    # a long reasoning message, so the history has some weight to it
+                    "content": f"Step {index}. " + "Thinking about the sum. " * 200,
+                    "tool_calls": [
+                        {
+                            "id": f"tool_call_{index}",
+                            "type": "function",
+                            "function": {
+                                "name": "add",
+                                "arguments": f'{{"a": {index}, "b": 1}}',
+                            },
+                        }
+                    ],
+                }
+            }
+        ],
+    )
+
+
+async def run_tool_loop(tmp_path: Path, iterations: int) -> tuple[list, list[int]]:
+    adapter = tool_loop_adapter(tmp_path)
+    responses = [add_tool_call_response(i) for i in range(iterations)]
+    responses.append(
+        ModelResponse(
+            model="gpt-4o-mini",
+            choices=[{"message": {"content": "Done", "tool_calls": None}}],
+        )
+    )
+    sent_message_counts: list[int] = []
+
+    async def mock_acompletion(**kwargs):
+        sent_message_counts.append(len(kwargs["messages"]))
+        return responses[len(sent_message_counts) - 1]
+
+    provider = KilnModelProvider(name=ModelProviderName.openai, model_id="gpt-4.1-mini")
+    messages = [{"role": "user", "content": "Add up the numbers. " * 500}]
+    with (
+        patch.object(adapter, "cached_available_tools", return_value=[AddTool()]),
+        patch.object(adapter, "litellm_model_id", return_value="openai/gpt-4.1-mini"),
+        patch.object(adapter, "build_extra_body", return_value={}),
+        patch("litellm.acompletion", side_effect=mock_acompletion),
+    ):
+        result = await adapter._run_model_turn(provider, messages, None, False)
+
+    assert result.assistant_message == "Done"
+    return result.all_messages, sent_message_counts
+
+
+async def test_run_model_turn_tool_loop_sends_growing_history(tmp_path):
+    all_messages, sent_message_counts = await run_tool_loop(tmp_path, 3)
+
+    # user, then an assistant + tool message pair per iteration
+    assert sent_message_counts == [1, 3, 5, 7]
+    assert len(all_messages) == 8
+    # the trace keeps the LiteLLM message objects the adapter was given
+    assert isinstance(all_messages[1], LiteLLMMessage)
+
+
+@pytest.mark.benchmark
+def test_benchmark_tool_loop_message_history(benchmark, tmp_path):
+    iterations = 50
+
+    def run():
+        _, sent_message_counts = asyncio.run(
+            run_tool_loop(tmp_path / str(uuid.uuid4()), iterations)
+        )
+        assert len(sent_message_counts) == iterations + 1
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    mean = benchmark.stats.stats.mean
+
+    # The model calls are mocked, so this is mostly message handling. A deep copy of
+    # the full history per call made it grow quadratically. Loose bound for CI and
+    # parallel testing.
+    if mean > 2.0:
+        pytest.fail(
+            f"{iterations} iteration tool loop averaged {mean:.2f}s, expected under 2s"
+        )
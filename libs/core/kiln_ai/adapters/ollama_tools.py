@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 from kiln_ai.adapters.ml_embedding_model_list import built_in_embedding_models
 from kiln_ai.adapters.ml_model_list import ModelProviderName, built_in_models
 from kiln_ai.utils.config import Config
+from kiln_ai.utils.http_client_pool import HttpClientPool
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,8 @@ async def ollama_online() -> bool:
         True if Ollama is available and responding, False otherwise
     """
     try:
-        httpx.get(ollama_base_url() + "/api/tags")
+        url = ollama_base_url() + "/api/tags"
+        await HttpClientPool.shared().client(url).get(url)
     except httpx.RequestError:
         return False
     return True
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import json
+import logging
 from abc import ABCMeta, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from kiln_ai.adapters.few_shot_example_index import FewShotExampleIndex
 from kiln_ai.datamodel import PromptGenerators, PromptId, Task, TaskRun
 from kiln_ai.utils.exhaustive_error import raise_exhaustive_enum_error
 
 if TYPE_CHECKING:
+    from kiln_ai.datamodel.datamodel_enums import InputType
+    from kiln_ai.datamodel.embedding import EmbeddingConfig
     from kiln_ai.datamodel.skill import Skill
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class PromptExample:
@@ -62,6 +70,17 @@ class BasePromptBuilder(metaclass=ABCMeta):
         """
         return None
 
+    async def prepare_for_input(self, input: InputType) -> None:
+        """Prepare anything the prompt depends on for a specific input, before it's built.
+
+        Adapters await this with the run's input before building the prompt for a new
+        run. Most prompts don't depend on the input, so the default does nothing.
+
+        Args:
+            input: The input of the run the prompt is being built for.
+        """
+        return None
+
     def build_prompt(
         self,
         include_json_instructions: bool,
@@ -183,18 +202,34 @@ class MultiShotPromptBuilder(BasePromptBuilder):
         Returns:
             str: The constructed prompt string with examples.
         """
-        base_prompt = self.build_instruction_and_requirements()
-
-        valid_examples = self.collect_examples()
+        return self.build_instruction_and_requirements() + self.build_examples_section()
 
-        if len(valid_examples) == 0:
-            return base_prompt
+    def build_examples_section(self) -> str:
+        """Build the examples section of the prompt, empty if there are no examples.
 
-        base_prompt += "# Example Outputs\n\n"
-        for i, example in enumerate(valid_examples):
-            base_prompt += self.prompt_section_for_example(i, example)
-
-        return base_prompt
+        Memoized per builder type against the version of the task's runs, so repeated
+        builds (like every job of an eval run) don't reselect examples until a run changes.
+        """
+        index = FewShotExampleIndex.for_task(self.task)
+        if index is None:
+            return self.format_examples(self.collect_examples())
+
+        version = index.refresh()
+        key = self.__class__
+        section = index.memoized_section(key, version)
+        if section is None:
+            section = self.format_examples(self.collect_examples())
+            index.store_section(key, version, section)
+        return section
+
+    def format_examples(self, examples: list[TaskRun]) -> str:
+        if len(examples) == 0:
+            return ""
+
+        section = "# Example Outputs\n\n"
+        for i, example in enumerate(examples):
+            section += self.prompt_section_for_example(i, example)
+        return section
 
     def prompt_section_for_example(self, index: int, example: TaskRun) -> str:
         # Prefer repaired output if it exists, otherwise use the regular output
@@ -202,35 +237,15 @@ class MultiShotPromptBuilder(BasePromptBuilder):
         return f"## Example {index + 1}\n\nInput: {example.input}\nOutput: {output.output}\n\n"
 
     def collect_examples(self) -> list[TaskRun]:
-        valid_examples: list[TaskRun] = []
-        runs = self.task.runs(readonly=True)
-
-        # first pass, we look for repaired outputs. These are the best examples.
-        for run in runs:
-            if len(valid_examples) >= self.__class__.example_count():
-                break
-            if run.repaired_output is not None:
-                valid_examples.append(run)
-
-        # second pass, we look for high quality outputs (rating based)
-        # Minimum is "high_quality" (4 star in star rating scale), then sort by rating
-        # exclude repaired outputs as they were used above
-        runs_with_rating = [
-            run
-            for run in runs
-            if run.output.rating is not None
-            and run.output.rating.value is not None
-            and run.output.rating.is_high_quality()
-            and run.repaired_output is None
-        ]
-        runs_with_rating.sort(
-            key=lambda x: (x.output.rating and x.output.rating.value) or 0, reverse=True
-        )
-        for run in runs_with_rating:
-            if len(valid_examples) >= self.__class__.example_count():
-                break
-            valid_examples.append(run)
-        return valid_examples
+        """The examples for the prompt: repaired runs first, then high quality runs by rating.
+
+        Selected from the task's FewShotExampleIndex rather than a scan of every run.
+        """
+        index = FewShotExampleIndex.for_task(self.task)
+        if index is None:
+            return []
+        index.refresh()
+        return index.top_examples(self.example_count())
 
 
 class FewShotPromptBuilder(MultiShotPromptBuilder):
@@ -246,6 +261,75 @@ class FewShotPromptBuilder(MultiShotPromptBuilder):
         return 4
 
 
+# The examples retrieved for the current input, with the builder they were retrieved by.
+# A context variable so concurrent runs sharing an adapter each see their own examples.
+_similar_examples: ContextVar[
+    tuple[SimilarExamplesPromptBuilder, list[TaskRun]] | None
+] = ContextVar("similar_examples", default=None)
+
+
+class SimilarExamplesPromptBuilder(FewShotPromptBuilder):
+    """A prompt builder that includes the high quality examples most similar to the input.
+
+    Examples are retrieved from the task's SimilarExampleIndex, an embedding index of
+    the inputs of repaired and high quality runs, updated in the background as runs
+    change. Runs with the same input as the current one aren't used. prepare_for_input
+    must be awaited with the input before the prompt is built. If it wasn't (like a
+    prompt built for display), the index hasn't finished its first update, or
+    retrieval fails, the top rated examples are used instead.
+    """
+
+    def __init__(self, task: Task, embedding_config: EmbeddingConfig):
+        super().__init__(task)
+        self.embedding_config = embedding_config
+
+    async def prepare_for_input(self, input: InputType) -> None:
+        # Avoids loading the vector store for every prompt builder
+        from kiln_ai.adapters.similar_example_index import SimilarExampleIndex
+
+        _similar_examples.set(None)
+        index = SimilarExampleIndex.for_task(self.task, self.embedding_config)
+        if index is None:
+            return
+
+        # Compare against the inputs as they're saved on runs
+        input_str = (
+            input if isinstance(input, str) else json.dumps(input, ensure_ascii=False)
+        )
+        # Embedding new runs is left to the background, this only embeds the input
+        index.schedule_update()
+        if not index.ready:
+            return
+        try:
+            examples = await index.most_similar(input_str, self.example_count())
+        except Exception:
+            logger.warning(
+                "Failed to retrieve similar examples, using the top rated examples instead",
+                exc_info=True,
+            )
+            return
+        _similar_examples.set((self, examples))
+
+    def build_examples_section(self) -> str:
+        retrieved = self._retrieved_examples()
+        if retrieved is None:
+            return super().build_examples_section()
+        # Specific to this input, so not memoized
+        return self.format_examples(retrieved)
+
+    def collect_examples(self) -> list[TaskRun]:
+        retrieved = self._retrieved_examples()
+        if retrieved is None:
+            return super().collect_examples()
+        return retrieved
+
+    def _retrieved_examples(self) -> list[TaskRun] | None:
+        retrieved = _similar_examples.get()
+        if retrieved is None or retrieved[0] is not self:
+            return None
+        return retrieved[1]
+
+
 class CustomExamplePromptBuilder(FewShotPromptBuilder):
     """A prompt builder that uses custom examples instead of collecting from the dataset.
 
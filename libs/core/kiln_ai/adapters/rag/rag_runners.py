@@ -734,6 +734,10 @@ class RagIndexingStepRunner(AbstractRagStepRunner):
                 self.get_all_target_document_ids()
             )
 
+            # once enough vectors are indexed, build (or refresh) the ANN index so searches
+            # stop scanning the whole table
+            await vector_store.ensure_vector_index()
+
 
 class RagWorkflowRunnerConfiguration(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
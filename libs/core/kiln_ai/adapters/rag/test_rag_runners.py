@@ -1316,6 +1316,7 @@ class TestRagIndexingStepRunner:
             mock_vector_store = MagicMock()
             mock_vector_store.add_chunks_with_embeddings = AsyncMock()
             mock_vector_store.delete_nodes_not_in_set = AsyncMock()
+            mock_vector_store.ensure_vector_index = AsyncMock()
             mock_vector_store_factory.return_value = mock_vector_store
 
             progress_values = []
@@ -1364,6 +1365,7 @@ class TestRagIndexingStepRunner:
             mock_vector_store = MagicMock()
             mock_vector_store.add_chunks_with_embeddings = AsyncMock()
             mock_vector_store.delete_nodes_not_in_set = AsyncMock()
+            mock_vector_store.ensure_vector_index = AsyncMock()
             mock_vector_store_factory.return_value = mock_vector_store
 
             progress_values = []
@@ -1421,6 +1423,7 @@ class TestRagIndexingStepRunner:
                 side_effect=Exception("Vector store error")
             )
             mock_vector_store.delete_nodes_not_in_set = AsyncMock()
+            mock_vector_store.ensure_vector_index = AsyncMock()
             mock_vector_store_factory.return_value = mock_vector_store
 
             progress_values = []
@@ -1496,6 +1499,7 @@ class TestRagIndexingStepRunner:
             mock_vector_store = MagicMock()
             mock_vector_store.add_chunks_with_embeddings = AsyncMock()
             mock_vector_store.delete_nodes_not_in_set = AsyncMock()
+            mock_vector_store.ensure_vector_index = AsyncMock()
             mock_vector_store_factory.return_value = mock_vector_store
 
             # Run the indexing
@@ -1506,6 +1510,8 @@ class TestRagIndexingStepRunner:
             mock_vector_store.delete_nodes_not_in_set.assert_called_once_with(
                 {"doc-1", "doc-2", "doc-3"}
             )
+            # and the ANN index is maintained after reconciliation
+            mock_vector_store.ensure_vector_index.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_run_calls_delete_nodes_not_in_set_with_tagged_documents_only(
@@ -1569,6 +1575,7 @@ class TestRagIndexingStepRunner:
             mock_vector_store = MagicMock()
             mock_vector_store.add_chunks_with_embeddings = AsyncMock()
             mock_vector_store.delete_nodes_not_in_set = AsyncMock()
+            mock_vector_store.ensure_vector_index = AsyncMock()
             mock_vector_store_factory.return_value = mock_vector_store
 
             # Run the indexing
@@ -1632,6 +1639,7 @@ class TestRagIndexingStepRunner:
             mock_vector_store = MagicMock()
             mock_vector_store.add_chunks_with_embeddings = AsyncMock()
             mock_vector_store.delete_nodes_not_in_set = AsyncMock()
+            mock_vector_store.ensure_vector_index = AsyncMock()
             mock_vector_store_factory.return_value = mock_vector_store
 
             # Should yield a progress message and return early when no documents match the tag filter
@@ -1712,6 +1720,7 @@ class TestRagIndexingStepRunner:
             mock_vector_store = MagicMock()
             mock_vector_store.add_chunks_with_embeddings = AsyncMock()
             mock_vector_store.delete_nodes_not_in_set = AsyncMock()
+            mock_vector_store.ensure_vector_index = AsyncMock()
             mock_vector_store_factory.return_value = mock_vector_store
 
             # Run the indexing
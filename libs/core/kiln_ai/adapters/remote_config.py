@@ -202,6 +202,8 @@ def deserialize_config_data(
 
 
 async def load_from_url(url: str) -> KilnRemoteConfig:
+    # A one-off client, not a pooled one: this runs under asyncio.run on its own
+    # thread, so a pooled client would be left bound to a closed loop
     async with httpx.AsyncClient() as client:
         response = await client.get(url, timeout=10.0)
         response.raise_for_status()
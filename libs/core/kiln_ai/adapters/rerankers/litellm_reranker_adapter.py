@@ -1,6 +1,7 @@
 from functools import cached_property
 
 import litellm
+from kiln_ai.adapters.litellm_utils.response_cache import LlmResponseCache
 from kiln_ai.adapters.provider_tools import LiteLlmCoreConfig
 from kiln_ai.adapters.reranker_list import (
     KilnRerankerModelProvider,
@@ -14,6 +15,7 @@ from kiln_ai.adapters.rerankers.base_reranker import (
 )
 from kiln_ai.datamodel.datamodel_enums import ModelProviderName
 from kiln_ai.datamodel.reranker import RerankerConfig
+from kiln_ai.utils.http_client_pool import HttpClientPool
 from kiln_ai.utils.litellm import get_litellm_provider_info
 
 
@@ -37,6 +39,11 @@ class LitellmRerankerAdapter(BaseReranker):
             "query": query,
             "documents": [document.text for document in documents],
             "top_n": self.reranker_config.top_n,
+            # rerank doesn't take a shared_session, but its client can wrap the pooled one
+            "client": HttpClientPool.shared().litellm_http_handler(
+                self.litellm_provider_config.base_url,
+                self.reranker_config.model_provider_name,
+            ),
         }
 
         if self.litellm_provider_config.base_url:
@@ -50,7 +57,7 @@ class LitellmRerankerAdapter(BaseReranker):
         if self.litellm_provider_config.additional_body_options:
             rerank_kwargs.update(self.litellm_provider_config.additional_body_options)
 
-        response = await litellm.arerank(**rerank_kwargs)
+        response = await LlmResponseCache.shared().arerank(**rerank_kwargs)
         if not isinstance(response, litellm.RerankResponse):
             raise ValueError(f"Expected RerankResponse, got {type(response)}")
 
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import litellm
 import pytest
@@ -221,6 +221,7 @@ class TestLitellmRerankerAdapterRerank:
                     "Third document about birds",
                 ],
                 top_n=3,
+                client=ANY,
                 base_url="https://api.litellm.com",
                 default_headers={"Authorization": "Bearer test-token"},
                 temperature="0.5",
@@ -422,6 +423,7 @@ class TestLitellmRerankerAdapterIntegration:
                     "Document about cooking recipes",
                 ],
                 top_n=2,
+                client=ANY,
                 base_url="https://api.litellm.com",
                 default_headers={"Authorization": "Bearer test-token"},
                 temperature="0.5",
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import ClassVar
+
+import anyio
+import lancedb
+import pyarrow as pa
+from lancedb import AsyncConnection, AsyncTable
+
+from kiln_ai.adapters.embedding.base_embedding_adapter import BaseEmbeddingAdapter
+from kiln_ai.adapters.few_shot_example_index import FewShotExampleIndex
+from kiln_ai.adapters.vector_store.lancedb_helpers import lancedb_in_predicate
+from kiln_ai.datamodel import Task, TaskRun
+from kiln_ai.datamodel.embedding import EmbeddingConfig
+from kiln_ai.utils.config import Config
+from kiln_ai.utils.lock import AsyncLockManager
+
+logger = logging.getLogger(__name__)
+
+index_lock_manager = AsyncLockManager()
+
+# number of run inputs sent to the embedding model per request when indexing
+EMBEDDING_BATCH_SIZE = 100
+
+# max number of run ids per delete predicate, keeps the SQL filter a reasonable size
+DELETE_PREDICATE_BATCH_SIZE = 1000
+
+
+class SimilarExampleIndex:
+    """
+    A locally persisted embedding index over the inputs of a task's candidate few-shot
+    examples, for retrieving the examples most similar to a new input.
+
+    The candidates are the runs FewShotExampleIndex would pick from (repaired and high
+    quality runs). The index is a LanceDB table in the Kiln settings directory, one
+    per task and embedding config, holding each candidate's embedding and a hash of
+    its input. Updates are incremental: only runs which became candidates, or whose
+    input changed, are embedded, and runs which stopped being candidates are deleted.
+
+    Prompt builds shouldn't wait on embedding runs, so they call schedule_update to
+    update in the background and search whatever was indexed by the last update.
+    """
+
+    _indexes: ClassVar[dict[tuple[Path, str], SimilarExampleIndex]] = {}
+    _indexes_lock = threading.Lock()
+
+    def __init__(
+        self,
+        examples: FewShotExampleIndex,
+        embedding_adapter: BaseEmbeddingAdapter,
+        db_path: Path,
+        table_name: str,
+    ):
+        self.examples = examples
+        self.embedding_adapter = embedding_adapter
+        self.db_path = db_path
+        self.table_name = table_name
+        self._connection: AsyncConnection | None = None
+        self._table: AsyncTable | None = None
+        # run ID to input hash of every row in the table, None until the table is read
+        self._indexed: dict[str, str] | None = None
+        # FewShotExampleIndex version the table was last synced with
+        self._synced_version: int | None = None
+        # run ID to path, for loading the runs found by a search
+        self._paths: dict[str, Path] = {}
+        self._update_task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def for_task(
+        cls, task: Task, embedding_config: EmbeddingConfig
+    ) -> SimilarExampleIndex | None:
+        """The shared index for a task and embedding config, or None if the task isn't saved."""
+        examples = FewShotExampleIndex.for_task(task)
+        if examples is None or task.path is None:
+            return None
+        if task.id is None or embedding_config.id is None:
+            raise ValueError("Task and embedding config must have IDs")
+
+        key = (task.path, embedding_config.id)
+        with cls._indexes_lock:
+            index = cls._indexes.get(key)
+            if index is None:
+                # Avoids a circular import, the registry depends on the provider tools
+                from kiln_ai.adapters.embedding.embedding_registry import (
+                    embedding_adapter_from_type,
+                )
+
+                index = cls(
+                    examples,
+                    embedding_adapter_from_type(embedding_config),
+                    cls.db_path_for_task(task),
+                    embedding_config.id,
+                )
+                cls._indexes[key] = index
+            return index
+
+    @classmethod
+    def clear_all(cls) -> None:
+        with cls._indexes_lock:
+            cls._indexes.clear()
+
+    @staticmethod
+    def db_path_for_task(task: Task) -> Path:
+        if task.id is None:
+            raise ValueError("Task ID is required")
+        return Path(Config.settings_dir()) / "cache" / "few_shot_embeddings" / task.id
+
+    @property
+    def ready(self) -> bool:
+        """Whether an update has finished, so searches cover the task's examples."""
+        return self._synced_version is not None
+
+    def schedule_update(self) -> None:
+        """Start an update in the background, unless one is already running. Must be called from a running event loop."""
+        running = self._update_task
+        if (
+            running is not None
+            and not running.done()
+            and running.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+        self._update_task = asyncio.create_task(self._update_in_background())
+
+    async def _update_in_background(self) -> None:
+        try:
+            await self.update()
+        except Exception:
+            logger.warning("Failed to update the similar example index", exc_info=True)
+
+    async def update(self) -> None:
+        """Bring the embeddings up to date with the task's candidate examples."""
+        async with index_lock_manager.acquire((self.db_path, self.table_name)):
+            # stats the run files, so kept off the event loop
+            version = await anyio.to_thread.run_sync(self.examples.refresh)
+            if version == self._synced_version:
+                return
+
+            candidates = self.examples.candidates()
+            indexed = await self._read_indexed()
+            stale = [run_id for run_id in indexed if run_id not in candidates]
+            to_embed = [
+                run_id
+                for run_id, (_, input_hash) in candidates.items()
+                if indexed.get(run_id) != input_hash
+            ]
+
+            for start in range(0, len(stale), DELETE_PREDICATE_BATCH_SIZE):
+                batch = stale[start : start + DELETE_PREDICATE_BATCH_SIZE]
+                if self._table is not None:
+                    await self._table.delete(lancedb_in_predicate("run_id", batch))
+                for run_id in batch:
+                    del indexed[run_id]
+
+            for start in range(0, len(to_embed), EMBEDDING_BATCH_SIZE):
+                await self._embed_runs(
+                    to_embed[start : start + EMBEDDING_BATCH_SIZE], candidates
+                )
+
+            self._paths = {run_id: path for run_id, (path, _) in candidates.items()}
+            self._synced_version = version
+
+    async def most_similar(self, text: str, count: int) -> list[TaskRun]:
+        """
+        The count candidate examples with the inputs most similar to text, most similar
+        first, as of the last update.
+
+        Runs with exactly text as their input are left out. Otherwise an eval item (or
+        a rerun of a rated input) would be given its own gold output as an example.
+        """
+        if count <= 0 or self._table is None or not self._paths:
+            return []
+
+        result = await self.embedding_adapter.generate_embeddings([text])
+        if len(result.embeddings) != 1:
+            raise RuntimeError("Expected one embedding for the example query")
+        input_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        query = await self._table.search(result.embeddings[0].vector)
+        rows = await (
+            query.distance_type("cosine")
+            .where(f"input_hash != '{input_hash}'")
+            .limit(count)
+            .to_list()
+        )
+
+        examples: list[TaskRun] = []
+        for row in rows:
+            path = self._paths.get(row["run_id"])
+            if path is None:
+                continue
+            try:
+                examples.append(TaskRun.load_from_file(path, readonly=True))
+            except FileNotFoundError:
+                # deleted since the last update
+                continue
+        return examples
+
+    async def _read_indexed(self) -> dict[str, str]:
+        if self._indexed is not None:
+            return self._indexed
+
+        if self._connection is None:
+            self._connection = await lancedb.connect_async(str(self.db_path))
+        indexed: dict[str, str] = {}
+        if self.table_name in await self._connection.table_names():
+            self._table = await self._connection.open_table(self.table_name)
+            rows = await self._table.query().select(["run_id", "input_hash"]).to_arrow()
+            indexed = dict(
+                zip(
+                    rows.column("run_id").to_pylist(),
+                    rows.column("input_hash").to_pylist(),
+                )
+            )
+        self._indexed = indexed
+        return indexed
+
+    async def _embed_runs(
+        self, run_ids: list[str], candidates: dict[str, tuple[Path, str]]
+    ) -> None:
+        inputs: list[str] = []
+        hashes: list[str] = []
+        embedded_ids: list[str] = []
+        for run_id in run_ids:
+            path, input_hash = candidates[run_id]
+            try:
+                run = TaskRun.load_from_file(path, readonly=True)
+            except FileNotFoundError:
+                # deleted since the refresh, the next update removes it
+                continue
+            inputs.append(run.input)
+            hashes.append(input_hash)
+            embedded_ids.append(run_id)
+        if not inputs:
+            return
+
+        result = await self.embedding_adapter.generate_embeddings(inputs)
+        if len(result.embeddings) != len(inputs):
+            raise RuntimeError(
+                f"Expected {len(inputs)} embeddings for the examples, got {len(result.embeddings)}"
+            )
+        vectors = [embedding.vector for embedding in result.embeddings]
+        rows = pa.table(
+            {
+                "run_id": pa.array(embedded_ids, pa.string()),
+                "input_hash": pa.array(hashes, pa.string()),
+                "vector": pa.array(vectors, pa.list_(pa.float32(), len(vectors[0]))),
+            }
+        )
+
+        if self._table is None:
+            if self._connection is None:
+                raise RuntimeError("The index must be read before it's written")
+            self._table = await self._connection.create_table(
+                self.table_name, data=rows
+            )
+        else:
+            await (
+                self._table.merge_insert("run_id")
+                .when_matched_update_all()
+                .when_not_matched_insert_all()
+                .execute(rows)
+            )
+
+        indexed = await self._read_indexed()
+        indexed.update(zip(embedded_ids, hashes))
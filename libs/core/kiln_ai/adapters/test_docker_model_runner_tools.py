@@ -10,6 +10,7 @@ from kiln_ai.adapters.docker_model_runner_tools import (
     parse_docker_model_runner_models,
 )
 from kiln_ai.datamodel.datamodel_enums import ModelProviderName
+from kiln_ai.utils.http_client_pool import HttpClientPool
 
 
 def test_docker_model_runner_base_url_default():
@@ -86,15 +87,11 @@ def test_docker_model_runner_connection_all_models():
 @pytest.mark.asyncio
 async def test_docker_model_runner_online_success():
     """Test that docker_model_runner_online returns True when service is available."""
-    with patch(
-        "kiln_ai.adapters.docker_model_runner_tools.httpx.AsyncClient"
-    ) as mock_client_class:
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
+    mock_client = Mock()
+    mock_response = Mock()
+    mock_response.raise_for_status.return_value = None
+    mock_client.get = AsyncMock(return_value=mock_response)
+    with patch.object(HttpClientPool, "client", return_value=mock_client):
         from kiln_ai.adapters.docker_model_runner_tools import (
             docker_model_runner_online,
         )
@@ -108,13 +105,9 @@ async def test_docker_model_runner_online_success():
 @pytest.mark.asyncio
 async def test_docker_model_runner_online_failure():
     """Test that docker_model_runner_online returns False when service is unavailable."""
-    with patch(
-        "kiln_ai.adapters.docker_model_runner_tools.httpx.AsyncClient"
-    ) as mock_client_class:
-        mock_client = Mock()
-        mock_client.get = AsyncMock(side_effect=httpx.RequestError("Connection error"))
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
+    mock_client = Mock()
+    mock_client.get = AsyncMock(side_effect=httpx.RequestError("Connection error"))
+    with patch.object(HttpClientPool, "client", return_value=mock_client):
         from kiln_ai.adapters.docker_model_runner_tools import (
             docker_model_runner_online,
         )
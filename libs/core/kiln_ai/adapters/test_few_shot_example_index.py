@@ -0,0 +1,293 @@
+import json
+import os
+import shutil
+import time
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from kiln_ai.adapters.few_shot_example_index import FewShotExampleIndex
+from kiln_ai.adapters.prompt_builders import (
+    FewShotPromptBuilder,
+    MultiShotPromptBuilder,
+    RepairsPromptBuilder,
+)
+from kiln_ai.datamodel import (
+    DataSource,
+    DataSourceType,
+    Project,
+    Task,
+    TaskOutput,
+    TaskOutputRating,
+    TaskRun,
+)
+from kiln_ai.datamodel.model_cache import ModelCache
+from kiln_ai.datamodel.task_run import EvalItemSource
+
+
+@pytest.fixture
+def task(tmp_path):
+    project = Project(name="Test Project", path=tmp_path / "project.kiln")
+    project.save_to_file()
+    task = Task(name="Test Task", instruction="Tell a joke.", parent=project)
+    task.save_to_file()
+    return task
+
+
+@pytest.fixture
+def trust_mtimes():
+    # The cache disables itself on filesystems with coarse mtimes, force the fast path
+    with patch.object(
+        ModelCache, "enabled", new_callable=PropertyMock, return_value=True
+    ):
+        yield
+
+
+def add_run(
+    task: Task,
+    name: str,
+    rating: float | None = None,
+    repaired: bool = False,
+    **kwargs,
+) -> TaskRun:
+    source = DataSource(type=DataSourceType.human, properties={"created_by": "test"})
+    if repaired:
+        kwargs["repair_instructions"] = "Fix it"
+        kwargs["repaired_output"] = TaskOutput(output=f"repaired {name}", source=source)
+    run = TaskRun(
+        parent=task,
+        input=f"input {name}",
+        input_source=source,
+        output=TaskOutput(
+            output=f"output {name}",
+            source=source,
+            rating=TaskOutputRating(value=rating) if rating is not None else None,
+        ),
+        **kwargs,
+    )
+    run.save_to_file()
+    return run
+
+
+def example_inputs(index: FewShotExampleIndex, count: int = 25) -> list[str]:
+    index.refresh()
+    return [run.input for run in index.top_examples(count)]
+
+
+def test_for_task(task, tmp_path):
+    index = FewShotExampleIndex.for_task(task)
+    assert index is not None
+    assert FewShotExampleIndex.for_task(task) is index
+    assert FewShotExampleIndex.for_task(Task(name="Unsaved", instruction="x")) is None
+
+
+def test_selection_order(task):
+    add_run(task, "low", rating=3)
+    add_run(task, "four", rating=4)
+    add_run(task, "repaired", rating=5, repaired=True)
+    add_run(task, "five", rating=5)
+    add_run(task, "unrated")
+
+    index = FewShotExampleIndex.for_task(task)
+    assert index is not None
+    assert example_inputs(index) == ["input repaired", "input five", "input four"]
+    assert example_inputs(index, count=2) == ["input repaired", "input five"]
+
+
+def test_excludes_eval_generated_and_intermediate_runs(task):
+    parent = add_run(task, "turn 1", rating=5)
+    add_run(task, "turn 2", rating=4, parent_task_run_id=parent.id)
+    add_run(
+        task,
+        "eval",
+        rating=5,
+        eval_source=EvalItemSource(source_type="eval_input", source_id="ei1"),
+    )
+
+    index = FewShotExampleIndex.for_task(task)
+    assert index is not None
+    assert example_inputs(index) == ["input turn 2"]
+    # matches what a scan of task.runs() would consider
+    assert {run.input for run in task.runs()} == {"input turn 2"}
+
+
+def test_refresh_only_reloads_changed_runs(task, trust_mtimes):
+    runs = [add_run(task, str(i), rating=4) for i in range(5)]
+    index = FewShotExampleIndex.for_task(task)
+    assert index is not None
+    version = index.refresh()
+
+    with patch.object(TaskRun, "load_from_file", wraps=TaskRun.load_from_file) as load:
+        assert index.refresh() == version
+        load.assert_not_called()
+
+        runs[2].output.rating = TaskOutputRating(value=5)
+        runs[2].save_to_file()
+        new_version = index.refresh()
+        assert load.call_count == 1
+
+    assert new_version > version
+    assert index.top_examples(1)[0].input == "input 2"
+
+
+def test_refresh_tracks_added_and_deleted_runs(task, trust_mtimes):
+    add_run(task, "first", rating=4)
+    index = FewShotExampleIndex.for_task(task)
+    assert index is not None
+    assert example_inputs(index) == ["input first"]
+
+    second = add_run(task, "second", rating=5)
+    assert example_inputs(index) == ["input second", "input first"]
+
+    assert second.path is not None
+    shutil.rmtree(second.path.parent)
+    assert example_inputs(index) == ["input first"]
+
+
+def test_refresh_is_throttled(task, trust_mtimes):
+    run = add_run(task, "run", rating=4)
+    assert task.path is not None and run.path is not None
+    index = FewShotExampleIndex(task.path, refresh_interval=60)
+    version = index.refresh()
+
+    with patch(
+        "kiln_ai.adapters.few_shot_example_index.os.stat", wraps=os.stat
+    ) as stat:
+        assert index.refresh() == version
+        # only the runs folder, not every run file
+        assert stat.call_count == 1
+
+    # an edit made outside this process is picked up once the interval passes
+    data = json.loads(run.path.read_text())
+    data["output"]["rating"]["value"] = 5
+    run.path.write_text(json.dumps(data))
+    assert index.refresh() == version
+    with patch(
+        "kiln_ai.adapters.few_shot_example_index.time.monotonic",
+        return_value=time.monotonic() + 61,
+    ):
+        assert index.refresh() > version
+
+
+def test_untrusted_mtimes_still_detect_changes(task):
+    with patch.object(
+        ModelCache, "enabled", new_callable=PropertyMock, return_value=False
+    ):
+        run = add_run(task, "run", rating=4)
+        index = FewShotExampleIndex.for_task(task)
+        assert index is not None
+        version = index.refresh()
+        # nothing changed, so the version holds even though every run is re-read
+        assert index.refresh() == version
+
+        run.output.rating = TaskOutputRating(value=5)
+        run.save_to_file()
+        assert index.refresh() > version
+
+
+def test_prompt_examples_section_is_memoized(task, trust_mtimes):
+    add_run(task, "good", rating=5)
+
+    with patch.object(
+        MultiShotPromptBuilder,
+        "collect_examples",
+        autospec=True,
+        side_effect=MultiShotPromptBuilder.collect_examples,
+    ) as collect:
+        first = MultiShotPromptBuilder(task).build_prompt(
+            include_json_instructions=False
+        )
+        second = MultiShotPromptBuilder(task).build_prompt(
+            include_json_instructions=False
+        )
+        assert collect.call_count == 1
+        assert first == second
+        assert "output good" in first
+
+        # builders format examples differently, so they're memoized separately
+        FewShotPromptBuilder(task).build_prompt(include_json_instructions=False)
+        assert collect.call_count == 2
+
+        # a run change invalidates the memoized sections
+        add_run(task, "better", rating=5, repaired=True)
+        third = MultiShotPromptBuilder(task).build_prompt(
+            include_json_instructions=False
+        )
+        assert collect.call_count == 3
+        assert "repaired better" in third
+
+
+def test_editing_an_example_changes_the_section(task, trust_mtimes):
+    good = add_run(task, "good", rating=5)
+    repaired = add_run(task, "fixed", repaired=True)
+    first = RepairsPromptBuilder(task).build_prompt(include_json_instructions=False)
+    assert "output good" in first
+
+    good.output.output = "edited output"
+    good.save_to_file()
+    second = RepairsPromptBuilder(task).build_prompt(include_json_instructions=False)
+    assert "edited output" in second
+    assert "output good" not in second
+
+    assert repaired.repaired_output is not None
+    repaired.repaired_output.output = "edited repair"
+    repaired.repair_instructions = "edited instructions"
+    repaired.save_to_file()
+    third = RepairsPromptBuilder(task).build_prompt(include_json_instructions=False)
+    assert "edited repair" in third
+    assert "edited instructions" in third
+
+
+def test_repairs_builder_memoized_separately(task, trust_mtimes):
+    add_run(task, "run", rating=4, repaired=True)
+    multi_shot = MultiShotPromptBuilder(task).build_prompt(
+        include_json_instructions=False
+    )
+    repairs = RepairsPromptBuilder(task).build_prompt(include_json_instructions=False)
+    assert "Instructions On How to Improve" not in multi_shot
+    assert "Instructions On How to Improve" in repairs
+
+
+def full_scan_examples(task: Task, count: int) -> list[TaskRun]:
+    """The previous selection: load every run, then filter and sort the rated ones."""
+    runs = task.runs(readonly=True)
+    examples = [run for run in runs if run.repaired_output is not None][:count]
+    rated = [
+        run
+        for run in runs
+        if run.output.rating is not None
+        and run.output.rating.value is not None
+        and run.output.rating.is_high_quality()
+        and run.repaired_output is None
+    ]
+    rated.sort(
+        key=lambda x: (x.output.rating and x.output.rating.value) or 0, reverse=True
+    )
+    return (examples + rated)[:count]
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+def test_benchmark_few_shot_prompt_builds(benchmark, task, trust_mtimes):
+    for i in range(1000):
+        add_run(task, str(i), rating=[3, 4, 5][i % 3], repaired=i % 100 == 0)
+    builds = 20
+
+    # both warm the model cache first
+    full_scan_examples(task, 4)
+    start = benchmark._timer()
+    for _ in range(builds):
+        full_scan_examples(task, 4)
+    scan_time = benchmark._timer() - start
+
+    FewShotPromptBuilder(task).build_prompt(include_json_instructions=False)
+    start = benchmark._timer()
+    for _ in range(builds):
+        FewShotPromptBuilder(task).build_prompt(include_json_instructions=False)
+    indexed_time = benchmark._timer() - start
+
+    # Loading and sorting every run per build should be far slower. Loose bound for CI.
+    if indexed_time * 2 > scan_time:
+        pytest.fail(
+            f"{builds} builds over 1000 runs: indexed {indexed_time:.3f}s, full scan {scan_time:.3f}s, expected at least 2x faster"
+        )
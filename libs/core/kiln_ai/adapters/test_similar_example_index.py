@@ -0,0 +1,316 @@
+import shutil
+from typing import List
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from kiln_ai.adapters.embedding.base_embedding_adapter import (
+    BaseEmbeddingAdapter,
+    Embedding,
+    EmbeddingResult,
+)
+from kiln_ai.adapters.prompt_builders import SimilarExamplesPromptBuilder
+from kiln_ai.adapters.similar_example_index import SimilarExampleIndex
+from kiln_ai.datamodel import (
+    DataSource,
+    DataSourceType,
+    Project,
+    Task,
+    TaskOutput,
+    TaskOutputRating,
+    TaskRun,
+)
+from kiln_ai.datamodel.datamodel_enums import ModelProviderName
+from kiln_ai.datamodel.embedding import EmbeddingConfig
+from kiln_ai.datamodel.model_cache import ModelCache
+
+VOCABULARY = ["cat", "dog", "fish", "bird"]
+
+
+class KeywordEmbeddingAdapter(BaseEmbeddingAdapter):
+    """Embeds text as counts of a few keywords, so similarity is predictable."""
+
+    def __init__(self, embedding_config: EmbeddingConfig):
+        super().__init__(embedding_config)
+        self.embedded: list[str] = []
+
+    async def _generate_embeddings(self, input_texts: List[str]) -> EmbeddingResult:
+        self.embedded.extend(input_texts)
+        return EmbeddingResult(
+            embeddings=[
+                Embedding(vector=[text.count(word) + 0.01 for word in VOCABULARY])
+                for text in input_texts
+            ]
+        )
+
+
+@pytest.fixture
+def task(tmp_path):
+    project = Project(name="Test Project", path=tmp_path / "project.kiln")
+    project.save_to_file()
+    task = Task(name="Test Task", instruction="Describe the animal.", parent=project)
+    task.save_to_file()
+    return task
+
+
+@pytest.fixture
+def embedding_config(task):
+    config = EmbeddingConfig(
+        name="test-embedding",
+        model_provider_name=ModelProviderName.openai,
+        model_name="openai_text_embedding_3_small",
+        properties={},
+        parent=task.parent,
+    )
+    config.save_to_file()
+    return config
+
+
+@pytest.fixture(autouse=True)
+def settings_dir(tmp_path):
+    with patch(
+        "kiln_ai.utils.config.Config.settings_dir", return_value=tmp_path / "settings"
+    ):
+        yield tmp_path / "settings"
+
+
+@pytest.fixture(autouse=True)
+def keyword_embeddings():
+    SimilarExampleIndex.clear_all()
+    with patch(
+        "kiln_ai.adapters.embedding.embedding_registry.embedding_adapter_from_type",
+        side_effect=KeywordEmbeddingAdapter,
+    ):
+        yield
+    SimilarExampleIndex.clear_all()
+
+
+@pytest.fixture(autouse=True)
+async def finish_background_updates(keyword_embeddings):
+    yield
+    # updates started by prompt builds shouldn't outlive the test's event loop
+    for index in list(SimilarExampleIndex._indexes.values()):
+        if index._update_task is not None:
+            await index._update_task
+
+
+def add_run(task: Task, input: str, rating: float | None = 5) -> TaskRun:
+    source = DataSource(type=DataSourceType.human, properties={"created_by": "test"})
+    run = TaskRun(
+        parent=task,
+        input=input,
+        input_source=source,
+        output=TaskOutput(
+            output=f"about {input}",
+            source=source,
+            rating=TaskOutputRating(value=rating) if rating is not None else None,
+        ),
+    )
+    run.save_to_file()
+    return run
+
+
+def get_index(task, embedding_config) -> SimilarExampleIndex:
+    index = SimilarExampleIndex.for_task(task, embedding_config)
+    assert index is not None
+    return index
+
+
+def embedded(index: SimilarExampleIndex) -> list[str]:
+    """The run inputs embedded for the index, leaving out the queries (which end with ?)."""
+    assert isinstance(index.embedding_adapter, KeywordEmbeddingAdapter)
+    return [text for text in index.embedding_adapter.embedded if not text.endswith("?")]
+
+
+async def similar_inputs(index: SimilarExampleIndex, text: str, count: int = 4):
+    return [run.input for run in await index.most_similar(f"{text}?", count)]
+
+
+def test_for_task(task, embedding_config, settings_dir):
+    index = get_index(task, embedding_config)
+    assert SimilarExampleIndex.for_task(task, embedding_config) is index
+    assert index.db_path == settings_dir / "cache" / "few_shot_embeddings" / task.id
+    assert index.table_name == embedding_config.id
+    assert (
+        SimilarExampleIndex.for_task(
+            Task(name="Unsaved", instruction="x"), embedding_config
+        )
+        is None
+    )
+
+
+async def test_most_similar(task, embedding_config):
+    add_run(task, "a cat")
+    add_run(task, "a dog and a dog")
+    add_run(task, "a fish")
+    add_run(task, "a bird", rating=2)
+    add_run(task, "a dog, unrated", rating=None)
+
+    index = get_index(task, embedding_config)
+    await index.update()
+    # only high quality runs are candidates
+    assert sorted(embedded(index)) == ["a cat", "a dog and a dog", "a fish"]
+    assert await similar_inputs(index, "my dog", count=1) == ["a dog and a dog"]
+    assert (await similar_inputs(index, "fish or cat"))[:2] in (
+        ["a fish", "a cat"],
+        ["a cat", "a fish"],
+    )
+    assert len(await similar_inputs(index, "fish")) == 3
+    assert await similar_inputs(index, "fish", count=0) == []
+
+
+async def test_update_is_incremental(task, embedding_config):
+    add_run(task, "a cat")
+    dog = add_run(task, "a dog")
+    index = get_index(task, embedding_config)
+    await index.update()
+    assert len(embedded(index)) == 2
+
+    # nothing changed
+    await index.update()
+    assert len(embedded(index)) == 2
+
+    # only the new run is embedded
+    add_run(task, "a fish")
+    await index.update()
+    assert embedded(index)[2:] == ["a fish"]
+
+    # a changed input is embedded again
+    dog.input = "a bird"
+    dog.save_to_file()
+    await index.update()
+    assert embedded(index)[3:] == ["a bird"]
+    assert await similar_inputs(index, "bird", count=1) == ["a bird"]
+
+    # runs which are no longer candidates are removed
+    dog.output.rating = TaskOutputRating(value=1)
+    dog.save_to_file()
+    assert dog.path is not None
+    await index.update()
+    assert len(embedded(index)) == 4
+    assert "a bird" not in await similar_inputs(index, "bird")
+
+    shutil.rmtree(dog.path.parent)
+    await index.update()
+    assert sorted(await similar_inputs(index, "bird")) == ["a cat", "a fish"]
+
+
+async def test_index_is_persisted(task, embedding_config):
+    add_run(task, "a cat")
+    add_run(task, "a dog")
+    await get_index(task, embedding_config).update()
+
+    SimilarExampleIndex.clear_all()
+    add_run(task, "a fish")
+    index = get_index(task, embedding_config)
+    await index.update()
+    # the persisted embeddings are reused
+    assert embedded(index) == ["a fish"]
+    assert await similar_inputs(index, "cat", count=1) == ["a cat"]
+
+
+async def test_prompt_builder_uses_similar_examples(task, embedding_config):
+    add_run(task, "a cat")
+    add_run(task, "a dog")
+    add_run(task, "a fish", rating=4)
+    await get_index(task, embedding_config).update()
+    builder = SimilarExamplesPromptBuilder(task, embedding_config)
+
+    await builder.prepare_for_input("which fish?")
+    prompt = builder.build_prompt(include_json_instructions=False)
+    assert prompt.index("Input: a fish") < prompt.index("Input: a cat")
+    assert prompt.index("Input: a fish") < prompt.index("Input: a dog")
+
+    # structured inputs are compared as they're saved on runs
+    await builder.prepare_for_input({"animal": "dog"})
+    prompt = builder.build_prompt(include_json_instructions=False)
+    assert prompt.index("Input: a dog") < prompt.index("Input: a fish")
+
+
+async def test_prompt_builder_updates_in_the_background(task, embedding_config):
+    add_run(task, "a cat")
+    add_run(task, "a fish", rating=4)
+    index = get_index(task, embedding_config)
+    builder = SimilarExamplesPromptBuilder(task, embedding_config)
+
+    # the first build doesn't wait for the runs to be embedded
+    await builder.prepare_for_input("which fish?")
+    prompt = builder.build_prompt(include_json_instructions=False)
+    assert prompt.index("Input: a cat") < prompt.index("Input: a fish")
+
+    assert index._update_task is not None
+    await index._update_task
+    assert index.ready
+    await builder.prepare_for_input("which fish?")
+    prompt = builder.build_prompt(include_json_instructions=False)
+    assert prompt.index("Input: a fish") < prompt.index("Input: a cat")
+
+
+async def test_exact_input_matches_are_excluded(task, embedding_config):
+    add_run(task, "a fish")
+    add_run(task, "a fish and a cat")
+    index = get_index(task, embedding_config)
+    await index.update()
+
+    # a run's own input doesn't retrieve it (like an eval item and its gold output)
+    assert [run.input for run in await index.most_similar("a fish", 4)] == [
+        "a fish and a cat"
+    ]
+
+
+async def test_prompt_builder_falls_back_to_top_rated(task, embedding_config):
+    add_run(task, "a cat")
+    add_run(task, "a fish", rating=4)
+    await get_index(task, embedding_config).update()
+    builder = SimilarExamplesPromptBuilder(task, embedding_config)
+
+    # not prepared for an input
+    prompt = builder.build_prompt(include_json_instructions=False)
+    assert prompt.index("Input: a cat") < prompt.index("Input: a fish")
+
+    # retrieval fails
+    with patch.object(
+        KeywordEmbeddingAdapter,
+        "_generate_embeddings",
+        side_effect=RuntimeError("down"),
+    ):
+        await builder.prepare_for_input("which fish?")
+    prompt = builder.build_prompt(include_json_instructions=False)
+    assert prompt.index("Input: a cat") < prompt.index("Input: a fish")
+
+    # examples retrieved by another builder aren't used
+    other = SimilarExamplesPromptBuilder(task, embedding_config)
+    await other.prepare_for_input("which fish?")
+    prompt = builder.build_prompt(include_json_instructions=False)
+    assert prompt.index("Input: a cat") < prompt.index("Input: a fish")
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+async def test_benchmark_similar_example_queries(benchmark, task, embedding_config):
+    words = ["cat", "dog", "fish", "bird", "horse"]
+    for i in range(1000):
+        add_run(task, f"{words[i % 5]} {words[(i // 5) % 5]} {i}", rating=[4, 5][i % 2])
+    index = get_index(task, embedding_config)
+    builder = SimilarExamplesPromptBuilder(task, embedding_config)
+
+    # The model cache disables itself on filesystems with coarse mtimes, force the fast path
+    with patch.object(
+        ModelCache, "enabled", new_callable=PropertyMock, return_value=True
+    ):
+        start = benchmark._timer()
+        await index.update()
+        build_time = benchmark._timer() - start
+
+        queries = 200
+        start = benchmark._timer()
+        for i in range(queries):
+            await builder.prepare_for_input(f"{words[i % 5]} {words[(i + 2) % 5]}")
+        query_time = (benchmark._timer() - start) / queries
+
+    # Preparing a prompt only embeds the input and searches, it never waits on
+    # indexing runs. Loose bound for CI.
+    if query_time * 10 > build_time:
+        pytest.fail(
+            f"Prepared a prompt in {query_time * 1000:.2f}ms, building the index over 1000 runs took {build_time * 1000:.0f}ms, expected at least 10x faster"
+        )
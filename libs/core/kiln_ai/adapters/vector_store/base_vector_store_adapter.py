@@ -72,6 +72,14 @@ class BaseVectorStoreAdapter(ABC):
     async def destroy(self) -> None:
         pass
 
+    async def ensure_vector_index(self) -> None:
+        """
+        Build or rebuild the approximate nearest neighbor index over the vectors, if the store
+        is configured with one and it is due (e.g. the row count crossed the threshold). Called
+        after indexing. No-op for stores without index management.
+        """
+        return None
+
     @abstractmethod
     async def delete_nodes_not_in_set(self, document_ids: Set[str]) -> None:
         """
@@ -4,8 +4,9 @@ import shutil
 from pathlib import Path
 from typing import List, Literal, Optional, Set, TypedDict
 
+import pyarrow as pa
 from llama_index.core import StorageContext, VectorStoreIndex
-from llama_index.core.schema import BaseNode, TextNode
+from llama_index.core.schema import BaseNode
 from llama_index.core.vector_stores.types import (
     VectorStoreQuery as LlamaIndexVectorStoreQuery,
 )
@@ -20,13 +21,20 @@ from kiln_ai.adapters.vector_store.base_vector_store_adapter import (
     VectorStoreQuery,
 )
 from kiln_ai.adapters.vector_store.lancedb_helpers import (
-    convert_to_llama_index_node,
     deterministic_chunk_id,
     lancedb_construct_from_config,
+    lancedb_create_vector_index,
+    lancedb_in_predicate,
+    lancedb_index_matches_properties,
+    lancedb_node_metadata,
+    lancedb_table_schema,
     store_type_to_lancedb_query_type,
 )
 from kiln_ai.datamodel.rag import RagConfig
-from kiln_ai.datamodel.vector_store import VectorStoreConfig
+from kiln_ai.datamodel.vector_store import (
+    LanceDBVectorIndexProperties,
+    VectorStoreConfig,
+)
 from kiln_ai.utils.config import Config
 from kiln_ai.utils.env import temporary_env
 from kiln_ai.utils.exhaustive_error import raise_exhaustive_enum_error
@@ -36,6 +44,12 @@ table_lock_manager = AsyncLockManager()
 
 logger = logging.getLogger(__name__)
 
+# column holding the Kiln document id of each chunk, used for document-level reconciliation
+KILN_DOC_ID_COLUMN = "metadata.kiln_doc_id"
+
+# max number of document ids per delete predicate, keeps the SQL filter a reasonable size
+DELETE_PREDICATE_BATCH_SIZE = 1000
+
 
 class LanceDBAdapterQueryKwargs(TypedDict):
     similarity_top_k: int
@@ -63,6 +77,13 @@ class LanceDBAdapter(BaseVectorStoreAdapter):
         )
         self._index = None
 
+        # document-level index membership: the set of Kiln document ids that (may) have chunks
+        # in the table. Loaded lazily from the table once, then maintained incrementally on
+        # add / delete so reconciliation is a set difference instead of a full table scan.
+        # It may over-approximate (deleting a missing document is a no-op) but must never
+        # under-approximate, or stale chunks would be left behind.
+        self._indexed_document_ids: Set[str] | None = None
+
     @property
     def index(self) -> VectorStoreIndex:
         """
@@ -100,6 +121,8 @@ class LanceDBAdapter(BaseVectorStoreAdapter):
         # which is set through the source node relationship
         try:
             self.index.delete_ref_doc(document_id)
+            if self._indexed_document_ids is not None:
+                self._indexed_document_ids.discard(document_id)
         except TableNotFoundError:
             # Table doesn't exist yet, so there's nothing to delete
             logger.debug(
@@ -121,43 +144,48 @@ class LanceDBAdapter(BaseVectorStoreAdapter):
     async def add_chunks_with_embeddings(
         self,
         doc_batch: list[DocumentWithChunksAndEmbeddings],
-        nodes_batch_size: int = 100,
+        rows_batch_size: int = 5000,
     ) -> None:
+        """
+        Upsert the chunks of the documents into the table, keyed by deterministic chunk id.
+
+        Rows are built as Arrow columns directly (no llama_index nodes) and written with a
+        merge-insert on the id column in large batches. Documents whose chunks are all already
+        in the table are skipped, and partially indexed or changed documents are replaced.
+        """
         if len(doc_batch) == 0:
             return
 
-        node_batch: List[TextNode] = []
         for doc in doc_batch:
-            document_id = doc.document_id
-            chunks = doc.chunks
-            embeddings = doc.embeddings
-
-            # the lancedb vector store implementation is sync (even though it has an async API)
-            # so we sleep to avoid blocking the event loop - that allows other async ops to run
-            await asyncio.sleep(0)
-
-            if len(embeddings) != len(chunks):
+            if len(doc.embeddings) != len(doc.chunks):
                 raise RuntimeError(
-                    f"Number of embeddings ({len(embeddings)}) does not match number of chunks ({len(chunks)}) for document {document_id}"
+                    f"Number of embeddings ({len(doc.embeddings)}) does not match number of chunks ({len(doc.chunks)}) for document {doc.document_id}"
                 )
 
-            chunk_count_for_document = len(chunks)
-            deterministic_chunk_ids = [
-                deterministic_chunk_id(document_id, chunk_idx)
-                for chunk_idx in range(chunk_count_for_document)
-            ]
+        existing_chunk_ids = await self._chunk_ids_by_document_id(
+            {doc.document_id for doc in doc_batch}
+        )
 
-            # check if the chunk ids are already in the database
-            chunk_ids_in_database = await self.get_nodes_by_ids(deterministic_chunk_ids)
+        columns: dict[str, list] = {
+            "id": [],
+            "doc_id": [],
+            "vector": [],
+            "text": [],
+            "metadata": [],
+        }
 
-            # we already have all the chunks for this document in the database
-            if len(chunk_ids_in_database) == chunk_count_for_document:
-                # free up event loop to avoid risk of looping for a long time
-                # without any real async ops releasing the event loop at all
-                # (get_nodes_by_ids implementation in llama_index is actually sync
-                # and it is slow)
+        for doc in doc_batch:
+            document_id = doc.document_id
+            chunk_ids = [
+                deterministic_chunk_id(document_id, chunk_idx)
+                for chunk_idx in range(len(doc.chunks))
+            ]
+            existing_ids_for_doc = existing_chunk_ids.get(document_id, set())
+            if existing_ids_for_doc.issuperset(chunk_ids):
+                # we already have all the chunks for this document in the database
                 continue
-            else:
+
+            if existing_ids_for_doc:
                 # the chunks are different, which is because either:
                 # - an upstream sync conflict caused multiple chunked documents to be created and the incoming one
                 # is different; we need to delete all the chunks for this document otherwise there can be lingering stale chunks
@@ -165,30 +193,96 @@ class LanceDBAdapter(BaseVectorStoreAdapter):
                 # - an incomplete indexing of this same chunked doc, upserting is enough to overwrite the current chunked doc fully
                 await self.delete_nodes_by_document_id(document_id)
 
+            # record membership before writing so a failure mid-write can only over-approximate
+            if self._indexed_document_ids is not None:
+                self._indexed_document_ids.add(document_id)
+
             chunks_text = await doc.chunked_document.load_chunks_text()
-            for chunk_idx, (chunk_text, embedding) in enumerate(
-                zip(chunks_text, embeddings)
+            for chunk_idx, (chunk_id, chunk_text, embedding) in enumerate(
+                zip(chunk_ids, chunks_text, doc.embeddings)
             ):
-                node_batch.append(
-                    convert_to_llama_index_node(
+                columns["id"].append(chunk_id)
+                columns["doc_id"].append(document_id)
+                columns["vector"].append(embedding.vector)
+                columns["text"].append(chunk_text)
+                columns["metadata"].append(
+                    lancedb_node_metadata(
                         document_id=document_id,
                         chunk_idx=chunk_idx,
-                        node_id=deterministic_chunk_id(document_id, chunk_idx),
+                        node_id=chunk_id,
                         text=chunk_text,
-                        vector=embedding.vector,
                     )
                 )
 
-                if len(node_batch) >= nodes_batch_size:
-                    # async_add is currently not async, LanceDB has an async API but
-                    # llama_index does not use it, so it is synchronous and blocking
-                    # avoid calling with too many nodes at once
-                    await self.lancedb_vector_store.async_add(node_batch)
-                    node_batch.clear()
+            if len(columns["id"]) >= rows_batch_size:
+                await self._upsert_rows(columns)
+                for column in columns.values():
+                    column.clear()
+
+        if columns["id"]:
+            await self._upsert_rows(columns)
+
+    async def _chunk_ids_by_document_id(
+        self, document_ids: Set[str]
+    ) -> dict[str, Set[str]]:
+        """Return the chunk ids currently in the table for each of the documents, in one columnar scan."""
+        if self.lancedb_vector_store._table is None:
+            return {}
+
+        tbl = self.lancedb_vector_store.table
+        query = (
+            tbl.search()
+            .where(lancedb_in_predicate(KILN_DOC_ID_COLUMN, sorted(document_ids)))
+            .select({"id": "id", "kiln_doc_id": KILN_DOC_ID_COLUMN})
+            .limit(None)
+        )
+        chunk_ids: dict[str, Set[str]] = {}
+        for batch in query.to_batches(10_000):
+            await asyncio.sleep(0)
+            for chunk_id, document_id in zip(
+                batch.column("id").to_pylist(), batch.column("kiln_doc_id").to_pylist()
+            ):
+                chunk_ids.setdefault(document_id, set()).add(chunk_id)
+        return chunk_ids
+
+    async def _upsert_rows(self, columns: dict[str, list]) -> None:
+        # the lancedb table API is sync, release the event loop between batches
+        await asyncio.sleep(0)
+
+        store = self.lancedb_vector_store
+        schema = (
+            store.table.schema
+            if store._table is not None
+            else lancedb_table_schema(
+                store, vector_dimensions=len(columns["vector"][0])
+            )
+        )
+        data = pa.Table.from_pydict(
+            {
+                "id": columns["id"],
+                store.doc_id_key: columns["doc_id"],
+                store.vector_column_name: columns["vector"],
+                store.text_key: columns["text"],
+                "metadata": columns["metadata"],
+            },
+            schema=schema,
+        )
+
+        if store._table is None:
+            # same as llama_index's LanceDBVectorStore.add when the table does not exist yet
+            store._table = store.client.create_table(
+                store._table_name, data, mode=store.mode
+            )
+        else:
+            (
+                store.table.merge_insert("id")
+                .when_matched_update_all()
+                .when_not_matched_insert_all()
+                .execute(data)
+            )
 
-        if node_batch:
-            await self.lancedb_vector_store.async_add(node_batch)
-            node_batch.clear()
+        # new data requires re-creating the fts index
+        store._fts_index_ready = False
 
     def format_query_result(
         self, query_result: VectorStoreQueryResult
@@ -313,6 +407,66 @@ class LanceDBAdapter(BaseVectorStoreAdapter):
         except TableNotFoundError:
             return 0
 
+    @property
+    def vector_index_properties(self) -> LanceDBVectorIndexProperties | None:
+        if self.query_type == "fts":
+            return None
+        return self.vector_store_config.properties.get("vector_index")
+
+    async def ensure_vector_index(self) -> None:
+        """
+        Build the ANN index once the table has crossed the configured row count, and keep it
+        current: rows added since are merged in incrementally with optimize(), and the index
+        is only retrained from scratch when its type or metric no longer match the config.
+        """
+        index_properties = self.vector_index_properties
+        if index_properties is None or self.lancedb_vector_store._table is None:
+            return
+
+        tbl = self.lancedb_vector_store.table
+        vector_column_name = self.vector_store_config.properties["vector_column_name"]
+
+        row_count = tbl.count_rows()
+        if row_count < index_properties["min_rows"]:
+            return
+
+        existing_index = next(
+            (
+                index
+                for index in tbl.list_indices()
+                if index.columns == [vector_column_name]
+            ),
+            None,
+        )
+        stats = (
+            tbl.index_stats(existing_index.name) if existing_index is not None else None
+        )
+
+        if stats is not None and lancedb_index_matches_properties(
+            stats, index_properties
+        ):
+            if stats.num_unindexed_rows == 0:
+                return
+            async with table_lock_manager.acquire(tbl.name):
+                # adds the new rows to the existing index without retraining it
+                await asyncio.to_thread(tbl.optimize)
+            return
+
+        logger.info(
+            "Building %s vector index over %d rows for RAG config %s",
+            index_properties["index_type"].value,
+            row_count,
+            self.rag_config.id,
+        )
+        async with table_lock_manager.acquire(tbl.name):
+            # training the index can take a while on large tables, keep it off the event loop
+            await asyncio.to_thread(
+                lancedb_create_vector_index,
+                tbl,
+                vector_column_name,
+                index_properties,
+            )
+
     @property
     def query_type(self) -> Literal["fts", "hybrid", "vector"]:
         return store_type_to_lancedb_query_type(self.vector_store_config.store_type)
@@ -327,22 +481,47 @@ class LanceDBAdapter(BaseVectorStoreAdapter):
     async def destroy(self) -> None:
         lancedb_path = LanceDBAdapter.lancedb_path_for_config(self.rag_config)
         shutil.rmtree(lancedb_path)
+        self._indexed_document_ids = None
+
+    async def indexed_document_ids(self) -> Set[str]:
+        """
+        Return the set of Kiln document ids currently indexed in the table.
+
+        The first call scans only the document id column of the table (columnar, no
+        pandas conversion, no vectors or text loaded); subsequent calls return the
+        incrementally maintained set.
+        """
+        if self._indexed_document_ids is not None:
+            return self._indexed_document_ids
 
-    async def delete_nodes_not_in_set(self, document_ids: Set[str]) -> None:
         tbl = self.lancedb_vector_store.table
         if tbl is None:
             raise ValueError("Table is not initialized")
 
-        for batch in tbl.search().to_batches(100):
-            batch = batch.to_pandas()
+        document_ids: Set[str] = set()
+        query = tbl.search().select({"kiln_doc_id": KILN_DOC_ID_COLUMN}).limit(None)
+        for batch in query.to_batches(10_000):
+            # the table scan is sync, release the event loop between batches
+            await asyncio.sleep(0)
+            unique_ids = batch.column("kiln_doc_id").unique().drop_null()
+            document_ids.update(unique_ids.to_pylist())
+
+        self._indexed_document_ids = document_ids
+        return document_ids
+
+    async def delete_nodes_not_in_set(self, document_ids: Set[str]) -> None:
+        tbl = self.lancedb_vector_store.table
+        if tbl is None:
+            raise ValueError("Table is not initialized")
 
-            rows_to_delete = []
-            for _, row in batch.iterrows():
-                kiln_doc_id = row["metadata"]["kiln_doc_id"]
-                if kiln_doc_id not in document_ids:
-                    kiln_chunk_idx = row["metadata"]["kiln_chunk_idx"]
-                    record_id = deterministic_chunk_id(kiln_doc_id, kiln_chunk_idx)
-                    rows_to_delete.append(record_id)
+        indexed_document_ids = await self.indexed_document_ids()
+        stale_document_ids = sorted(indexed_document_ids - document_ids)
+        if not stale_document_ids:
+            return
 
-            if rows_to_delete:
-                self.lancedb_vector_store.delete_nodes(rows_to_delete)
+        # delete by document id predicate, rather than listing every chunk id to delete
+        for i in range(0, len(stale_document_ids), DELETE_PREDICATE_BATCH_SIZE):
+            batch = stale_document_ids[i : i + DELETE_PREDICATE_BATCH_SIZE]
+            await asyncio.sleep(0)
+            tbl.delete(lancedb_in_predicate(KILN_DOC_ID_COLUMN, batch))
+            indexed_document_ids.difference_update(batch)
@@ -1,9 +1,16 @@
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, Iterable, List, Literal
 
+import pyarrow as pa
 from llama_index.core.schema import NodeRelationship, RelatedNodeInfo, TextNode
+from llama_index.core.vector_stores.utils import node_to_metadata_dict
 from llama_index.vector_stores.lancedb import LanceDBVectorStore
 
-from kiln_ai.datamodel.vector_store import VectorStoreConfig, VectorStoreType
+from kiln_ai.datamodel.vector_store import (
+    LanceDBVectorIndexProperties,
+    LanceDBVectorIndexType,
+    VectorStoreConfig,
+    VectorStoreType,
+)
 from kiln_ai.utils.exhaustive_error import raise_exhaustive_enum_error
 from kiln_ai.utils.uuid import string_to_uuid
 
@@ -22,6 +29,56 @@ def store_type_to_lancedb_query_type(
             raise_exhaustive_enum_error(store_type)
 
 
+def vector_index_type_to_lancedb_index_type(
+    index_type: LanceDBVectorIndexType,
+) -> Literal["IVF_PQ", "IVF_HNSW_SQ", "IVF_HNSW_PQ"]:
+    match index_type:
+        case LanceDBVectorIndexType.IVF_PQ:
+            return "IVF_PQ"
+        case LanceDBVectorIndexType.IVF_HNSW_SQ:
+            return "IVF_HNSW_SQ"
+        case LanceDBVectorIndexType.IVF_HNSW_PQ:
+            return "IVF_HNSW_PQ"
+        case _:
+            raise_exhaustive_enum_error(index_type)
+
+
+def lancedb_create_vector_index(
+    table: Any,
+    vector_column_name: str,
+    index_properties: LanceDBVectorIndexProperties,
+) -> None:
+    """(Re)build the ANN index over the vector column of a LanceDB table, replacing any existing one."""
+    kwargs: Dict[str, Any] = {}
+    if "num_partitions" in index_properties:
+        kwargs["num_partitions"] = index_properties["num_partitions"]
+    if "num_sub_vectors" in index_properties:
+        kwargs["num_sub_vectors"] = index_properties["num_sub_vectors"]
+
+    table.create_index(
+        metric=index_properties["metric"].value,
+        vector_column_name=vector_column_name,
+        index_type=vector_index_type_to_lancedb_index_type(
+            index_properties["index_type"]
+        ),
+        replace=True,
+        **kwargs,
+    )
+
+
+def lancedb_index_matches_properties(
+    index_stats: Any,
+    index_properties: LanceDBVectorIndexProperties,
+) -> bool:
+    """Whether an existing index (from table.index_stats) was built with the configured type and metric."""
+    if index_stats.index_type != vector_index_type_to_lancedb_index_type(
+        index_properties["index_type"]
+    ):
+        return False
+    distance_type = getattr(index_stats, "distance_type", None)
+    return distance_type is None or distance_type == index_properties["metric"].value
+
+
 def lancedb_construct_from_config(
     vector_store_config: VectorStoreConfig,
     uri: str,
@@ -31,6 +88,11 @@ def lancedb_construct_from_config(
     kwargs: Dict[str, Any] = {**extra_params}
     if "nprobes" in vector_store_config.properties and "nprobes" not in kwargs:
         kwargs["nprobes"] = vector_store_config.properties["nprobes"]
+    if (
+        "refine_factor" in vector_store_config.properties
+        and "refine_factor" not in kwargs
+    ):
+        kwargs["refine_factor"] = vector_store_config.properties["refine_factor"]
 
     return LanceDBVectorStore(
         mode="create",
@@ -90,6 +152,77 @@ def convert_to_llama_index_node(
     )
 
 
+# struct type of the metadata column, as written by llama_index's LanceDBVectorStore.add for our nodes
+LANCEDB_METADATA_TYPE = pa.struct(
+    [
+        pa.field("_node_content", pa.string()),
+        pa.field("_node_type", pa.string()),
+        pa.field("doc_id", pa.string()),
+        pa.field("document_id", pa.string()),
+        pa.field("kiln_chunk_idx", pa.int64()),
+        pa.field("kiln_doc_id", pa.string()),
+        pa.field("ref_doc_id", pa.string()),
+    ]
+)
+
+
+def lancedb_table_schema(
+    lancedb_vector_store: LanceDBVectorStore,
+    vector_dimensions: int,
+) -> pa.Schema:
+    """Arrow schema of a LanceDB table, matching the one llama_index creates from our nodes."""
+    vector_column_name = lancedb_vector_store.vector_column_name
+    text_key = lancedb_vector_store.text_key
+    doc_id_key = lancedb_vector_store.doc_id_key
+    if vector_column_name is None or text_key is None or doc_id_key is None:
+        raise ValueError(
+            "vector_column_name, text_key and doc_id_key must be set on the vector store"
+        )
+
+    return pa.schema(
+        [
+            pa.field("id", pa.string()),
+            pa.field(doc_id_key, pa.string()),
+            pa.field(vector_column_name, pa.list_(pa.float32(), vector_dimensions)),
+            pa.field(text_key, pa.string()),
+            pa.field("metadata", LANCEDB_METADATA_TYPE),
+        ]
+    )
+
+
+def lancedb_node_metadata(
+    document_id: str,
+    chunk_idx: int,
+    node_id: str,
+    text: str,
+) -> Dict[str, Any]:
+    """
+    Build the metadata dict llama_index's LanceDBVectorStore stores for the node built by
+    convert_to_llama_index_node, including the `_node_content` it reads nodes back from.
+
+    Goes through llama_index's own node_to_metadata_dict so the columnar ingestion path
+    can't drift from what the vector store writes and reads.
+    """
+    node = convert_to_llama_index_node(
+        document_id=document_id,
+        chunk_idx=chunk_idx,
+        node_id=node_id,
+        text=text,
+        # the embedding is stored in its own column, and dropped from _node_content anyway
+        vector=[],
+    )
+    return node_to_metadata_dict(node, remove_text=False, flat_metadata=True)
+
+
+def lancedb_in_predicate(column: str, values: Iterable[str]) -> str:
+    """Build a SQL `IN` predicate usable in LanceDB filters and deletes.
+
+    Values are quoted as SQL string literals (single quotes are escaped by doubling them).
+    """
+    quoted = ", ".join("'" + value.replace("'", "''") + "'" for value in values)
+    return f"{column} IN ({quoted})"
+
+
 def deterministic_chunk_id(document_id: str, chunk_idx: int) -> str:
     # the id_ of the Node must be a UUID string, otherwise llama_index / LanceDB fails downstream
     return str(string_to_uuid(f"{document_id}::{chunk_idx}"))
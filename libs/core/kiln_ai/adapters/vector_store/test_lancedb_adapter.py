@@ -1,6 +1,7 @@
 import asyncio
 import os
 import random
+import time
 import uuid
 from pathlib import Path
 from typing import Callable, List
@@ -17,7 +18,10 @@ from kiln_ai.adapters.vector_store.base_vector_store_adapter import (
     VectorStoreQuery,
 )
 from kiln_ai.adapters.vector_store.lancedb_adapter import LanceDBAdapter
-from kiln_ai.adapters.vector_store.lancedb_helpers import deterministic_chunk_id
+from kiln_ai.adapters.vector_store.lancedb_helpers import (
+    convert_to_llama_index_node,
+    deterministic_chunk_id,
+)
 from kiln_ai.adapters.vector_store.vector_store_registry import (
     vector_store_adapter_for_config,
 )
@@ -26,7 +30,12 @@ from kiln_ai.datamodel.chunk import Chunk, ChunkedDocument
 from kiln_ai.datamodel.datamodel_enums import ModelProviderName
 from kiln_ai.datamodel.embedding import ChunkEmbeddings, Embedding, EmbeddingConfig
 from kiln_ai.datamodel.rag import RagConfig
-from kiln_ai.datamodel.vector_store import VectorStoreConfig, VectorStoreType
+from kiln_ai.datamodel.vector_store import (
+    LanceDBVectorIndexMetric,
+    LanceDBVectorIndexType,
+    VectorStoreConfig,
+    VectorStoreType,
+)
 from kiln_ai.utils.config import Config
 
 
@@ -102,6 +111,53 @@ def knn_vector_store_config():
     )
 
 
+def vector_store_config_with_index(
+    min_rows: int,
+    index_type: LanceDBVectorIndexType = LanceDBVectorIndexType.IVF_HNSW_SQ,
+    refine_factor: int | None = None,
+    num_partitions: int = 1,
+) -> VectorStoreConfig:
+    properties = {
+        "similarity_top_k": 10,
+        "nprobes": 10,
+        "overfetch_factor": 1,
+        "vector_column_name": "vector",
+        "text_key": "text",
+        "doc_id_key": "doc_id",
+        "store_type": VectorStoreType.LANCE_DB_VECTOR,
+        "vector_index": {
+            "index_type": index_type,
+            "metric": LanceDBVectorIndexMetric.L2,
+            "min_rows": min_rows,
+            "num_partitions": num_partitions,
+        },
+    }
+    if refine_factor is not None:
+        properties["refine_factor"] = refine_factor
+    return VectorStoreConfig(
+        name="test_config",
+        store_type=VectorStoreType.LANCE_DB_VECTOR,
+        properties=properties,
+    )
+
+
+def random_vector_docs(
+    doc_count: int, dimensions: int, tmp_path: Path
+) -> list[DocumentWithChunksAndEmbeddings]:
+    return dicts_to_indexable_docs(
+        {
+            f"doc_{i}": [
+                {
+                    "vector": [random.uniform(-1, 1) for _ in range(dimensions)],
+                    "text": f"chunk of document {i}",
+                }
+            ]
+            for i in range(doc_count)
+        },
+        tmp_path,
+    )
+
+
 @pytest.fixture
 def embedding_config():
     """Create an embedding config for testing."""
@@ -769,6 +825,28 @@ async def test_skip_existing_chunks_when_count_matches(
     assert "Tokyo" in results[0].chunk_text
 
 
+def single_chunk_docs(
+    count: int, tmp_path: Path
+) -> list[DocumentWithChunksAndEmbeddings]:
+    return dicts_to_indexable_docs(
+        {
+            f"doc_{i}": [{"vector": [i * 0.1, i * 0.2], "text": f"Chunk {i} content"}]
+            for i in range(count)
+        },
+        tmp_path,
+    )
+
+
+def spy_upsert_batch_sizes(adapter: LanceDBAdapter, batch_sizes: list[int]):
+    original_upsert = adapter._upsert_rows
+
+    async def spy_upsert(columns):
+        batch_sizes.append(len(columns["id"]))
+        return await original_upsert(columns)
+
+    return patch.object(adapter, "_upsert_rows", side_effect=spy_upsert)
+
+
 @pytest.mark.asyncio
 async def test_batching_functionality(
     fts_vector_store_config,
@@ -781,36 +859,16 @@ async def test_batching_functionality(
 
     adapter = LanceDBAdapter(rag_config, fts_vector_store_config)
 
-    # Create a document with many chunks to test batching
-    large_doc_data = {
-        "large_doc": [
-            {"vector": [i * 0.1, i * 0.2], "text": f"Chunk {i} content"}
-            for i in range(15)  # 15 chunks to test batching
-        ]
-    }
-
-    large_doc_records = dicts_to_indexable_docs(large_doc_data, tmp_path)
+    # 15 single-chunk documents to test batching
+    docs = single_chunk_docs(15, tmp_path)
 
-    # Track batch sizes by patching the insert method
     batch_sizes = []
-
-    async def mock_async_add(self, nodes, **kwargs):
-        batch_sizes.append(len(nodes))
-        return self.add(nodes, **kwargs)
-
-    # Patch the async_add method at the class level
-    with patch.object(
-        adapter.lancedb_vector_store.__class__, "async_add", mock_async_add
-    ):
+    with spy_upsert_batch_sizes(adapter, batch_sizes):
         # Add with small batch size to force batching
-        await adapter.add_chunks_with_embeddings(large_doc_records, nodes_batch_size=5)
+        await adapter.add_chunks_with_embeddings(docs, rows_batch_size=5)
 
-    # Verify batching behavior
-    # With 15 chunks and batch_size=5, we expect 3 batches of 5 chunks each
-    expected_batch_sizes = [5, 5, 5]
-    assert batch_sizes == expected_batch_sizes, (
-        f"Expected batch sizes {expected_batch_sizes}, got {batch_sizes}"
-    )
+    # With 15 rows and batch_size=5, we expect 3 batches of 5 rows each
+    assert batch_sizes == [5, 5, 5]
 
     # Verify all chunks were added
     count = await adapter.count_records()
@@ -834,36 +892,15 @@ async def test_batching_functionality_with_remainder(
 
     adapter = LanceDBAdapter(rag_config, fts_vector_store_config)
 
-    # Create a document with 17 chunks to test batching with remainder
-    large_doc_data = {
-        "large_doc": [
-            {"vector": [i * 0.1, i * 0.2], "text": f"Chunk {i} content"}
-            for i in range(17)  # 17 chunks to test batching with remainder
-        ]
-    }
+    docs = single_chunk_docs(17, tmp_path)
 
-    large_doc_records = dicts_to_indexable_docs(large_doc_data, tmp_path)
-
-    # Track batch sizes by patching the insert method
     batch_sizes = []
-
-    async def mock_async_add(self, nodes, **kwargs):
-        batch_sizes.append(len(nodes))
-        return self.add(nodes, **kwargs)
-
-    # Patch the async_add method at the class level
-    with patch.object(
-        adapter.lancedb_vector_store.__class__, "async_add", mock_async_add
-    ):
+    with spy_upsert_batch_sizes(adapter, batch_sizes):
         # Add with batch_size=7 to get 2 full batches + 1 remainder batch
-        await adapter.add_chunks_with_embeddings(large_doc_records, nodes_batch_size=7)
+        await adapter.add_chunks_with_embeddings(docs, rows_batch_size=7)
 
-    # Verify batching behavior
-    # With 17 chunks and batch_size=7, we expect 2 batches of 7 and 1 batch of 3
-    expected_batch_sizes = [7, 7, 3]
-    assert batch_sizes == expected_batch_sizes, (
-        f"Expected batch sizes {expected_batch_sizes}, got {batch_sizes}"
-    )
+    # With 17 rows and batch_size=7, we expect 2 batches of 7 and 1 batch of 3
+    assert batch_sizes == [7, 7, 3]
 
     # Verify all chunks were added
     count = await adapter.count_records()
@@ -877,62 +914,51 @@ async def test_batching_functionality_edge_cases(
     create_rag_config_factory,
     tmp_path,
 ):
-    """Test batching functionality edge cases (small batches, single batch)."""
+    """Test batching functionality edge cases (small batches, single batch, large document)."""
     rag_config = create_rag_config_factory(fts_vector_store_config, embedding_config)
 
     adapter = LanceDBAdapter(rag_config, fts_vector_store_config)
 
-    # Test 1: Single batch (3 chunks with batch_size=10)
-    small_doc_data = {
-        "small_doc": [
-            {"vector": [i * 0.1, i * 0.2], "text": f"Small chunk {i} content"}
-            for i in range(3)
-        ]
-    }
-
-    small_doc_records = dicts_to_indexable_docs(small_doc_data, tmp_path)
+    # Test 1: Single batch (3 rows with batch_size=10)
+    docs = single_chunk_docs(3, tmp_path)
 
-    # Track batch sizes by patching the insert method
     batch_sizes = []
+    with spy_upsert_batch_sizes(adapter, batch_sizes):
+        await adapter.add_chunks_with_embeddings(docs, rows_batch_size=10)
 
-    async def mock_async_add(self, nodes, **kwargs):
-        batch_sizes.append(len(nodes))
-        return self.add(nodes, **kwargs)
-
-    # Test single batch scenario
-    with patch.object(
-        adapter.lancedb_vector_store.__class__, "async_add", mock_async_add
-    ):
-        await adapter.add_chunks_with_embeddings(small_doc_records, nodes_batch_size=10)
-
-    # With 3 chunks and batch_size=10, we expect 1 batch of 3 chunks
-    expected_batch_sizes = [3]
-    assert batch_sizes == expected_batch_sizes, (
-        f"Expected batch sizes {expected_batch_sizes}, got {batch_sizes}"
-    )
-
-    # Verify all chunks were added
-    count = await adapter.count_records()
-    assert count == 3
-
-    # Test 2: Very small batches (batch_size=1)
-    batch_sizes.clear()  # Reset for next test
+    assert batch_sizes == [3]
+    assert await adapter.count_records() == 3
 
-    # Create new rag_config to get a fresh database
+    # Test 2: Very small batches (batch_size=1), on a fresh database
     rag_config2 = create_rag_config_factory(fts_vector_store_config, embedding_config)
     adapter2 = LanceDBAdapter(rag_config2, fts_vector_store_config)
 
-    with patch.object(
-        adapter2.lancedb_vector_store.__class__, "async_add", mock_async_add
-    ):
-        await adapter2.add_chunks_with_embeddings(small_doc_records, nodes_batch_size=1)
-
-    # With 3 chunks and batch_size=1, we expect 3 batches of 1 chunk each
-    expected_batch_sizes = [1, 1, 1]
-    assert batch_sizes == expected_batch_sizes, (
-        f"Expected batch sizes {expected_batch_sizes}, got {batch_sizes}"
+    batch_sizes = []
+    with spy_upsert_batch_sizes(adapter2, batch_sizes):
+        await adapter2.add_chunks_with_embeddings(docs, rows_batch_size=1)
+
+    assert batch_sizes == [1, 1, 1]
+
+    # Test 3: a document is never split across batches, even past the batch size
+    rag_config3 = create_rag_config_factory(fts_vector_store_config, embedding_config)
+    adapter3 = LanceDBAdapter(rag_config3, fts_vector_store_config)
+    large_doc = dicts_to_indexable_docs(
+        {
+            "large_doc": [
+                {"vector": [i * 0.1, i * 0.2], "text": f"Chunk {i} content"}
+                for i in range(15)
+            ]
+        },
+        tmp_path,
     )
 
+    batch_sizes = []
+    with spy_upsert_batch_sizes(adapter3, batch_sizes):
+        await adapter3.add_chunks_with_embeddings(large_doc, rows_batch_size=5)
+
+    assert batch_sizes == [15]
+    assert await adapter3.count_records() == 15
+
 
 @pytest.mark.asyncio
 async def test_get_nodes_by_ids_functionality(
@@ -1675,6 +1701,399 @@ def test_benchmark_add_chunks(
         )
 
 
+@pytest.mark.benchmark
+# Not actually paid, but we want the "must be run manually" feature of the paid marker as this is very slow
+@pytest.mark.paid
+def test_benchmark_add_chunks_columnar(
+    benchmark,
+    knn_vector_store_config,
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    """Benchmark the columnar ingestion path on a 100k chunk corpus."""
+
+    doc_count = 2000
+    chunks_per_doc = 50
+    vector_size = 1024
+    word_count = 200
+
+    random.seed(42)
+    benchmark_data = generate_benchmark_data(
+        doc_count, chunks_per_doc, vector_size, word_count, tmp_path
+    )
+
+    rag_config = create_rag_config_factory(knn_vector_store_config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, knn_vector_store_config)
+
+    def add_chunks():
+        return asyncio.run(adapter.add_chunks_with_embeddings(benchmark_data))
+
+    benchmark.pedantic(add_chunks, rounds=1, iterations=1)
+    stats = benchmark.stats.stats
+
+    final_count = asyncio.run(adapter.count_records())
+    assert final_count == doc_count * chunks_per_doc
+
+    chunks_per_second = (doc_count * chunks_per_doc) / stats.max
+    print(f"add_chunks_with_embeddings: {chunks_per_second:.0f} chunks/s")
+
+
+@pytest.mark.asyncio
+async def test_add_chunks_with_embeddings_writes_large_batches(
+    fts_vector_store_config,
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    """Rows are accumulated across documents and written in batches of at least rows_batch_size."""
+    rag_config = create_rag_config_factory(fts_vector_store_config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, fts_vector_store_config)
+
+    docs = dicts_to_indexable_docs(
+        {
+            f"doc_{d}": [
+                {"vector": [float(d), float(i)], "text": f"Doc {d} chunk {i}"}
+                for i in range(3)
+            ]
+            for d in range(5)
+        },
+        tmp_path,
+    )
+
+    batch_sizes = []
+    original_upsert = adapter._upsert_rows
+
+    async def spy_upsert(columns):
+        batch_sizes.append(len(columns["id"]))
+        return await original_upsert(columns)
+
+    with patch.object(adapter, "_upsert_rows", side_effect=spy_upsert):
+        await adapter.add_chunks_with_embeddings(docs, rows_batch_size=6)
+
+    # documents are not split across batches: 2 docs (6 rows), 2 docs (6 rows), 1 doc (3 rows)
+    assert batch_sizes == [6, 6, 3]
+    assert await adapter.count_records() == 15
+
+
+async def add_as_llama_index_nodes(
+    adapter: LanceDBAdapter, docs: list[DocumentWithChunksAndEmbeddings]
+) -> None:
+    """Reference write through llama_index TextNodes, as LanceDBVectorStore does natively."""
+    nodes = []
+    for doc in docs:
+        chunks_text = await doc.chunked_document.load_chunks_text()
+        for chunk_idx, (chunk_text, embedding) in enumerate(
+            zip(chunks_text, doc.embeddings)
+        ):
+            nodes.append(
+                convert_to_llama_index_node(
+                    document_id=doc.document_id,
+                    chunk_idx=chunk_idx,
+                    node_id=deterministic_chunk_id(doc.document_id, chunk_idx),
+                    text=chunk_text,
+                    vector=embedding.vector,
+                )
+            )
+    adapter.lancedb_vector_store.add(nodes)
+
+
+@pytest.mark.asyncio
+async def test_add_chunks_with_embeddings_matches_node_path(
+    hybrid_vector_store_config,
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    """The columnar path writes the same rows as llama_index does from TextNodes, and both can share a table."""
+    rag_config = create_rag_config_factory(hybrid_vector_store_config, embedding_config)
+    columnar_adapter = LanceDBAdapter(rag_config, hybrid_vector_store_config)
+
+    other_rag_config = create_rag_config_factory(
+        hybrid_vector_store_config, embedding_config
+    )
+    nodes_adapter = LanceDBAdapter(other_rag_config, hybrid_vector_store_config)
+
+    docs = dicts_to_indexable_docs(
+        {
+            "doc_a": [
+                {"vector": [1.0, 2.0], "text": "alpha chunk one"},
+                {"vector": [3.0, 4.0], "text": "alpha chunk two"},
+            ],
+        },
+        tmp_path,
+    )
+    await columnar_adapter.add_chunks_with_embeddings(docs)
+    await add_as_llama_index_nodes(nodes_adapter, docs)
+
+    def rows(adapter: LanceDBAdapter):
+        table = adapter.lancedb_vector_store.table
+        assert table is not None
+        return sorted(table.to_arrow().to_pylist(), key=lambda row: row["id"])
+
+    assert columnar_adapter.lancedb_vector_store.table.schema.equals(
+        nodes_adapter.lancedb_vector_store.table.schema
+    )
+    assert rows(columnar_adapter) == rows(nodes_adapter)
+
+    # nodes read back through llama_index are identical
+    columnar_nodes = columnar_adapter.lancedb_vector_store.get_nodes()
+    nodes_nodes = nodes_adapter.lancedb_vector_store.get_nodes()
+    assert sorted(n.node_id for n in columnar_nodes) == sorted(
+        n.node_id for n in nodes_nodes
+    )
+
+    # llama_index can append nodes to a table created by the columnar path
+    more_docs = dicts_to_indexable_docs(
+        {"doc_b": [{"vector": [5.0, 6.0], "text": "beta chunk one"}]}, tmp_path
+    )
+    await add_as_llama_index_nodes(columnar_adapter, more_docs)
+    assert await columnar_adapter.count_records() == 3
+
+    results = await columnar_adapter.search(
+        VectorStoreQuery(query_string="alpha", query_embedding=[1.0, 2.0])
+    )
+    assert {r.document_id for r in results} >= {"doc_a"}
+
+
+@pytest.mark.asyncio
+async def test_add_chunks_with_embeddings_upserts_partially_indexed_document(
+    fts_vector_store_config,
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    """A partially indexed document is completed without duplicating the existing chunks."""
+    rag_config = create_rag_config_factory(fts_vector_store_config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, fts_vector_store_config)
+
+    full_doc = dicts_to_indexable_docs(
+        {
+            "doc_a": [
+                {"vector": [float(i), 1.0], "text": f"chunk {i}"} for i in range(4)
+            ]
+        },
+        tmp_path,
+    )
+    partial_doc = dicts_to_indexable_docs(
+        {
+            "doc_a": [
+                {"vector": [float(i), 1.0], "text": f"chunk {i}"} for i in range(2)
+            ]
+        },
+        tmp_path,
+    )
+
+    await adapter.add_chunks_with_embeddings(partial_doc)
+    assert await adapter.count_records() == 2
+
+    await adapter.add_chunks_with_embeddings(full_doc)
+    assert await adapter.count_records() == 4
+
+    ids = sorted(n.node_id for n in adapter.lancedb_vector_store.get_nodes())
+    assert ids == sorted(deterministic_chunk_id("doc_a", i) for i in range(4))
+
+
+@pytest.mark.asyncio
+async def test_ensure_vector_index_noop_without_index_config(
+    knn_vector_store_config,
+    fts_vector_store_config,
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    """No index is built when the config does not ask for one, or for FTS stores."""
+    for config in [knn_vector_store_config, fts_vector_store_config]:
+        rag_config = create_rag_config_factory(config, embedding_config)
+        adapter = LanceDBAdapter(rag_config, config)
+        assert adapter.vector_index_properties is None
+
+        # before the table exists
+        await adapter.ensure_vector_index()
+
+        await adapter.add_chunks_with_embeddings(random_vector_docs(20, 8, tmp_path))
+        await adapter.ensure_vector_index()
+
+        table = adapter.lancedb_vector_store.table
+        assert not [i for i in table.list_indices() if i.columns == ["vector"]]
+
+
+@pytest.mark.asyncio
+async def test_ensure_vector_index_builds_once_threshold_crossed(
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    random.seed(0)
+    config = vector_store_config_with_index(min_rows=300)
+    rag_config = create_rag_config_factory(config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, config)
+
+    docs = random_vector_docs(400, 16, tmp_path)
+
+    # below the threshold: still exact search
+    await adapter.add_chunks_with_embeddings(docs[:200])
+    await adapter.ensure_vector_index()
+    table = adapter.lancedb_vector_store.table
+    assert not [i for i in table.list_indices() if i.columns == ["vector"]]
+
+    # crossing the threshold builds the index
+    await adapter.add_chunks_with_embeddings(docs[200:])
+    await adapter.ensure_vector_index()
+    indices = [i for i in table.list_indices() if i.columns == ["vector"]]
+    assert len(indices) == 1
+    stats = table.index_stats(indices[0].name)
+    assert stats.num_indexed_rows == 400
+    assert stats.index_type == "IVF_HNSW_SQ"
+
+    # search still works through the index
+    query_vector = docs[0].embeddings[0].vector
+    results = await adapter.search(VectorStoreQuery(query_embedding=query_vector))
+    assert results[0].document_id == "doc_0"
+
+
+@pytest.mark.asyncio
+async def test_ensure_vector_index_adds_new_rows_incrementally(
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    random.seed(1)
+    config = vector_store_config_with_index(min_rows=100)
+    rag_config = create_rag_config_factory(config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, config)
+    docs = random_vector_docs(400, 16, tmp_path)
+
+    await adapter.add_chunks_with_embeddings(docs[:200])
+    await adapter.ensure_vector_index()
+
+    with patch(
+        "kiln_ai.adapters.vector_store.lancedb_adapter.lancedb_create_vector_index"
+    ) as mock_create_index:
+        await adapter.add_chunks_with_embeddings(docs[200:])
+        await adapter.ensure_vector_index()
+        # new rows are merged into the existing index, it is not retrained
+        mock_create_index.assert_not_called()
+
+    table = adapter.lancedb_vector_store.table
+    indices = [i for i in table.list_indices() if i.columns == ["vector"]]
+    stats = table.index_stats(indices[0].name)
+    assert stats.num_indexed_rows == 400
+    assert stats.num_unindexed_rows == 0
+
+    # nothing left to index: no-op
+    with patch.object(table, "optimize") as mock_optimize:
+        await adapter.ensure_vector_index()
+        mock_optimize.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ensure_vector_index_rebuilds_when_index_type_changes(
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    random.seed(2)
+    config = vector_store_config_with_index(min_rows=100)
+    rag_config = create_rag_config_factory(config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, config)
+    await adapter.add_chunks_with_embeddings(random_vector_docs(200, 16, tmp_path))
+    await adapter.ensure_vector_index()
+
+    # same table, reconfigured for a different index type
+    new_config = vector_store_config_with_index(
+        min_rows=100, index_type=LanceDBVectorIndexType.IVF_PQ
+    )
+    new_adapter = LanceDBAdapter(rag_config, new_config)
+    await new_adapter.ensure_vector_index()
+
+    table = new_adapter.lancedb_vector_store.table
+    indices = [i for i in table.list_indices() if i.columns == ["vector"]]
+    assert len(indices) == 1
+    assert table.index_stats(indices[0].name).index_type == "IVF_PQ"
+
+
+@pytest.mark.asyncio
+async def test_refine_factor_passed_to_vector_store(
+    embedding_config,
+    create_rag_config_factory,
+):
+    config = vector_store_config_with_index(min_rows=100, refine_factor=5)
+    rag_config = create_rag_config_factory(config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, config)
+    assert adapter.lancedb_vector_store.refine_factor == 5
+    assert adapter.lancedb_vector_store.nprobes == 10
+
+
+@pytest.mark.benchmark
+# Not actually paid, but we want the "must be run manually" feature of the paid marker as this is very slow
+@pytest.mark.paid
+@pytest.mark.parametrize(
+    "index_type,refine_factor",
+    [
+        (LanceDBVectorIndexType.IVF_HNSW_SQ, None),
+        (LanceDBVectorIndexType.IVF_PQ, None),
+        (LanceDBVectorIndexType.IVF_PQ, 10),
+    ],
+)
+def test_benchmark_vector_index_recall_and_latency(
+    index_type,
+    refine_factor,
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    """Measure recall@10 and query latency of the ANN index against exact search."""
+    random.seed(42)
+    doc_count = 50_000
+    dimensions = 256
+    query_count = 100
+    top_k = 10
+
+    config = vector_store_config_with_index(
+        min_rows=1,
+        index_type=index_type,
+        refine_factor=refine_factor,
+        num_partitions=64,
+    )
+    rag_config = create_rag_config_factory(config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, config)
+    asyncio.run(
+        adapter.add_chunks_with_embeddings(
+            random_vector_docs(doc_count, dimensions, tmp_path)
+        )
+    )
+    table = adapter.lancedb_vector_store.table
+    queries = [
+        [random.uniform(-1, 1) for _ in range(dimensions)] for _ in range(query_count)
+    ]
+
+    def timed_search(exact: bool) -> tuple[list[set[str]], float]:
+        results = []
+        start = time.perf_counter()
+        for query in queries:
+            search = table.search(query).limit(top_k).select(["id"])
+            if exact:
+                search = search.bypass_vector_index()
+            elif refine_factor is not None:
+                search = search.refine_factor(refine_factor)
+            results.append(set(search.nprobes(10).to_arrow()["id"].to_pylist()))
+        return results, (time.perf_counter() - start) / query_count
+
+    exact_results, exact_latency = timed_search(exact=True)
+    asyncio.run(adapter.ensure_vector_index())
+    ann_results, ann_latency = timed_search(exact=False)
+
+    recall = sum(len(exact & ann) for exact, ann in zip(exact_results, ann_results)) / (
+        top_k * query_count
+    )
+    print(
+        f"{index_type.value} refine={refine_factor}: recall@{top_k}={recall:.3f}, "
+        f"exact={exact_latency * 1000:.2f}ms, ann={ann_latency * 1000:.2f}ms"
+    )
+    assert ann_latency < exact_latency
+
+
 @pytest.mark.asyncio
 async def test_delete_nodes_not_in_set_basic_functionality(
     fts_vector_store_config,
@@ -1863,3 +2282,104 @@ async def test_delete_nodes_not_in_set_empty_table(
     # Verify count is still 0
     final_count = await adapter.count_records()
     assert final_count == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_nodes_not_in_set_tracks_membership_incrementally(
+    fts_vector_store_config,
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    """After the first reconciliation, membership is maintained without rescanning the table."""
+    rag_config = create_rag_config_factory(fts_vector_store_config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, fts_vector_store_config)
+
+    docs = dicts_to_indexable_docs(
+        {
+            "doc_a": [{"vector": [1.0, 1.0], "text": "alpha content"}],
+            "doc_b": [{"vector": [2.0, 2.0], "text": "beta content"}],
+        },
+        tmp_path,
+    )
+    await adapter.add_chunks_with_embeddings(docs)
+
+    # first reconciliation loads membership from the table
+    await adapter.delete_nodes_not_in_set({"doc_a", "doc_b"})
+    assert await adapter.indexed_document_ids() == {"doc_a", "doc_b"}
+
+    # documents added after the initial load are tracked without a rescan
+    new_docs = dicts_to_indexable_docs(
+        {"doc_c": [{"vector": [3.0, 3.0], "text": "gamma content"}]}, tmp_path
+    )
+    await adapter.add_chunks_with_embeddings(new_docs)
+    assert await adapter.indexed_document_ids() == {"doc_a", "doc_b", "doc_c"}
+
+    table = adapter.lancedb_vector_store.table
+    with patch.object(type(table), "search", side_effect=AssertionError("rescan")):
+        await adapter.delete_nodes_not_in_set({"doc_a"})
+
+    assert await adapter.count_records() == 1
+    assert await adapter.indexed_document_ids() == {"doc_a"}
+    remaining = get_all_nodes(adapter)
+    assert [node.document_id for node in remaining] == ["doc_a"]
+
+
+@pytest.mark.asyncio
+async def test_delete_nodes_not_in_set_document_ids_with_quotes(
+    fts_vector_store_config,
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    """Document ids are escaped when building the delete predicate."""
+    rag_config = create_rag_config_factory(fts_vector_store_config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, fts_vector_store_config)
+
+    docs = dicts_to_indexable_docs(
+        {
+            "doc'one": [{"vector": [1.0, 1.0], "text": "alpha content"}],
+            "doc_two": [{"vector": [2.0, 2.0], "text": "beta content"}],
+        },
+        tmp_path,
+    )
+    await adapter.add_chunks_with_embeddings(docs)
+
+    await adapter.delete_nodes_not_in_set({"doc_two"})
+
+    remaining = get_all_nodes(adapter)
+    assert [node.document_id for node in remaining] == ["doc_two"]
+
+
+@pytest.mark.asyncio
+async def test_delete_nodes_not_in_set_batches_delete_predicates(
+    fts_vector_store_config,
+    embedding_config,
+    create_rag_config_factory,
+    tmp_path,
+):
+    """Stale documents are deleted with one predicate per batch of document ids."""
+    rag_config = create_rag_config_factory(fts_vector_store_config, embedding_config)
+    adapter = LanceDBAdapter(rag_config, fts_vector_store_config)
+
+    docs = dicts_to_indexable_docs(
+        {
+            f"doc_{i}": [{"vector": [float(i), 1.0], "text": f"content {i}"}]
+            for i in range(5)
+        },
+        tmp_path,
+    )
+    await adapter.add_chunks_with_embeddings(docs)
+
+    table = adapter.lancedb_vector_store.table
+    with (
+        patch(
+            "kiln_ai.adapters.vector_store.lancedb_adapter.DELETE_PREDICATE_BATCH_SIZE",
+            2,
+        ),
+        patch.object(type(table), "delete", autospec=True) as mock_delete,
+    ):
+        await adapter.delete_nodes_not_in_set({"doc_0"})
+
+    assert mock_delete.call_count == 2
+    assert await adapter.indexed_document_ids() == {"doc_0"}
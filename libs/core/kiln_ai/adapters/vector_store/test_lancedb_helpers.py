@@ -1,17 +1,29 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+from llama_index.core.vector_stores.utils import (
+    metadata_dict_to_node,
+    node_to_metadata_dict,
+)
 
 from kiln_ai.adapters.vector_store.lancedb_helpers import (
     convert_to_llama_index_node,
     deterministic_chunk_id,
     lancedb_construct_from_config,
+    lancedb_create_vector_index,
+    lancedb_in_predicate,
+    lancedb_index_matches_properties,
+    lancedb_node_metadata,
+    lancedb_table_schema,
     store_type_to_lancedb_query_type,
 )
 from kiln_ai.datamodel.vector_store import (
     LanceDBConfigFTSProperties,
     LanceDBConfigHybridProperties,
     LanceDBConfigVectorProperties,
+    LanceDBVectorIndexMetric,
+    LanceDBVectorIndexProperties,
+    LanceDBVectorIndexType,
     VectorStoreConfig,
     VectorStoreType,
 )
@@ -172,3 +184,138 @@ def test_deterministic_chunk_id_uses_uuid_v5_namespace():
 
     # call again to ensure the same value is returned
     assert deterministic_chunk_id(doc_id, idx) == expected
+
+
+def test_lancedb_in_predicate_quotes_values():
+    assert (
+        lancedb_in_predicate("metadata.kiln_doc_id", ["a", "b"])
+        == "metadata.kiln_doc_id IN ('a', 'b')"
+    )
+
+
+def test_lancedb_in_predicate_escapes_single_quotes():
+    assert lancedb_in_predicate("id", ["it's"]) == "id IN ('it''s')"
+
+
+@pytest.mark.parametrize(
+    "document_id,chunk_idx,text",
+    [
+        ("doc-123", 0, "hello world"),
+        ("doc'with\"quotes", 7, "unicode ✓ text\nwith newlines"),
+        ("", 0, ""),
+    ],
+)
+def test_lancedb_node_metadata_matches_llama_index(document_id, chunk_idx, text):
+    node_id = deterministic_chunk_id(document_id, chunk_idx)
+    node = convert_to_llama_index_node(
+        document_id=document_id,
+        chunk_idx=chunk_idx,
+        node_id=node_id,
+        text=text,
+        vector=[0.1, 0.2],
+    )
+    expected = node_to_metadata_dict(node, remove_text=False, flat_metadata=True)
+
+    assert (
+        lancedb_node_metadata(
+            document_id=document_id,
+            chunk_idx=chunk_idx,
+            node_id=node_id,
+            text=text,
+        )
+        == expected
+    )
+
+    # and round trips back to an equivalent node
+    restored = metadata_dict_to_node(expected)
+    assert restored.node_id == node_id
+    assert restored.get_content() == text
+    assert restored.ref_doc_id == document_id
+
+
+def test_lancedb_table_schema_uses_store_columns():
+    store = MagicMock(
+        vector_column_name="embedding", text_key="body", doc_id_key="source_id"
+    )
+    schema = lancedb_table_schema(store, vector_dimensions=3)
+
+    assert schema.names == ["id", "source_id", "embedding", "body", "metadata"]
+    assert schema.field("embedding").type.list_size == 3
+
+
+def test_lancedb_table_schema_requires_columns():
+    store = MagicMock(vector_column_name=None, text_key="text", doc_id_key="doc_id")
+    with pytest.raises(ValueError, match="must be set"):
+        lancedb_table_schema(store, vector_dimensions=3)
+
+
+@pytest.mark.parametrize(
+    "index_type,expected",
+    [
+        (LanceDBVectorIndexType.IVF_PQ, "IVF_PQ"),
+        (LanceDBVectorIndexType.IVF_HNSW_SQ, "IVF_HNSW_SQ"),
+        (LanceDBVectorIndexType.IVF_HNSW_PQ, "IVF_HNSW_PQ"),
+    ],
+)
+def test_lancedb_create_vector_index(index_type, expected):
+    table = MagicMock()
+    lancedb_create_vector_index(
+        table,
+        "vector",
+        LanceDBVectorIndexProperties(
+            index_type=index_type,
+            metric=LanceDBVectorIndexMetric.COSINE,
+            min_rows=100,
+            num_partitions=16,
+        ),
+    )
+    table.create_index.assert_called_once_with(
+        metric="cosine",
+        vector_column_name="vector",
+        index_type=expected,
+        replace=True,
+        num_partitions=16,
+    )
+
+
+def test_lancedb_construct_from_config_includes_refine_factor():
+    cfg = _make_config(VectorStoreType.LANCE_DB_HYBRID, nprobes=7)
+    cfg.properties["refine_factor"] = 4
+    with patch(
+        "kiln_ai.adapters.vector_store.lancedb_helpers.LanceDBVectorStore",
+        new=_FakeLanceDBVectorStore,
+    ):
+        result = lancedb_construct_from_config(vector_store_config=cfg, uri="memory://")
+
+    assert result.kwargs["refine_factor"] == 4
+    assert result.kwargs["nprobes"] == 7
+
+
+def test_lancedb_construct_from_config_omits_refine_factor_when_not_set():
+    cfg = _make_config(VectorStoreType.LANCE_DB_VECTOR, nprobes=7)
+    with patch(
+        "kiln_ai.adapters.vector_store.lancedb_helpers.LanceDBVectorStore",
+        new=_FakeLanceDBVectorStore,
+    ):
+        result = lancedb_construct_from_config(vector_store_config=cfg, uri="memory://")
+
+    assert "refine_factor" not in result.kwargs
+
+
+@pytest.mark.parametrize(
+    "index_type,distance_type,expected",
+    [
+        ("IVF_HNSW_SQ", "l2", True),
+        ("IVF_HNSW_SQ", None, True),
+        ("IVF_HNSW_SQ", "cosine", False),
+        ("IVF_PQ", "l2", False),
+    ],
+)
+def test_lancedb_index_matches_properties(index_type, distance_type, expected):
+    stats = MagicMock(index_type=index_type, distance_type=distance_type)
+    properties = LanceDBVectorIndexProperties(
+        index_type=LanceDBVectorIndexType.IVF_HNSW_SQ,
+        metric=LanceDBVectorIndexMetric.L2,
+        min_rows=1,
+    )
+    assert lancedb_index_matches_properties(stats, properties) is expected
@@ -31,6 +31,7 @@ from typing_extensions import Annotated, Self
 from kiln_ai.datamodel.model_cache import ModelCache
 from kiln_ai.utils.config import Config
 from kiln_ai.utils.formatting import snake_case
+from kiln_ai.utils.git_sync_protocols import record_written_path
 from kiln_ai.utils.mime_type import guess_extension
 
 
@@ -235,6 +236,7 @@ class KilnAttachmentModel(BaseModel):
             filename = f"{filename_prefix}_{filename}"
         target_path = dest_folder / filename
         shutil.copy(self.input_path, target_path)
+        record_written_path(target_path)
         return target_path
 
     @classmethod
@@ -505,6 +507,7 @@ class KilnBaseModel(BaseModel):
         )
         with open(path, "w", encoding="utf-8") as file:
             file.write(json_data)
+        record_written_path(path)
         # save the path so even if something like name changes, the file doesn't move
         self.path = path
         # We could save, but invalidating will trigger load on next use.
@@ -518,6 +521,7 @@ class KilnBaseModel(BaseModel):
         if dir_path is None:
             raise ValueError("Cannot delete model because path is not set")
         shutil.rmtree(dir_path)
+        record_written_path(dir_path)
         ModelCache.shared().invalidate(self.path)
         self.path = None
 
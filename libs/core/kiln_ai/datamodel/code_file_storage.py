@@ -10,12 +10,15 @@ This module is that single, shared mechanism, called from each model's thin
 before-validator / wrap-serializer. It is also the ONE audited place for path
 containment: each caller passes a fixed, bare filename (a module constant), and
 the file is only ever `<folder-from-context>/<filename>` — no traversal, no
-absolute paths, and never an import/exec of the file. stdlib-only.
+absolute paths, and never an import/exec of the file. stdlib-only, apart from
+recording the write for git sync.
 """
 
 from pathlib import Path, PurePosixPath, PureWindowsPath
 from typing import Any
 
+from kiln_ai.utils.git_sync_protocols import record_written_path
+
 
 def _require_bare_filename(filename: str) -> None:
     """Guard the containment invariant: `filename` must be a bare filename.
@@ -139,6 +142,7 @@ def write_code_to_sibling_file(
         # are persisted, save is byte-idempotent, and the round-trip is
         # byte-for-byte (functional spec §1.1 / §2.1), cross-platform.
         (dest / filename).write_bytes(code.encode("utf-8"))
+        record_written_path(dest / filename)
         # Copy-on-write: code lives in the sibling file, not the .kiln JSON.
         data = {key: value for key, value in data.items() if key != "code"}
     return data
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import re
 from enum import Enum
 from typing import Any
@@ -42,6 +44,8 @@ class LocalServerProperties(TypedDict, total=True):
     args: NotRequired[list[str]]
     env_vars: NotRequired[dict[str, str]]
     secret_env_var_keys: NotRequired[list[str]]
+    # The server keeps no state between calls, so its sessions can be shared by runs
+    stateless: NotRequired[bool]
     is_archived: bool
 
 
@@ -49,6 +53,8 @@ class RemoteServerProperties(TypedDict, total=True):
     server_url: str
     headers: NotRequired[dict[str, str]]
     secret_header_keys: NotRequired[list[str]]
+    # The server keeps no state between calls, so its sessions can be shared by runs
+    stateless: NotRequired[bool]
     is_archived: bool
 
 
@@ -156,6 +162,13 @@ class ExternalToolServer(KilnParentedModel):
         if parsed_url.scheme not in ["http", "https"]:
             raise ValueError("Server URL must start with http:// or https://")
 
+    @classmethod
+    def check_stateless(cls, properties: dict) -> None:
+        """Validate the optional stateless flag"""
+        stateless = properties.get("stateless", None)
+        if stateless is not None and not isinstance(stateless, bool):
+            raise ValueError("stateless must be a boolean")
+
     @classmethod
     def check_headers(cls, headers: dict) -> None:
         """Validate Headers"""
@@ -252,6 +265,7 @@ class ExternalToolServer(KilnParentedModel):
                         "Server URL is required to connect to a remote MCP server"
                     )
                 ExternalToolServer.check_server_url(server_url)
+                ExternalToolServer.check_stateless(properties)
 
             case ToolServerType.local_mcp:
                 command = properties.get("command", None)
@@ -271,6 +285,7 @@ class ExternalToolServer(KilnParentedModel):
                         raise ValueError(
                             "arguments must be a list to start a local MCP server"
                         )
+                ExternalToolServer.check_stateless(properties)
 
             case ToolServerType.kiln_task:
                 tool_name_validator(properties.get("name", ""))
@@ -398,6 +413,17 @@ class ExternalToolServer(KilnParentedModel):
 
         return secrets, missing_secrets
 
+    def connection_fingerprint(self) -> str:
+        """
+        A hash of the properties and secret values used to connect to the server.
+        Changes when either is edited, so cached connections can be replaced.
+        """
+        secrets, _ = self.retrieve_secrets()
+        connection = {"properties": self.properties, "secrets": secrets}
+        return hashlib.sha256(
+            json.dumps(connection, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
     def _save_secrets(self) -> None:
         """
         Save unsaved secrets to the configuration system.
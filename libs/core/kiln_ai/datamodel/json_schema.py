@@ -1,5 +1,7 @@
 import json
 import re
+import threading
+from collections import OrderedDict
 from copy import deepcopy
 from typing import Annotated, Any, Dict
 
@@ -53,9 +55,7 @@ def validate_schema(
     Raises:
         jsonschema.exceptions.ValidationError: If validation fails
     """
-    schema = schema_from_json_str(schema_str, require_object=require_object)
-    v = jsonschema.Draft202012Validator(schema)
-    v.validate(instance)
+    validator_for_schema(schema_str, require_object=require_object).validate(instance)
 
 
 def validate_schema_with_value_error(
@@ -77,11 +77,108 @@ def validate_schema_with_value_error(
     try:
         validate_schema(instance, schema_str, require_object=require_object)
     except jsonschema.exceptions.ValidationError as e:
-        msg = f"The error from the schema check was: {e.message}. The JSON was: \n```json\n{instance}\n```"
-        if error_prefix:
-            msg = f"{error_prefix} {msg}"
+        raise _validation_value_error(instance, e, error_prefix) from e
 
-        raise ValueError(msg) from e
+
+# Enough for every task, tool and eval schema in a typical project
+VALIDATOR_CACHE_MAX_SIZE = 256
+
+
+class _ValidatorCache:
+    """A bounded LRU of compiled validators, keyed by schema text. Safe to share between threads."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._validators: OrderedDict[
+            tuple[str, bool], jsonschema.Draft202012Validator
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, schema_str: str, require_object: bool
+    ) -> jsonschema.Draft202012Validator:
+        key = (schema_str, require_object)
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+                return validator
+
+        # Compile outside the lock so a slow schema doesn't block lookups. Two threads
+        # may compile the same schema at once, which is harmless: the first one wins.
+        schema = schema_from_json_str(schema_str, require_object=require_object)
+        validator = jsonschema.Draft202012Validator(schema)
+
+        with self._lock:
+            validator = self._validators.setdefault(key, validator)
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.max_size:
+                self._validators.popitem(last=False)
+        return validator
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._validators)
+
+
+_validator_cache = _ValidatorCache(VALIDATOR_CACHE_MAX_SIZE)
+
+
+def validator_for_schema(
+    schema_str: str, require_object: bool = True
+) -> jsonschema.Draft202012Validator:
+    """Get a compiled validator for a JSON schema string.
+
+    Validators are kept in a process-wide LRU cache keyed by the schema text, so a
+    schema is only parsed and checked once however many times it's used. Compiled
+    validators are immutable and safe to use from multiple threads.
+
+    Args:
+        schema_str: JSON schema string to compile
+
+    Returns:
+        A validator for the schema
+
+    Raises:
+        ValueError: If the schema is invalid
+    """
+    return _validator_cache.get(schema_str, require_object)
+
+
+def validate_with_value_error(
+    instance: Any,
+    validator: jsonschema.Draft202012Validator,
+    error_prefix: str | None = None,
+) -> None:
+    """Validate an instance with a compiled validator and raise a ValueError if it doesn't match.
+
+    Args:
+        instance: Instance to validate
+        validator: Compiled validator, from validator_for_schema
+        error_prefix: Error message prefix to include in the ValueError
+
+    Raises:
+        ValueError: If the instance does not match the schema
+    """
+    try:
+        validator.validate(instance)
+    except jsonschema.exceptions.ValidationError as e:
+        raise _validation_value_error(instance, e, error_prefix) from e
+
+
+def _validation_value_error(
+    instance: Any,
+    error: jsonschema.exceptions.ValidationError,
+    error_prefix: str | None,
+) -> ValueError:
+    msg = f"The error from the schema check was: {error.message}. The JSON was: \n```json\n{instance}\n```"
+    if error_prefix:
+        msg = f"{error_prefix} {msg}"
+    return ValueError(msg)
 
 
 def schema_from_json_str(v: str, require_object: bool = True) -> Dict:
@@ -32,6 +32,9 @@ class ModelCache:
     def __init__(self):
         # Store both the model and the modified time of the cached file contents
         self.model_cache: Dict[Path, Tuple[KilnBaseModel, int]] = {}
+        # Incremented on every invalidation (saves and deletes invalidate), so indexes
+        # over model files can tell when something may have changed in this process
+        self.generation = 0
         self._enabled = self._check_timestamp_granularity()
         if not self._enabled:
             warnings.warn(
@@ -45,6 +48,11 @@ class ModelCache:
             cls._shared_instance = cls()
         return cls._shared_instance
 
+    @property
+    def enabled(self) -> bool:
+        """Whether file mtimes are fine-grained enough to detect changes, and caching is on."""
+        return self._enabled
+
     def _is_cache_valid(self, path: Path, cached_mtime_ns: int) -> bool:
         try:
             current_mtime_ns = path.stat().st_mtime_ns
@@ -100,6 +108,7 @@ class ModelCache:
         self.model_cache[path] = (model, mtime_ns)
 
     def invalidate(self, path: Path):
+        self.generation += 1
         if path in self.model_cache:
             del self.model_cache[path]
 
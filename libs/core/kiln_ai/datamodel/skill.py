@@ -7,6 +7,7 @@ import yaml
 from pydantic import Field
 
 from kiln_ai.datamodel.basemodel import KilnParentedModel
+from kiln_ai.utils.git_sync_protocols import record_written_path
 from kiln_ai.utils.validation import SkillNameString
 
 if TYPE_CHECKING:
@@ -127,6 +128,7 @@ class Skill(KilnParentedModel):
         ).rstrip("\n")
         content = f"---\n{frontmatter}\n---\n\n{body}"
         self.skill_md_path().write_text(content, encoding="utf-8")
+        record_written_path(self.skill_md_path())
         self.references_dir().mkdir(exist_ok=True)
         self.assets_dir().mkdir(exist_ok=True)
 
@@ -23,6 +23,7 @@ from kiln_ai.datamodel.basemodel import (
 )
 from kiln_ai.datamodel.model_cache import ModelCache
 from kiln_ai.datamodel.run_config import KilnAgentRunConfigProperties
+from kiln_ai.utils.git_sync_protocols import track_written_paths
 
 
 @pytest.fixture
@@ -362,6 +363,18 @@ def test_delete_dir(tmp_path):
     assert model.path is None
 
 
+def test_save_and_delete_record_written_paths(tmp_path):
+    file_path = tmp_path / "model_dir" / "test.kiln"
+    model = KilnBaseModel(path=file_path)
+    with track_written_paths() as written:
+        model.save_to_file()
+    assert written == {file_path}
+
+    with track_written_paths() as written:
+        model.delete()
+    assert written == {file_path.parent}
+
+
 def test_delete_no_path():
     # Test deleting with no path
     model = KilnBaseModel()
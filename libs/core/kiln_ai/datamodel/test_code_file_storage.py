@@ -13,6 +13,7 @@ from kiln_ai.datamodel.code_file_storage import (
     read_code_from_sibling_file,
     write_code_to_sibling_file,
 )
+from kiln_ai.utils.git_sync_protocols import track_written_paths
 
 FILENAME = "tool.py"
 KILN_FILENAME = "code_tool.kiln"
@@ -113,6 +114,11 @@ class TestWriteCodeToSiblingFile:
         assert "code" not in result
         assert result["name"] == "My Tool"
 
+    def test_records_the_written_file(self, tmp_path):
+        with track_written_paths() as written:
+            _save({"code": CODE}, {"save_attachments": True, "dest_path": tmp_path})
+        assert written == {tmp_path / FILENAME}
+
     def test_writes_code_verbatim(self, tmp_path):
         weird = "def run():\n\treturn 'é中'  # unicode + tab\n"
         _save(
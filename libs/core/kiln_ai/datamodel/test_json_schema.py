@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import jsonschema
 import pytest
@@ -6,6 +7,7 @@ from pydantic import BaseModel
 
 from kiln_ai.datamodel.json_schema import (
     JsonObjectSchema,
+    _ValidatorCache,
     close_object_schemas,
     schema_from_json_str,
     single_string_field_name,
@@ -13,6 +15,8 @@ from kiln_ai.datamodel.json_schema import (
     strip_numeric_bounds,
     validate_schema,
     validate_schema_with_value_error,
+    validate_with_value_error,
+    validator_for_schema,
 )
 
 
@@ -106,6 +110,88 @@ def test_validate_schema_content_with_value_error():
         validate_schema_with_value_error(o, json_joke_schema, "PREFIX")
 
 
+def test_validator_for_schema_is_cached():
+    validator = validator_for_schema(json_joke_schema)
+    assert validator_for_schema(json_joke_schema) is validator
+    # require_object is part of the key, as it changes what counts as a valid schema
+    assert validator_for_schema(json_joke_schema, require_object=False) is not validator
+
+    validator.validate({"setup": "asdf", "punchline": "asdf", "rating": 1})
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        validator.validate({"setup": "asdf"})
+
+
+def test_validator_for_schema_invalid_schema():
+    with pytest.raises(ValueError):
+        validator_for_schema("{asdf")
+    with pytest.raises(ValueError):
+        validator_for_schema('{"type": "string"}')
+    assert validator_for_schema('{"type": "string"}', require_object=False)
+
+
+def test_validator_cache_evicts_least_recently_used():
+    cache = _ValidatorCache(max_size=2)
+    schema_a = '{"type": "object", "properties": {"a": {"type": "string"}}}'
+    schema_b = '{"type": "object", "properties": {"b": {"type": "string"}}}'
+    schema_c = '{"type": "object", "properties": {"c": {"type": "string"}}}'
+
+    validator_a = cache.get(schema_a, True)
+    validator_b = cache.get(schema_b, True)
+    # touch a, so b is the least recently used
+    assert cache.get(schema_a, True) is validator_a
+    cache.get(schema_c, True)
+
+    assert len(cache) == 2
+    assert cache.get(schema_a, True) is validator_a
+    assert cache.get(schema_b, True) is not validator_b
+
+
+def test_validator_cache_does_not_cache_invalid_schemas():
+    cache = _ValidatorCache(max_size=2)
+    with pytest.raises(ValueError):
+        cache.get("{asdf", True)
+    assert len(cache) == 0
+
+
+def test_validator_cache_concurrent_access():
+    cache = _ValidatorCache(max_size=8)
+    schemas = [
+        json.dumps(
+            {
+                "type": "object",
+                "properties": {f"field_{i}": {"type": "integer"}},
+                "required": [f"field_{i}"],
+            }
+        )
+        for i in range(16)
+    ]
+
+    def validate(i: int) -> None:
+        schema_index = i % len(schemas)
+        validator = cache.get(schemas[schema_index], True)
+        validator.validate({f"field_{schema_index}": i})
+        with pytest.raises(jsonschema.exceptions.ValidationError):
+            validator.validate({f"field_{schema_index}": "not an int"})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(validate, range(2000)))
+
+    assert len(cache) == 8
+
+
+def test_validate_with_value_error():
+    validator = validator_for_schema(json_joke_schema)
+    validate_with_value_error(
+        {"setup": "asdf", "punchline": "asdf", "rating": 1}, validator, "PREFIX"
+    )
+    with pytest.raises(
+        ValueError, match="PREFIX The error from the schema check was: "
+    ):
+        validate_with_value_error({"setup": "asdf"}, validator, "PREFIX")
+    with pytest.raises(ValueError, match=r"^The error from the schema check was: "):
+        validate_with_value_error({"setup": "asdf"}, validator)
+
+
 json_triangle_schema = """{
   "type": "object",
   "properties": {
@@ -507,3 +593,28 @@ def test_close_object_schemas_strict_no_properties():
 )
 def test_single_string_field_name(schema, expected):
     assert single_string_field_name(schema) == expected
+
+
+@pytest.mark.benchmark
+def test_benchmark_validate_schema(benchmark):
+    instance = {"setup": "asdf", "punchline": "asdf", "rating": 1}
+    iterations = 2000
+
+    # Before: parse and compile the schema on every validation
+    start = benchmark._timer()
+    for _ in range(iterations):
+        schema = schema_from_json_str(json_joke_schema)
+        jsonschema.Draft202012Validator(schema).validate(instance)
+    uncached_time = benchmark._timer() - start
+
+    # After: the compiled validator comes from the cache
+    start = benchmark._timer()
+    for _ in range(iterations):
+        validate_schema(instance, json_joke_schema)
+    cached_time = benchmark._timer() - start
+
+    # Skipping the parse and compile should be much faster. Loose bound for CI.
+    if cached_time * 2 > uncached_time:
+        pytest.fail(
+            f"Cached validation took {cached_time:.4f}s, uncached {uncached_time:.4f}s, expected at least 2x faster"
+        )
@@ -59,10 +59,12 @@ def test_invalidate_model(model_cache, test_path):
     mtime = test_path.stat().st_mtime
 
     model_cache.set_model(test_path, model, mtime)
+    generation = model_cache.generation
     model_cache.invalidate(test_path)
     cached_model = model_cache.get_model(test_path, KilnModelTest)
 
     assert cached_model is None
+    assert model_cache.generation > generation
 
 
 def test_clear_cache(model_cache, test_path):
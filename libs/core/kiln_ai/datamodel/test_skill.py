@@ -5,6 +5,7 @@ from pydantic import ValidationError
 
 from kiln_ai.datamodel.project import Project
 from kiln_ai.datamodel.skill import Skill, _parse_skill_md_body
+from kiln_ai.utils.git_sync_protocols import track_written_paths
 
 
 @pytest.fixture
@@ -356,6 +357,12 @@ class TestReferences:
         assert skill.references_dir().is_dir()
         assert skill.assets_dir().is_dir()
 
+    def test_save_skill_md_records_the_written_file(self, mock_project):
+        skill = save_skill_with_body(mock_project)
+        with track_written_paths() as written:
+            skill.save_skill_md("New body")
+        assert written == {skill.skill_md_path()}
+
     def test_read_reference(self, mock_project):
         skill = save_skill_with_body(mock_project)
         ref_dir = skill.references_dir()
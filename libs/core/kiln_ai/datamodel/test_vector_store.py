@@ -4,7 +4,12 @@ import pytest
 from pydantic import ValidationError
 
 from kiln_ai.datamodel.project import Project
-from kiln_ai.datamodel.vector_store import VectorStoreConfig, VectorStoreType
+from kiln_ai.datamodel.vector_store import (
+    LanceDBVectorIndexMetric,
+    LanceDBVectorIndexType,
+    VectorStoreConfig,
+    VectorStoreType,
+)
 
 
 @pytest.fixture
@@ -189,6 +194,62 @@ class TestVectorStoreConfig:
                 properties=mock_vector_store_vector_config_properties,
             )
 
+    def test_vector_store_config_with_vector_index(
+        self, mock_vector_store_hybrid_config_properties, tmp_path
+    ):
+        """Vector index and refine properties are optional, validated, and persisted."""
+        mock_vector_store_hybrid_config_properties["refine_factor"] = 5
+        mock_vector_store_hybrid_config_properties["vector_index"] = {
+            "index_type": "ivf_pq",
+            "metric": "cosine",
+            "min_rows": 10_000,
+            "num_partitions": 128,
+            "num_sub_vectors": 32,
+        }
+        config = VectorStoreConfig(
+            name="test_store",
+            store_type=VectorStoreType.LANCE_DB_HYBRID,
+            properties=mock_vector_store_hybrid_config_properties,
+            path=tmp_path / "vector_store_config.kiln",
+        )
+
+        vector_index = config.lancedb_hybrid_properties["vector_index"]
+        assert vector_index["index_type"] == LanceDBVectorIndexType.IVF_PQ
+        assert vector_index["metric"] == LanceDBVectorIndexMetric.COSINE
+        assert vector_index["min_rows"] == 10_000
+        assert config.lancedb_hybrid_properties["refine_factor"] == 5
+
+        config.save_to_file()
+        loaded = VectorStoreConfig.load_from_file(config.path)
+        assert loaded.properties == config.properties
+
+    def test_vector_store_config_invalid_vector_index(
+        self, mock_vector_store_vector_config_properties
+    ):
+        mock_vector_store_vector_config_properties["vector_index"] = {
+            "index_type": "not_an_index",
+            "metric": "l2",
+            "min_rows": 10,
+        }
+        with pytest.raises(ValidationError, match="index_type"):
+            VectorStoreConfig(
+                name="test_store",
+                store_type=VectorStoreType.LANCE_DB_VECTOR,
+                properties=mock_vector_store_vector_config_properties,
+            )
+
+        mock_vector_store_vector_config_properties["vector_index"] = {
+            "index_type": "ivf_pq",
+            "metric": "l2",
+            "min_rows": 0,
+        }
+        with pytest.raises(ValidationError, match="min_rows"):
+            VectorStoreConfig(
+                name="test_store",
+                store_type=VectorStoreType.LANCE_DB_VECTOR,
+                properties=mock_vector_store_vector_config_properties,
+            )
+
     def test_lancedb_vector_properties(
         self, mock_vector_store_vector_config_properties
     ):
@@ -2,7 +2,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Literal, Union
 
 from pydantic import Field, PositiveInt, ValidationInfo, model_validator
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 from kiln_ai.datamodel.basemodel import FilenameString, KilnParentedModel
 
@@ -18,6 +18,33 @@ class VectorStoreType(str, Enum):
     LANCE_DB_VECTOR = "lancedb_vector"
 
 
+class LanceDBVectorIndexType(str, Enum):
+    """The type of approximate nearest neighbor (ANN) index built over the vectors."""
+
+    IVF_PQ = "ivf_pq"
+    IVF_HNSW_SQ = "ivf_hnsw_sq"
+    IVF_HNSW_PQ = "ivf_hnsw_pq"
+
+
+class LanceDBVectorIndexMetric(str, Enum):
+    """The distance metric the ANN index is built for."""
+
+    L2 = "l2"
+    COSINE = "cosine"
+    DOT = "dot"
+
+
+class LanceDBVectorIndexProperties(TypedDict, total=True):
+    index_type: LanceDBVectorIndexType
+    metric: LanceDBVectorIndexMetric
+    # the index is only built once the table has at least this many rows, below that
+    # an exact (brute force) search is fast enough and more accurate
+    min_rows: PositiveInt
+    # when not set, LanceDB picks defaults from the row count and vector dimensions
+    num_partitions: NotRequired[PositiveInt]
+    num_sub_vectors: NotRequired[PositiveInt]
+
+
 class LanceDBConfigFTSProperties(TypedDict, total=True):
     store_type: Literal[VectorStoreType.LANCE_DB_FTS]
     similarity_top_k: PositiveInt
@@ -35,6 +62,10 @@ class LanceDBConfigVectorProperties(TypedDict, total=True):
     text_key: str
     doc_id_key: str
     nprobes: PositiveInt
+    # re-rank this multiple of the results with exact distances after an ANN search
+    refine_factor: NotRequired[PositiveInt]
+    # no ANN index is built when not set (exact search)
+    vector_index: NotRequired[LanceDBVectorIndexProperties]
 
 
 class LanceDBConfigHybridProperties(LanceDBConfigVectorProperties, total=True):
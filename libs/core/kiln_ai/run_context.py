@@ -27,3 +27,19 @@ def clear_agent_run_id() -> None:
 
 def generate_agent_run_id() -> str:
     return f"run_{uuid.uuid4().hex[:16]}"
+
+
+# The eval an agent run is part of, so work can be shared across the eval's items
+_eval_id: ContextVar[str | None] = ContextVar("eval_id", default=None)
+
+
+def get_eval_id() -> str | None:
+    return _eval_id.get()
+
+
+def set_eval_id(eval_id: str) -> None:
+    _eval_id.set(eval_id)
+
+
+def clear_eval_id() -> None:
+    _eval_id.set(None)
@@ -6,9 +6,12 @@ import pytest
 
 from kiln_ai.run_context import (
     clear_agent_run_id,
+    clear_eval_id,
     generate_agent_run_id,
     get_agent_run_id,
+    get_eval_id,
     set_agent_run_id,
+    set_eval_id,
 )
 
 
@@ -109,3 +112,17 @@ class TestAdapterRunContext:
     async def _read_context_var(self) -> str | None:
         """Helper to read the context var in an async context."""
         return get_agent_run_id()
+
+
+class TestEvalContext:
+    """Unit tests for the eval ID context."""
+
+    def test_set_get_and_clear(self):
+        clear_eval_id()
+        assert get_eval_id() is None
+
+        set_eval_id("eval_123")
+        assert get_eval_id() == "eval_123"
+
+        clear_eval_id()
+        assert get_eval_id() is None
@@ -56,6 +56,10 @@ class KilnToolInterface(ABC):
     This ensures consistency across all tool implementations.
     """
 
+    # Whether calls with the same arguments return the same result, so results can be
+    # reused from the tool result cache. Only set for tools without side effects.
+    cacheable: bool = False
+
     @abstractmethod
     async def run(
         self, context: ToolCallContext | None = None, **kwargs
@@ -15,6 +15,8 @@ class AddTool(KilnTool):
     Demonstrates how to use the KilnTool base class.
     """
 
+    cacheable = True
+
     def __init__(self):
         parameters_schema = {
             "type": "object",
@@ -50,6 +52,8 @@ class SubtractTool(KilnTool):
     A concrete tool that subtracts two numbers.
     """
 
+    cacheable = True
+
     def __init__(self):
         parameters_schema = {
             "type": "object",
@@ -88,6 +92,8 @@ class MultiplyTool(KilnTool):
     A concrete tool that multiplies two numbers together.
     """
 
+    cacheable = True
+
     def __init__(self):
         parameters_schema = {
             "type": "object",
@@ -123,6 +129,8 @@ class DivideTool(KilnTool):
     A concrete tool that divides two numbers.
     """
 
+    cacheable = True
+
     def __init__(self):
         parameters_schema = {
             "type": "object",
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from kiln_ai.datamodel import Task
+from kiln_ai.datamodel.model_cache import ModelCache
+from kiln_ai.datamodel.run_config import as_kiln_agent_run_config
+from kiln_ai.datamodel.task import TaskRunConfig
+from kiln_ai.datamodel.tool_id import (
+    KILN_TASK_TOOL_ID_PREFIX,
+    MCP_LOCAL_TOOL_ID_PREFIX,
+    MCP_REMOTE_TOOL_ID_PREFIX,
+    kiln_task_server_id_from_tool_id,
+    mcp_server_and_tool_name_from_id,
+)
+from kiln_ai.utils.config import Config
+
+if TYPE_CHECKING:
+    from kiln_ai.adapters.model_adapters.base_adapter import BaseAdapter
+
+# Path to its mtime in ns, None if it didn't exist
+_Signature = tuple[tuple[Path, int | None], ...]
+
+
+@dataclass
+class _CachedAdapter:
+    adapter: BaseAdapter
+    signature: _Signature
+
+
+class KilnTaskAdapterCache:
+    """
+    Reuses the adapters KilnTaskTool runs its sub-task with.
+
+    Building an adapter loads the run config's skills, builds its prompt builder and
+    resolves its provider, and the adapter resolves its tools on first use. An agent
+    can call a sub-task tool many times per run, so adapters are cached per (task,
+    run config, allow_saving) and shared by every call, including concurrent ones:
+    adapters keep no per-invocation state.
+
+    A cached adapter is rebuilt when any file it was built from changes, judged by
+    mtime like the ModelCache: the task, run config, saved prompt, skills, tool
+    servers and the settings file. Without fine-grained mtimes (ModelCache disabled)
+    changes can't be detected, so nothing is cached.
+    """
+
+    _shared_instance: KilnTaskAdapterCache | None = None
+
+    def __init__(self):
+        self._entries: dict[tuple[Path, str, bool], _CachedAdapter] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> KilnTaskAdapterCache:
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        cls._shared_instance = None
+
+    def adapter_for(
+        self, task: Task, run_config: TaskRunConfig, allow_saving: bool
+    ) -> BaseAdapter:
+        if (
+            not ModelCache.shared().enabled
+            or task.path is None
+            or run_config.id is None
+        ):
+            return _build_adapter(task, run_config, allow_saving)
+
+        key = (task.path, run_config.id, allow_saving)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and _signature_is_current(cached.signature):
+            return cached.adapter
+
+        adapter = _build_adapter(task, run_config, allow_saving)
+        signature = _signature(_source_paths(task, run_config, adapter))
+        with self._lock:
+            self._entries[key] = _CachedAdapter(adapter=adapter, signature=signature)
+        return adapter
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _build_adapter(
+    task: Task, run_config: TaskRunConfig, allow_saving: bool
+) -> BaseAdapter:
+    # These imports are here to avoid circular chains
+    from kiln_ai.adapters.adapter_registry import (
+        adapter_for_task,
+        load_skills_for_task,
+    )
+    from kiln_ai.adapters.model_adapters.base_adapter import AdapterConfig
+
+    skills = load_skills_for_task(task, run_config.run_config_properties)
+    return adapter_for_task(
+        task,
+        run_config_properties=run_config.run_config_properties,
+        base_adapter_config=AdapterConfig(
+            allow_saving=allow_saving,
+            default_tags=["tool_call"],
+            skills=skills,
+            task_run_config_id=run_config.id,
+        ),
+    )
+
+
+def _source_paths(
+    task: Task, run_config: TaskRunConfig, adapter: BaseAdapter
+) -> list[Path]:
+    from kiln_ai.adapters.prompt_builders import (
+        FineTunePromptBuilder,
+        SavedPromptBuilder,
+    )
+
+    paths = [Path(Config.settings_path(create=False))]
+    for model in [task, run_config]:
+        if model.path is not None:
+            paths.append(model.path)
+
+    prompt_builder = getattr(adapter, "prompt_builder", None)
+    if isinstance(prompt_builder, SavedPromptBuilder):
+        paths.append(prompt_builder.prompt_model.path)
+    elif isinstance(prompt_builder, FineTunePromptBuilder):
+        paths.append(prompt_builder.fine_tune_model.path)
+
+    skills = adapter.base_adapter_config.skills or {}
+    paths.extend(skill.path for skill in skills.values() if skill.path is not None)
+
+    server_ids = _tool_server_ids(run_config)
+    project = task.parent_project()
+    if server_ids and project is not None:
+        paths.extend(
+            server.path
+            for server in project.external_tool_servers(readonly=True)
+            if server.id in server_ids and server.path is not None
+        )
+    return [path for path in paths if path is not None]
+
+
+def _tool_server_ids(run_config: TaskRunConfig) -> set[str]:
+    if run_config.run_config_properties.type != "kiln_agent":
+        return set()
+    tools_config = as_kiln_agent_run_config(
+        run_config.run_config_properties
+    ).tools_config
+    if tools_config is None or tools_config.tools is None:
+        return set()
+
+    server_ids: set[str] = set()
+    for tool_id in tools_config.tools:
+        if tool_id.startswith((MCP_REMOTE_TOOL_ID_PREFIX, MCP_LOCAL_TOOL_ID_PREFIX)):
+            server_ids.add(mcp_server_and_tool_name_from_id(tool_id)[0])
+        elif tool_id.startswith(KILN_TASK_TOOL_ID_PREFIX):
+            server_ids.add(kiln_task_server_id_from_tool_id(tool_id))
+    return server_ids
+
+
+def _signature(paths: list[Path]) -> _Signature:
+    signature: list[tuple[Path, int | None]] = []
+    for path in paths:
+        try:
+            signature.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            signature.append((path, None))
+    return tuple(signature)
+
+
+def _signature_is_current(signature: _Signature) -> bool:
+    return _signature([path for path, _ in signature]) == signature
@@ -12,6 +12,7 @@ from kiln_ai.tools.base_tool import (
     ToolCallDefinition,
     ToolCallResult,
 )
+from kiln_ai.tools.kiln_task_adapter_cache import KilnTaskAdapterCache
 from kiln_ai.utils.project_utils import project_from_id
 
 
@@ -26,6 +27,9 @@ class KilnTaskTool(KilnToolInterface):
     This tool loads a task by ID and executes it using the specified run configuration.
     """
 
+    # Each call is a new (possibly saved) run of a model, so results are never reused
+    cacheable = False
+
     def __init__(
         self,
         project_id: str,
@@ -81,25 +85,9 @@ class KilnTaskTool(KilnToolInterface):
             else:
                 raise ValueError(f"Input not found in kwargs: {kwargs}")
 
-        # These imports are here to avoid circular chains
-        from kiln_ai.adapters.adapter_registry import (
-            adapter_for_task,
-            load_skills_for_task,
-        )
-        from kiln_ai.adapters.model_adapters.base_adapter import AdapterConfig
-
-        skills = load_skills_for_task(
-            self._task, self._run_config.run_config_properties
-        )
-        adapter = adapter_for_task(
-            self._task,
-            run_config_properties=self._run_config.run_config_properties,
-            base_adapter_config=AdapterConfig(
-                allow_saving=context.allow_saving,
-                default_tags=["tool_call"],
-                skills=skills,
-                task_run_config_id=self._run_config_id,
-            ),
+        # Reused across calls, rebuilt when the task or run config changes on disk
+        adapter = KilnTaskAdapterCache.shared().adapter_for(
+            self._task, self._run_config, allow_saving=context.allow_saving
         )
         task_run = await adapter.invoke(
             input,
@@ -1,7 +1,7 @@
 import json
 from typing import Any
 
-from mcp.types import CallToolResult, TextContent
+from mcp.types import CallToolResult, ListToolsResult, TextContent
 from mcp.types import Tool as MCPTool
 
 from kiln_ai.datamodel.external_tool_server import ExternalToolServer
@@ -14,6 +14,7 @@ from kiln_ai.tools.base_tool import (
     ToolCallResult,
 )
 from kiln_ai.tools.mcp_session_manager import MCPSessionManager
+from kiln_ai.tools.mcp_tool_catalog import MCPToolCatalog
 
 
 class MCPServerTool(KilnToolInterface):
@@ -130,28 +131,38 @@ class MCPServerTool(KilnToolInterface):
 
         tool = await self._get_tool(self._name)
         self._tool = tool
+        # Only results of tools the server declares read only and idempotent are reused
+        self.cacheable = bool(
+            tool.annotations
+            and tool.annotations.readOnlyHint
+            and tool.annotations.idempotentHint
+        )
         self._description = tool.description or "N/A"
         self._parameters_schema = tool.inputSchema or {
             "type": "object",
             "properties": {},
         }
 
-    #  Get the MCP Tool from the server
+    #  Get the MCP Tool from the server's (cached) tool list
     async def _get_tool(self, tool_name: str) -> MCPTool:
+        tools = await MCPToolCatalog.shared().tools(
+            self._tool_server_model, self._list_tools
+        )
+        tool = tools.get(tool_name)
+        if tool is None:
+            raise ValueError(f"Tool {tool_name} not found")
+        return tool
+
+    async def _list_tools(self) -> ListToolsResult:
         session_id = get_agent_run_id()
 
         if session_id:
             session = await MCPSessionManager.shared().get_or_create_session(
                 self._tool_server_model, session_id
             )
-            tools = await session.list_tools()
-        else:
-            async with MCPSessionManager.shared().mcp_client(
-                self._tool_server_model
-            ) as session:
-                tools = await session.list_tools()
-
-        tool = next((tool for tool in tools.tools if tool.name == tool_name), None)
-        if tool is None:
-            raise ValueError(f"Tool {tool_name} not found")
-        return tool
+            return await session.list_tools()
+
+        async with MCPSessionManager.shared().mcp_client(
+            self._tool_server_model
+        ) as session:
+            return await session.list_tools()
@@ -4,18 +4,26 @@ import os
 import subprocess
 import sys
 import tempfile
+import weakref
 from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import timedelta
 from typing import AsyncGenerator, NoReturn
 
 import httpx
 from mcp import StdioServerParameters
-from mcp.client.session import ClientSession
+from mcp.client.session import ClientSession, MessageHandlerFnT
 from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.shared.exceptions import McpError
+from mcp.types import ServerNotification, ToolListChangedNotification
 
 from kiln_ai.datamodel.external_tool_server import ExternalToolServer, ToolServerType
+from kiln_ai.tools.mcp_session_pool import (
+    MCPSessionPool,
+    MCPSessionPoolSettings,
+    PooledMCPSession,
+)
+from kiln_ai.tools.mcp_tool_catalog import MCPToolCatalog
 from kiln_ai.utils.config import Config
 from kiln_ai.utils.exhaustive_error import raise_exhaustive_enum_error
 
@@ -35,6 +43,12 @@ class KilnMCPError(RuntimeError):
 class MCPSessionManager:
     """
     This class is a singleton that manages MCP sessions for remote MCP servers.
+
+    Sessions are per agent run: a run's first tool call on a server opens a session,
+    and the session is closed when the run ends. Servers which declare themselves
+    stateless (the `stateless` property) instead lease sessions from a per-server
+    MCPSessionPool, so runs reuse and share warm sessions rather than starting a
+    process or handshake each time.
     """
 
     _shared_instance = None
@@ -44,6 +58,14 @@ class MCPSessionManager:
         # Session cache: key = "{server_id}::{session_id}" → (ClientSession, AsyncExitStack)
         self._session_cache: dict[str, tuple[ClientSession, AsyncExitStack]] = {}
         self._cache_lock = asyncio.Lock()
+        # Pools are bound to the event loop their sessions were opened on, then by server ID
+        self._pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, tuple[str, MCPSessionPool]]
+        ] = weakref.WeakKeyDictionary()
+        # Pooled sessions leased to a run: key = "{server_id}::{session_id}" → (pool, session)
+        self._leases: dict[str, tuple[MCPSessionPool, PooledMCPSession]] = {}
+        # Retiring pools, referenced until their idle sessions are closed
+        self._retiring: set[asyncio.Task[None]] = set()
 
     @classmethod
     def shared(cls):
@@ -90,6 +112,8 @@ class MCPSessionManager:
             RuntimeError: If connection to the server fails
         """
         cache_key = build_mcp_session_cache_key(tool_server.id, session_id)
+        if is_stateless_server(tool_server):
+            return await self._lease_pooled_session(tool_server, cache_key)
 
         async with self._cache_lock:
             if cache_key in self._session_cache:
@@ -123,6 +147,7 @@ class MCPSessionManager:
             session_id: The session ID to clean up
         """
         to_cleanup: list[tuple[str, AsyncExitStack]] = []
+        to_release: list[tuple[MCPSessionPool, PooledMCPSession]] = []
 
         async with self._cache_lock:
             keys_to_remove = [
@@ -133,6 +158,20 @@ class MCPSessionManager:
             for key in keys_to_remove:
                 _, exit_stack = self._session_cache.pop(key)
                 to_cleanup.append((key, exit_stack))
+            leases_to_remove = [
+                key
+                for key in self._leases
+                if parse_mcp_session_cache_session_id(key) == session_id
+            ]
+            for key in leases_to_remove:
+                to_release.append(self._leases.pop(key))
+
+        # Pooled sessions go back to their pool for the next run
+        for pool, pooled in to_release:
+            try:
+                await pool.release(pooled)
+            except Exception:
+                logger.warning("Error releasing pooled MCP session", exc_info=True)
 
         # Close outside the lock to avoid holding it during I/O.
         # LIFO order: each session leaves anyio cancel scopes open on this
@@ -144,6 +183,83 @@ class MCPSessionManager:
             except Exception:
                 logger.warning(f"Error closing MCP session {key}", exc_info=True)
 
+    async def prewarm_sessions(self, tool_servers: list[ExternalToolServer]) -> None:
+        """Open the pooled sessions of stateless servers ahead of their first run.
+
+        Failures are logged rather than raised, a server which can't be reached now
+        is retried when a run uses it.
+        """
+        for tool_server in tool_servers:
+            if not is_stateless_server(tool_server):
+                continue
+            try:
+                await self._pool_for(tool_server).prewarm()
+            except Exception as e:
+                logger.warning(
+                    f"Couldn't prewarm sessions for MCP server '{tool_server.name}': {e}"
+                )
+
+    async def close_pools(self) -> None:
+        """Close every pooled session on this event loop. Called on shutdown."""
+        async with self._cache_lock:
+            pools = self._pools.pop(asyncio.get_running_loop(), {})
+            self._leases = {
+                key: lease
+                for key, lease in self._leases.items()
+                if all(lease[0] is not pool for _, pool in pools.values())
+            }
+        for _, pool in pools.values():
+            await pool.close()
+
+    async def _lease_pooled_session(
+        self, tool_server: ExternalToolServer, cache_key: str
+    ) -> ClientSession:
+        async with self._cache_lock:
+            lease = self._leases.get(cache_key)
+            if lease is not None and lease[1].alive:
+                return lease[1].session
+            pool = self._pool_for(tool_server)
+
+        # Acquire outside the lock, it can wait on a full pool or open a session
+        pooled = await pool.acquire()
+
+        async with self._cache_lock:
+            existing = self._leases.get(cache_key)
+            replaced = existing is None or not existing[1].alive
+            if replaced:
+                self._leases[cache_key] = (pool, pooled)
+        if existing is None:
+            return pooled.session
+        if replaced:
+            # The run's previous session died, give its slot back to its pool
+            await existing[0].discard(existing[1])
+            return pooled.session
+        # Another call for this run leased one first, use theirs and return ours
+        await pool.release(pooled)
+        return existing[1].session
+
+    def _pool_for(self, tool_server: ExternalToolServer) -> MCPSessionPool:
+        if tool_server.id is None:
+            raise ValueError("Pooled MCP sessions require a saved tool server")
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        # Editing the server's connection properties or secrets replaces its pool
+        fingerprint = tool_server.connection_fingerprint()
+        existing = pools.get(tool_server.id)
+        if existing is not None and existing[0] == fingerprint:
+            return existing[1]
+        if existing is not None:
+            # Sessions leased from the old pool stay open until their runs end
+            task = asyncio.get_running_loop().create_task(existing[1].retire())
+            self._retiring.add(task)
+            task.add_done_callback(self._retiring.discard)
+
+        async def open_session() -> tuple[ClientSession, AsyncExitStack]:
+            return await self._create_cached_session(tool_server)
+
+        pool = MCPSessionPool(open_session, MCPSessionPoolSettings.from_config())
+        pools[tool_server.id] = (fingerprint, pool)
+        return pool
+
     async def _create_cached_session(
         self,
         tool_server: ExternalToolServer,
@@ -234,7 +350,11 @@ class MCPSessionManager:
                 streamablehttp_client(server_url, headers=headers)
             )
             session = await stack.enter_async_context(
-                ClientSession(read_stream, write_stream)
+                ClientSession(
+                    read_stream,
+                    write_stream,
+                    message_handler=tool_list_changed_handler(tool_server.id),
+                )
             )
             await session.initialize()
             return session
@@ -316,7 +436,12 @@ class MCPSessionManager:
                 stdio_client(server_params, errlog=err_log)
             )
             session = await stack.enter_async_context(
-                ClientSession(read, write, read_timeout_seconds=timedelta(seconds=30))
+                ClientSession(
+                    read,
+                    write,
+                    read_timeout_seconds=timedelta(seconds=30),
+                    message_handler=tool_list_changed_handler(tool_server.id),
+                )
             )
             await session.initialize()
             return session
@@ -369,7 +494,11 @@ class MCPSessionManager:
                 _,
             ):
                 # Create a session using the client streams
-                async with ClientSession(read_stream, write_stream) as session:
+                async with ClientSession(
+                    read_stream,
+                    write_stream,
+                    message_handler=tool_list_changed_handler(tool_server.id),
+                ) as session:
                     await session.initialize()
                     yield session
         except Exception as e:
@@ -399,7 +528,10 @@ class MCPSessionManager:
                     write,
                 ):
                     async with ClientSession(
-                        read, write, read_timeout_seconds=timedelta(seconds=30)
+                        read,
+                        write,
+                        read_timeout_seconds=timedelta(seconds=30),
+                        message_handler=tool_list_changed_handler(tool_server.id),
                     ) as session:
                         await session.initialize()
                         yield session
@@ -507,3 +639,24 @@ def build_mcp_session_cache_key(server_id: str | None, session_id: str) -> str:
 
 def parse_mcp_session_cache_session_id(cache_key: str) -> str:
     return cache_key.rsplit(MCP_SESSION_CACHE_KEY_DELIMITER, 1)[1]
+
+
+def is_stateless_server(tool_server: ExternalToolServer) -> bool:
+    """Whether the server declares it keeps no state between calls, so its sessions can be shared by runs."""
+    if tool_server.type not in (ToolServerType.remote_mcp, ToolServerType.local_mcp):
+        return False
+    return tool_server.properties.get("stateless", False) is True
+
+
+def tool_list_changed_handler(server_id: str | None) -> MessageHandlerFnT:
+    """A session message handler which drops the server's cached tool list when the server says it changed."""
+
+    async def handle(message) -> None:
+        if (
+            server_id is not None
+            and isinstance(message, ServerNotification)
+            and isinstance(message.root, ToolListChangedNotification)
+        ):
+            MCPToolCatalog.shared().invalidate(server_id)
+
+    return handle
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from mcp.client.session import ClientSession
+
+from kiln_ai.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+OpenSession = Callable[[], Awaitable[tuple[ClientSession, AsyncExitStack]]]
+
+# Seconds before an MCP server must answer a health check ping
+HEALTH_CHECK_TIMEOUT_SECONDS = 5
+
+
+@dataclass(frozen=True)
+class MCPSessionPoolSettings:
+    min_size: int = 1
+    max_size: int = 8
+    idle_timeout_seconds: int = 300
+    # Idle sessions are pinged before reuse if they haven't been checked this recently
+    health_check_interval_seconds: int = 30
+
+    @classmethod
+    def from_config(cls) -> MCPSessionPoolSettings:
+        config = Config.shared()
+        max_size = config.mcp_session_pool_max_size
+        return cls(
+            min_size=min(config.mcp_session_pool_min_size, max_size),
+            max_size=max_size,
+            idle_timeout_seconds=config.mcp_session_pool_idle_timeout_seconds,
+        )
+
+
+class PooledMCPSession:
+    """
+    An MCP session kept open by a task of its own.
+
+    The MCP transports hold anyio cancel scopes, which must be exited by the task
+    which entered them. A pooled session outlives the run that opened it and can be
+    closed by any other, so a dedicated task opens it, waits to be asked to close,
+    then closes it.
+    """
+
+    def __init__(self, open_session: OpenSession):
+        self._open_session = open_session
+        self._session: ClientSession | None = None
+        self._close_requested = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self.last_used = time.monotonic()
+        self.last_checked = time.monotonic()
+
+    @property
+    def session(self) -> ClientSession:
+        if self._session is None:
+            raise RuntimeError("The pooled MCP session isn't open")
+        return self._session
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self._session is not None
+            and self._task is not None
+            and not self._task.done()
+            and not self._close_requested.is_set()
+        )
+
+    async def open(self) -> None:
+        """Open the session, raising the connection error if it fails."""
+        ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._hold_open(ready))
+        try:
+            await ready
+        except asyncio.CancelledError:
+            # The session closes as soon as it's open, rather than being orphaned
+            self._close_requested.set()
+            raise
+
+    async def close(self) -> None:
+        self._close_requested.set()
+        if self._task is not None:
+            try:
+                await self._task
+            except Exception:
+                logger.warning("Error closing pooled MCP session", exc_info=True)
+
+    async def _hold_open(self, ready: asyncio.Future[None]) -> None:
+        try:
+            self._session, stack = await self._open_session()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            return
+        if not ready.done():
+            ready.set_result(None)
+        try:
+            await self._close_requested.wait()
+        finally:
+            await stack.aclose()
+
+
+class MCPSessionPool:
+    """
+    A pool of open sessions to one MCP server, for servers that declare themselves
+    stateless so sessions can be shared by agent runs.
+
+    A run leases a session for its duration and returns it when the run ends. Runs get
+    a session of their own while the pool has fewer than max_size open. Past that,
+    they share the leased session with the fewest runs on it (an MCP session handles
+    concurrent requests), so runs never wait on a full pool. The pool keeps at least
+    min_size sessions open (once warmed). Sessions idle for idle_timeout_seconds beyond
+    min_size are closed, and idle sessions are health checked with a ping before
+    they're handed to a run.
+    """
+
+    def __init__(self, open_session: OpenSession, settings: MCPSessionPoolSettings):
+        self._open_session = open_session
+        self.settings = settings
+        self._idle: list[PooledMCPSession] = []
+        # Leased sessions and the number of runs sharing each
+        self._leased: dict[PooledMCPSession, int] = {}
+        # Sessions open or opening, counted against max_size
+        self._size = 0
+        self._available = asyncio.Condition()
+        self._reaper: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    async def acquire(self) -> PooledMCPSession:
+        """Lease a healthy session: an idle one, a new one if the pool isn't full, or else a shared one."""
+        while True:
+            pooled: PooledMCPSession | None = None
+            shared = False
+            async with self._available:
+                dead = self._drop_dead_leases()
+                while True:
+                    if self._closed:
+                        raise RuntimeError("The MCP session pool is closed")
+                    if self._idle:
+                        # Most recently used first, it's the least likely to have gone stale
+                        pooled = self._idle.pop()
+                        self._leased[pooled] = 1
+                        break
+                    if self._size < self.settings.max_size:
+                        self._size += 1
+                        break
+                    if self._leased:
+                        pooled = min(self._leased, key=self._leased.__getitem__)
+                        self._leased[pooled] += 1
+                        shared = True
+                        break
+                    # Every slot is taken by a session still opening
+                    await self._available.wait()
+                    dead += self._drop_dead_leases()
+            for dead_session in dead:
+                await dead_session.close()
+
+            if pooled is None:
+                return await self._open_leased()
+            # A shared session is in use by another run, it was checked when leased
+            if shared or await self._healthy(pooled):
+                pooled.last_used = time.monotonic()
+                return pooled
+            await self.discard(pooled)
+
+    async def release(self, pooled: PooledMCPSession) -> None:
+        """Return a run's lease on a session to the pool."""
+        async with self._available:
+            runs = self._leased.get(pooled, 0)
+            if runs > 1 and pooled.alive:
+                # Still in use by other runs
+                self._leased[pooled] = runs - 1
+                return
+            reuse = pooled.alive and not self._closed
+            if reuse:
+                self._leased.pop(pooled, None)
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+                self._available.notify()
+        if not reuse:
+            await self.discard(pooled)
+            return
+        self._start_reaper()
+
+    async def discard(self, pooled: PooledMCPSession) -> None:
+        """Close a leased session which died or failed, freeing its slot in the pool."""
+        async with self._available:
+            if self._leased.pop(pooled, None) is not None:
+                self._size -= 1
+                self._available.notify()
+        await pooled.close()
+
+    async def prewarm(self) -> None:
+        """Open sessions until min_size are idle, so the first runs don't wait on startup."""
+        while True:
+            async with self._available:
+                if (
+                    self._closed
+                    or self._size >= self.settings.max_size
+                    or len(self._idle) >= self.settings.min_size
+                ):
+                    return
+                self._size += 1
+            pooled = await self._open_leased()
+            await self.release(pooled)
+
+    async def retire(self) -> None:
+        """Stop handing out sessions and close the idle ones. Leased sessions are closed as they're released."""
+        await self._close(include_leased=False)
+
+    async def close(self) -> None:
+        """Close every session, including leased ones. For shutdown."""
+        await self._close(include_leased=True)
+
+    async def _close(self, include_leased: bool) -> None:
+        async with self._available:
+            self._closed = True
+            sessions = list(self._idle)
+            self._size -= len(self._idle)
+            self._idle.clear()
+            if include_leased:
+                sessions += list(self._leased)
+                self._size -= len(self._leased)
+                self._leased.clear()
+            self._available.notify_all()
+        if self._reaper is not None:
+            self._reaper.cancel()
+        # Newest first, matching the LIFO teardown of per-run sessions
+        for pooled in reversed(sessions):
+            await pooled.close()
+
+    async def close_idle_sessions(self) -> None:
+        """Close sessions beyond min_size which have been idle for longer than the idle timeout."""
+        now = time.monotonic()
+        expired: list[PooledMCPSession] = []
+        async with self._available:
+            # Oldest first, they're at the front of the idle list
+            while (
+                len(self._idle) > self.settings.min_size
+                and now - self._idle[0].last_used > self.settings.idle_timeout_seconds
+            ):
+                expired.append(self._idle.pop(0))
+            self._size -= len(expired)
+            if expired:
+                self._available.notify(len(expired))
+        for pooled in expired:
+            await pooled.close()
+
+    async def _open_leased(self) -> PooledMCPSession:
+        # A slot must be reserved in _size before calling this
+        pooled = PooledMCPSession(self._open_session)
+        try:
+            await pooled.open()
+        except BaseException:
+            async with self._available:
+                self._size -= 1
+                self._available.notify()
+            raise
+        async with self._available:
+            self._leased[pooled] = 1
+            # Runs waiting on a full pool can share it now
+            self._available.notify_all()
+        return pooled
+
+    def _drop_dead_leases(self) -> list[PooledMCPSession]:
+        """Free the slots of leased sessions which died, rather than waiting for their runs to end.
+
+        Call with the lock held. The returned sessions still need closing.
+        """
+        dead = [pooled for pooled in self._leased if not pooled.alive]
+        for pooled in dead:
+            del self._leased[pooled]
+        self._size -= len(dead)
+        if dead:
+            self._available.notify(len(dead))
+        return dead
+
+    async def _healthy(self, pooled: PooledMCPSession) -> bool:
+        if not pooled.alive:
+            return False
+        now = time.monotonic()
+        if now - pooled.last_checked < self.settings.health_check_interval_seconds:
+            return True
+        try:
+            await asyncio.wait_for(
+                pooled.session.send_ping(), HEALTH_CHECK_TIMEOUT_SECONDS
+            )
+        except Exception:
+            logger.info("Discarding pooled MCP session which failed a health check")
+            return False
+        pooled.last_checked = now
+        return True
+
+    def _start_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle_sessions())
+
+    async def _reap_idle_sessions(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.settings.idle_timeout_seconds)
+            await self.close_idle_sessions()
+            async with self._available:
+                if len(self._idle) <= self.settings.min_size:
+                    # Nothing more can expire until a session is released again
+                    return
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from mcp.types import ListToolsResult
+from mcp.types import Tool as MCPTool
+
+from kiln_ai.datamodel.external_tool_server import ExternalToolServer
+from kiln_ai.utils.config import Config
+from kiln_ai.utils.lock import AsyncLockManager
+
+# Concurrent lookups for the same server wait for one list_tools call
+_list_locks = AsyncLockManager()
+
+
+@dataclass
+class _CatalogEntry:
+    # Connection properties and secrets the catalog was listed with, editing them lists the tools again
+    fingerprint: str
+    # time.monotonic() after which the entry is stale, None to never expire
+    expires_at: float | None
+    tools: dict[str, MCPTool]
+
+
+class MCPToolCatalog:
+    """
+    A per-server cache of the tools an MCP server lists, keyed by tool name.
+
+    Every MCPServerTool loads its description and schemas from its server's tool list,
+    so without the cache each tool of a run config costs a list_tools round trip per
+    run. Entries expire after mcp_tool_catalog_ttl_seconds, and are invalidated when
+    a server sends a tools/list_changed notification on any session the
+    MCPSessionManager has open.
+    """
+
+    _shared_instance: MCPToolCatalog | None = None
+
+    def __init__(self):
+        self._entries: dict[str, _CatalogEntry] = {}
+        # Bumped on invalidation, so a list started before it isn't stored after it
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> MCPToolCatalog:
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        cls._shared_instance = None
+
+    async def tools(
+        self,
+        tool_server: ExternalToolServer,
+        list_tools: Callable[[], Awaitable[ListToolsResult]],
+    ) -> dict[str, MCPTool]:
+        """
+        The server's tools by name, from the cache or from list_tools (stored for next time).
+        """
+        server_id = tool_server.id
+        if server_id is None:
+            # Unsaved servers can't be told apart, don't cache them
+            return _tools_by_name(await list_tools())
+
+        fingerprint = tool_server.connection_fingerprint()
+        async with _list_locks.acquire(server_id):
+            cached = self._get(server_id, fingerprint)
+            if cached is not None:
+                return cached
+
+            generation = self._generation(server_id)
+            tools = _tools_by_name(await list_tools())
+            ttl_seconds = _ttl_from_config()
+            with self._lock:
+                if self._generations.get(server_id, 0) == generation:
+                    self._entries[server_id] = _CatalogEntry(
+                        fingerprint=fingerprint,
+                        expires_at=time.monotonic() + ttl_seconds
+                        if ttl_seconds
+                        else None,
+                        tools=tools,
+                    )
+            return tools
+
+    def invalidate(self, server_id: str) -> None:
+        with self._lock:
+            self._entries.pop(server_id, None)
+            self._generations[server_id] = self._generations.get(server_id, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for server_id in list(self._entries):
+                self._generations[server_id] = self._generations.get(server_id, 0) + 1
+            self._entries.clear()
+
+    def _get(self, server_id: str, fingerprint: str) -> dict[str, MCPTool] | None:
+        with self._lock:
+            entry = self._entries.get(server_id)
+            if entry is None or entry.fingerprint != fingerprint:
+                return None
+            if entry.expires_at is not None and time.monotonic() > entry.expires_at:
+                del self._entries[server_id]
+                return None
+            return entry.tools
+
+    def _generation(self, server_id: str) -> int:
+        with self._lock:
+            return self._generations.get(server_id, 0)
+
+
+def _tools_by_name(result: ListToolsResult) -> dict[str, MCPTool]:
+    return {tool.name: tool for tool in result.tools}
+
+
+def _ttl_from_config() -> int:
+    return Config.shared().mcp_tool_catalog_ttl_seconds
@@ -0,0 +1,168 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from kiln_ai.adapters.model_adapters.litellm_adapter import LiteLlmAdapter
+from kiln_ai.datamodel import Project, Prompt, Task
+from kiln_ai.datamodel.datamodel_enums import ModelProviderName, StructuredOutputMode
+from kiln_ai.datamodel.external_tool_server import ExternalToolServer, ToolServerType
+from kiln_ai.datamodel.model_cache import ModelCache
+from kiln_ai.datamodel.run_config import (
+    KilnAgentRunConfigProperties,
+    ToolsRunConfig,
+)
+from kiln_ai.datamodel.task import TaskRunConfig
+from kiln_ai.tools.base_tool import ToolCallContext
+from kiln_ai.tools.kiln_task_adapter_cache import KilnTaskAdapterCache
+from kiln_ai.tools.kiln_task_tool import KilnTaskTool
+
+
+@pytest.fixture(autouse=True)
+def model_cache_enabled():
+    # The cache is off on filesystems with coarse mtimes, force it on
+    with patch.object(
+        ModelCache, "enabled", new_callable=PropertyMock, return_value=True
+    ):
+        yield
+
+
+@pytest.fixture
+def task(tmp_path):
+    project = Project(name="Test Project", path=tmp_path / "project.kiln")
+    project.save_to_file()
+    task = Task(name="Sub Task", instruction="Summarize the input.", parent=project)
+    task.save_to_file()
+    return task
+
+
+@pytest.fixture
+def prompt(task):
+    prompt = Prompt(name="Saved Prompt", prompt="Be brief.", parent=task)
+    prompt.save_to_file()
+    return prompt
+
+
+def make_run_config(task, prompt_id: str, tools: list[str] | None = None):
+    run_config = TaskRunConfig(
+        name="Run Config",
+        run_config_properties=KilnAgentRunConfigProperties(
+            model_name="gpt_4o_mini",
+            model_provider_name=ModelProviderName.openai,
+            prompt_id=prompt_id,
+            structured_output_mode=StructuredOutputMode.json_schema,
+            tools_config=ToolsRunConfig(tools=tools) if tools else None,
+        ),
+        parent=task,
+    )
+    run_config.save_to_file()
+    return run_config
+
+
+def touch(path: Path | None):
+    # Bump the mtime explicitly, saves within one mtime tick look unchanged
+    assert path is not None
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_adapters_are_reused(task, prompt):
+    run_config = make_run_config(task, f"id::{prompt.id}")
+    cache = KilnTaskAdapterCache()
+
+    adapter = cache.adapter_for(task, run_config, allow_saving=True)
+    assert isinstance(adapter, LiteLlmAdapter)
+    assert adapter.base_adapter_config.default_tags == ["tool_call"]
+    assert adapter.base_adapter_config.task_run_config_id == run_config.id
+    assert cache.adapter_for(task, run_config, allow_saving=True) is adapter
+
+    # allow_saving is part of the adapter config, so it's cached separately
+    unsaved = cache.adapter_for(task, run_config, allow_saving=False)
+    assert unsaved is not adapter
+    assert unsaved.base_adapter_config.allow_saving is False
+
+
+@pytest.mark.parametrize("changed", ["task", "run_config", "prompt", "tool_server"])
+def test_changed_files_rebuild_the_adapter(task, prompt, changed):
+    tool_server = ExternalToolServer(
+        name="search",
+        type=ToolServerType.remote_mcp,
+        properties={"server_url": "https://example.com/mcp", "is_archived": False},
+        parent=task.parent_project(),
+    )
+    tool_server.save_to_file()
+    run_config = make_run_config(
+        task, f"id::{prompt.id}", tools=[f"mcp::remote::{tool_server.id}::search"]
+    )
+    cache = KilnTaskAdapterCache()
+    adapter = cache.adapter_for(task, run_config, allow_saving=True)
+
+    touch(
+        {
+            "task": task,
+            "run_config": run_config,
+            "prompt": prompt,
+            "tool_server": tool_server,
+        }[changed].path
+    )
+    rebuilt = cache.adapter_for(task, run_config, allow_saving=True)
+    assert rebuilt is not adapter
+    assert cache.adapter_for(task, run_config, allow_saving=True) is rebuilt
+
+
+def test_deleted_prompt_rebuilds_the_adapter(task, prompt):
+    run_config = make_run_config(task, f"id::{prompt.id}")
+    cache = KilnTaskAdapterCache()
+    cache.adapter_for(task, run_config, allow_saving=True)
+
+    prompt.delete()
+    with pytest.raises(ValueError, match="Prompt ID not found"):
+        cache.adapter_for(task, run_config, allow_saving=True)
+
+
+def test_not_cached_without_fine_grained_mtimes(task):
+    run_config = make_run_config(task, "simple_prompt_builder")
+    cache = KilnTaskAdapterCache()
+    with patch.object(
+        ModelCache, "enabled", new_callable=PropertyMock, return_value=False
+    ):
+        first = cache.adapter_for(task, run_config, allow_saving=True)
+        assert cache.adapter_for(task, run_config, allow_saving=True) is not first
+
+
+async def test_tool_calls_share_the_adapter(task):
+    run_config = make_run_config(task, "simple_prompt_builder")
+    tool_server = ExternalToolServer(
+        name="sub_task",
+        type=ToolServerType.kiln_task,
+        properties={
+            "name": "sub_task",
+            "description": "Runs the sub task",
+            "task_id": task.id or "",
+            "run_config_id": run_config.id or "",
+            "is_archived": False,
+        },
+    )
+
+    adapters: list[LiteLlmAdapter] = []
+
+    async def invoke(self, input, input_source=None):
+        adapters.append(self)
+        task_run = MagicMock()
+        task_run.output.output = f"summary of {input}"
+        return task_run
+
+    with patch.object(LiteLlmAdapter, "invoke", invoke):
+        for i in range(3):
+            # A new tool instance per run, like tool_from_id
+            tool = KilnTaskTool("project_id", "kiln_task::server_id", tool_server)
+            tool._task = task
+            tool._run_config = run_config
+            result = await tool.run(
+                context=ToolCallContext(allow_saving=False), input=f"doc {i}"
+            )
+            assert result.output == f"summary of doc {i}"
+
+    assert len(adapters) == 3
+    assert adapters[0] is adapters[1] is adapters[2]
@@ -1,10 +1,11 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
 from kiln_ai.datamodel import Task
 from kiln_ai.datamodel.datamodel_enums import ModelProviderName, StructuredOutputMode
 from kiln_ai.datamodel.external_tool_server import ExternalToolServer, ToolServerType
+from kiln_ai.datamodel.model_cache import ModelCache
 from kiln_ai.datamodel.run_config import KilnAgentRunConfigProperties
 from kiln_ai.datamodel.task import TaskRunConfig
 from kiln_ai.datamodel.task_output import DataSource, DataSourceType
@@ -15,6 +16,15 @@ from kiln_ai.tools.kiln_task_tool import KilnTaskTool, KilnTaskToolResult
 class TestKilnTaskTool:
     """Test the KilnTaskTool class."""
 
+    @pytest.fixture(autouse=True)
+    def no_adapter_cache(self):
+        # The mock tasks aren't saved files, so build an adapter for every call
+        # (see test_kiln_task_adapter_cache.py for the cache)
+        with patch.object(
+            ModelCache, "enabled", new_callable=PropertyMock, return_value=False
+        ):
+            yield
+
     @pytest.fixture
     def mock_external_tool_server(self):
         """Create a mock ExternalToolServer for testing."""
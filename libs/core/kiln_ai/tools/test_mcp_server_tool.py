@@ -8,6 +8,7 @@ from mcp.types import (
     ListToolsResult,
     TextContent,
     Tool,
+    ToolAnnotations,
 )
 
 from kiln_ai.datamodel.external_tool_server import (
@@ -452,6 +453,48 @@ class TestMCPServerTool:
 
         assert await tool.description() == "N/A"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "annotations,cacheable",
+        [
+            (None, False),
+            (ToolAnnotations(readOnlyHint=False), False),
+            (ToolAnnotations(idempotentHint=True), False),
+            (ToolAnnotations(readOnlyHint=True), False),
+            (ToolAnnotations(readOnlyHint=True, idempotentHint=True), True),
+        ],
+    )
+    @patch("kiln_ai.tools.mcp_server_tool.get_agent_run_id", return_value=None)
+    @patch("kiln_ai.tools.mcp_server_tool.MCPSessionManager")
+    async def test_load_tool_properties_cacheable(
+        self, mock_session_manager, _mock_get_run_id, annotations, cacheable
+    ):
+        """Only tools the server declares read only have reusable results."""
+        mock_session = AsyncMock()
+        _configure_ephemeral_mcp_client_mock(mock_session_manager, mock_session)
+        tool_def = Tool(
+            name="test_tool",
+            inputSchema={"type": "object", "properties": {}},
+            annotations=annotations,
+        )
+        mock_session.list_tools = AsyncMock(
+            return_value=ListToolsResult(tools=[tool_def])
+        )
+
+        server = ExternalToolServer(
+            name="test_server",
+            type=ToolServerType.remote_mcp,
+            properties={
+                "server_url": "https://example.com",
+                "is_archived": False,
+            },
+        )
+        tool = MCPServerTool(server, "test_tool")
+        assert tool.cacheable is False
+
+        await tool._load_tool_properties()
+        assert tool.cacheable is cacheable
+
     @pytest.mark.asyncio
     @patch("kiln_ai.tools.mcp_server_tool.get_agent_run_id", return_value=None)
     @patch("kiln_ai.tools.mcp_server_tool.MCPSessionManager")
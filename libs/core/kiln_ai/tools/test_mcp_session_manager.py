@@ -1,5 +1,7 @@
+import asyncio
 import os
 import subprocess
+from contextlib import AsyncExitStack
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -17,6 +19,7 @@ from kiln_ai.tools.mcp_session_manager import (
     KilnMCPError,
     MCPSessionManager,
     build_mcp_session_cache_key,
+    is_stateless_server,
     parse_mcp_session_cache_session_id,
 )
 from kiln_ai.utils.config import MCP_SECRETS_KEY
@@ -1983,3 +1986,182 @@ class TestMCPSessionCacheKeyHelpers:
         self, cache_key, expected_session_id
     ):
         assert parse_mcp_session_cache_session_id(cache_key) == expected_session_id
+
+
+@pytest.fixture
+def stateless_tool_server():
+    server = ExternalToolServer(
+        name="stateless_server",
+        type=ToolServerType.remote_mcp,
+        description="Test server",
+        properties={
+            "server_url": "http://example.com/mcp",
+            "stateless": True,
+            "is_archived": False,
+        },
+    )
+    server.id = "stateless_server_id"
+    return server
+
+
+class TestPooledMCPSessions:
+    """Stateless servers lease sessions from a pool shared by runs."""
+
+    @pytest.fixture
+    def closed_sessions(self):
+        return []
+
+    @pytest.fixture
+    def opened_sessions(self, closed_sessions):
+        opened: list[AsyncMock] = []
+
+        async def create_session(tool_server):
+            session = AsyncMock()
+            stack = AsyncExitStack()
+            stack.callback(closed_sessions.append, session)
+            opened.append(session)
+            return session, stack
+
+        with patch.object(
+            MCPSessionManager, "_create_cached_session", side_effect=create_session
+        ):
+            yield opened
+
+    def test_is_stateless_server(
+        self, stateless_tool_server, cached_remote_tool_server
+    ):
+        assert is_stateless_server(stateless_tool_server)
+        assert not is_stateless_server(cached_remote_tool_server)
+
+    def test_stateless_must_be_a_bool(self):
+        with pytest.raises(ValidationError, match="stateless must be a boolean"):
+            ExternalToolServer(
+                name="test_server",
+                type=ToolServerType.local_mcp,
+                properties={
+                    "command": "python",
+                    "stateless": "yes",
+                    "is_archived": False,
+                },
+            )
+
+    async def test_runs_reuse_pooled_sessions(
+        self, stateless_tool_server, opened_sessions, closed_sessions
+    ):
+        manager = MCPSessionManager()
+
+        session = await manager.get_or_create_session(stateless_tool_server, "run_1")
+        # the same run keeps its session
+        assert (
+            await manager.get_or_create_session(stateless_tool_server, "run_1")
+            is session
+        )
+        # a concurrent run gets another
+        other = await manager.get_or_create_session(stateless_tool_server, "run_2")
+        assert other is not session
+        assert manager._session_cache == {}
+
+        # ending a run returns its session to the pool for the next run
+        await manager.cleanup_session("run_1")
+        assert closed_sessions == []
+        assert (
+            await manager.get_or_create_session(stateless_tool_server, "run_3")
+            is session
+        )
+        assert len(opened_sessions) == 2
+
+        await manager.close_pools()
+        assert len(closed_sessions) == 2
+
+    async def test_dead_lease_is_replaced_and_discarded(
+        self, stateless_tool_server, opened_sessions, closed_sessions
+    ):
+        manager = MCPSessionManager()
+        session = await manager.get_or_create_session(stateless_tool_server, "run_1")
+        pool, pooled = manager._leases["stateless_server_id::run_1"]
+
+        # the session closes mid run
+        pooled._close_requested.set()
+        await asyncio.sleep(0)
+        assert not pooled.alive
+
+        other = await manager.get_or_create_session(stateless_tool_server, "run_1")
+        assert other is not session
+        # the dead session no longer holds a slot in the pool
+        assert list(pool._leased) == [manager._leases["stateless_server_id::run_1"][1]]
+        assert pool._size == 1
+
+        await manager.cleanup_session("run_1")
+        await manager.close_pools()
+        assert closed_sessions == [session, other]
+
+    async def test_prewarm_sessions(
+        self, stateless_tool_server, cached_remote_tool_server, opened_sessions
+    ):
+        manager = MCPSessionManager()
+        await manager.prewarm_sessions(
+            [stateless_tool_server, cached_remote_tool_server]
+        )
+        # only the stateless server is pooled
+        assert len(opened_sessions) == 1
+
+        session = await manager.get_or_create_session(stateless_tool_server, "run_1")
+        assert session is opened_sessions[0]
+        await manager.close_pools()
+
+    async def test_prewarm_failures_are_logged(self, stateless_tool_server, caplog):
+        manager = MCPSessionManager()
+        with patch.object(
+            MCPSessionManager,
+            "_create_cached_session",
+            side_effect=RuntimeError("unreachable"),
+        ):
+            await manager.prewarm_sessions([stateless_tool_server])
+        assert "Couldn't prewarm sessions" in caplog.text
+        await manager.close_pools()
+
+    async def test_edited_server_gets_a_new_pool(
+        self, stateless_tool_server, opened_sessions, closed_sessions
+    ):
+        manager = MCPSessionManager()
+        session = await manager.get_or_create_session(stateless_tool_server, "run_1")
+
+        stateless_tool_server.properties["server_url"] = "http://example.com/other"
+        other = await manager.get_or_create_session(stateless_tool_server, "run_2")
+        assert other is not session
+
+        # the old pool retires in a task the manager holds on to until it's done
+        retiring = list(manager._retiring)
+        assert len(retiring) == 1
+        await asyncio.gather(*retiring)
+        await asyncio.sleep(0)
+        assert manager._retiring == set()
+
+        # the old pool's session stays open until its run ends
+        assert closed_sessions == []
+        await manager.cleanup_session("run_1")
+        assert closed_sessions == [session]
+        await manager.close_pools()
+
+    async def test_edited_secret_gets_a_new_pool(
+        self, stateless_tool_server, opened_sessions
+    ):
+        manager = MCPSessionManager()
+        with patch.object(
+            ExternalToolServer,
+            "retrieve_secrets",
+            return_value=({"Authorization": "Bearer old"}, []),
+        ):
+            session = await manager.get_or_create_session(
+                stateless_tool_server, "run_1"
+            )
+        with patch.object(
+            ExternalToolServer,
+            "retrieve_secrets",
+            return_value=({"Authorization": "Bearer new"}, []),
+        ):
+            other = await manager.get_or_create_session(stateless_tool_server, "run_2")
+        assert other is not session
+        await manager.cleanup_session("run_1")
+        await manager.cleanup_session("run_2")
+        await manager.close_pools()
@@ -0,0 +1,268 @@
+import asyncio
+import os
+from contextlib import AsyncExitStack
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from kiln_ai.tools import mcp_session_pool
+from kiln_ai.tools.mcp_session_pool import (
+    MCPSessionPool,
+    MCPSessionPoolSettings,
+    PooledMCPSession,
+)
+from kiln_ai.utils.config import Config
+
+
+class FakeServer:
+    """Opens fake sessions, recording which are open."""
+
+    def __init__(self):
+        self.opened = 0
+        self.open_sessions: set[int] = set()
+        self.fail = False
+
+    async def open_session(self):
+        if self.fail:
+            raise ConnectionError("server down")
+        self.opened += 1
+        number = self.opened
+        session = AsyncMock()
+        session.number = number
+        stack = AsyncExitStack()
+        self.open_sessions.add(number)
+        stack.callback(self.open_sessions.discard, number)
+        return session, stack
+
+
+def make_pool(server: FakeServer, **settings) -> MCPSessionPool:
+    return MCPSessionPool(server.open_session, MCPSessionPoolSettings(**settings))
+
+
+async def test_sessions_are_reused():
+    server = FakeServer()
+    pool = make_pool(server)
+
+    first = await pool.acquire()
+    await pool.release(first)
+    second = await pool.acquire()
+    assert second is first
+    assert server.opened == 1
+
+    # a second concurrent run gets its own session
+    third = await pool.acquire()
+    assert third is not first
+    assert pool.size == 2
+
+    await pool.close()
+    assert server.open_sessions == set()
+    with pytest.raises(RuntimeError, match="closed"):
+        await pool.acquire()
+
+
+async def test_runs_share_sessions_when_full():
+    server = FakeServer()
+    pool = make_pool(server, max_size=2)
+    first = await pool.acquire()
+    second = await pool.acquire()
+
+    # past max_size, runs share the session with the fewest runs on it
+    third = await pool.acquire()
+    fourth = await pool.acquire()
+    assert {third, fourth} == {first, second}
+    assert pool.size == 2
+    assert server.opened == 2
+
+    # a shared session stays leased until every run sharing it is done
+    await pool.release(third)
+    assert pool.idle_count == 0
+    await pool.release(fourth)
+    await pool.release(first)
+    await pool.release(second)
+    assert pool.idle_count == 2
+    await pool.close()
+    assert server.open_sessions == set()
+
+
+async def test_acquire_waits_for_opening_sessions_when_full():
+    opening = asyncio.Event()
+    finish_open = asyncio.Event()
+
+    async def slow_open_session():
+        opening.set()
+        await finish_open.wait()
+        return AsyncMock(), AsyncExitStack()
+
+    pool = MCPSessionPool(slow_open_session, MCPSessionPoolSettings(max_size=1))
+    first = asyncio.create_task(pool.acquire())
+    await opening.wait()
+    # the only slot is still opening, so there's nothing to share yet
+    second = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    assert not second.done()
+
+    finish_open.set()
+    assert await second is await first
+    assert pool.size == 1
+    await pool.close()
+
+
+async def test_dead_shared_sessions_free_their_slot():
+    server = FakeServer()
+    pool = make_pool(server, max_size=1)
+    first = await pool.acquire()
+    first._close_requested.set()
+    await asyncio.sleep(0)
+
+    # rather than sharing the dead session, a new one is opened in its slot
+    second = await pool.acquire()
+    assert second is not first
+    assert pool.size == 1
+    assert server.open_sessions == {second.session.number}
+
+    # the run holding the dead session can still discard it
+    await pool.discard(first)
+    assert pool.size == 1
+    await pool.close()
+
+
+async def test_unhealthy_sessions_are_replaced():
+    server = FakeServer()
+    pool = make_pool(server, health_check_interval_seconds=0)
+    first = await pool.acquire()
+    await pool.release(first)
+
+    first.session.send_ping.side_effect = ConnectionError("gone")
+    second = await pool.acquire()
+    assert second is not first
+    assert server.open_sessions == {2}
+    assert pool.size == 1
+
+    # healthy sessions pass the check
+    await pool.release(second)
+    assert await pool.acquire() is second
+    second.session.send_ping.assert_awaited()
+    await pool.close()
+
+
+async def test_failed_opens_free_their_slot():
+    server = FakeServer()
+    server.fail = True
+    pool = make_pool(server, max_size=1)
+    with pytest.raises(ConnectionError):
+        await pool.acquire()
+    assert pool.size == 0
+
+    server.fail = False
+    pooled = await pool.acquire()
+    assert pooled.alive
+    await pool.close()
+
+
+async def test_idle_sessions_beyond_min_size_are_closed():
+    server = FakeServer()
+    pool = make_pool(server, min_size=1, idle_timeout_seconds=60)
+    sessions = [await pool.acquire() for _ in range(3)]
+    for pooled in sessions:
+        await pool.release(pooled)
+    assert pool.idle_count == 3
+
+    # not idle for long enough
+    await pool.close_idle_sessions()
+    assert pool.idle_count == 3
+
+    now = mcp_session_pool.time.monotonic()
+    with patch.object(mcp_session_pool.time, "monotonic", return_value=now + 61):
+        await pool.close_idle_sessions()
+    assert pool.idle_count == 1
+    assert pool.size == 1
+    # the most recently used session is kept
+    assert server.open_sessions == {3}
+    await pool.close()
+
+
+async def test_prewarm():
+    server = FakeServer()
+    pool = make_pool(server, min_size=2)
+    await pool.prewarm()
+    assert pool.idle_count == 2
+    assert server.opened == 2
+
+    # already warm
+    await pool.prewarm()
+    assert server.opened == 2
+    await pool.close()
+
+
+async def test_retire_keeps_shared_sessions_open_until_their_last_run():
+    server = FakeServer()
+    pool = make_pool(server, max_size=1)
+    pooled = await pool.acquire()
+    assert await pool.acquire() is pooled
+
+    await pool.retire()
+    await pool.release(pooled)
+    assert pooled.alive
+    await pool.release(pooled)
+    assert not pooled.alive
+    assert pool.size == 0
+
+
+async def test_retire_closes_leased_sessions_when_released():
+    server = FakeServer()
+    pool = make_pool(server)
+    leased = await pool.acquire()
+    idle = await pool.acquire()
+    await pool.release(idle)
+
+    await pool.retire()
+    assert server.open_sessions == {leased.session.number}
+    assert leased.alive
+    await pool.release(leased)
+    assert server.open_sessions == set()
+    assert pool.size == 0
+
+
+async def test_cancelled_open_closes_the_session():
+    opened = asyncio.Event()
+    closed = asyncio.Event()
+    release_open = asyncio.Event()
+
+    async def slow_open_session():
+        opened.set()
+        await release_open.wait()
+        stack = AsyncExitStack()
+        stack.callback(closed.set)
+        return AsyncMock(), stack
+
+    pooled = PooledMCPSession(slow_open_session)
+    task = asyncio.create_task(pooled.open())
+    await opened.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    release_open.set()
+    await asyncio.wait_for(closed.wait(), 1)
+    assert not pooled.alive
+
+
+def test_settings_from_config(caplog):
+    with patch.dict(
+        os.environ,
+        {
+            "KILN_MCP_SESSION_POOL_MIN_SIZE": "3",
+            "KILN_MCP_SESSION_POOL_MAX_SIZE": "2",
+            "KILN_MCP_SESSION_POOL_IDLE_TIMEOUT_SECONDS": "0",
+        },
+    ):
+        with patch.object(Config, "_shared_instance", Config()):
+            settings = MCPSessionPoolSettings.from_config()
+    # min size is capped at the max size
+    assert settings.min_size == 2
+    assert settings.max_size == 2
+    assert settings.idle_timeout_seconds == 300
+    assert "Invalid mcp_session_pool_idle_timeout_seconds" in caplog.text
+
+    with patch.object(Config, "_shared_instance", Config()):
+        assert MCPSessionPoolSettings.from_config() == MCPSessionPoolSettings()
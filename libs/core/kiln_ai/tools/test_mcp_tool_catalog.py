@@ -0,0 +1,160 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, patch
+
+from mcp.types import (
+    ListToolsResult,
+    ServerNotification,
+    Tool,
+    ToolListChangedNotification,
+)
+
+from kiln_ai.datamodel.external_tool_server import ExternalToolServer, ToolServerType
+from kiln_ai.tools.mcp_server_tool import MCPServerTool
+from kiln_ai.tools.mcp_session_manager import tool_list_changed_handler
+from kiln_ai.tools.mcp_tool_catalog import MCPToolCatalog
+from kiln_ai.utils.config import Config
+
+
+def make_server(server_id: str | None = "server_1") -> ExternalToolServer:
+    server = ExternalToolServer(
+        name="test_server",
+        type=ToolServerType.remote_mcp,
+        properties={"server_url": "https://example.com/mcp", "is_archived": False},
+    )
+    server.id = server_id
+    return server
+
+
+def make_list_tools(*names: str) -> AsyncMock:
+    return AsyncMock(
+        return_value=ListToolsResult(
+            tools=[Tool(name=name, inputSchema={}) for name in names]
+        )
+    )
+
+
+async def test_tools_are_cached_per_server():
+    catalog = MCPToolCatalog()
+    server = make_server()
+    list_tools = make_list_tools("a", "b")
+
+    tools = await catalog.tools(server, list_tools)
+    assert list(tools) == ["a", "b"]
+    assert await catalog.tools(server, list_tools) is tools
+    assert list_tools.await_count == 1
+
+    # another server has its own catalog
+    await catalog.tools(make_server("server_2"), list_tools)
+    assert list_tools.await_count == 2
+
+    # unsaved servers aren't cached
+    unsaved = make_server(None)
+    await catalog.tools(unsaved, list_tools)
+    await catalog.tools(unsaved, list_tools)
+    assert list_tools.await_count == 4
+
+
+async def test_editing_a_server_lists_its_tools_again():
+    catalog = MCPToolCatalog()
+    server = make_server()
+    await catalog.tools(server, make_list_tools("a"))
+
+    server.properties["server_url"] = "https://example.com/other"
+    assert list(await catalog.tools(server, make_list_tools("b"))) == ["b"]
+
+
+async def test_editing_a_secret_lists_its_tools_again():
+    catalog = MCPToolCatalog()
+    server = make_server()
+    with patch.object(
+        ExternalToolServer, "retrieve_secrets", return_value=({"key": "old"}, [])
+    ):
+        await catalog.tools(server, make_list_tools("a"))
+        assert list(await catalog.tools(server, make_list_tools("b"))) == ["a"]
+    with patch.object(
+        ExternalToolServer, "retrieve_secrets", return_value=({"key": "new"}, [])
+    ):
+        assert list(await catalog.tools(server, make_list_tools("b"))) == ["b"]
+
+
+async def test_ttl():
+    catalog = MCPToolCatalog()
+    server = make_server()
+    list_tools = make_list_tools("a")
+
+    with patch("kiln_ai.tools.mcp_tool_catalog.time.monotonic", return_value=1000):
+        await catalog.tools(server, list_tools)
+    with patch("kiln_ai.tools.mcp_tool_catalog.time.monotonic", return_value=1299):
+        await catalog.tools(server, list_tools)
+    assert list_tools.await_count == 1
+    with patch("kiln_ai.tools.mcp_tool_catalog.time.monotonic", return_value=1301):
+        await catalog.tools(server, list_tools)
+    assert list_tools.await_count == 2
+
+    # 0 keeps the tool list until the server says it changed
+    with patch.dict(os.environ, {"KILN_MCP_TOOL_CATALOG_TTL_SECONDS": "0"}):
+        with patch.object(Config, "_shared_instance", Config()):
+            catalog.clear()
+            await catalog.tools(server, list_tools)
+    with patch("kiln_ai.tools.mcp_tool_catalog.time.monotonic", return_value=10**9):
+        await catalog.tools(server, list_tools)
+    assert list_tools.await_count == 3
+
+
+async def test_concurrent_lookups_list_once():
+    catalog = MCPToolCatalog()
+    server = make_server()
+    list_tools = make_list_tools("a")
+
+    await asyncio.gather(*[catalog.tools(server, list_tools) for _ in range(5)])
+    assert list_tools.await_count == 1
+
+
+async def test_list_changed_notification_invalidates_the_catalog():
+    catalog = MCPToolCatalog.shared()
+    server = make_server()
+    list_tools = make_list_tools("a")
+    await catalog.tools(server, list_tools)
+
+    handler = tool_list_changed_handler("server_1")
+    # other messages are ignored
+    await handler(RuntimeError("transport error"))
+    await catalog.tools(server, list_tools)
+    assert list_tools.await_count == 1
+
+    await handler(
+        ServerNotification(
+            ToolListChangedNotification(method="notifications/tools/list_changed")
+        )
+    )
+    await catalog.tools(server, list_tools)
+    assert list_tools.await_count == 2
+
+
+async def test_invalidation_during_a_list_isnt_overwritten():
+    catalog = MCPToolCatalog()
+    server = make_server()
+
+    async def list_then_invalidate():
+        catalog.invalidate("server_1")
+        return ListToolsResult(tools=[Tool(name="old", inputSchema={})])
+
+    await catalog.tools(server, list_then_invalidate)
+    assert list(await catalog.tools(server, make_list_tools("new"))) == ["new"]
+
+
+@patch("kiln_ai.tools.mcp_server_tool.get_agent_run_id", return_value=None)
+@patch("kiln_ai.tools.mcp_server_tool.MCPSessionManager")
+async def test_server_tools_share_the_catalog(mock_session_manager, _mock_run_id):
+    session = AsyncMock()
+    session.list_tools = make_list_tools("a", "b")
+    mock_cm = AsyncMock()
+    mock_cm.__aenter__ = AsyncMock(return_value=session)
+    mock_cm.__aexit__ = AsyncMock(return_value=False)
+    mock_session_manager.shared.return_value.mcp_client.return_value = mock_cm
+
+    server = make_server()
+    for name in ["a", "b", "a"]:
+        await MCPServerTool(server, name).toolcall_definition()
+    session.list_tools.assert_awaited_once()
@@ -0,0 +1,231 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+
+from kiln_ai.run_context import (
+    clear_agent_run_id,
+    clear_eval_id,
+    set_agent_run_id,
+    set_eval_id,
+)
+from kiln_ai.tools.base_tool import KilnTool, ToolCallContext, ToolCallResult
+from kiln_ai.tools.built_in_tools.math_tools import AddTool
+from kiln_ai.tools.kiln_task_tool import KilnTaskTool
+from kiln_ai.tools.rag_tools import RagTool
+from kiln_ai.tools.tool_result_cache import (
+    ToolResultCache,
+    ToolResultCacheScope,
+    arguments_hash,
+)
+from kiln_ai.utils.config import Config
+
+
+class CountingTool(KilnTool):
+    def __init__(self, cacheable: bool = True, is_error: bool = False):
+        super().__init__(
+            tool_id="kiln_tool::counting",
+            name="counting",
+            description="Counts its calls",
+            parameters_schema={
+                "type": "object",
+                "properties": {"query": {"type": "string"}},
+            },
+        )
+        self.cacheable = cacheable
+        self.is_error = is_error
+        self.calls = 0
+
+    async def run(
+        self, context: ToolCallContext | None = None, **kwargs
+    ) -> ToolCallResult:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return ToolCallResult(
+            output=f"{kwargs.get('query')} #{self.calls}", is_error=self.is_error
+        )
+
+
+async def call(cache: ToolResultCache, tool: CountingTool, **arguments):
+    result, cache_hit = await cache.call(
+        tool, arguments, lambda: tool.run(None, **arguments)
+    )
+    return result.output, cache_hit
+
+
+@pytest.fixture(autouse=True)
+def clean_run_context():
+    clear_agent_run_id()
+    clear_eval_id()
+    yield
+    clear_agent_run_id()
+    clear_eval_id()
+
+
+def test_declared_cacheability():
+    assert AddTool.cacheable is True
+    # its index can be rebuilt between calls
+    assert RagTool.cacheable is False
+    assert KilnTaskTool.cacheable is False
+    assert KilnTool.cacheable is False
+
+
+def test_arguments_hash_ignores_key_order():
+    assert arguments_hash({"a": 1, "b": [1, 2]}) == arguments_hash(
+        {"b": [1, 2], "a": 1}
+    )
+    assert arguments_hash({"a": 1}) != arguments_hash({"a": 2})
+
+
+async def test_reuses_results_within_a_run():
+    cache = ToolResultCache(ToolResultCacheScope.run)
+    tool = CountingTool()
+
+    # no run, nothing to scope the results to
+    assert await call(cache, tool, query="x") == ("x #1", False)
+    assert await call(cache, tool, query="x") == ("x #2", False)
+
+    set_agent_run_id("run_1")
+    assert await call(cache, tool, query="x") == ("x #3", False)
+    assert await call(cache, tool, query="x") == ("x #3", True)
+    assert await call(cache, tool, query="y") == ("y #4", False)
+
+    set_agent_run_id("run_2")
+    assert await call(cache, tool, query="x") == ("x #5", False)
+
+
+async def test_uncacheable_tools_and_errors_always_run():
+    cache = ToolResultCache(ToolResultCacheScope.run)
+    set_agent_run_id("run_1")
+
+    tool = CountingTool(cacheable=False)
+    await call(cache, tool, query="x")
+    assert await call(cache, tool, query="x") == ("x #2", False)
+
+    failing = CountingTool(is_error=True)
+    await call(cache, failing, query="x")
+    assert await call(cache, failing, query="x") == ("x #2", False)
+
+
+async def test_uncacheable_calls_invalidate_their_scope():
+    cache = ToolResultCache(ToolResultCacheScope.run)
+    tool = CountingTool()
+    writer = CountingTool(cacheable=False)
+
+    set_agent_run_id("run_2")
+    await call(cache, tool, query="x")
+    set_agent_run_id("run_1")
+    await call(cache, tool, query="x")
+    assert await call(cache, tool, query="x") == ("x #2", True)
+
+    await call(cache, writer, query="write")
+    assert await call(cache, tool, query="x") == ("x #3", False)
+
+    # other runs' results are kept
+    set_agent_run_id("run_2")
+    assert await call(cache, tool, query="x") == ("x #1", True)
+
+
+async def test_eval_scope_shares_results_across_runs():
+    cache = ToolResultCache(ToolResultCacheScope.eval)
+    tool = CountingTool()
+
+    set_eval_id("eval_1")
+    set_agent_run_id("run_1")
+    await call(cache, tool, query="x")
+    set_agent_run_id("run_2")
+    assert await call(cache, tool, query="x") == ("x #1", True)
+
+    set_eval_id("eval_2")
+    assert await call(cache, tool, query="x") == ("x #2", False)
+
+    # outside of an eval, results are shared within the run
+    clear_eval_id()
+    set_agent_run_id("run_3")
+    await call(cache, tool, query="x")
+    assert await call(cache, tool, query="x") == ("x #3", True)
+
+
+async def test_global_and_off_scopes():
+    tool = CountingTool()
+    global_cache = ToolResultCache(ToolResultCacheScope.global_)
+    await call(global_cache, tool, query="x")
+    set_agent_run_id("run_1")
+    assert await call(global_cache, tool, query="x") == ("x #1", True)
+
+    off = ToolResultCache(ToolResultCacheScope.off)
+    await call(off, tool, query="x")
+    assert await call(off, tool, query="x") == ("x #3", False)
+
+
+async def test_ttl_and_eviction():
+    set_agent_run_id("run_1")
+    tool = CountingTool()
+
+    cache = ToolResultCache(ToolResultCacheScope.run, ttl_seconds=60)
+    with patch("kiln_ai.tools.tool_result_cache.time.monotonic", return_value=1000):
+        await call(cache, tool, query="x")
+    with patch("kiln_ai.tools.tool_result_cache.time.monotonic", return_value=1059):
+        assert await call(cache, tool, query="x") == ("x #1", True)
+    with patch("kiln_ai.tools.tool_result_cache.time.monotonic", return_value=1061):
+        assert await call(cache, tool, query="x") == ("x #2", False)
+
+    cache = ToolResultCache(ToolResultCacheScope.run, max_entries=2)
+    await call(cache, tool, query="a")
+    await call(cache, tool, query="b")
+    # a is used more recently than b, so b is evicted
+    await call(cache, tool, query="a")
+    await call(cache, tool, query="c")
+    assert (await call(cache, tool, query="a"))[1] is True
+    assert (await call(cache, tool, query="b"))[1] is False
+
+
+async def test_concurrent_identical_calls_run_once():
+    cache = ToolResultCache(ToolResultCacheScope.run)
+    tool = CountingTool()
+    set_agent_run_id("run_1")
+
+    results = await asyncio.gather(*[call(cache, tool, query="x") for _ in range(5)])
+    assert tool.calls == 1
+    assert [hit for _, hit in results].count(False) == 1
+
+
+def test_from_config(caplog):
+    with patch.dict(
+        os.environ,
+        {
+            "KILN_TOOL_RESULT_CACHE_SCOPE": "eval",
+            "KILN_TOOL_RESULT_CACHE_TTL_SECONDS": "0",
+            "KILN_TOOL_RESULT_CACHE_MAX_ENTRIES": "10",
+        },
+    ):
+        with patch.object(Config, "_shared_instance", Config()):
+            cache = ToolResultCache.from_config()
+    assert cache.scope == ToolResultCacheScope.eval
+    assert cache.ttl_seconds is None
+    assert cache.max_entries == 10
+
+    with patch.dict(
+        os.environ,
+        {
+            "KILN_TOOL_RESULT_CACHE_SCOPE": "forever",
+            "KILN_TOOL_RESULT_CACHE_TTL_SECONDS": "-1",
+        },
+    ):
+        with patch.object(Config, "_shared_instance", Config()):
+            cache = ToolResultCache.from_config()
+    assert cache.scope == ToolResultCacheScope.off
+    assert cache.ttl_seconds == 600
+    assert "Invalid tool_result_cache_scope" in caplog.text
+
+
+def test_shared_follows_config_changes():
+    with patch.object(Config, "_shared_instance", Config()):
+        default = ToolResultCache.shared()
+        assert default.scope == ToolResultCacheScope.off
+        assert default.ttl_seconds == 600
+        assert ToolResultCache.shared() is default
+
+        with patch.dict(os.environ, {"KILN_TOOL_RESULT_CACHE_SCOPE": "global"}):
+            assert ToolResultCache.shared().scope == ToolResultCacheScope.global_
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable
+
+from kiln_ai.run_context import get_agent_run_id, get_eval_id
+from kiln_ai.tools.base_tool import KilnToolInterface, ToolCallResult
+from kiln_ai.utils.config import Config
+from kiln_ai.utils.lock import AsyncLockManager
+
+logger = logging.getLogger(__name__)
+
+# Identical calls wait for the first to finish, then reuse its result
+_call_locks = AsyncLockManager()
+
+
+class ToolResultCacheScope(str, Enum):
+    """
+    off: tool results are never reused.
+    run: results are reused within an agent run, including its sub-agent runs.
+    eval: results are reused across all the items of an eval, and within a run outside of evals.
+    global: results are reused by every run in this process.
+    """
+
+    off = "off"
+    run = "run"
+    eval = "eval"
+    global_ = "global"
+
+
+@dataclass
+class _CacheEntry:
+    # time.monotonic() after which the entry is stale, None to never expire
+    expires_at: float | None
+    result: ToolCallResult
+
+
+class ToolResultCache:
+    """
+    An in-memory cache of tool call results, keyed by the tool and a canonical hash of
+    the call's arguments.
+
+    Agents often make the same search or read only call more than once in a run, and
+    evals repeat them for every item. Only tools which declare themselves cacheable
+    (see KilnToolInterface.cacheable) go through the cache, and error results are never
+    stored. A call to a tool which isn't cacheable may have side effects, so it drops
+    the results cached in its scope. Entries expire after the TTL and the least
+    recently used are evicted past max_entries.
+
+    Configured with the tool_result_cache_* settings, off by default.
+    """
+
+    _shared_instance: ToolResultCache | None = None
+    _shared_settings: tuple[Any, ...] | None = None
+
+    def __init__(
+        self,
+        scope: ToolResultCacheScope,
+        ttl_seconds: int | None = None,
+        max_entries: int = 1000,
+    ):
+        if ttl_seconds is not None and ttl_seconds < 1:
+            raise ValueError("ttl_seconds must be >= 1")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.scope = scope
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str], _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> ToolResultCache:
+        # Rebuilt when the settings change, so the cache can be reconfigured without a restart
+        settings = _settings_from_config()
+        if cls._shared_instance is None or cls._shared_settings != settings:
+            cls._shared_instance = cls.from_config()
+            cls._shared_settings = settings
+        return cls._shared_instance
+
+    @classmethod
+    def from_config(cls) -> ToolResultCache:
+        scope_setting, ttl_setting, max_entries_setting = _settings_from_config()
+        try:
+            scope = ToolResultCacheScope(scope_setting or ToolResultCacheScope.off)
+        except ValueError:
+            logger.warning(
+                f"Invalid tool_result_cache_scope {scope_setting!r}, the tool result cache is off. Expected one of: {', '.join(s.value for s in ToolResultCacheScope)}"
+            )
+            scope = ToolResultCacheScope.off
+
+        return cls(
+            scope=scope,
+            # 0 means entries never expire
+            ttl_seconds=ttl_setting or None,
+            max_entries=max_entries_setting,
+        )
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        cls._shared_instance = None
+        cls._shared_settings = None
+
+    async def call(
+        self,
+        tool: KilnToolInterface,
+        arguments: dict[str, Any],
+        run: Callable[[], Awaitable[ToolCallResult]],
+    ) -> tuple[ToolCallResult, bool]:
+        """
+        Run a tool call through the cache: the cached result of an identical call if
+        there is one, otherwise the result of run (stored for next time).
+
+        Returns the result and whether it came from the cache.
+        """
+        scope_id = self.scope_id()
+        if scope_id is None:
+            return await run(), False
+        if not tool.cacheable:
+            try:
+                return await run(), False
+            finally:
+                # it may have changed what the cached calls would return
+                self._invalidate_scope(scope_id)
+
+        key = (scope_id, await tool.id(), arguments_hash(arguments))
+        async with _call_locks.acquire(key):
+            cached = self._get(key)
+            if cached is not None:
+                return cached, True
+            result = await run()
+            if not result.is_error:
+                self._set(key, result)
+            return result, False
+
+    def scope_id(self) -> str | None:
+        """The ID of the scope results are shared in for the current context, None if results can't be shared."""
+        if self.scope == ToolResultCacheScope.global_:
+            return "global"
+        if self.scope == ToolResultCacheScope.eval:
+            eval_id = get_eval_id()
+            if eval_id is not None:
+                return f"eval:{eval_id}"
+        if self.scope in (ToolResultCacheScope.run, ToolResultCacheScope.eval):
+            run_id = get_agent_run_id()
+            if run_id is not None:
+                return f"run:{run_id}"
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _invalidate_scope(self, scope_id: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == scope_id]:
+                del self._entries[key]
+
+    def _get(self, key: tuple[str, str, str]) -> ToolCallResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and time.monotonic() > entry.expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.result.model_copy()
+
+    def _set(self, key: tuple[str, str, str], result: ToolCallResult) -> None:
+        expires_at = (
+            time.monotonic() + self.ttl_seconds
+            if self.ttl_seconds is not None
+            else None
+        )
+        with self._lock:
+            self._entries[key] = _CacheEntry(
+                expires_at=expires_at, result=result.model_copy()
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _settings_from_config() -> tuple[Any, ...]:
+    config = Config.shared()
+    return (
+        config.tool_result_cache_scope,
+        config.tool_result_cache_ttl_seconds,
+        config.tool_result_cache_max_entries,
+    )
+
+
+def arguments_hash(arguments: dict[str, Any]) -> str:
+    """A canonical hash of tool call arguments, independent of their key order."""
+    canonical = json.dumps(
+        arguments, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -1,5 +1,6 @@
 import copy
 import getpass
+import logging
 import os
 import threading
 from pathlib import Path
@@ -7,6 +8,8 @@ from typing import Any, Callable, Dict, List, Optional
 
 import yaml
 
+logger = logging.getLogger(__name__)
+
 # Configuration keys
 MCP_SECRETS_KEY = "mcp_secrets"
 
@@ -21,6 +24,7 @@ class ConfigProperty:
         sensitive: bool = False,
         sensitive_keys: Optional[List[str]] = None,
         in_memory: bool = False,
+        minimum: Optional[int] = None,
     ):
         self.type = type_
         self.default = default
@@ -29,6 +33,8 @@ class ConfigProperty:
         self.sensitive = sensitive
         self.sensitive_keys = sensitive_keys
         self.in_memory = in_memory
+        # Numeric settings below this (or which don't parse) fall back to the default
+        self.minimum = minimum
 
 
 class Config:
@@ -194,6 +200,112 @@ class Config:
                 default=8757,
                 in_memory=True,
             ),
+            # Number of worker processes used to split and render PDF pages
+            "pdf_conversion_max_workers": ConfigProperty(
+                int,
+                env_var="KILN_PDF_CONVERSION_MAX_WORKERS",
+                default_lambda=lambda: min(4, os.cpu_count() or 1),
+            ),
+            # Size limit of the persistent extraction cache, least recently used entries are evicted
+            "extraction_cache_max_size_mb": ConfigProperty(
+                int,
+                env_var="KILN_EXTRACTION_CACHE_MAX_SIZE_MB",
+                default=1024,
+                minimum=1,
+            ),
+            # Opt-in cache of LLM responses: "off", "record" or "replay_only" (offline, errors on a miss)
+            "llm_response_cache_mode": ConfigProperty(
+                str,
+                env_var="KILN_LLM_RESPONSE_CACHE_MODE",
+                default="off",
+            ),
+            # Defaults to a cache directory in the Kiln settings directory
+            "llm_response_cache_dir": ConfigProperty(
+                str,
+                env_var="KILN_LLM_RESPONSE_CACHE_DIR",
+            ),
+            # Hours before a cached LLM response expires, 0 to never expire
+            "llm_response_cache_ttl_hours": ConfigProperty(
+                int,
+                env_var="KILN_LLM_RESPONSE_CACHE_TTL_HOURS",
+                default=24 * 7,
+                minimum=0,
+            ),
+            # Size limit of the LLM response cache, least recently used entries are evicted
+            "llm_response_cache_max_size_mb": ConfigProperty(
+                int,
+                env_var="KILN_LLM_RESPONSE_CACHE_MAX_SIZE_MB",
+                default=512,
+                minimum=1,
+            ),
+            # Which calls share results of cacheable tools: off, run, eval or global
+            "tool_result_cache_scope": ConfigProperty(
+                str,
+                env_var="KILN_TOOL_RESULT_CACHE_SCOPE",
+                default="off",
+            ),
+            # Seconds before a cached tool result expires, 0 to never expire
+            "tool_result_cache_ttl_seconds": ConfigProperty(
+                int,
+                env_var="KILN_TOOL_RESULT_CACHE_TTL_SECONDS",
+                default=600,
+                minimum=0,
+            ),
+            # Number of tool results kept, least recently used results are evicted
+            "tool_result_cache_max_entries": ConfigProperty(
+                int,
+                env_var="KILN_TOOL_RESULT_CACHE_MAX_ENTRIES",
+                default=1000,
+                minimum=1,
+            ),
+            # Seconds an MCP server's tool list is cached, 0 to keep it until the server
+            # sends a tools/list_changed notification
+            "mcp_tool_catalog_ttl_seconds": ConfigProperty(
+                int,
+                env_var="KILN_MCP_TOOL_CATALOG_TTL_SECONDS",
+                default=300,
+                minimum=0,
+            ),
+            # Pooled sessions kept per stateless MCP server (see ExternalToolServer properties)
+            "mcp_session_pool_min_size": ConfigProperty(
+                int,
+                env_var="KILN_MCP_SESSION_POOL_MIN_SIZE",
+                default=1,
+                minimum=0,
+            ),
+            "mcp_session_pool_max_size": ConfigProperty(
+                int,
+                env_var="KILN_MCP_SESSION_POOL_MAX_SIZE",
+                default=8,
+                minimum=1,
+            ),
+            # Seconds before an idle pooled MCP session beyond the min size is closed
+            "mcp_session_pool_idle_timeout_seconds": ConfigProperty(
+                int,
+                env_var="KILN_MCP_SESSION_POOL_IDLE_TIMEOUT_SECONDS",
+                default=300,
+                minimum=1,
+            ),
+            # Limits of the pooled HTTP clients shared by all provider traffic (per base URL)
+            "http_max_connections": ConfigProperty(
+                int,
+                env_var="KILN_HTTP_MAX_CONNECTIONS",
+                default=100,
+                minimum=1,
+            ),
+            "http_max_keepalive_connections": ConfigProperty(
+                int,
+                env_var="KILN_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+                default=20,
+                minimum=0,
+            ),
+            # How long an idle pooled connection is kept open for reuse
+            "http_keepalive_expiry_seconds": ConfigProperty(
+                int,
+                env_var="KILN_HTTP_KEEPALIVE_EXPIRY_SECONDS",
+                default=30,
+                minimum=0,
+            ),
             # Allow the user to set the path to lookup MCP server commands, like npx.
             "custom_mcp_path": ConfigProperty(
                 str,
@@ -209,6 +321,21 @@ class Config:
                 default_lambda=lambda: {},
                 sensitive_keys=["pat_token", "oauth_token"],
             ),
+            # Milliseconds git sync coalesces writes into one commit before pushing it in
+            # the background. 0 commits and pushes each write before it returns.
+            "git_sync_group_commit_window_ms": ConfigProperty(
+                int,
+                env_var="KILN_GIT_SYNC_GROUP_COMMIT_WINDOW_MS",
+                default=0,
+                minimum=0,
+            ),
+            # A coalesced commit is pushed early once it changes this many files
+            "git_sync_group_commit_max_files": ConfigProperty(
+                int,
+                env_var="KILN_GIT_SYNC_GROUP_COMMIT_MAX_FILES",
+                default=1000,
+                minimum=1,
+            ),
             # has the user indicated it's for personal or work use?
             "user_type": ConfigProperty(
                 str,  # "personal" or "work"
@@ -253,16 +380,16 @@ class Config:
         if property_config.in_memory:
             if name in self._in_memory_settings:
                 value = self._in_memory_settings[name]
-                return value if value is None else property_config.type(value)
+                return self._typed_value(name, property_config, value)
         else:
             if name in self._settings:
                 value = self._settings[name]
-                return value if value is None else property_config.type(value)
+                return self._typed_value(name, property_config, value)
 
         # Check environment variable
         if property_config.env_var and property_config.env_var in os.environ:
             value = os.environ[property_config.env_var]
-            return property_config.type(value)
+            return self._typed_value(name, property_config, value)
 
         # Use default value or default_lambda
         if property_config.default_lambda:
@@ -272,6 +399,27 @@ class Config:
 
         return None if value is None else property_config.type(value)
 
+    def _typed_value(self, name: str, property_config: ConfigProperty, value: Any):
+        if value is None:
+            return None
+        if property_config.minimum is None:
+            return property_config.type(value)
+
+        # A bad limit or timeout shouldn't break the feature using it, fall back to the default
+        try:
+            typed = property_config.type(value)
+        except (TypeError, ValueError):
+            typed = None
+        if typed is None or typed < property_config.minimum:
+            default = (
+                property_config.default_lambda()
+                if property_config.default_lambda
+                else property_config.default
+            )
+            logger.warning(f"Invalid {name} {value!r}, using the default of {default}")
+            return default
+        return typed
+
     def __setattr__(self, name, value):
         if name in ("_properties", "_settings", "_lock", "_in_memory_settings"):
             super().__setattr__(name, value)
@@ -1,6 +1,8 @@
+import hashlib
 import os
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -12,3 +14,24 @@ def open_folder(path: str | Path) -> None:
         os.startfile(dir)  # type: ignore[attr-defined]
     else:
         subprocess.run(["xdg-open", dir], check=True)
+
+
+def file_sha256(path: str | Path) -> str:
+    """
+    SHA-256 of a file's contents, as hex.
+
+    Memoized on the resolved path, size and mtime, so repeated calls for an unchanged
+    file don't re-read it. Reads the whole file on a miss: call from a thread in async code.
+    """
+    resolved_path = Path(path).resolve()
+    stat = resolved_path.stat()
+    return _file_sha256(str(resolved_path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=1024)
+def _file_sha256(resolved_path: str, size: int, mtime_ns: int) -> str:
+    digest = hashlib.sha256()
+    with open(resolved_path, "rb") as file:
+        while block := file.read(1024 * 1024):
+            digest.update(block)
+    return digest.hexdigest()
@@ -1,17 +1,38 @@
+import asyncio
 import logging
+import os
 import tempfile
 from pathlib import Path
 
 import anyio
 
 from kiln_ai.datamodel.basemodel import name_validator
+from kiln_ai.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# When a size-bounded cache overflows, evict down to this fraction of the limit so we
+# don't pay for a directory scan on every subsequent write
+EVICTION_TARGET_FRACTION = 0.9
+
 
 class FilesystemCache:
-    def __init__(self, path: Path):
+    """
+    A key/value cache of files in a directory.
+
+    If max_size_bytes is set, the cache evicts least recently used entries once the total
+    size of the directory goes over the limit. Recency is tracked with the file mtime, which
+    reads bump, so it survives restarts.
+    """
+
+    def __init__(self, path: Path, max_size_bytes: int | None = None):
+        if max_size_bytes is not None and max_size_bytes < 1:
+            raise ValueError("max_size_bytes must be >= 1")
         self.cache_dir_path = path
+        self.max_size_bytes = max_size_bytes
+        # total size of the cache dir, loaded lazily; None means unknown
+        self._size_bytes: int | None = None
+        self._eviction_lock = asyncio.Lock()
 
     def validate_key(self, key: str) -> None:
         # throws if invalid
@@ -22,36 +43,108 @@ class FilesystemCache:
         return self.cache_dir_path / key
 
     async def get(self, key: str) -> bytes | None:
+        path = self.get_path(key)
         # check if the file exists - don't need to validate the key
         # worst case we just return None
-        if not self.get_path(key).exists():
+        if not await anyio.Path(path).exists():
             return None
 
         # we don't want to raise because of internal cache corruption issues
         try:
-            return await anyio.Path(self.get_path(key)).read_bytes()
+            value = await anyio.Path(path).read_bytes()
         except Exception:
-            logger.error(f"Error reading file {self.get_path(key)}", exc_info=True)
+            logger.error(f"Error reading file {path}", exc_info=True)
             return None
 
+        if self.max_size_bytes is not None:
+            await anyio.to_thread.run_sync(self._touch, path)
+        return value
+
     async def set(self, key: str, value: bytes) -> Path:
         logger.debug(f"Caching {key} at {self.get_path(key)}")
         self.validate_key(key)
         path = self.get_path(key)
+
+        previous_size = 0
+        if self.max_size_bytes is not None:
+            try:
+                previous_size = (await anyio.Path(path).stat()).st_size
+            except FileNotFoundError:
+                pass
+
         await anyio.Path(path).write_bytes(value)
+
+        if self.max_size_bytes is not None:
+            if self._size_bytes is not None:
+                self._size_bytes += len(value) - previous_size
+            await self._evict_if_needed()
         return path
 
     async def delete_by_prefix(self, prefix: str) -> None:
         # we avoid globbing here to avoid any unexpected traversal/glob injection
         logger.debug(f"Deleting cache by prefix {prefix} in {self.cache_dir_path}")
-        for path in self.cache_dir_path.iterdir():
-            if path.is_file() and path.name.startswith(prefix):
+        async for path in anyio.Path(self.cache_dir_path).iterdir():
+            if path.name.startswith(prefix) and await path.is_file():
                 try:
-                    await anyio.Path(path).unlink()
+                    await path.unlink()
                 except FileNotFoundError:
                     continue
                 except Exception:
                     logger.error(f"Error deleting cache path {path}", exc_info=True)
+        # re-measure on the next write rather than tracking each deletion
+        self._size_bytes = None
+
+    def _touch(self, path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            # an entry evicted between read and touch is fine
+            logger.debug(f"Could not update access time for {path}", exc_info=True)
+
+    async def _evict_if_needed(self) -> None:
+        if self.max_size_bytes is None:
+            return
+        if self._size_bytes is not None and self._size_bytes <= self.max_size_bytes:
+            return
+
+        async with self._eviction_lock:
+            self._size_bytes = await asyncio.to_thread(
+                self._evict_sync, self.max_size_bytes
+            )
+
+    def _evict_sync(self, max_size_bytes: int) -> int:
+        entries: list[tuple[int, int, Path]] = []
+        total_size = 0
+        for path in self.cache_dir_path.iterdir():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if not path.is_file():
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total_size += stat.st_size
+
+        if total_size <= max_size_bytes:
+            return total_size
+
+        target_size = int(max_size_bytes * EVICTION_TARGET_FRACTION)
+        # oldest access first
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= target_size:
+                break
+            try:
+                path.unlink()
+                total_size -= size
+            except FileNotFoundError:
+                total_size -= size
+            except Exception:
+                logger.error(f"Error evicting cache path {path}", exc_info=True)
+
+        logger.debug(
+            f"Evicted cache entries in {self.cache_dir_path}, now {total_size} bytes"
+        )
+        return total_size
 
 
 class TemporaryFilesystemCache:
@@ -70,3 +163,29 @@ class TemporaryFilesystemCache:
         if cls._shared_instance is None:
             cls._shared_instance = cls()
         return cls._shared_instance.filesystem_cache
+
+
+class ExtractionFilesystemCache:
+    """
+    The cache of extracted document content, kept in the Kiln settings directory so it
+    survives restarts. Size-bounded with LRU eviction (see extraction_cache_max_size_mb).
+    """
+
+    _shared_instance = None
+
+    def __init__(self, path: Path | None = None, max_size_bytes: int | None = None):
+        cache_dir = path or Path(Config.settings_dir()) / "cache" / "extractions"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        if max_size_bytes is None:
+            max_size_bytes = Config.shared().extraction_cache_max_size_mb * 1024 * 1024
+        self.filesystem_cache = FilesystemCache(
+            path=cache_dir, max_size_bytes=max_size_bytes
+        )
+
+        logger.debug(f"Using extraction cache directory: {cache_dir}")
+
+    @classmethod
+    def shared(cls) -> FilesystemCache:
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance.filesystem_cache
@@ -1,5 +1,7 @@
-from collections.abc import AsyncIterator, Callable
-from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
 from typing import Protocol
 
 SaveContext = Callable[[], AbstractAsyncContextManager[None]]
@@ -12,3 +14,27 @@ async def default_save_context() -> AsyncIterator[None]:
 
 class AtomicWriteCapable(Protocol):
     def atomic_write(self, context: str) -> AbstractAsyncContextManager[None]: ...
+
+
+# Paths written or deleted inside the current atomic write, None when nothing is tracking.
+# The set is shared by reference, so writes from tasks and threads spawned inside the
+# block (which copy the context) are recorded too.
+_written_paths: ContextVar[set[Path] | None] = ContextVar("written_paths", default=None)
+
+
+def record_written_path(path: Path) -> None:
+    """Record a file or folder a save wrote or deleted, if a write is being tracked."""
+    paths = _written_paths.get()
+    if paths is not None:
+        paths.add(path)
+
+
+@contextmanager
+def track_written_paths() -> Iterator[set[Path]]:
+    """Collect the paths recorded by saves made inside the block."""
+    paths: set[Path] = set()
+    token = _written_paths.set(paths)
+    try:
+        yield paths
+    finally:
+        _written_paths.reset(token)
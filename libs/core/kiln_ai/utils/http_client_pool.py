@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import aiohttp
+import httpx
+
+from kiln_ai.utils.config import Config
+
+if TYPE_CHECKING:
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+# httpx only speaks HTTP/2 with the optional h2 package installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class HttpPoolMetrics:
+    """Request and connection counts for one pooled base URL."""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        # every request either opened a connection or went out on a pooled one
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        if self.requests == 0:
+            return 0.0
+        return self.connections_reused / self.requests
+
+
+@dataclass
+class _LoopClients:
+    httpx_clients: dict[str, httpx.AsyncClient] = field(default_factory=dict)
+    litellm_sessions: dict[str, aiohttp.ClientSession] = field(default_factory=dict)
+    # Each handler wraps the pooled session it was created with
+    litellm_handlers: dict[str, tuple[aiohttp.ClientSession, AsyncHTTPHandler]] = field(
+        default_factory=dict
+    )
+
+
+class HttpClientPool:
+    """
+    Process-wide registry of pooled async HTTP clients, one per provider base URL.
+
+    Creating a client per call throws away its connections, so every short call pays
+    for a new TCP connection and TLS handshake. Clients from this pool keep
+    connections alive between calls, with limits from the http_* settings.
+
+    Two kinds of client are pooled: httpx clients for Kiln's own requests (remote
+    config, local server checks, key verification), and aiohttp sessions passed to
+    LiteLLM as its shared_session, as LiteLLM's default transport is aiohttp.
+
+    Async clients are bound to the event loop they were created on, so the pool keeps
+    a set of clients per running loop. Don't close the clients you're given, they're
+    shared. Request and connection counts per base URL are available from metrics().
+    """
+
+    _shared_instance: HttpClientPool | None = None
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_seconds: int = 30,
+        http2: bool = HTTP2_AVAILABLE,
+    ):
+        if max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+        if max_keepalive_connections < 0 or keepalive_expiry_seconds < 0:
+            raise ValueError("Keep-alive settings must be >= 0")
+        if http2 and not HTTP2_AVAILABLE:
+            raise ValueError("HTTP/2 requires the h2 package")
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry_seconds = keepalive_expiry_seconds
+        self.http2 = http2
+        self._loop_clients: dict[asyncio.AbstractEventLoop, _LoopClients] = {}
+        self._metrics: dict[str, HttpPoolMetrics] = {}
+
+    @classmethod
+    def shared(cls) -> HttpClientPool:
+        if cls._shared_instance is None:
+            cls._shared_instance = cls.from_config()
+        return cls._shared_instance
+
+    @classmethod
+    def from_config(cls) -> HttpClientPool:
+        config = Config.shared()
+        return cls(
+            max_connections=config.http_max_connections,
+            max_keepalive_connections=config.http_max_keepalive_connections,
+            keepalive_expiry_seconds=config.http_keepalive_expiry_seconds,
+        )
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Drop the shared pool. Clients on a loop that's still running should be closed with aclose first."""
+        if cls._shared_instance is not None:
+            cls._shared_instance._discard_closed_loops(all_loops=True)
+        cls._shared_instance = None
+
+    def client(self, url: str) -> httpx.AsyncClient:
+        """The pooled httpx client for the base URL of url. Must be called from a running event loop."""
+        key = pool_key(url)
+        clients = self._clients_for_running_loop().httpx_clients
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = self._new_httpx_client(key)
+            clients[key] = client
+        return client
+
+    def litellm_session(
+        self, base_url: str | None, provider_name: str
+    ) -> aiohttp.ClientSession:
+        """
+        The pooled aiohttp session to pass to LiteLLM as shared_session. Pooled by the
+        custom base URL if there is one, otherwise by provider. Must be called from a
+        running event loop.
+        """
+        key = pool_key(base_url) if base_url else provider_name
+        sessions = self._clients_for_running_loop().litellm_sessions
+        session = sessions.get(key)
+        if session is None or session.closed:
+            session = self._new_litellm_session(key)
+            sessions[key] = session
+        return session
+
+    def litellm_http_handler(
+        self, base_url: str | None, provider_name: str
+    ) -> AsyncHTTPHandler:
+        """
+        A LiteLLM AsyncHTTPHandler wrapping the pooled aiohttp session, for LiteLLM calls
+        which take a client rather than a shared_session (like rerank). Pooled like
+        litellm_session. Must be called from a running event loop.
+        """
+        # litellm is slow to import, and most users of the pool don't need it
+        from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+        key = pool_key(base_url) if base_url else provider_name
+        session = self.litellm_session(base_url, provider_name)
+        handlers = self._clients_for_running_loop().litellm_handlers
+        pooled = handlers.get(key)
+        if pooled is None or pooled[0] is not session:
+            pooled = (session, AsyncHTTPHandler(shared_session=session))
+            handlers[key] = pooled
+        return pooled[1]
+
+    def metrics(self) -> dict[str, HttpPoolMetrics]:
+        """A snapshot of the request and connection counts, by pool key."""
+        return {key: replace(metrics) for key, metrics in self._metrics.items()}
+
+    async def aclose(self) -> None:
+        """Close the clients created on the running event loop."""
+        loop = asyncio.get_running_loop()
+        clients = self._loop_clients.pop(loop, None)
+        if clients is None:
+            return
+        for client in clients.httpx_clients.values():
+            await client.aclose()
+        for _, handler in clients.litellm_handlers.values():
+            await handler.close()
+        for session in clients.litellm_sessions.values():
+            await session.close()
+
+    def _metrics_for(self, key: str) -> HttpPoolMetrics:
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = HttpPoolMetrics()
+            self._metrics[key] = metrics
+        return metrics
+
+    def _clients_for_running_loop(self) -> _LoopClients:
+        loop = asyncio.get_running_loop()
+        clients = self._loop_clients.get(loop)
+        if clients is None:
+            self._discard_closed_loops()
+            clients = _LoopClients()
+            self._loop_clients[loop] = clients
+        return clients
+
+    def _discard_closed_loops(self, all_loops: bool = False) -> None:
+        for loop in list(self._loop_clients):
+            if not all_loops and not loop.is_closed():
+                continue
+            clients = self._loop_clients.pop(loop)
+            # A session can't be closed once its loop is gone. Detaching marks it
+            # closed without touching the loop, so dropping it doesn't warn.
+            for session in clients.litellm_sessions.values():
+                if not session.closed:
+                    session.detach()
+
+    def _new_httpx_client(self, key: str) -> httpx.AsyncClient:
+        metrics = self._metrics_for(key)
+
+        async def count_connections(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                metrics.connections_opened += 1
+
+        async def on_request(request: httpx.Request) -> None:
+            metrics.requests += 1
+            request.extensions["trace"] = count_connections
+
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry_seconds,
+            ),
+            http2=self.http2,
+            event_hooks={"request": [on_request]},
+        )
+
+    def _new_litellm_session(self, key: str) -> aiohttp.ClientSession:
+        metrics = self._metrics_for(key)
+
+        async def on_request_start(*_: Any) -> None:
+            metrics.requests += 1
+
+        async def on_connection_create_end(*_: Any) -> None:
+            metrics.connections_opened += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+
+        # aiohttp has no separate cap on idle connections, the overall limit applies
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=self.keepalive_expiry_seconds,
+            ),
+            trace_configs=[trace_config],
+        )
+
+
+def pool_key(url: str) -> str:
+    """The base URL clients are pooled by: scheme, host and port."""
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return url
+    return f"{parts.scheme}://{parts.netloc}".lower()
@@ -122,6 +122,9 @@ class ChatCompletionToolMessageParamWrapper(TypedDict, total=False):
     error_message: Optional[str]
     """Human-readable error description when is_error is True."""
 
+    cache_hit: Optional[bool]
+    """Whether the result was reused from the tool result cache, rather than running the tool."""
+
 
 ChatCompletionMessageParam: TypeAlias = Union[
     ChatCompletionDeveloperMessageParam,
@@ -139,6 +142,7 @@ KILN_ONLY_MESSAGE_FIELDS: frozenset[str] = frozenset(
         "is_error",
         "error_message",
         "kiln_task_tool_data",
+        "cache_hit",
         "usage",
     }
 )
@@ -147,22 +151,23 @@ keys, so these are stripped before sending to LiteLLM. Add new Kiln-only message
 fields here when extending the wrappers above."""
 
 
+def sanitize_message_for_provider(message: Any) -> Any:
+    """Return ``message`` with ``KILN_ONLY_MESSAGE_FIELDS`` removed if it is a
+    dict. Non-dict messages (e.g. LiteLLM ``Message`` objects) are returned
+    unchanged. The input is not mutated."""
+    # Traces mix TypedDict messages (which may carry kiln-only fields) with
+    # LiteLLM Message pydantic objects returned from prior calls (which never
+    # do). Only dicts need stripping; pass other types through untouched.
+    if isinstance(message, dict):
+        return {k: v for k, v in message.items() if k not in KILN_ONLY_MESSAGE_FIELDS}
+    return message
+
+
 def sanitize_messages_for_provider(messages: Iterable[Any]) -> list[Any]:
     """Return a copy of ``messages`` with ``KILN_ONLY_MESSAGE_FIELDS`` removed
     from any dict entries. Non-dict entries (e.g. LiteLLM ``Message`` objects)
     pass through unchanged. The input list and its dicts are not mutated."""
-    sanitized: list[Any] = []
-    for message in messages:
-        # Traces mix TypedDict messages (which may carry kiln-only fields) with
-        # LiteLLM Message pydantic objects returned from prior calls (which never
-        # do). Only dicts need stripping; pass other types through untouched.
-        if isinstance(message, dict):
-            sanitized.append(
-                {k: v for k, v in message.items() if k not in KILN_ONLY_MESSAGE_FIELDS}
-            )
-        else:
-            sanitized.append(message)
-    return sanitized
+    return [sanitize_message_for_provider(message) for message in messages]
 
 
 _trace_adapter: TypeAdapter[list[ChatCompletionMessageParam]] = TypeAdapter(
@@ -5,80 +5,153 @@ Utilities for working with PDF files.
 import asyncio
 import atexit
 import tempfile
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, wait
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator
 
 import pypdfium2
 from pypdf import PdfReader, PdfWriter
 
+from kiln_ai.utils.config import Config
+
 _pdf_conversion_executor: ProcessPoolExecutor | None = None
 
 
+def pdf_conversion_max_workers() -> int:
+    max_workers = Config.shared().pdf_conversion_max_workers
+    if max_workers is None or max_workers < 1:
+        return 1
+    return max_workers
+
+
 # Lazy load for speed, singleton so dev-server reloading doesn't recreate the executor
 def get_pdf_conversion_executor() -> ProcessPoolExecutor:
     global _pdf_conversion_executor
     if _pdf_conversion_executor is None:
-        _pdf_conversion_executor = ProcessPoolExecutor(max_workers=1)
+        _pdf_conversion_executor = ProcessPoolExecutor(
+            max_workers=pdf_conversion_max_workers()
+        )
     return _pdf_conversion_executor
 
 
-@asynccontextmanager
-async def split_pdf_into_pages(pdf_path: Path) -> AsyncGenerator[list[Path], None]:
-    with tempfile.TemporaryDirectory(prefix="kiln_pdf_pages_") as temp_dir:
-        page_paths = []
+def _pdf_page_count_sync(pdf_path: Path) -> int:
+    with open(pdf_path, "rb") as file:
+        return len(PdfReader(file).pages)
 
-        with open(pdf_path, "rb") as file:
-            # Reader init can be heavy; offload to thread
-            pdf_reader = await asyncio.to_thread(PdfReader, file)
 
-            for page_num in range(len(pdf_reader.pages)):
-                await asyncio.sleep(0)
-                pdf_writer = PdfWriter()
-                pdf_writer.add_page(pdf_reader.pages[page_num])
+def _write_pdf_page_sync(pdf_path: Path, page_index: int, output_dir: Path) -> Path:
+    # Each worker opens its own reader: readers can't be shared across processes, and
+    # pypdf only parses the objects the requested page references
+    with open(pdf_path, "rb") as file:
+        pdf_reader = PdfReader(file)
+        pdf_writer = PdfWriter()
+        pdf_writer.add_page(pdf_reader.pages[page_index])
 
-                # Create temporary file for this page
-                page_filename = f"page_{page_num + 1}.pdf"
-                page_path = Path(temp_dir) / page_filename
+        page_path = output_dir / f"page_{page_index + 1}.pdf"
+        with open(page_path, "wb") as page_file:
+            pdf_writer.write(page_file)
 
-                with open(page_path, "wb") as page_file:
-                    # Writing/compression can be expensive; offload to thread
-                    await asyncio.to_thread(pdf_writer.write, page_file)
+    return page_path
 
-                page_paths.append(page_path)
 
-        yield page_paths
+class PdfPageStream:
+    """
+    The pages of a PDF being split across the conversion pool.
 
+    Iterating yields (page_index, page_path) tuples in the order the pages finish, so
+    callers can start working on early pages while later ones are still being written.
+    """
 
-def _convert_pdf_to_images_sync(pdf_path: Path, output_dir: Path) -> list[Path]:
-    image_paths = []
+    def __init__(self, page_count: int, page_futures: list[Future[Path]]):
+        self.page_count = page_count
+        self._page_futures: list[Future[Path]] = page_futures
 
-    # note: doing this in a thread causes a segfault - but this is slow and blocking
-    # so we should try to find a better way
+    async def __aiter__(self) -> AsyncIterator[tuple[int, Path]]:
+        async def page_with_index(page_index: int, future: Future[Path]):
+            return page_index, await asyncio.wrap_future(future)
+
+        for next_page in asyncio.as_completed(
+            [
+                page_with_index(page_index, future)
+                for page_index, future in enumerate(self._page_futures)
+            ]
+        ):
+            yield await next_page
+
+    async def close(self) -> None:
+        # Pages that have not started are dropped; pages already in a worker must finish
+        # before their output directory can be removed
+        for future in self._page_futures:
+            future.cancel()
+        await asyncio.to_thread(lambda: wait(self._page_futures))
+
+
+@asynccontextmanager
+async def stream_pdf_pages(pdf_path: Path) -> AsyncGenerator[PdfPageStream, None]:
+    """
+    Split a PDF into single page PDFs, one task per page on the conversion pool.
+
+    Page files live in a temporary directory that is removed when the context exits.
+    """
+    with tempfile.TemporaryDirectory(prefix="kiln_pdf_pages_") as temp_dir:
+        # Reader init can be heavy; offload to thread
+        page_count = await asyncio.to_thread(_pdf_page_count_sync, pdf_path)
+
+        executor = get_pdf_conversion_executor()
+        page_stream = PdfPageStream(
+            page_count,
+            [
+                executor.submit(
+                    _write_pdf_page_sync, pdf_path, page_index, Path(temp_dir)
+                )
+                for page_index in range(page_count)
+            ],
+        )
+        try:
+            yield page_stream
+        finally:
+            await page_stream.close()
+
+
+def _render_pdf_page_sync(pdf_path: Path, page_index: int, output_dir: Path) -> Path:
+    # note: doing this in a thread causes a segfault, so it must run in a process
     pdf = pypdfium2.PdfDocument(pdf_path)
     try:
-        for idx, page in enumerate(pdf):
-            # scale=2 is legible for ~A4 pages (research papers, etc.) - lower than this is blurry
-            bitmap = page.render(scale=2).to_pil()
-            target_path = output_dir / f"img-{pdf_path.name}-{idx}.png"
-            bitmap.save(target_path)
-            image_paths.append(target_path)
-
-        return image_paths
+        # scale=2 is legible for ~A4 pages (research papers, etc.) - lower than this is blurry
+        bitmap = pdf[page_index].render(scale=2).to_pil()
+        target_path = output_dir / f"img-{pdf_path.name}-{page_index}.png"
+        bitmap.save(target_path)
+        return target_path
+    finally:
+        pdf.close()
+
+
+def _rendered_page_count_sync(pdf_path: Path) -> int:
+    pdf = pypdfium2.PdfDocument(pdf_path)
+    try:
+        return len(pdf)
     finally:
         pdf.close()
 
 
 async def convert_pdf_to_images(pdf_path: Path, output_dir: Path) -> list[Path]:
+    """Render every page of a PDF to a PNG, one task per page on the conversion pool."""
     loop = asyncio.get_running_loop()
-    result = await loop.run_in_executor(
-        get_pdf_conversion_executor(),
-        _convert_pdf_to_images_sync,
-        pdf_path,
-        output_dir,
+    executor = get_pdf_conversion_executor()
+    page_count = await loop.run_in_executor(
+        executor, _rendered_page_count_sync, pdf_path
+    )
+    return list(
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    executor, _render_pdf_page_sync, pdf_path, page_index, output_dir
+                )
+                for page_index in range(page_count)
+            ]
+        )
     )
-    return result
 
 
 def _shutdown_pdf_conversion_executor():
@@ -97,6 +97,41 @@ def test_property_priority(config_with_yaml):
     del os.environ["EXAMPLE_PROPERTY"]
 
 
+@pytest.mark.parametrize("value", ["0", "-3", "not a number"])
+def test_property_minimum_falls_back_to_default(value, caplog):
+    config = Config(
+        properties={
+            "limit": ConfigProperty(int, default=10, env_var="LIMIT", minimum=1)
+        }
+    )
+    with patch.dict(os.environ, {"LIMIT": value}):
+        assert config.limit == 10
+    assert "Invalid limit" in caplog.text
+
+    with patch.dict(os.environ, {"LIMIT": "1"}):
+        assert config.limit == 1
+
+
+def test_property_minimum_applies_to_saved_values(config_with_yaml):
+    config = Config(properties={"limit": ConfigProperty(int, default=10, minimum=0)})
+    config._settings["limit"] = -1
+    assert config.limit == 10
+    config._settings["limit"] = 0
+    assert config.limit == 0
+
+
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_extraction_cache_max_size_falls_back_to_default(value, mock_yaml_file):
+    with (
+        patch(
+            "kiln_ai.utils.config.Config.settings_path",
+            return_value=mock_yaml_file,
+        ),
+        patch.dict(os.environ, {"KILN_EXTRACTION_CACHE_MAX_SIZE_MB": value}),
+    ):
+        assert Config().extraction_cache_max_size_mb == 1024
+
+
 def test_default_lambda(config_with_yaml):
     config = config_with_yaml
 
@@ -0,0 +1,29 @@
+import hashlib
+from unittest.mock import patch
+
+from kiln_ai.utils.filesystem import _file_sha256, file_sha256
+
+
+def test_file_sha256(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"hello world")
+    assert file_sha256(path) == hashlib.sha256(b"hello world").hexdigest()
+
+
+def test_file_sha256_same_content_different_paths(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"same")
+    (tmp_path / "b.pdf").write_bytes(b"same")
+    assert file_sha256(tmp_path / "a.pdf") == file_sha256(tmp_path / "b.pdf")
+
+
+def test_file_sha256_is_memoized_until_file_changes(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"first")
+    first = file_sha256(path)
+
+    with patch("kiln_ai.utils.filesystem.open", side_effect=AssertionError("reread")):
+        assert file_sha256(path) == first
+
+    path.write_bytes(b"second, longer")
+    assert file_sha256(path) == hashlib.sha256(b"second, longer").hexdigest()
+    assert _file_sha256.cache_info().currsize >= 2
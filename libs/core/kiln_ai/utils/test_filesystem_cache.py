@@ -1,3 +1,4 @@
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -5,7 +6,12 @@ from unittest.mock import AsyncMock, patch
 import anyio
 import pytest
 
-from kiln_ai.utils.filesystem_cache import FilesystemCache, TemporaryFilesystemCache
+from kiln_ai.utils.config import Config
+from kiln_ai.utils.filesystem_cache import (
+    ExtractionFilesystemCache,
+    FilesystemCache,
+    TemporaryFilesystemCache,
+)
 
 
 class TestFilesystemCache:
@@ -327,19 +333,122 @@ class TestFilesystemCache:
         async def bad_unlink(self):  # type: ignore[no-redef]
             raise RuntimeError("unexpected")
 
-        monkeypatch.setattr(
-            anyio,
-            "Path",
-            lambda p: type(
-                "P", (), {"__init__": lambda self, q: None, "unlink": bad_unlink}
-            )(),
-        )
+        monkeypatch.setattr(anyio.Path, "unlink", bad_unlink)
 
         with patch("kiln_ai.utils.filesystem_cache.logger") as mock_logger:
             await cache.delete_by_prefix("test_")
             assert mock_logger.error.called
 
 
+def set_access_time(path: Path, seconds: int) -> None:
+    os.utime(path, (seconds, seconds))
+
+
+class TestFilesystemCacheLRU:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return FilesystemCache(tmp_path, max_size_bytes=100)
+
+    def test_rejects_invalid_max_size(self, tmp_path):
+        with pytest.raises(ValueError, match="max_size_bytes"):
+            FilesystemCache(tmp_path, max_size_bytes=0)
+
+    async def test_unbounded_cache_never_evicts(self, tmp_path):
+        cache = FilesystemCache(tmp_path)
+        for i in range(20):
+            await cache.set(f"key_{i}", b"x" * 50)
+        assert len(list(tmp_path.iterdir())) == 20
+
+    async def test_evicts_least_recently_used_over_limit(self, cache, tmp_path):
+        for i in range(3):
+            await cache.set(f"key_{i}", b"x" * 30)
+            set_access_time(tmp_path / f"key_{i}", 1000 + i)
+
+        # 90 bytes, under the limit
+        assert len(list(tmp_path.iterdir())) == 3
+
+        # 120 bytes: evicts oldest entries down to 90% of the limit
+        await cache.set("key_3", b"x" * 30)
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "key_1",
+            "key_2",
+            "key_3",
+        ]
+
+    async def test_get_refreshes_recency(self, cache, tmp_path):
+        for i in range(3):
+            await cache.set(f"key_{i}", b"x" * 30)
+            set_access_time(tmp_path / f"key_{i}", 1000 + i)
+
+        # reading the oldest entry makes it the most recently used
+        assert await cache.get("key_0") is not None
+
+        await cache.set("key_3", b"x" * 30)
+
+        assert await cache.get("key_0") is not None
+        assert not (tmp_path / "key_1").exists()
+
+    async def test_overwrite_does_not_double_count(self, cache, tmp_path):
+        for _ in range(10):
+            await cache.set("same_key", b"x" * 60)
+        assert await cache.get("same_key") == b"x" * 60
+
+    async def test_accounts_for_existing_entries_on_disk(self, tmp_path):
+        # entries from a previous run count towards the limit
+        for i in range(3):
+            (tmp_path / f"old_{i}").write_bytes(b"x" * 30)
+            set_access_time(tmp_path / f"old_{i}", 1000 + i)
+
+        cache = FilesystemCache(tmp_path, max_size_bytes=100)
+        await cache.set("new", b"x" * 30)
+
+        assert not (tmp_path / "old_0").exists()
+        assert (tmp_path / "new").exists()
+
+    async def test_cache_hit_touches_entry_off_the_event_loop(self, tmp_path):
+        cache = FilesystemCache(path=tmp_path, max_size_bytes=1000)
+        await cache.set("key", b"value")
+
+        with patch(
+            "kiln_ai.utils.filesystem_cache.anyio.to_thread.run_sync",
+            wraps=anyio.to_thread.run_sync,
+        ) as mock_run_sync:
+            assert await cache.get("key") == b"value"
+
+        mock_run_sync.assert_called_once_with(cache._touch, tmp_path / "key")
+
+    async def test_size_remeasured_after_delete_by_prefix(self, cache, tmp_path):
+        await cache.set("a_1", b"x" * 60)
+        await cache.delete_by_prefix("a_")
+        await cache.set("b_1", b"x" * 60)
+        assert await cache.get("b_1") is not None
+
+
+class TestExtractionFilesystemCache:
+    def test_persistent_cache_in_settings_dir(self, tmp_path):
+        with patch.object(Config, "settings_dir", return_value=str(tmp_path)):
+            cache = ExtractionFilesystemCache().filesystem_cache
+
+        assert cache.cache_dir_path == tmp_path / "cache" / "extractions"
+        assert cache.cache_dir_path.is_dir()
+        assert cache.max_size_bytes == 1024 * 1024 * 1024
+
+    def test_max_size_from_config(self, tmp_path):
+        Config.shared().extraction_cache_max_size_mb = 5
+        cache = ExtractionFilesystemCache(path=tmp_path).filesystem_cache
+        assert cache.max_size_bytes == 5 * 1024 * 1024
+
+    async def test_cache_survives_new_instances(self, tmp_path):
+        await ExtractionFilesystemCache(path=tmp_path).filesystem_cache.set(
+            "key", b"value"
+        )
+        assert (
+            await ExtractionFilesystemCache(path=tmp_path).filesystem_cache.get("key")
+            == b"value"
+        )
+
+
 class TestTemporaryFilesystemCache:
     def test_temporary_cache_creation(self):
         """Test that TemporaryFilesystemCache creates a temporary directory."""
@@ -1,5 +1,7 @@
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from pathlib import Path
 
 import pytest
 
@@ -7,6 +9,8 @@ from kiln_ai.utils.git_sync_protocols import (
     AtomicWriteCapable,
     SaveContext,
     default_save_context,
+    record_written_path,
+    track_written_paths,
 )
 
 
@@ -58,3 +62,39 @@ async def test_atomic_write_capable_structural_duck_typing():
     async with fake.atomic_write("x"):
         pass
     assert entered_with_context == "x"
+
+
+def test_record_written_path_without_tracking_is_no_op():
+    record_written_path(Path("/tmp/untracked.kiln"))
+
+
+@pytest.mark.asyncio
+async def test_track_written_paths_collects_from_tasks_and_threads():
+    with track_written_paths() as written:
+        record_written_path(Path("/repo/a.kiln"))
+
+        async def in_task():
+            record_written_path(Path("/repo/b.kiln"))
+
+        await asyncio.create_task(in_task())
+        await asyncio.to_thread(record_written_path, Path("/repo/c.kiln"))
+
+    assert written == {
+        Path("/repo/a.kiln"),
+        Path("/repo/b.kiln"),
+        Path("/repo/c.kiln"),
+    }
+
+    # tracking ends with the block
+    record_written_path(Path("/repo/d.kiln"))
+    assert Path("/repo/d.kiln") not in written
+
+
+def test_track_written_paths_nested_blocks_are_separate():
+    with track_written_paths() as outer:
+        with track_written_paths() as inner:
+            record_written_path(Path("/repo/inner.kiln"))
+        record_written_path(Path("/repo/outer.kiln"))
+
+    assert inner == {Path("/repo/inner.kiln")}
+    assert outer == {Path("/repo/outer.kiln")}
@@ -0,0 +1,192 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+
+from kiln_ai.utils.config import Config
+from kiln_ai.utils.http_client_pool import (
+    HTTP2_AVAILABLE,
+    HttpClientPool,
+    HttpPoolMetrics,
+    pool_key,
+)
+
+
+@pytest.fixture
+async def server_url():
+    async def ok(request: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/ok", ok)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+def test_pool_key():
+    assert pool_key("https://API.openai.com/v1/chat") == "https://api.openai.com"
+    assert pool_key("http://localhost:11434/api/tags") == "http://localhost:11434"
+    assert pool_key("not a url") == "not a url"
+
+
+def test_metrics_reuse():
+    metrics = HttpPoolMetrics()
+    assert metrics.connections_reused == 0
+    assert metrics.reuse_ratio == 0.0
+
+    metrics = HttpPoolMetrics(requests=4, connections_opened=1)
+    assert metrics.connections_reused == 3
+    assert metrics.reuse_ratio == 0.75
+
+
+def test_init_validation():
+    with pytest.raises(ValueError, match="max_connections"):
+        HttpClientPool(max_connections=0)
+    with pytest.raises(ValueError, match="Keep-alive"):
+        HttpClientPool(keepalive_expiry_seconds=-1)
+    if not HTTP2_AVAILABLE:
+        with pytest.raises(ValueError, match="h2"):
+            HttpClientPool(http2=True)
+
+
+def test_from_config():
+    with patch.dict(
+        os.environ,
+        {
+            "KILN_HTTP_MAX_CONNECTIONS": "7",
+            "KILN_HTTP_MAX_KEEPALIVE_CONNECTIONS": "3",
+            "KILN_HTTP_KEEPALIVE_EXPIRY_SECONDS": "9",
+        },
+    ):
+        with patch.object(Config, "_shared_instance", Config()):
+            pool = HttpClientPool.from_config()
+
+    assert pool.max_connections == 7
+    assert pool.max_keepalive_connections == 3
+    assert pool.keepalive_expiry_seconds == 9
+    assert pool.http2 == HTTP2_AVAILABLE
+
+
+async def test_clients_are_pooled_by_base_url():
+    pool = HttpClientPool()
+    client = pool.client("https://api.example.com/v1/models")
+    assert pool.client("https://api.example.com/other") is client
+    assert pool.client("https://other.example.com/v1/models") is not client
+
+    session = pool.litellm_session(None, "openai")
+    assert pool.litellm_session(None, "openai") is session
+    assert pool.litellm_session(None, "anthropic") is not session
+    custom = pool.litellm_session("http://localhost:1234/v1", "openai_compatible")
+    assert pool.litellm_session("http://localhost:1234/v2", "openai") is custom
+
+    await pool.aclose()
+    assert client.is_closed
+    assert session.closed
+    # closed clients are replaced
+    assert pool.client("https://api.example.com/v1/models") is not client
+    await pool.aclose()
+
+
+async def test_litellm_http_handler_wraps_the_pooled_session():
+    pool = HttpClientPool()
+    handler = pool.litellm_http_handler(None, "cohere")
+    assert pool.litellm_http_handler(None, "cohere") is handler
+    assert pool.litellm_http_handler(None, "openai") is not handler
+
+    session = pool.litellm_session(None, "cohere")
+    await session.close()
+    # a handler is replaced along with its session
+    assert pool.litellm_http_handler(None, "cohere") is not handler
+    await pool.aclose()
+
+
+async def test_httpx_client_reuses_connections(server_url):
+    pool = HttpClientPool()
+    for _ in range(3):
+        response = await pool.client(server_url).get(f"{server_url}/ok")
+        assert response.json() == {"ok": True}
+    await pool.aclose()
+
+    metrics = pool.metrics()[server_url]
+    assert metrics.requests == 3
+    assert metrics.connections_opened == 1
+    assert metrics.connections_reused == 2
+
+
+async def test_litellm_session_reuses_connections(server_url):
+    pool = HttpClientPool()
+    for _ in range(3):
+        session = pool.litellm_session(server_url, "openai_compatible")
+        async with session.get(f"{server_url}/ok") as response:
+            assert await response.json() == {"ok": True}
+    await pool.aclose()
+
+    metrics = pool.metrics()[server_url]
+    assert metrics.requests == 3
+    assert metrics.connections_opened == 1
+    assert metrics.connections_reused == 2
+
+
+async def test_concurrent_requests_share_the_pool(server_url):
+    pool = HttpClientPool(max_connections=2)
+    client = pool.client(server_url)
+    await asyncio.gather(*[client.get(f"{server_url}/ok") for _ in range(10)])
+    await pool.aclose()
+
+    metrics = pool.metrics()[server_url]
+    assert metrics.requests == 10
+    assert metrics.connections_opened <= 2
+
+
+def test_clients_are_per_event_loop():
+    pool = HttpClientPool()
+
+    async def get_clients():
+        return pool.client("https://api.example.com"), pool.litellm_session(
+            None, "openai"
+        )
+
+    first_client, first_session = asyncio.run(get_clients())
+    second_client, second_session = asyncio.run(get_clients())
+
+    assert first_client is not second_client
+    # the first loop is closed, so its session was detached rather than left open
+    assert first_session.closed
+    assert second_session is not first_session
+
+    pool._discard_closed_loops(all_loops=True)
+    assert second_session.closed
+
+
+def test_shared():
+    pool = HttpClientPool.shared()
+    assert HttpClientPool.shared() is pool
+    HttpClientPool.reset_shared()
+    assert HttpClientPool.shared() is not pool
+
+
+def test_client_requires_running_loop():
+    with pytest.raises(RuntimeError):
+        HttpClientPool().client("https://api.example.com")
+
+
+def test_from_config_invalid_settings_use_defaults():
+    with patch.dict(
+        os.environ,
+        {
+            "KILN_HTTP_MAX_CONNECTIONS": "0",
+            "KILN_HTTP_KEEPALIVE_EXPIRY_SECONDS": "-5",
+        },
+    ):
+        with patch.object(Config, "_shared_instance", Config()):
+            pool = HttpClientPool.from_config()
+
+    assert pool.max_connections == 100
+    assert pool.keepalive_expiry_seconds == 30
@@ -81,7 +81,12 @@ def test_tool_message_param_properties_match():
     openai_properties = set(openai_annotations.keys())
     kiln_properties = set(kiln_annotations.keys())
 
-    kiln_extra_properties = {"kiln_task_tool_data", "is_error", "error_message"}
+    kiln_extra_properties = {
+        "kiln_task_tool_data",
+        "is_error",
+        "error_message",
+        "cache_hit",
+    }
     for prop in kiln_extra_properties:
         assert prop in kiln_properties, f"Kiln should have {prop}"
         kiln_properties.remove(prop)
@@ -225,7 +230,14 @@ def test_tool_message_wrapper_can_be_instantiated():
 
 def test_kiln_only_message_fields_set():
     assert KILN_ONLY_MESSAGE_FIELDS == frozenset(
-        {"latency_ms", "is_error", "error_message", "kiln_task_tool_data", "usage"}
+        {
+            "latency_ms",
+            "is_error",
+            "error_message",
+            "kiln_task_tool_data",
+            "cache_hit",
+            "usage",
+        }
     )
 
 
@@ -442,6 +454,7 @@ class TestSerializeTrace:
             "total_tokens": None,
             "cost": 0.01,
             "cached_tokens": None,
+            "response_cache_hits": None,
         }
 
     def test_output_is_byte_identical_to_json_dumps_for_a_plain_data_trace(self):
@@ -1,84 +1,98 @@
 import asyncio
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pypdf import PdfReader
 
 from kiln_ai.pytest_mock_files import MockFileFactoryMimeType
 from kiln_ai.utils.pdf_utils import (
-    _convert_pdf_to_images_sync,
+    _render_pdf_page_sync,
     convert_pdf_to_images,
-    split_pdf_into_pages,
+    pdf_conversion_max_workers,
+    stream_pdf_pages,
 )
 
 
-async def test_split_pdf_into_pages_success(mock_file_factory):
-    """Test that split_pdf_into_pages successfully splits a PDF into individual pages."""
+async def test_stream_pdf_pages_yields_every_page(mock_file_factory):
+    """Test that stream_pdf_pages yields each page once, tagged with its index."""
     test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
 
-    async with split_pdf_into_pages(test_file) as page_paths:
-        # Verify we get the expected number of pages (test PDF has 2 pages)
-        assert len(page_paths) == 2
+    async with stream_pdf_pages(test_file) as page_stream:
+        assert page_stream.page_count == 2
+        pages = [page async for page in page_stream]
 
-        # Verify all page files exist
-        for page_path in page_paths:
-            assert page_path.exists()
-            assert page_path.suffix == ".pdf"
-
-        # Verify page files are named correctly
-        assert page_paths[0].name == "page_1.pdf"
-        assert page_paths[1].name == "page_2.pdf"
-
-        # Verify each page file is a valid PDF with exactly 1 page
-        for page_path in page_paths:
+        assert sorted(page_index for page_index, _ in pages) == [0, 1]
+        for page_index, page_path in pages:
+            assert page_path.name == f"page_{page_index + 1}.pdf"
             with open(page_path, "rb") as file:
-                reader = PdfReader(file)
-                assert len(reader.pages) == 1
+                assert len(PdfReader(file).pages) == 1
 
-    # Verify cleanup: all page files should be removed after context exit
-    for page_path in page_paths:
+    for _, page_path in pages:
         assert not page_path.exists()
 
 
-async def test_split_pdf_into_pages_cleanup_on_exception(mock_file_factory):
+async def test_stream_pdf_pages_cleanup_when_not_consumed(mock_file_factory):
+    """Test that leaving the context before consuming the stream still cleans up."""
+    test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
+
+    async with stream_pdf_pages(test_file) as page_stream:
+        async for _, page_path in page_stream:
+            temp_dir = page_path.parent
+            break
+
+    assert not temp_dir.exists()
+
+
+async def test_stream_pdf_pages_cleanup_on_exception(mock_file_factory):
     """Test that temporary files are cleaned up even when an exception occurs during normal usage."""
     test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
     captured_page_paths = []
 
-    # Test that cleanup happens even when an exception occurs during the with block
     with pytest.raises(RuntimeError, match="Simulated error during usage"):
-        async with split_pdf_into_pages(test_file) as page_paths:
-            # Capture the page paths before the exception
-            captured_page_paths.extend(page_paths)
-            # Simulate an exception during normal usage of the context manager
+        async with stream_pdf_pages(test_file) as page_stream:
+            async for _, page_path in page_stream:
+                captured_page_paths.append(page_path)
             raise RuntimeError("Simulated error during usage")
 
-    # Verify cleanup happened: the specific page files we created should be gone
+    assert len(captured_page_paths) == 2
     for page_path in captured_page_paths:
         assert not page_path.exists()
-
-    # Also verify the temporary directory itself is gone
-    if captured_page_paths:
-        temp_dir = captured_page_paths[0].parent
-        assert not temp_dir.exists()
+    assert not captured_page_paths[0].parent.exists()
 
 
-async def test_split_pdf_into_pages_temporary_directory_creation(mock_file_factory):
+async def test_stream_pdf_pages_temporary_directory_creation(mock_file_factory):
     """Test that temporary directories are created with the correct prefix."""
     test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
-    captured_temp_dirs = []
 
-    async with split_pdf_into_pages(test_file) as page_paths:
-        # Check that page paths are in a directory with the expected prefix
-        temp_dir = page_paths[0].parent
-        captured_temp_dirs.append(temp_dir)
-        assert "kiln_pdf_pages_" in temp_dir.name
-        assert temp_dir.exists()
+    async with stream_pdf_pages(test_file) as page_stream:
+        async for _, page_path in page_stream:
+            temp_dir = page_path.parent
+            assert "kiln_pdf_pages_" in temp_dir.name
+            assert temp_dir.exists()
+
+    assert not temp_dir.exists()
 
-    # Verify the temporary directory is cleaned up
-    for temp_dir in captured_temp_dirs:
-        assert not temp_dir.exists()
+
+@pytest.mark.parametrize(
+    "configured, expected",
+    [(None, 1), (0, 1), (1, 1), (8, 8)],
+)
+def test_pdf_conversion_max_workers(configured, expected):
+    mock_config = MagicMock()
+    mock_config.pdf_conversion_max_workers = configured
+    with patch("kiln_ai.utils.pdf_utils.Config.shared", return_value=mock_config):
+        assert pdf_conversion_max_workers() == expected
+
+
+def test_render_pdf_page_sync(mock_file_factory):
+    """Test that a single page can be rendered on its own."""
+    test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image_path = _render_pdf_page_sync(test_file, 1, Path(temp_dir))
+        assert image_path.name == f"img-{test_file.name}-1.png"
+        assert image_path.exists()
 
 
 async def test_convert_pdf_to_images(mock_file_factory):
@@ -89,6 +103,11 @@ async def test_convert_pdf_to_images(mock_file_factory):
         assert len(images) == 2
         assert all(image.exists() for image in images)
         assert all(image.suffix == ".png" for image in images)
+        # pages are rendered in parallel but returned in page order
+        assert [image.name for image in images] == [
+            f"img-{test_file.name}-0.png",
+            f"img-{test_file.name}-1.png",
+        ]
 
 
 async def run_convert_pdf_concurrently(mock_file_factory, concurrency: int):
@@ -117,16 +136,6 @@ async def test_convert_pdf_to_images_concurrent_access_3(mock_file_factory):
     await run_convert_pdf_concurrently(mock_file_factory, concurrency=3)
 
 
-def test_convert_pdf_to_images_sync(mock_file_factory):
-    """Test that the sync converter creates PNGs for each page."""
-    test_file = mock_file_factory(MockFileFactoryMimeType.PDF)
-    with tempfile.TemporaryDirectory() as temp_dir:
-        images = _convert_pdf_to_images_sync(test_file, Path(temp_dir))
-        assert len(images) == 2
-        assert all(image.exists() for image in images)
-        assert all(image.suffix == ".png" for image in images)
-
-
 @pytest.mark.slow
 async def test_convert_pdf_to_images_concurrent_access_100(mock_file_factory):
     """Test running convert_pdf_to_images concurrently from multiple tasks."""
@@ -50,6 +50,16 @@ def test_message_usage_add_handles_none_fields():
     assert result.cost == 0.5
 
 
+def test_usage_add_sums_response_cache_hits():
+    a = MessageUsage(input_tokens=10, response_cache_hits=1, cost=0.0)
+    b = MessageUsage(input_tokens=3, cost=0.5)
+
+    assert (a + b).response_cache_hits == 1
+    assert (a + a).response_cache_hits == 2
+    assert (b + b).response_cache_hits is None
+    assert (Usage(response_cache_hits=1) + a).response_cache_hits == 2
+
+
 def test_message_usage_add_rejects_non_message_usage():
     with pytest.raises(TypeError, match="Cannot add MessageUsage with"):
         MessageUsage() + 5  # type: ignore[operator]
@@ -92,6 +92,11 @@ class MessageUsage(BaseModel):
         description="Number of tokens served from prompt cache. None if not reported.",
         ge=0,
     )
+    response_cache_hits: int | None = Field(
+        default=None,
+        description="Number of LLM calls replayed from Kiln's local response cache instead of calling the provider. Their token counts are from the original call, and their cost is zero.",
+        ge=0,
+    )
 
     def __add__(self, other: "MessageUsage") -> "MessageUsage":
         """Add two MessageUsage objects together, handling None values gracefully.
@@ -110,6 +115,9 @@ class MessageUsage(BaseModel):
             total_tokens=_add_optional_int(self.total_tokens, other.total_tokens),
             cost=_add_optional_float(self.cost, other.cost),
             cached_tokens=_add_optional_int(self.cached_tokens, other.cached_tokens),
+            response_cache_hits=_add_optional_int(
+                self.response_cache_hits, other.response_cache_hits
+            ),
         )
 
     @staticmethod
@@ -187,6 +195,9 @@ class Usage(MessageUsage):
             total_tokens=_add_optional_int(self.total_tokens, other.total_tokens),
             cost=_add_optional_float(self.cost, other.cost),
             cached_tokens=_add_optional_int(self.cached_tokens, other.cached_tokens),
+            response_cache_hits=_add_optional_int(
+                self.response_cache_hits, other.response_cache_hits
+            ),
             total_llm_latency_ms=_add_optional_int(
                 self.total_llm_latency_ms, other_latency
             ),
@@ -18,7 +18,10 @@ from fastapi import (
 from fastapi.responses import FileResponse, StreamingResponse
 from kiln_ai.adapters.chunkers.chunker_registry import chunker_adapter_from_type
 from kiln_ai.adapters.extractors.extractor_registry import extractor_adapter_from_type
-from kiln_ai.adapters.extractors.extractor_runner import ExtractorRunner
+from kiln_ai.adapters.extractors.extractor_runner import (
+    ExtractorProgress,
+    ExtractorRunner,
+)
 from kiln_ai.adapters.ml_embedding_model_list import (
     built_in_embedding_models_from_provider,
 )
@@ -84,7 +87,7 @@ from kiln_ai.tools.tool_registry import tool_from_id
 from kiln_ai.utils import shared_async_lock_manager
 from kiln_ai.utils.exhaustive_error import raise_exhaustive_enum_error
 from kiln_ai.utils.filesystem import open_folder
-from kiln_ai.utils.filesystem_cache import TemporaryFilesystemCache
+from kiln_ai.utils.filesystem_cache import ExtractionFilesystemCache
 from kiln_ai.utils.git_sync_protocols import SaveContext
 from kiln_ai.utils.mime_type import guess_mime_type
 from kiln_ai.utils.name_generator import generate_memorable_name
@@ -170,6 +173,10 @@ async def run_extractor_runner_with_status(
                 "total": progress.total,
                 "errors": progress.errors,
             }
+            if isinstance(progress, ExtractorProgress):
+                data["pages_progress"] = progress.pages_complete
+                data["pages_total"] = progress.pages_total
+                data["pages_errors"] = progress.pages_errors
             yield f"data: {json.dumps(data)}\n\n"
 
         # Send the final complete message the app expects, and uses to stop listening
@@ -902,7 +909,7 @@ async def build_rag_workflow_runner(
                     extractor_config,
                     concurrency=extractor_concurrency,
                     rag_config=rag_config,
-                    filesystem_cache=TemporaryFilesystemCache.shared(),
+                    filesystem_cache=ExtractionFilesystemCache.shared(),
                     save_context=save_context,
                 ),
                 RagChunkingStepRunner(
@@ -1464,6 +1471,7 @@ def connect_document_api(app: FastAPI):
                 extractor_configs=[extractor_config],
                 documents=documents,
                 save_context=save_context,
+                filesystem_cache=ExtractionFilesystemCache.shared(),
             )
 
             return await run_extractor_runner_with_status(extractor_runner)
@@ -1816,6 +1824,7 @@ def connect_document_api(app: FastAPI):
             extractor_configs=extractor_configs,
             documents=[document],
             save_context=save_context,
+            filesystem_cache=ExtractionFilesystemCache.shared(),
         )
 
         return await run_extractor_runner_with_status(extractor_runner)
@@ -1879,7 +1888,7 @@ def connect_document_api(app: FastAPI):
         extractor = extractor_adapter_from_type(
             extractor_config.extractor_type,
             extractor_config,
-            filesystem_cache=TemporaryFilesystemCache.shared(),
+            filesystem_cache=ExtractionFilesystemCache.shared(),
         )
 
         try:
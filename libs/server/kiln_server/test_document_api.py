@@ -9,6 +9,7 @@ import pytest
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
+from kiln_ai.adapters.extractors.extractor_runner import ExtractorProgress
 from kiln_ai.adapters.ml_embedding_model_list import (
     EmbeddingModelName,
     KilnEmbeddingModelProvider,
@@ -35,6 +36,7 @@ from kiln_ai.datamodel.reranker import RerankerConfig, RerankerType
 from kiln_ai.datamodel.vector_store import VectorStoreConfig, VectorStoreType
 from kiln_ai.pytest_mock_files import MockFileFactoryMimeType
 from kiln_ai.tools.rag_tools import RagTool
+from kiln_ai.utils.async_job_runner import Progress
 
 from kiln_server.custom_errors import connect_custom_errors
 from kiln_server.document_api import (
@@ -42,6 +44,7 @@ from kiln_server.document_api import (
     build_rag_workflow_runner,
     connect_document_api,
     get_documents_filtered,
+    run_extractor_runner_with_status,
     run_rag_workflow_runner_with_status,
 )
 
@@ -1388,6 +1391,8 @@ async def test_create_vector_store_config_with_hybrid_type(client, mock_project)
     assert result["properties"]["vector_column_name"] == "vector"
     assert result["properties"]["text_key"] == "text"
     assert result["properties"]["doc_id_key"] == "doc_id"
+    # ANN indexing is opt-in, new stores search exactly
+    assert "vector_index" not in result["properties"]
 
 
 async def test_get_vector_store_configs(
@@ -2763,6 +2768,42 @@ async def test_get_rag_config_progress_invalid_config_id(
     assert "fake_id" not in result
 
 
+async def test_run_extractor_runner_with_status_includes_page_progress():
+    async def mock_run():
+        yield Progress(complete=0, total=2, errors=0)
+        yield ExtractorProgress(
+            complete=1,
+            total=2,
+            errors=0,
+            pages_complete=7,
+            pages_total=12,
+            pages_errors=1,
+        )
+
+    mock_runner = MagicMock()
+    mock_runner.run.return_value = mock_run()
+
+    response = await run_extractor_runner_with_status(mock_runner)
+
+    content = ""
+    async for chunk in response.body_iterator:
+        content += str(chunk)
+    data_lines = [
+        line[6:] for line in content.strip().split("\n") if line.startswith("data: ")
+    ]
+
+    assert json.loads(data_lines[0]) == {"progress": 0, "total": 2, "errors": 0}
+    assert json.loads(data_lines[1]) == {
+        "progress": 1,
+        "total": 2,
+        "errors": 0,
+        "pages_progress": 7,
+        "pages_total": 12,
+        "pages_errors": 1,
+    }
+    assert data_lines[-1] == "complete"
+
+
 async def test_run_rag_workflow_runner_with_status_success():
     """Test successful execution of run_rag_workflow_runner_with_status"""
 